@@ -19,8 +19,6 @@ These are two separate processes with different responsibilities:
 - The *launcher* is spawned by the adapter to run the target program.
 """
 
-from dapper.adapter.adapter import main as _adapter_main
-
 __all__ = ["__version__", "main"]
 __version__ = "0.9.4"
 
@@ -39,4 +37,8 @@ def main() -> None:
        adapter.  See :mod:`dapper.__main__` and
        :mod:`dapper.launcher`.
     """
+    # Imported here so the launcher and auto-attached children, which import
+    # ``dapper`` as a package, never load the asyncio adapter stack.
+    from dapper.adapter.adapter import main as _adapter_main  # noqa: PLC0415
+
     _adapter_main()
@@ -0,0 +1,248 @@
+"""Persistent on-disk cache of instrumented bytecode.
+
+Rewriting bytecode (``get_instructions`` → ``_find_injection_points`` →
+``_rebuild_code_object``) is repeated for every instrumented function in
+every debug session.  For large code bases with saved breakpoints this adds
+seconds to startup, so :class:`BytecodeDiskCache` stores the marshalled
+result under the user cache directory and reuses it across sessions.
+
+Entries are keyed by:
+
+* the interpreter (``sys.implementation.cache_tag`` and ``sys.version``);
+* the SHA-256 of the source file the code object was compiled from;
+* the code object's qualified name, first line and a CRC of its bytecode;
+* the breakpoint-line fingerprint;
+* the instrumentation metadata version (``_BYTECODE_META_VERSION``).
+
+Loaded code objects are re-validated with
+:func:`~dapper._frame_eval.bytecode_safety.validate_code_object` before use.
+Any unreadable, mismatched or invalid entry is deleted and reported as a
+miss, so callers always fall back to rebuilding in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+from types import CodeType
+from typing import TypedDict
+import zlib
+
+from dapper._frame_eval.bytecode_safety import validate_code_object
+from dapper._frame_eval.telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+#: Environment variable that enables the cache; ``1`` selects the default
+#: location, any other non-empty value is used as the cache directory.
+CACHE_DIR_ENV_VAR = "DAPPER_BYTECODE_CACHE_DIR"
+
+_ENTRY_MAGIC = b"DPBC1\n"
+_ENTRY_SUFFIX = ".dbc"
+
+
+class BytecodeDiskCacheStats(TypedDict):
+    """Counters describing disk-cache effectiveness."""
+
+    cache_dir: str
+    hits: int
+    misses: int
+    stores: int
+    rejected: int
+    errors: int
+
+
+def default_cache_dir() -> Path:
+    """Return the platform-specific user cache directory for dapper bytecode."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "dapper" / "Cache" / "bytecode"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "dapper" / "bytecode"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "dapper" / "bytecode"
+
+
+def cache_dir_from_environment() -> Path | None:
+    """Return the cache directory requested via :data:`CACHE_DIR_ENV_VAR`."""
+    value = os.environ.get(CACHE_DIR_ENV_VAR, "").strip()
+    if not value or value == "0":
+        return None
+    if value == "1":
+        return default_cache_dir()
+    return Path(value).expanduser()
+
+
+class BytecodeDiskCache:
+    """Store and load marshalled instrumented code objects by content key."""
+
+    def __init__(self, cache_dir: str | os.PathLike[str] | None = None, *, meta_version: int):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.meta_version = meta_version
+        self._lock = threading.Lock()
+        # filename -> (mtime_ns, size, sha256 hex)
+        self._source_hashes: dict[str, tuple[int, int, str]] = {}
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "rejected": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _source_hash(self, filename: str) -> str | None:
+        """Return the SHA-256 of *filename*, memoised by ``(mtime, size)``."""
+        try:
+            st = Path(filename).stat()
+        except (OSError, ValueError):
+            return None
+        cached = self._source_hashes.get(filename)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            digest = hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+        except OSError:
+            return None
+        self._source_hashes[filename] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def entry_key(self, code_obj: CodeType, breakpoint_lines: set[int]) -> str | None:
+        """Return the cache key for *code_obj*, or ``None`` when it has no source file."""
+        source_hash = self._source_hash(code_obj.co_filename)
+        if source_hash is None:
+            return None
+        qualname = getattr(code_obj, "co_qualname", code_obj.co_name)
+        parts = (
+            sys.implementation.cache_tag or sys.implementation.name,
+            sys.version,
+            source_hash,
+            qualname,
+            str(code_obj.co_firstlineno),
+            f"{zlib.crc32(code_obj.co_code):08x}",
+            ",".join(str(line) for line in sorted(breakpoint_lines)),
+            str(self.meta_version),
+        )
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    # ------------------------------------------------------------------
+    # Load / store
+    # ------------------------------------------------------------------
+
+    def load(self, code_obj: CodeType, breakpoint_lines: set[int]) -> CodeType | None:
+        """Return the cached instrumented variant of *code_obj*, if valid."""
+        key = self.entry_key(code_obj, breakpoint_lines)
+        if key is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except OSError as exc:
+            logger.debug("Could not read bytecode cache entry %s: %s", path, exc)
+            self._count("errors")
+            return None
+
+        modified = self._decode(data)
+        if modified is None or not self._matches(code_obj, modified):
+            self._reject(path, code_obj, "disk_cache_entry_mismatch")
+            return None
+
+        result = validate_code_object(code_obj, modified)
+        if not result.valid:
+            self._reject(path, code_obj, "disk_cache_validation_failed", errors=result.errors)
+            return None
+
+        self._count("hits")
+        return modified
+
+    def store(self, code_obj: CodeType, breakpoint_lines: set[int], modified: CodeType) -> bool:
+        """Persist *modified* for ``(code_obj, breakpoint_lines)`` atomically."""
+        key = self.entry_key(code_obj, breakpoint_lines)
+        if key is None:
+            return False
+        path = self._entry_path(key)
+        try:
+            payload = marshal.dumps(modified)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(_ENTRY_MAGIC)
+                    handle.write(payload)
+                Path(tmp_name).replace(path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except (OSError, ValueError) as exc:
+            logger.debug("Could not write bytecode cache entry %s: %s", path, exc)
+            self._count("errors")
+            return False
+        self._count("stores")
+        return True
+
+    def clear(self) -> int:
+        """Delete every cache entry; return the number of files removed."""
+        removed = 0
+        if self.cache_dir.is_dir():
+            for entry in self.cache_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+                entry.unlink(missing_ok=True)
+                removed += 1
+        self._source_hashes.clear()
+        return removed
+
+    def get_stats(self) -> BytecodeDiskCacheStats:
+        """Return hit/miss/store counters and the cache location."""
+        with self._lock:
+            return {"cache_dir": str(self.cache_dir), **self._stats}  # type: ignore[typeddict-item]
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _decode(data: bytes) -> CodeType | None:
+        if not data.startswith(_ENTRY_MAGIC):
+            return None
+        try:
+            loaded = marshal.loads(data[len(_ENTRY_MAGIC) :])
+        except (EOFError, ValueError, TypeError):
+            return None
+        return loaded if isinstance(loaded, CodeType) else None
+
+    @staticmethod
+    def _matches(original: CodeType, modified: CodeType) -> bool:
+        return (
+            modified.co_filename == original.co_filename
+            and modified.co_name == original.co_name
+            and modified.co_firstlineno == original.co_firstlineno
+            and modified.co_argcount == original.co_argcount
+            and modified.co_varnames == original.co_varnames
+            and modified.co_freevars == original.co_freevars
+            and modified.co_cellvars == original.co_cellvars
+        )
+
+    def _reject(self, path: Path, code_obj: CodeType, cause: str, **context: object) -> None:
+        self._count("rejected")
+        telemetry.record_bytecode_cache_key_mismatch(
+            filename=code_obj.co_filename,
+            name=code_obj.co_name,
+            cause=cause,
+            **context,
+        )
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -74,11 +74,14 @@ def _resolve_instruction_arguments(
 def rebuild_code_object(  # noqa: PLR0912
     original_code: CodeType,
     new_instructions: list[dis.Instruction],
+    extra_stack: int = 2,
 ) -> tuple[bool, CodeType]:
     """Rebuild *original_code* with *new_instructions* substituted in.
 
-    Returns ``(accepted, code)`` where *accepted* is ``False`` when the safety
-    validator rejects the candidate (caller should fall back to the original).
+    *extra_stack* is the stack depth the injected instructions may need on
+    top of the original code's.  Returns ``(accepted, code)`` where
+    *accepted* is ``False`` when the safety validator rejects the candidate
+    (caller should fall back to the original).
     """
     new_instructions, constants, names = _resolve_instruction_arguments(
         original_code,
@@ -106,7 +109,7 @@ def rebuild_code_object(  # noqa: PLR0912
                 co_code=bytes(bytecode),
                 co_consts=tuple(constants),
                 co_names=tuple(names),
-                co_stacksize=original_code.co_stacksize + 2,
+                co_stacksize=original_code.co_stacksize + extra_stack,
             )
             return safe_replace_code(original_code, candidate)
         except Exception:
@@ -121,7 +124,7 @@ def rebuild_code_object(  # noqa: PLR0912
         "co_argcount": original_code.co_argcount,
         "co_kwonlyargcount": original_code.co_kwonlyargcount,
         "co_nlocals": original_code.co_nlocals,
-        "co_stacksize": original_code.co_stacksize + 2,  # Increase stack size for breakpoint calls
+        "co_stacksize": original_code.co_stacksize + extra_stack,
         "co_flags": original_code.co_flags,
         "co_code": bytes(bytecode),
         "co_consts": tuple(constants),
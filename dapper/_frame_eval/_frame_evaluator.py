@@ -167,6 +167,12 @@ def _clear_code_extra_metadata(code_obj: CodeType) -> bool:
     return _code_extra_fallback.pop(code_obj, None) is not None
 
 
+def _has_cached_skip_decision(code_obj: CodeType) -> bool:
+    # Without the eval-frame hook there is no C fast path to feed.
+    del code_obj
+    return False
+
+
 def _store_modified_code_for_evaluation(
     original_code: CodeType,
     modified_code: CodeType,
@@ -233,6 +239,7 @@ __all__ = [
     "_get_code_extra_metadata",
     "_get_current_eval_frame_address",
     "_get_modified_code_for_evaluation",
+    "_has_cached_skip_decision",
     "_set_thread_trace_func",
     "_should_trace_code_for_eval_frame",
     "_should_trace_code_for_eval_frame_with_frame",
@@ -5,7 +5,7 @@ pure-Python backends do not duplicate the same state classes and helpers.
 """
 
 from cpython.ref cimport Py_INCREF, Py_DECREF
-from cpython.object cimport PyObject
+from cpython.object cimport PyObject, PyTypeObject
 from cpython.exc cimport PyErr_Fetch, PyErr_NormalizeException, PyErr_Restore
 
 import contextvars
@@ -15,6 +15,7 @@ import types
 from typing import Any as TypingAny
 from typing import cast
 
+from dapper._frame_eval.cache_manager import add_breakpoint_generation_listener
 from dapper._frame_eval.cache_manager import get_breakpoints as _get_breakpoints
 from dapper._frame_eval.telemetry import telemetry
 
@@ -29,6 +30,100 @@ _BYTECODE_META_VERSION = 1
 # Cython consumers.
 include "./cpython_compat.pxi"
 
+
+cdef class _CodeExtra:
+    """Per-code-object state stored in the reserved ``co_extra`` slot.
+
+    ``metadata`` holds the modified-code record; ``skip_generation`` is the
+    trace generation at which the code object was found to contain no
+    breakpoint line, letting the eval-frame hook skip it from C.
+    """
+
+    cdef public object metadata
+    cdef public unsigned long skip_generation
+
+
+# C mirror of ``_code_extra_index`` for the hot path (-1 until reserved).
+cdef Py_ssize_t _code_extra_slot = -1
+# Advanced whenever breakpoints are set; cached skips from older generations
+# are ignored.  Starts at 1 so a fresh ``_CodeExtra`` never matches.
+cdef unsigned long _trace_generation = 1
+
+
+def _advance_trace_generation() -> None:
+    """Invalidate every cached skip decision."""
+    global _trace_generation
+    _trace_generation += 1
+
+
+add_breakpoint_generation_listener(_advance_trace_generation)
+
+
+cdef inline bint _has_cached_skip(PyObject *code) noexcept:
+    """Return whether *code* was already found to hold no breakpoint line.
+
+    Runs on every Python call while the hook is installed, so it only reads
+    the ``co_extra`` slot and compares the stored generation.
+    """
+    cdef void *extra = NULL
+
+    if _code_extra_slot < 0:
+        return <bint>False
+    if _dapper_Code_GetExtra_Ptr(code, _code_extra_slot, &extra) < 0 or extra == NULL:
+        return <bint>False
+    if (<PyObject *>extra).ob_type != <PyTypeObject *>_CodeExtra:
+        return <bint>False
+    return <bint>((<_CodeExtra>extra).skip_generation == _trace_generation)
+
+
+cdef _CodeExtra _get_code_extra(object code):
+    cdef void *extra = NULL
+
+    if not _ensure_code_extra_index():
+        return None
+    if _dapper_Code_GetExtra_C(code, _code_extra_slot, &extra) < 0 or extra == NULL:
+        return None
+    if (<PyObject *>extra).ob_type != <PyTypeObject *>_CodeExtra:
+        return None
+    return <_CodeExtra>extra
+
+
+cdef _CodeExtra _get_or_create_code_extra(object code):
+    cdef _CodeExtra holder = _get_code_extra(code)
+
+    if holder is None and _code_extra_slot >= 0:
+        holder = _CodeExtra()
+        Py_INCREF(holder)
+        if _dapper_Code_SetExtra_C(code, _code_extra_slot, <void *>holder) != 0:
+            Py_DECREF(holder)
+            return None
+    return holder
+
+
+cdef void _remember_unbreakable_code(object code_obj, unsigned long generation):
+    """Cache a skip decision when no breakpoint line lies in *code_obj*."""
+    cdef _CodeExtra holder
+    cdef object file_breakpoints
+
+    if not isinstance(code_obj, types.CodeType):
+        return
+    try:
+        file_breakpoints = _get_breakpoints(code_obj.co_filename)
+        if file_breakpoints and not file_breakpoints.isdisjoint(_collect_code_lines(code_obj)):
+            return
+        holder = _get_or_create_code_extra(code_obj)
+        if holder is not None:
+            holder.skip_generation = generation
+    except Exception:
+        pass
+
+
+def _has_cached_skip_decision(object code) -> bool:
+    """Return whether the eval-frame hook would skip *code* without Python calls."""
+    if not isinstance(code, types.CodeType) or not _ensure_code_extra_index():
+        return False
+    return bool(_has_cached_skip(<PyObject *>code))
+
 cdef bint _should_trace_code_for_eval_frame_impl(
     ThreadInfo thread_info,
     code_obj,
@@ -38,6 +133,7 @@ cdef bint _should_trace_code_for_eval_frame_impl(
 ) except -1:
     cdef FuncCodeInfo func_code_info
     cdef object decision
+    cdef unsigned long generation = _trace_generation
 
     try:
         # ask the shared tracer for a decision; this call can raise if the
@@ -88,6 +184,7 @@ cdef bint _should_trace_code_for_eval_frame_impl(
                         # swallow errors; we will simply fallback to tracing later
                         pass
             return <bint>True
+        _remember_unbreakable_code(code_obj, generation)
         return <bint>False
     except Exception:
         pass
@@ -584,11 +681,28 @@ cdef PyObject *get_bytecode_while_frame_eval(
     """
     Main frame evaluation hook.
 
-    This function is called by Python's frame evaluation mechanism and
-    currently delegates back to the previously installed evaluator. The
-    breakpoint-aware interception logic will be added in a later phase.
+    This function is called by Python's frame evaluation mechanism for every
+    frame.  Code objects already known to hold no breakpoint line under the
+    current trace generation go straight back to the previous evaluator with
+    only a ``co_extra`` read and an integer compare: no Python calls and no
+    frame object.  Everything else takes :func:`_eval_frame_slow_path`.
     """
-    cdef _PyFrameEvalFunction fallback_eval
+    cdef _PyFrameEvalFunction fallback_eval = _old_eval_frame
+
+    if fallback_eval is NULL:
+        fallback_eval = _PyEval_EvalFrameDefault
+    if _has_cached_skip(<PyObject *>frame.f_code):
+        return fallback_eval(tstate, frame, exc)
+    return _eval_frame_slow_path(tstate, frame, exc, fallback_eval)
+
+
+cdef PyObject *_eval_frame_slow_path(
+    PyThreadState *tstate,
+    _PyInterpreterFrame *frame,
+    int exc,
+    _PyFrameEvalFunction fallback_eval,
+) noexcept:
+    """Decide in Python whether *frame* takes the debugger path, then run it."""
     cdef ThreadInfo thread_info
     cdef object code_obj
     cdef object frame_obj = None
@@ -605,10 +719,7 @@ cdef PyObject *get_bytecode_while_frame_eval(
     cdef int lineno
     cdef bint trace_installed = <bint>False
     cdef bint restore_exception = <bint>False
-
-    fallback_eval = _old_eval_frame
-    if fallback_eval is NULL:
-        fallback_eval = _PyEval_EvalFrameDefault
+    cdef bint holds_frame_eval = <bint>True
 
     thread_info = <ThreadInfo>_state.get_thread_info()
     if thread_info.inside_frame_eval > 0:
@@ -630,6 +741,10 @@ cdef PyObject *get_bytecode_while_frame_eval(
             frame_obj,
             <bint>True,
         ):
+            # Leave the decision guard before running the frame so the calls
+            # it makes get their own (cached) decisions.
+            thread_info.exit_frame_eval()
+            holds_frame_eval = <bint>False
             return fallback_eval(tstate, frame, exc)
 
         _state.record_slow_path_attempt(True, thread_info.thread_trace_func is not None)
@@ -678,7 +793,8 @@ cdef PyObject *get_bytecode_while_frame_eval(
     finally:
         if trace_installed:
             sys.settrace(previous_trace)
-        thread_info.exit_frame_eval()
+        if holds_frame_eval:
+            thread_info.exit_frame_eval()
         if restore_exception:
             PyErr_Restore(exc_type, exc_value, exc_tb)
 
@@ -741,7 +857,7 @@ def _PyCode_GetExtra(object code, Py_ssize_t index):
 
 
 cdef bint _ensure_code_extra_index() except -1:
-    global _code_extra_index
+    global _code_extra_index, _code_extra_slot
     cdef int code_extra_index
 
     code_extra_index = int(cast(TypingAny, _code_extra_index))
@@ -753,43 +869,49 @@ cdef bint _ensure_code_extra_index() except -1:
     except Exception:
         _code_extra_index = -1
 
-    return <bint>(int(cast(TypingAny, _code_extra_index)) >= 0)
+    code_extra_index = int(cast(TypingAny, _code_extra_index))
+    if code_extra_index >= 0:
+        _code_extra_slot = <Py_ssize_t>code_extra_index
+    return <bint>(code_extra_index >= 0)
 
 
 def _get_code_extra_metadata(object code):
     """Get eval-frame metadata stored directly on a code object."""
-    cdef Py_ssize_t code_extra_index
+    cdef _CodeExtra holder
 
     if not isinstance(code, types.CodeType):
         raise TypeError("code argument must be a code object")
-    if not _ensure_code_extra_index():
-        return None
-    code_extra_index = <Py_ssize_t>_code_extra_index
-    return _PyCode_GetExtra(code, code_extra_index)
+    holder = _get_code_extra(code)
+    return None if holder is None else holder.metadata
 
 
 def _store_code_extra_metadata(object code, object metadata) -> bool:
     """Store eval-frame metadata directly on a code object."""
-    cdef Py_ssize_t code_extra_index
+    cdef _CodeExtra holder
 
     if not isinstance(code, types.CodeType):
         raise TypeError("code argument must be a code object")
     if not _ensure_code_extra_index():
         return False
-    code_extra_index = <Py_ssize_t>_code_extra_index
-    return _PyCode_SetExtra(code, code_extra_index, metadata) == 0
+    holder = _get_or_create_code_extra(code)
+    if holder is None:
+        return False
+    holder.metadata = metadata
+    return True
 
 
 def _clear_code_extra_metadata(object code) -> bool:
     """Remove eval-frame metadata from a code object."""
-    cdef Py_ssize_t code_extra_index
+    cdef _CodeExtra holder
 
     if not isinstance(code, types.CodeType):
         raise TypeError("code argument must be a code object")
     if not _ensure_code_extra_index():
         return False
-    code_extra_index = <Py_ssize_t>_code_extra_index
-    return _PyCode_SetExtra(code, code_extra_index, None) == 0
+    holder = _get_code_extra(code)
+    if holder is not None:
+        holder.metadata = None
+    return True
 
 
 def _store_modified_code_for_evaluation(
@@ -869,6 +991,7 @@ __all__ = [
     "_collect_code_lines",
     "_clear_thread_trace_func",
     "_get_code_extra_metadata",
+    "_has_cached_skip_decision",
     "_dispatch_trace_callback",
     "_get_modified_code_for_evaluation",
     "uninstall_eval_frame_hook",
@@ -0,0 +1,343 @@
+"""Inline breakpoint conditions for Dapper bytecode instrumentation.
+
+A conditional breakpoint normally costs a debugger callback plus an
+``eval`` of its condition on every hit.  For simple conditions over local
+variables (``n == 999_999``, ``n % 1000 == 0``, ``not done``) the test can
+instead be spliced into the instrumented code object in front of the
+breakpoint call, so the debugger is only entered once the condition holds.
+
+A guard is laid out as::
+
+    NOP            <guard length>     marker read back by remove_breakpoints()
+    <call condition(*locals)>         as compiled by CPython itself
+    POP_JUMP_*     <call length>      skips the breakpoint call when false
+    <breakpoint call sequence>
+
+The condition is compiled into a small function of the locals it reads,
+held as a constant of the instrumented code.  That function never raises
+and never runs user code: when an operand is not one of the builtin
+scalars in ``_SAFE_TYPES`` (whose ``__eq__``, ``__add__``, ``__bool__`` and
+so on could be user methods), or the evaluation fails, it returns true and
+the breakpoint call evaluates the condition the regular way.  The call and
+the jump are taken from a template function compiled with the running
+interpreter, so opcode names, inline caches and ``TO_BOOL`` conversions
+always match the interpreter.  Every name must be a plain local variable
+that is bound on every path to the breakpoint line; anything else returns
+``None`` and keeps the regular evaluated path.
+
+Only straight-line code before the first branch, loop or ``try`` can be
+inlined.  The code object rebuild does not relocate jumps or exception
+tables, so a breakpoint inside a loop body, after an ``if`` whose jump
+crosses it, or in a ``try`` block is not instrumented at all and keeps the
+traced path; loop-carried locals such as ``i`` in ``for i in ...`` never
+get an inline guard.
+"""
+
+from __future__ import annotations
+
+import ast
+import dis
+import textwrap
+from typing import TYPE_CHECKING
+
+from dapper._frame_eval._bytecode_instructions import get_instructions
+from dapper._frame_eval._bytecode_instructions import make_instruction
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Collection
+    from types import CodeType
+
+# NOP carrying the guard length (in instructions) as its argument.  The
+# compiler only ever emits NOP with argument 0, so the marker is unambiguous.
+GUARD_MARKER_OPNAME = "NOP"
+_NOP = dis.opmap["NOP"]
+
+# Deepest value stack an inlined condition may need.
+MAX_CONDITION_DEPTH = 8
+_MAX_ARG = 0xFF
+
+_COMPARE_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Is, ast.IsNot)
+_ARITHMETIC_OPS = (ast.Add, ast.Sub, ast.Mult)
+_DIVISION_OPS = (ast.Mod, ast.FloorDiv)
+_UNARY_OPS = (ast.Not, ast.USub, ast.UAdd)
+_CONSTANT_TYPES = (int, float, str, bytes, bool, type(None))
+# Operand types the condition function evaluates; none of their operators
+# can call back into user code.
+_SAFE_TYPES = _CONSTANT_TYPES
+# Prefix of the names the condition function uses for itself.
+_RESERVED_PREFIX = "__dapper_"
+_CONDITION_PARAM = f"{_RESERVED_PREFIX}condition"
+
+# Opcodes the call of the condition function may consist of, besides
+# loading it and the locals; anything else is rejected.
+_CALL_OPNAMES = frozenset({"CACHE", "PUSH_NULL", "PRECALL", "CALL", "CALL_FUNCTION", "TO_BOOL"})
+_LOCAL_LOAD_OPNAMES = frozenset(
+    {
+        "LOAD_FAST",
+        "LOAD_FAST_CHECK",
+        "LOAD_FAST_BORROW",
+        "LOAD_FAST_LOAD_FAST",
+        "LOAD_FAST_BORROW_LOAD_FAST_BORROW",
+    }
+)
+# 3.12+ LOAD_FAST trusts the compiler's proof that the local is bound; the
+# guard's own proof is more conservative, but it keeps the checking variant
+# where it exists.
+_LOAD_LOCAL_OPNAME = "LOAD_FAST_CHECK" if "LOAD_FAST_CHECK" in dis.opmap else "LOAD_FAST"
+_LOAD_LOCAL = dis.opmap[_LOAD_LOCAL_OPNAME]
+_LOAD_CONST = dis.opmap["LOAD_CONST"]
+_STORE_OPNAME_PREFIX = "STORE_FAST"
+_JUMP_OPCODES = frozenset(dis.hasjrel) | frozenset(dis.hasjabs)
+
+
+def _stack_depth(node: ast.AST) -> int | None:  # noqa: PLR0911
+    """Return the stack depth *node* needs, or ``None`` if it is not inlinable."""
+    if isinstance(node, ast.Name):
+        return 1 if isinstance(node.ctx, ast.Load) else None
+    if isinstance(node, ast.Constant):
+        return 1 if isinstance(node.value, _CONSTANT_TYPES) else None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, _UNARY_OPS):
+        return _stack_depth(node.operand)
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, _DIVISION_OPS):
+            # Only by a non-zero numeric constant, so it cannot raise.
+            right = node.right
+            if not (
+                isinstance(right, ast.Constant)
+                and type(right.value) in (int, float)
+                and right.value != 0
+            ):
+                return None
+        elif not isinstance(node.op, _ARITHMETIC_OPS):
+            return None
+        left, right_depth = _stack_depth(node.left), _stack_depth(node.right)
+        if left is None or right_depth is None:
+            return None
+        return max(left, right_depth + 1)
+    if isinstance(node, ast.Compare):
+        # Chained comparisons compile to jumps of their own.
+        if len(node.ops) != 1 or not isinstance(node.ops[0], _COMPARE_OPS):
+            return None
+        left, right_depth = _stack_depth(node.left), _stack_depth(node.comparators[0])
+        if left is None or right_depth is None:
+            return None
+        return max(left, right_depth + 1)
+    return None
+
+
+def parse_inline_condition(expression: str) -> tuple[ast.Expression, int] | None:
+    """Parse *expression* if it can be inlined; return its AST and stack depth."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except (SyntaxError, ValueError):
+        return None
+    depth = _stack_depth(tree.body)
+    if depth is None or depth > MAX_CONDITION_DEPTH:
+        return None
+    return tree, depth
+
+
+def _first_handled_offset(code_obj: CodeType) -> int | None:
+    """Return the first offset covered by an exception handler (3.11+)."""
+    try:
+        entries = getattr(dis.Bytecode(code_obj), "exception_entries", None) or ()
+    except Exception:
+        return 0
+    return min((entry.start for entry in entries), default=None)
+
+
+def bound_locals(code_obj: CodeType, instructions: list[dis.Instruction], index: int) -> set[str]:
+    """Return the locals of *code_obj* that are bound on every path to *index*.
+
+    Arguments always count.  Other locals count when a ``STORE_FAST*``
+    precedes *index* in the straight-line code every call runs first: up to
+    the first jump, jump target or instruction covered by an exception
+    handler.  A store in an ``if`` branch, a loop or a ``try`` body does not
+    count, since some path reaches *index* without it.  Locals that are
+    ever deleted, and cell variables, never count.
+    """
+    arg_count = code_obj.co_argcount + code_obj.co_kwonlyargcount
+    arg_count += bool(code_obj.co_flags & 0x04) + bool(code_obj.co_flags & 0x08)
+    bound = set(code_obj.co_varnames[:arg_count])
+    handled = _first_handled_offset(code_obj)
+    straight = True
+    deleted: set[str] = set()
+    for position, instr in enumerate(instructions):
+        if instr.opname == "DELETE_FAST":
+            deleted.add(instr.argval)
+        if not straight or position >= index:
+            continue
+        if instr.is_jump_target or (handled is not None and instr.offset >= handled):
+            straight = False
+        elif instr.opname.startswith(_STORE_OPNAME_PREFIX):
+            argval = instr.argval
+            bound.update(argval if isinstance(argval, tuple) else (argval,))
+        elif instr.opcode in _JUMP_OPCODES:
+            straight = False
+    return bound - deleted - set(code_obj.co_cellvars) - set(code_obj.co_freevars)
+
+
+def _condition_function(expression: str, names: list[str]) -> Callable[..., bool] | None:
+    """Compile *expression* into a function of *names* that never raises.
+
+    It returns true, leaving the decision to the regular evaluated path,
+    when an operand is not of a type in ``_SAFE_TYPES`` or the evaluation
+    fails.
+    """
+    checks = " and ".join(
+        f"{_RESERVED_PREFIX}type_ is not {_RESERVED_PREFIX}safe{i}"
+        for i in range(len(_SAFE_TYPES))
+    )
+    lines = [f"def {_RESERVED_PREFIX}condition({', '.join(names)}):"]
+    for name in names:
+        lines.append(f"    {_RESERVED_PREFIX}type_ = {_RESERVED_PREFIX}type({name})")
+        lines.append(f"    if {checks}:")
+        lines.append("        return True")
+    lines.append("    try:")
+    lines.append(f"        return True if ({expression}) else False")
+    lines.append("    except Exception:")
+    lines.append("        return True")
+    namespace: dict[str, object] = {f"{_RESERVED_PREFIX}type": type}
+    namespace.update({f"{_RESERVED_PREFIX}safe{i}": t for i, t in enumerate(_SAFE_TYPES)})
+    try:
+        exec(compile("\n".join(lines), "<dapper-condition>", "exec"), namespace)
+    except SyntaxError:
+        return None
+    return namespace[_CONDITION_PARAM]  # type: ignore[return-value]
+
+
+def _template_instructions(names: list[str]) -> list[dis.Instruction] | None:
+    """Compile a call of the condition function as an ``if`` test."""
+    arguments = ", ".join(names)
+    source = textwrap.dedent(
+        f"""\
+        def _dapper_guard({_CONDITION_PARAM}, {arguments}):
+            if {_CONDITION_PARAM}({arguments}):
+                _dapper_breakpoint(0)
+        """
+    )
+    namespace: dict[str, object] = {}
+    try:
+        exec(compile(source, "<dapper-guard>", "exec"), namespace)
+    except SyntaxError:
+        return None
+    guard = namespace["_dapper_guard"]
+    return get_instructions(guard.__code__)  # type: ignore[attr-defined]
+
+
+def compile_condition_guard(  # noqa: PLR0911, PLR0912
+    code_obj: CodeType,
+    expression: str,
+    bound_names: Collection[str],
+    call_units: int,
+) -> tuple[list[dis.Instruction], int] | None:
+    """Build the guard placed in front of a breakpoint call in *code_obj*.
+
+    *call_units* is the length, in code units, of the breakpoint call
+    sequence the guard skips.  Returns the guard instructions and the stack
+    depth they need, or ``None`` when *expression* has to be evaluated the
+    regular way.
+    """
+    parsed = parse_inline_condition(expression)
+    if parsed is None or call_units > _MAX_ARG:
+        return None
+    tree, _depth = parsed
+    names = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)})
+    varnames = code_obj.co_varnames
+    if any(
+        name not in bound_names or name not in varnames or name.startswith(_RESERVED_PREFIX)
+        for name in names
+    ):
+        return None
+    condition = _condition_function(expression.strip(), names)
+    template = _template_instructions(names)
+    if condition is None or template is None:
+        return None
+
+    body: list[dis.Instruction] = []
+    position = 0
+    if template and template[0].opname == "RESUME":
+        position = 1
+    while position < len(template):
+        instr = template[position]
+        position += 1
+        if instr.opname.startswith("POP_JUMP"):
+            jump = instr
+            break
+        if instr.opname in _LOCAL_LOAD_OPNAMES:
+            loaded = instr.argval if isinstance(instr.argval, tuple) else (instr.argval,)
+            for name in loaded:
+                if name == _CONDITION_PARAM:
+                    # Re-resolved against the instrumented code's constants.
+                    body.append(
+                        make_instruction(
+                            opname="LOAD_CONST",
+                            opcode=_LOAD_CONST,
+                            arg=-1,
+                            argval=condition,
+                            argrepr=repr(expression),
+                            offset=0,
+                            starts_line=None,
+                        )
+                    )
+                    continue
+                local_index = varnames.index(name)
+                if local_index > _MAX_ARG:
+                    return None
+                body.append(
+                    make_instruction(
+                        opname=_LOAD_LOCAL_OPNAME,
+                        opcode=_LOAD_LOCAL,
+                        arg=local_index,
+                        argval=name,
+                        argrepr=name,
+                        offset=0,
+                        starts_line=None,
+                    )
+                )
+        elif instr.opname in _CALL_OPNAMES:
+            body.append(instr)
+        else:
+            return None
+    else:
+        return None
+
+    jump_caches: list[dis.Instruction] = []
+    while position < len(template) and template[position].opname == "CACHE":
+        jump_caches.append(template[position])
+        position += 1
+
+    guard = [*body, jump._replace(arg=call_units), *jump_caches]
+    if len(guard) > _MAX_ARG:
+        return None
+    marker = make_instruction(
+        opname=GUARD_MARKER_OPNAME,
+        opcode=_NOP,
+        arg=len(guard),
+        argval=None,
+        argrepr="",
+        offset=0,
+        starts_line=None,
+    )
+    # The condition function, an optional NULL and the locals it is passed.
+    return [marker, *guard], len(names) + 2
+
+
+def guard_length(code_obj: CodeType, instructions: list[dis.Instruction], index: int) -> int:
+    """Return the guard length (marker included) starting at *index*, or ``0``."""
+    instr = instructions[index]
+    if instr.opname != GUARD_MARKER_OPNAME:
+        return 0
+    # dis reports no argument for NOP, so read the marker from the code.
+    length = code_obj.co_code[instr.offset + 1]
+    return length + 1 if length and index + length < len(instructions) else 0
+
+
+__all__ = [
+    "MAX_CONDITION_DEPTH",
+    "bound_locals",
+    "compile_condition_guard",
+    "guard_length",
+    "parse_inline_condition",
+]
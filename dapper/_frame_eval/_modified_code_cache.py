@@ -0,0 +1,259 @@
+"""Bounded, weak-keyed cache of instrumented code objects.
+
+:class:`~dapper._frame_eval.modify_bytecode.BytecodeModifier` produces one
+rebuilt code object per *(original code object, breakpoint fingerprint)*
+pair.  Keeping every variant forever makes memory grow while breakpoints are
+toggled during a long session, so this cache:
+
+* references the original code object weakly — variants vanish as soon as the
+  original is garbage collected;
+* keeps at most ``max_variants_per_code`` fingerprints per original (LRU);
+* keeps at most ``max_entries`` variants overall (global LRU), reporting
+  each evicted variant to ``on_evict`` so copies kept elsewhere (the
+  code-extra slot) can be released too;
+* tracks an estimate of the bytes retained by cached variants.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import functools
+import sys
+import threading
+from typing import TYPE_CHECKING
+from typing import TypedDict
+import weakref
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType
+
+DEFAULT_MAX_VARIANTS_PER_CODE = 4
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ModifiedCodeCacheStats(TypedDict):
+    """Snapshot of :class:`ModifiedCodeCache` occupancy and churn."""
+
+    cached_code_objects: int
+    unique_origins: int
+    max_entries: int
+    max_variants_per_code: int
+    estimated_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    collected_origins: int
+
+
+def fingerprint_lines(breakpoint_lines: set[int] | frozenset[int]) -> int:
+    """Return the cache fingerprint for a breakpoint-line set."""
+    return hash(tuple(sorted(breakpoint_lines)))
+
+
+def estimate_code_size(code_obj: CodeType) -> int:
+    """Return a rough byte estimate for the storage owned by *code_obj*."""
+    size = sys.getsizeof(code_obj) + sys.getsizeof(code_obj.co_consts)
+    for attr in ("co_linetable", "co_exceptiontable"):
+        value = getattr(code_obj, attr, None)
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size
+
+
+class _OriginEntry:
+    """Cached variants for a single original code object."""
+
+    __slots__ = ("filename", "ref", "variants")
+
+    def __init__(self, ref: weakref.ref[CodeType], filename: str) -> None:
+        self.ref = ref
+        self.filename = filename
+        # fingerprint -> (modified code, estimated size); most recent last
+        self.variants: OrderedDict[int, tuple[CodeType, int]] = OrderedDict()
+
+
+class ModifiedCodeCache:
+    """LRU cache mapping ``(original code, fingerprint)`` to modified code."""
+
+    def __init__(
+        self,
+        max_variants_per_code: int = DEFAULT_MAX_VARIANTS_PER_CODE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        on_evict: Callable[[CodeType, CodeType], None] | None = None,
+    ) -> None:
+        self.max_variants_per_code = max(1, max_variants_per_code)
+        self.max_entries = max(1, max_entries)
+        # Called as on_evict(original, variant) for every LRU eviction.
+        self.on_evict = on_evict
+        self._lock = threading.RLock()
+        # id(original) -> entry; the entry holds a weakref to the original
+        self._origins: dict[int, _OriginEntry] = {}
+        # global recency order of (id(original), fingerprint)
+        self._order: OrderedDict[tuple[int, int], None] = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "collected_origins": 0}
+
+    # ------------------------------------------------------------------
+    # Lookup / storage
+    # ------------------------------------------------------------------
+
+    def get(self, code_obj: CodeType, fingerprint: int) -> CodeType | None:
+        """Return the cached variant for *fingerprint*, refreshing its recency."""
+        with self._lock:
+            entry = self._live_entry(code_obj)
+            if entry is None or fingerprint not in entry.variants:
+                self._stats["misses"] += 1
+                return None
+            entry.variants.move_to_end(fingerprint)
+            self._order.move_to_end((id(code_obj), fingerprint))
+            self._stats["hits"] += 1
+            return entry.variants[fingerprint][0]
+
+    def put(self, code_obj: CodeType, fingerprint: int, modified_code: CodeType) -> None:
+        """Store *modified_code* and evict least recently used variants."""
+        with self._lock:
+            key = id(code_obj)
+            entry = self._live_entry(code_obj)
+            if entry is None:
+                # a stale entry can only survive if its callback has not run yet
+                self._drop_origin(key)
+                ref = weakref.ref(code_obj, functools.partial(self._on_origin_collected, key))
+                entry = _OriginEntry(ref, getattr(code_obj, "co_filename", ""))
+                self._origins[key] = entry
+
+            previous = entry.variants.pop(fingerprint, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            size = estimate_code_size(modified_code)
+            entry.variants[fingerprint] = (modified_code, size)
+            self._bytes += size
+            self._order[(key, fingerprint)] = None
+            self._order.move_to_end((key, fingerprint))
+
+            while len(entry.variants) > self.max_variants_per_code:
+                self._evict(key, next(iter(entry.variants)))
+            while len(self._order) > self.max_entries:
+                self._evict(*next(iter(self._order)))
+
+    def discard(self, code_obj: CodeType, fingerprint: int) -> bool:
+        """Remove a single fingerprint variant for *code_obj*."""
+        with self._lock:
+            if self._live_entry(code_obj) is None:
+                return False
+            return self._drop(id(code_obj), fingerprint)
+
+    def pop_origin(self, code_obj: CodeType) -> int:
+        """Remove every variant of *code_obj*; return how many were dropped."""
+        with self._lock:
+            entry = self._live_entry(code_obj)
+            if entry is None:
+                return 0
+            return self._drop_origin(id(code_obj))
+
+    def invalidate_file(self, filepath: str) -> tuple[int, list[CodeType]]:
+        """Evict every variant whose original belongs to *filepath*.
+
+        Returns the number of evicted variants and the originals that lost
+        them, so callers can clear related per-code metadata.
+        """
+        removed = 0
+        emptied: list[CodeType] = []
+        with self._lock:
+            for key, entry in list(self._origins.items()):
+                if entry.filename != filepath:
+                    continue
+                code_obj = entry.ref()
+                if code_obj is None:
+                    continue
+                removed += self._drop_origin(key)
+                emptied.append(code_obj)
+        return removed, emptied
+
+    def clear(self) -> None:
+        """Drop every cached variant."""
+        with self._lock:
+            self._origins.clear()
+            self._order.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, code_obj: object) -> bool:
+        entry = self._origins.get(id(code_obj))
+        return entry is not None and entry.ref() is code_obj
+
+    def fingerprints(self, code_obj: CodeType) -> list[int]:
+        """Return cached fingerprints for *code_obj*, least recent first."""
+        with self._lock:
+            entry = self._live_entry(code_obj)
+            return list(entry.variants) if entry is not None else []
+
+    def get_stats(self) -> ModifiedCodeCacheStats:
+        """Return occupancy, memory estimate and churn counters."""
+        with self._lock:
+            return {
+                "cached_code_objects": len(self._order),
+                "unique_origins": len(self._origins),
+                "max_entries": self.max_entries,
+                "max_variants_per_code": self.max_variants_per_code,
+                "estimated_bytes": self._bytes,
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "evictions": self._stats["evictions"],
+                "collected_origins": self._stats["collected_origins"],
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds ``_lock``)
+    # ------------------------------------------------------------------
+
+    def _live_entry(self, code_obj: CodeType) -> _OriginEntry | None:
+        entry = self._origins.get(id(code_obj))
+        if entry is None or entry.ref() is not code_obj:
+            return None
+        return entry
+
+    def _evict(self, key: int, fingerprint: int) -> None:
+        entry = self._origins.get(key)
+        variant = None if entry is None else entry.variants.get(fingerprint)
+        original = None if entry is None else entry.ref()
+        self._drop(key, fingerprint)
+        self._stats["evictions"] += 1
+        if self.on_evict is not None and variant is not None and original is not None:
+            self.on_evict(original, variant[0])
+
+    def _drop(self, key: int, fingerprint: int) -> bool:
+        entry = self._origins.get(key)
+        if entry is None:
+            return False
+        variant = entry.variants.pop(fingerprint, None)
+        self._order.pop((key, fingerprint), None)
+        if variant is None:
+            return False
+        self._bytes -= variant[1]
+        if not entry.variants:
+            del self._origins[key]
+        return True
+
+    def _drop_origin(self, key: int) -> int:
+        entry = self._origins.get(key)
+        if entry is None:
+            return 0
+        count = len(entry.variants)
+        for fp in list(entry.variants):
+            self._drop(key, fp)
+        return count
+
+    def _on_origin_collected(self, key: int, ref: weakref.ref[CodeType]) -> None:
+        with self._lock:
+            entry = self._origins.get(key)
+            if entry is None or entry.ref is not ref:
+                return
+            self._drop_origin(key)
+            self._stats["collected_origins"] += 1
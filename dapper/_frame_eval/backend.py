@@ -20,6 +20,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from dapper._frame_eval.debugger_integration import IntegrationStatistics
 
 
@@ -47,6 +49,15 @@ class FrameEvalBackend(ABC):
     ) -> None:  # pragma: no cover - interface
         """Notify backend of breakpoint set changes for a file."""
 
+    def update_breakpoints_batch(self, updates: Mapping[str, set[int]]) -> None:
+        """Notify backend of breakpoint changes for several files at once.
+
+        The default applies each file in turn; backends with a costly
+        per-update refresh should override this to refresh only once.
+        """
+        for filepath, lines in updates.items():
+            self.update_breakpoints(filepath, lines)
+
     @abstractmethod
     def set_stepping(self, mode: Any) -> None:  # pragma: no cover - interface
         """Set the current stepping mode (STEP_IN, STEP_OVER, etc.)."""
@@ -28,6 +28,7 @@ from dapper.common.constants import DEFAULT_CACHE_TTL
 from dapper.common.constants import DEFAULT_MAX_RECURSION_DEPTH
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
     import os
     from types import CodeType
@@ -856,6 +857,42 @@ def get_breakpoints(filepath: str) -> set[int] | None:
 def set_breakpoints(filepath: str, breakpoints: Iterable[int]) -> None:
     """Cache breakpoints for a file."""
     _caches.breakpoint.set_breakpoints(filepath, breakpoints)
+    _bump_breakpoint_generation()
+
+
+# Trace decisions cached on code objects (the eval-frame ``co_extra`` fast
+# path) only ever record "no breakpoint can fire here".  Setting breakpoints is
+# the only change that can invalidate such a decision; invalidation, eviction
+# and clearing only remove breakpoints, so they leave the generation alone.
+_breakpoint_generation = 0
+_breakpoint_generation_listeners: list[Callable[[], None]] = []
+
+
+def get_breakpoint_generation() -> int:
+    """Return a counter that increases every time breakpoints are set."""
+    return _breakpoint_generation
+
+
+def add_breakpoint_generation_listener(listener: Callable[[], None]) -> None:
+    """Call *listener* whenever the breakpoint generation advances."""
+    if listener not in _breakpoint_generation_listeners:
+        _breakpoint_generation_listeners.append(listener)
+
+
+def remove_breakpoint_generation_listener(listener: Callable[[], None]) -> bool:
+    """Stop calling *listener*; return True if it was registered."""
+    try:
+        _breakpoint_generation_listeners.remove(listener)
+    except ValueError:
+        return False
+    return True
+
+
+def _bump_breakpoint_generation() -> None:
+    global _breakpoint_generation  # noqa: PLW0603
+    _breakpoint_generation += 1
+    for listener in tuple(_breakpoint_generation_listeners):
+        listener()
 
 
 def set_cached_code(original_code: CodeType, modified_code: CodeType) -> None:
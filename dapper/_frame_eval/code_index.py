@@ -0,0 +1,163 @@
+"""Filename → live code-object index for eager bytecode instrumentation.
+
+Eager instrumentation needs to find every code object that belongs to a
+source file whenever breakpoints for that file change.  Scanning
+``sys.modules`` for that purpose is expensive (every attribute of every
+loaded module) and only ever sees top-level functions.
+
+:class:`CodeObjectIndex` instead records code objects as they are observed:
+
+* from the eval-frame / selective-tracer decision path and from
+  ``sys.monitoring`` ``PY_START`` callbacks (:meth:`CodeObjectIndex.register`);
+* from a one-time :func:`gc.get_objects` sweep that picks up functions that
+  exist but have not run yet (:meth:`CodeObjectIndex.seed_from_gc`).
+
+Nested code objects (methods defined in class bodies, closures, lambdas,
+comprehensions) are discovered by walking ``co_consts`` so a lookup for a
+file returns *all* code objects compiled from it.
+
+Entries are weakly referenced: a code object that is garbage collected drops
+out of the index automatically.  Membership tests are keyed by ``id()`` so the
+hot registration path does not allocate a weak reference for code objects
+that are already known.
+"""
+
+from __future__ import annotations
+
+import functools
+import gc
+import threading
+from types import CodeType
+from types import FunctionType
+import weakref
+
+
+class CodeObjectIndex:
+    """Weakly-referenced mapping of ``co_filename`` to live code objects."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # filename -> {id(code): weakref(code)}
+        self._by_file: dict[str, dict[int, weakref.ref[CodeType]]] = {}
+        # id(code) -> filename, for O(1) "already known" checks
+        self._known: dict[int, str] = {}
+        self._seeded = False
+        self._stats = {
+            "registrations": 0,
+            "gc_seed_runs": 0,
+            "gc_seeded_code_objects": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    def register(self, code_obj: CodeType) -> None:
+        """Record *code_obj* and any nested code objects in its constants.
+
+        Cheap for code objects that are already indexed, so it can be called
+        from per-call hooks.
+        """
+        if id(code_obj) in self._known:
+            return
+        with self._lock:
+            self._register_tree(code_obj)
+
+    def seed_from_gc(self, *, force: bool = False) -> int:
+        """Index code objects of every live function found by the GC.
+
+        Runs only once per index unless *force* is set.  Returns the number of
+        newly indexed code objects.
+        """
+        with self._lock:
+            if self._seeded and not force:
+                return 0
+            self._seeded = True
+            self._stats["gc_seed_runs"] += 1
+
+            before = len(self._known)
+            for obj in gc.get_objects():
+                # exact type checks: mocks with ``spec=CodeType`` pass isinstance
+                obj_type = type(obj)
+                if obj_type is FunctionType:
+                    code_obj = obj.__code__
+                elif obj_type is CodeType:
+                    code_obj = obj
+                else:
+                    continue
+                if type(code_obj) is CodeType and id(code_obj) not in self._known:
+                    self._register_tree(code_obj)
+            added = len(self._known) - before
+            self._stats["gc_seeded_code_objects"] += added
+            return added
+
+    def _register_tree(self, root: CodeType) -> None:
+        """Register *root* and its nested code objects.  Caller holds the lock."""
+        pending = [root]
+        while pending:
+            code_obj = pending.pop()
+            key = id(code_obj)
+            if key in self._known:
+                continue
+            filename = code_obj.co_filename
+            try:
+                ref = weakref.ref(code_obj, functools.partial(self._discard, key, filename))
+            except TypeError:
+                continue
+            self._by_file.setdefault(filename, {})[key] = ref
+            self._known[key] = filename
+            self._stats["registrations"] += 1
+            pending.extend(const for const in code_obj.co_consts if type(const) is CodeType)
+
+    def _discard(self, key: int, filename: str, ref: weakref.ref[CodeType]) -> None:
+        """Weakref callback: drop a collected code object from the index."""
+        with self._lock:
+            file_entries = self._by_file.get(filename)
+            if file_entries is not None and file_entries.get(key) is ref:
+                del file_entries[key]
+                if not file_entries:
+                    del self._by_file[filename]
+                self._known.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_code_objects(self, filename: str) -> list[CodeType]:
+        """Return the live code objects compiled from *filename*."""
+        with self._lock:
+            refs = list(self._by_file.get(filename, {}).values())
+        return [code_obj for ref in refs if (code_obj := ref()) is not None]
+
+    def is_seeded(self) -> bool:
+        """Return whether the one-time GC sweep has already run."""
+        return self._seeded
+
+    def clear(self) -> None:
+        """Forget all indexed code objects and allow reseeding."""
+        with self._lock:
+            self._by_file.clear()
+            self._known.clear()
+            self._seeded = False
+
+    def get_stats(self) -> dict[str, int]:
+        """Return index size and population counters."""
+        with self._lock:
+            return {
+                **self._stats,
+                "indexed_files": len(self._by_file),
+                "indexed_code_objects": len(self._known),
+            }
+
+
+_code_object_index = CodeObjectIndex()
+
+
+def get_code_object_index() -> CodeObjectIndex:
+    """Return the process-wide code-object index."""
+    return _code_object_index
+
+
+def register_code_object(code_obj: CodeType) -> None:
+    """Record *code_obj* (and its nested code) in the global index."""
+    _code_object_index.register(code_obj)
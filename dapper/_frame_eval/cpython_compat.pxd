@@ -92,4 +92,9 @@ cdef extern from *:
     )
     Py_ssize_t _dapper_RequestCodeExtraIndex_C "_dapper_RequestCodeExtraIndex"(freefunc)
     int _dapper_Code_SetExtra_C "_dapper_Code_SetExtra"(object code, Py_ssize_t index, void *extra)
-    int _dapper_Code_GetExtra_C "_dapper_Code_GetExtra"(object code, Py_ssize_t index, void **extra)
\ No newline at end of file
+    int _dapper_Code_GetExtra_C "_dapper_Code_GetExtra"(object code, Py_ssize_t index, void **extra)
+    int _dapper_Code_GetExtra_Ptr "_dapper_Code_GetExtra"(
+        PyObject *code,
+        Py_ssize_t index,
+        void **extra,
+    ) noexcept
@@ -13,7 +13,6 @@ import pathlib
 import sys
 import threading
 import time
-from types import CodeType
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -32,6 +31,8 @@ from dapper._frame_eval.cache_manager import CacheStatistics
 from dapper._frame_eval.cache_manager import clear_all_caches
 from dapper._frame_eval.cache_manager import get_cache_statistics
 from dapper._frame_eval.cache_manager import set_func_code_info
+from dapper._frame_eval.code_index import CodeObjectIndex
+from dapper._frame_eval.code_index import get_code_object_index
 from dapper._frame_eval.modify_bytecode import BytecodeModifier
 from dapper._frame_eval.modify_bytecode import inject_breakpoint_bytecode
 from dapper._frame_eval.selective_tracer import _decision_should_trace
@@ -43,6 +44,7 @@ from dapper._frame_eval.selective_tracer import update_breakpoints
 from dapper._frame_eval.telemetry import FrameEvalTelemetrySnapshot
 from dapper._frame_eval.telemetry import get_frame_eval_telemetry
 from dapper._frame_eval.telemetry import telemetry
+from dapper.core.line_index import code_object_lines
 
 # Check module availability
 debugger_bdb_available = importlib.util.find_spec("dapper.core.debugger_bdb") is not None
@@ -60,6 +62,9 @@ class FrameEvalConfigDict(TypedDict):
     fallback_on_error: bool
     # see :meth:`_apply_bytecode_optimizations` for eager vs lazy notes
     eager_instrumentation: bool
+    # compile simple breakpoint conditions into the instrumented code;
+    # straight-line code only, loops and branches keep the traced path
+    inline_conditions: bool
 
 
 # Backward-compatibility alias for external imports/tests.
@@ -97,15 +102,22 @@ class DebuggerFrameEvalBridge:
             # every time breakpoints update; otherwise instrumentation is
             # deferred until the eval-frame slow-path decision occurs.
             "eager_instrumentation": False,
+            # when True, simple conditions over locals (``n == 500``) are
+            # tested inline and the debugger is only entered when they hold.
+            # Only straight-line code before any branch or loop qualifies;
+            # breakpoints inside loops keep the traced path.
+            "inline_conditions": False,
         }
 
         self.bytecode_modifier = BytecodeModifier()
+        self.code_index: CodeObjectIndex = get_code_object_index()
         self.original_trace_functions = {}
         self.integration_stats = {
             "integrations_enabled": 0,
             "breakpoints_optimized": 0,
             "trace_calls_saved": 0,
             "bytecode_injections": 0,
+            "bytecode_eager_instrumentation": 0,
             "errors_handled": 0,
         }
         self._lock = threading.RLock()
@@ -375,11 +387,20 @@ class DebuggerFrameEvalBridge:
             breakpoint_lines = {line for bp in breakpoints if (line := bp.get("line")) is not None}
             if not breakpoint_lines:
                 return
+            conditions = None
+            if self.config.get("inline_conditions"):
+                conditions = {
+                    bp["line"]: bp["condition"]
+                    for bp in breakpoints
+                    if bp.get("line") is not None and bp.get("condition")
+                }
 
             # optionally attempt live-object instrumentation if configured
             if self.config.get(
                 "eager_instrumentation"
-            ) and self._instrument_live_code_objects_for_file(filepath, breakpoint_lines):
+            ) and self._instrument_live_code_objects_for_file(
+                filepath, breakpoint_lines, conditions
+            ):
                 self.integration_stats["bytecode_eager_instrumentation"] += 1
                 return
 
@@ -389,7 +410,7 @@ class DebuggerFrameEvalBridge:
                     source_code = f.read()
 
                 code_obj = compile(source_code, filepath, "exec")
-                modified_code = inject_breakpoint_bytecode(code_obj, breakpoint_lines)
+                modified_code = inject_breakpoint_bytecode(code_obj, breakpoint_lines, conditions)
                 if modified_code:
                     self.integration_stats["bytecode_injections"] += 1
                     set_func_code_info(
@@ -407,38 +428,46 @@ class DebuggerFrameEvalBridge:
             telemetry.record_bytecode_optimization_failed()
 
     def _instrument_live_code_objects_for_file(
-        self, _filepath: str, breakpoint_lines: set[int]
+        self,
+        _filepath: str,
+        breakpoint_lines: set[int],
+        conditions: dict[int, str] | None = None,
     ) -> bool:
-        """Scan loaded modules for code objects originating from *_filepath*.
+        """Instrument indexed live code objects originating from *_filepath*.
+
+        Code objects are looked up in the filename → code-object index, which
+        is fed by eval-frame / ``PY_START`` entry and seeded once from the GC,
+        so the cost is proportional to the code objects of this file and
+        methods, closures and lambdas are covered as well as top-level
+        functions.  Only code objects whose own lines carry a breakpoint are
+        rewritten.
 
         Returns True if at least one code object was successfully instrumented.
         """
         assert _filepath
 
+        index = self.code_index
+        if not index.is_seeded():
+            index.seed_from_gc()
+
         modified_any = False
-        for module in list(sys.modules.values()):
-            if not hasattr(module, "__dict__"):
+        for code_obj in index.get_code_objects(_filepath):
+            try:
+                own_lines = code_object_lines(code_obj)
+            except Exception:
+                own_lines = frozenset({code_obj.co_firstlineno})
+            target_lines = breakpoint_lines & own_lines
+            if not target_lines:
                 continue
-            for obj in module.__dict__.values():
-                code_obj = None
-                if hasattr(obj, "__code__"):
-                    code_obj = obj.__code__
-                elif isinstance(obj, CodeType):
-                    code_obj = obj
-                else:
-                    continue
-
-                if getattr(code_obj, "co_filename", "") != _filepath:
-                    continue
-
-                success, modified = _bytecode_modifier.inject_breakpoints(
-                    code_obj, breakpoint_lines
+
+            success, modified = _bytecode_modifier.inject_breakpoints(
+                code_obj, target_lines, conditions=conditions
+            )
+            if success and modified is not code_obj:
+                set_func_code_info(
+                    code_obj, {"modified_code": modified, "breakpoints": target_lines}
                 )
-                if success and modified is not code_obj:
-                    set_func_code_info(
-                        code_obj, {"modified_code": modified, "breakpoints": breakpoint_lines}
-                    )
-                    modified_any = True
+                modified_any = True
         if modified_any:
             telemetry.record_bytecode_eager_instrumentation(filepath=_filepath)
         return modified_any
@@ -531,12 +560,14 @@ class DebuggerFrameEvalBridge:
                 "performance_monitoring": True,
                 "fallback_on_error": True,
                 "eager_instrumentation": False,
+                "inline_conditions": False,
             }
             self.integration_stats = {
                 "integrations_enabled": 0,
                 "breakpoints_optimized": 0,
                 "trace_calls_saved": 0,
                 "bytecode_injections": 0,
+                "bytecode_eager_instrumentation": 0,
                 "errors_handled": 0,
             }
             self._performance_data = {
@@ -8,6 +8,12 @@ Lower-level helpers live in neighbouring modules:
 * :mod:`dapper._frame_eval._bytecode_instructions` — opcode constants,
   ``make_instruction()``, ``get_instructions()``
 * :mod:`dapper._frame_eval._code_object_builder` — ``rebuild_code_object()``
+* :mod:`dapper._frame_eval._modified_code_cache` — bounded, weak-keyed cache of
+  instrumented code objects
+* :mod:`dapper._frame_eval._bytecode_disk_cache` — optional persistent cache
+  of instrumented code objects shared across debug sessions
+* :mod:`dapper._frame_eval._inline_conditions` — simple breakpoint conditions
+  compiled into guards placed in front of the breakpoint call
 """
 
 # ruff: noqa: I001
@@ -20,6 +26,9 @@ from importlib import import_module
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 from dapper._frame_eval import _code_object_builder
+from dapper._frame_eval import _inline_conditions
+from dapper._frame_eval._bytecode_disk_cache import BytecodeDiskCache
+from dapper._frame_eval._bytecode_disk_cache import cache_dir_from_environment
 from dapper._frame_eval._bytecode_instructions import CACHE
 from dapper._frame_eval._bytecode_instructions import CALL_FUNCTION
 from dapper._frame_eval._bytecode_instructions import LOAD_CONST
@@ -27,10 +36,17 @@ from dapper._frame_eval._bytecode_instructions import LOAD_GLOBAL
 from dapper._frame_eval._bytecode_instructions import POP_TOP
 from dapper._frame_eval._bytecode_instructions import get_instructions
 from dapper._frame_eval._bytecode_instructions import make_instruction
+from dapper._frame_eval._modified_code_cache import DEFAULT_MAX_ENTRIES
+from dapper._frame_eval._modified_code_cache import DEFAULT_MAX_VARIANTS_PER_CODE
+from dapper._frame_eval._modified_code_cache import ModifiedCodeCache
+from dapper._frame_eval._modified_code_cache import fingerprint_lines
 from dapper._frame_eval.cache_manager import CacheManager
 from dapper._frame_eval.telemetry import telemetry
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    import os
+    from pathlib import Path
     from types import CodeType
 
 
@@ -116,6 +132,20 @@ class BytecodeErrorInfo(TypedDict):
 _BYTECODE_META_VERSION = 1
 
 
+_ABSOLUTE_JUMPS = frozenset(dis.hasjabs)
+_JUMPS = frozenset(dis.hasjrel) | _ABSOLUTE_JUMPS
+
+
+def _release_evicted_variant(original: CodeType, variant: CodeType) -> None:
+    """Forget *variant* wherever the frame evaluator still maps *original* to it."""
+    frame_evaluator = import_module("dapper._frame_eval._frame_evaluator")
+    metadata = frame_evaluator._get_code_extra_metadata(original)
+    if isinstance(metadata, dict) and metadata.get("modified_code") is variant:
+        frame_evaluator._clear_code_extra_metadata(original)
+    if CacheManager._get_cached_code(original) is variant:
+        CacheManager._remove_cached_code(original)
+
+
 class BytecodeModifier:
     """Advanced bytecode modification system for frame evaluation.
 
@@ -125,20 +155,37 @@ class BytecodeModifier:
     invalidation on file reloads or garbage collection much simpler.  The
     fingerprint allows multiple breakpoint configurations to coexist for the
     same code object.
+
+    The cache is a :class:`ModifiedCodeCache`: originals are held weakly and
+    variants are LRU-bounded per code object and globally, so toggling
+    breakpoints over a long session does not grow memory without limit.
+
+    When :attr:`disk_cache` is set, in-memory misses consult a
+    :class:`BytecodeDiskCache` before rewriting and freshly built variants
+    are persisted, so later sessions skip the rewrite entirely.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_variants_per_code: int = DEFAULT_MAX_VARIANTS_PER_CODE,
+        max_cached_variants: int = DEFAULT_MAX_ENTRIES,
+    ):
         self.breakpoint_counter = 0
-        # primary cache: original_code -> {fingerprint: modified_code}
-        # type: ignore[valid-type]  # quoting removed via annotations
-        self.modified_code_objects: dict[CodeType, dict[int, CodeType]] = {}
+        # primary cache: (original_code, fingerprint) -> modified_code
+        self.modified_code_objects = ModifiedCodeCache(
+            max_variants_per_code=max_variants_per_code,
+            max_entries=max_cached_variants,
+            on_evict=_release_evicted_variant,
+        )
         self.optimization_enabled = True
+        self.disk_cache: BytecodeDiskCache | None = None
 
     def _instrument_nested(
         self,
         code_obj: CodeType,
         breakpoint_lines: set[int],
         debug_mode: bool,
+        conditions: Mapping[int, str] | None = None,
     ) -> CodeType:
         """Recursive helper that instruments nested code objects."""
         if not breakpoint_lines:
@@ -148,7 +195,9 @@ class BytecodeModifier:
         changed_consts = False
         for idx, const in enumerate(consts):
             if isinstance(const, types.CodeType):
-                _, new_const = self.inject_breakpoints(const, breakpoint_lines, debug_mode)
+                _, new_const = self.inject_breakpoints(
+                    const, breakpoint_lines, debug_mode, conditions
+                )
                 if new_const is not const:
                     consts[idx] = new_const
                     changed_consts = True
@@ -168,15 +217,27 @@ class BytecodeModifier:
         code_obj: CodeType,
         breakpoint_lines: set[int],
         debug_mode: bool,
+        conditions: Mapping[int, str] | None = None,
     ) -> tuple[bool, CodeType]:
-        """Perform cache lookup, injection, and storage."""
+        """Perform cache lookup, injection, and storage.
+
+        Everything is keyed on *code_obj* as the caller passed it: the copy
+        with instrumented nested code objects is rebuilt on every miss and
+        would not outlive the call as a cache key.
+        """
         fp = None
         try:
             frame_evaluator = import_module("dapper._frame_eval._frame_evaluator")
-            fp = hash(tuple(sorted(breakpoint_lines)))
-            existing = self.modified_code_objects.get(code_obj)
-            if existing and fp in existing:
-                modified_code = existing[fp]
+            conditions = {
+                line: condition
+                for line, condition in (conditions or {}).items()
+                if line in breakpoint_lines
+            }
+            fp = fingerprint_lines(breakpoint_lines)
+            if conditions:
+                fp = hash((fp, tuple(sorted(conditions.items()))))
+            modified_code = self.modified_code_objects.get(code_obj, fp)
+            if modified_code is not None:
                 frame_evaluator._store_modified_code_for_evaluation(
                     code_obj,
                     modified_code,
@@ -184,23 +245,35 @@ class BytecodeModifier:
                 )
                 return True, modified_code
 
-            instructions = get_instructions(code_obj)
-            injection_points = self._find_injection_points(instructions, breakpoint_lines)
-            if not injection_points:
-                return True, code_obj
+            # The disk cache is keyed by breakpoint lines only.
+            disk_cache = None if conditions else self.disk_cache
+            if disk_cache is not None:
+                modified_code = disk_cache.load(code_obj, breakpoint_lines)
+                if modified_code is not None:
+                    self.modified_code_objects.put(code_obj, fp, modified_code)
+                    frame_evaluator._store_modified_code_for_evaluation(
+                        code_obj,
+                        modified_code,
+                        breakpoint_lines,
+                    )
+                    return True, modified_code
 
-            new_instructions = self._create_breakpoint_instructions(instructions, injection_points)
-            accepted, modified_code = self._rebuild_code_object(code_obj, new_instructions)
+            accepted, modified_code = self._rewrite(
+                code_obj, breakpoint_lines, debug_mode, conditions
+            )
             if not accepted:
-                if existing and fp in existing:
-                    del existing[fp]
+                self.modified_code_objects.discard(code_obj, fp)
                 telemetry.record_bytecode_rollback(
                     filename=getattr(code_obj, "co_filename", "unknown"),
                     name=getattr(code_obj, "co_name", "unknown"),
                 )
-                return False, code_obj
+                return False, modified_code
+            if modified_code is code_obj:
+                return True, code_obj
 
-            self.modified_code_objects.setdefault(code_obj, {})[fp] = modified_code
+            self.modified_code_objects.put(code_obj, fp, modified_code)
+            if disk_cache is not None:
+                disk_cache.store(code_obj, breakpoint_lines, modified_code)
             frame_evaluator._store_modified_code_for_evaluation(
                 code_obj,
                 modified_code,
@@ -213,18 +286,51 @@ class BytecodeModifier:
                 filename=getattr(code_obj, "co_filename", "unknown"),
                 name=getattr(code_obj, "co_name", "unknown"),
             )
-            existing = self.modified_code_objects.get(code_obj)
-            if fp is not None and existing and fp in existing:
-                del existing[fp]
+            if fp is not None:
+                self.modified_code_objects.discard(code_obj, fp)
             return False, code_obj
         else:
             return True, modified_code
 
+    def _rewrite(
+        self,
+        code_obj: CodeType,
+        breakpoint_lines: set[int],
+        debug_mode: bool,
+        conditions: Mapping[int, str],
+    ) -> tuple[bool, CodeType]:
+        """Instrument nested code objects, then inject into *code_obj* itself.
+
+        Returns ``(accepted, code)``; *code* is *code_obj* when nothing
+        needed instrumenting, and the nested-only rewrite when the injected
+        rebuild was rejected.
+        """
+        instrumented = self._instrument_nested(code_obj, breakpoint_lines, debug_mode, conditions)
+        instructions = get_instructions(instrumented)
+        injection_points = self._find_injection_points(instructions, breakpoint_lines)
+        if not injection_points:
+            return True, instrumented
+        if not self._injection_keeps_layout(instrumented, instructions, injection_points):
+            return False, instrumented
+
+        guards = self._create_condition_guards(
+            instrumented, instructions, injection_points, conditions
+        )
+        new_instructions = self._create_breakpoint_instructions(
+            instructions, injection_points, guards
+        )
+        extra_stack = max([2, *(depth for _guard, depth in guards.values())])
+        accepted, modified_code = self._rebuild_code_object(
+            instrumented, new_instructions, extra_stack
+        )
+        return accepted, modified_code if accepted else instrumented
+
     def inject_breakpoints(
         self,
         code_obj: CodeType,
         breakpoint_lines: set[int],
         debug_mode: bool = False,
+        conditions: Mapping[int, str] | None = None,
     ) -> tuple[bool, CodeType]:
         """Inject breakpoints into a code object at specified lines.
 
@@ -232,14 +338,17 @@ class BytecodeModifier:
             code_obj: The original code object to modify
             breakpoint_lines: Set of line numbers with breakpoints
             debug_mode: Enable debug mode for verbose logging
+            conditions: Optional breakpoint conditions by line.  Simple
+                conditions over locals are compiled into the code object so
+                the breakpoint helper only runs when they hold; others are
+                left to the regular evaluated path.
 
         Returns:
             tuple: (success, modified_code_obj)
         """
-        code_obj = self._instrument_nested(code_obj, breakpoint_lines, debug_mode)
         if not breakpoint_lines:
             return True, code_obj
-        return self._apply_injection(code_obj, breakpoint_lines, debug_mode)
+        return self._apply_injection(code_obj, breakpoint_lines, debug_mode, conditions)
 
     def create_breakpoint_wrapper_code(self, line: int) -> CodeType:
         """Create a code object that serves as a breakpoint wrapper.
@@ -330,6 +439,12 @@ __dapper_breakpoint_wrapper_{line}()
             while i < len(instructions):
                 instr = instructions[i]
 
+                # Skip condition guards together with their breakpoint sequence
+                guard = _inline_conditions.guard_length(code_obj, instructions, i)
+                if guard and self._is_breakpoint_sequence(instructions, i + guard):
+                    i += guard + self._get_breakpoint_sequence_length(instructions, i + guard)
+                    continue
+
                 # Skip breakpoint instruction sequences
                 if self._is_breakpoint_sequence(instructions, i):
                     # Skip the entire breakpoint sequence
@@ -364,7 +479,7 @@ __dapper_breakpoint_wrapper_{line}()
         Returns:
             (id(code_obj), fingerprint, meta_version)
         """
-        fp = hash(tuple(sorted(breakpoint_lines)))
+        fp = fingerprint_lines(breakpoint_lines)
         return (id(code_obj), fp, _BYTECODE_META_VERSION)
 
     def _find_injection_points(
@@ -400,12 +515,55 @@ __dapper_breakpoint_wrapper_{line}()
 
         return injection_points
 
+    def _injection_keeps_layout(
+        self,
+        code_obj: CodeType,
+        instructions: list[dis.Instruction],
+        injection_points: dict[int, int],
+    ) -> bool:
+        """Return True when inserting at *injection_points* moves no jump or handler.
+
+        The rebuild does not relocate jumps or the exception table, so an
+        insertion between a jump and its target (any loop body, and code
+        after an ``if``), in front of an absolute jump target or a ``try``
+        block, or inside an instruction's inline caches would corrupt the
+        code object.  Such code keeps the traced path instead.
+        """
+        end = len(code_obj.co_code)
+        offsets = []
+        for index in injection_points.values():
+            if index >= len(instructions):
+                offsets.append(end)
+            elif instructions[index].opname == "CACHE":
+                return False
+            else:
+                offsets.append(instructions[index].offset)
+        first = min(offsets)
+        entries = getattr(dis.Bytecode(code_obj), "exception_entries", ())  # Python 3.11+
+        if any(entry.end > first or entry.target >= first for entry in entries):
+            return False
+        for instr in instructions:
+            if instr.opcode not in _JUMPS or not isinstance(instr.argval, int):
+                continue
+            target = instr.argval
+            if instr.opcode in _ABSOLUTE_JUMPS:
+                if target >= first:
+                    return False
+            elif any((instr.offset < offset) != (target < offset) for offset in offsets):
+                return False
+        return True
+
     def _create_breakpoint_instructions(
         self,
         original_instructions: list[dis.Instruction],
         injection_points: dict[int, int],
+        guards: dict[int, tuple[list[dis.Instruction], int]] | None = None,
     ) -> list[dis.Instruction]:
-        """Create new instruction list with breakpoints injected."""
+        """Create new instruction list with breakpoints injected.
+
+        Lines in *guards* get their condition guard in front of the call.
+        """
+        guards = guards or {}
         new_instructions = []
         breakpoint_code_cache = {}
 
@@ -428,10 +586,35 @@ __dapper_breakpoint_wrapper_{line}()
 
                 # Add breakpoint check instructions
                 breakpoint_instrs = self._create_breakpoint_check_instructions(line_to_check)
+                if line_to_check in guards:
+                    new_instructions.extend(guards[line_to_check][0])
                 new_instructions.extend(breakpoint_instrs)
 
         return new_instructions
 
+    def _create_condition_guards(
+        self,
+        code_obj: CodeType,
+        instructions: list[dis.Instruction],
+        injection_points: dict[int, int],
+        conditions: Mapping[int, str],
+    ) -> dict[int, tuple[list[dis.Instruction], int]]:
+        """Compile the inlinable *conditions* into guards, keyed by line."""
+        guards: dict[int, tuple[list[dis.Instruction], int]] = {}
+        for line, condition in conditions.items():
+            index = injection_points.get(line)
+            if index is None:
+                continue
+            guard = _inline_conditions.compile_condition_guard(
+                code_obj,
+                condition,
+                _inline_conditions.bound_locals(code_obj, instructions, index),
+                len(self._create_breakpoint_check_instructions(line)),
+            )
+            if guard is not None:
+                guards[line] = guard
+        return guards
+
     def _create_breakpoint_check_instructions(self, line: int) -> list[dis.Instruction]:
         """Create a canonical instrumentation sequence for a breakpoint.
 
@@ -627,14 +810,24 @@ __dapper_breakpoint_wrapper_{line}()
         self,
         original_code: CodeType,
         new_instructions: list[dis.Instruction],
+        extra_stack: int = 2,
     ) -> tuple[bool, CodeType]:
         """Delegate to the module-level :func:`rebuild_code_object`."""
-        return _code_object_builder.rebuild_code_object(original_code, new_instructions)
+        return _code_object_builder.rebuild_code_object(
+            original_code, new_instructions, extra_stack
+        )
 
 
 # Global bytecode modifier instance
 _bytecode_modifier = BytecodeModifier()
 
+_env_cache_dir = cache_dir_from_environment()
+if _env_cache_dir is not None:
+    _bytecode_modifier.disk_cache = BytecodeDiskCache(
+        _env_cache_dir,
+        meta_version=_BYTECODE_META_VERSION,
+    )
+
 
 def insert_code(
     code_obj: CodeType,
@@ -769,18 +962,20 @@ def validate_bytecode(code_obj: CodeType) -> bool:
 def inject_breakpoint_bytecode(
     code_obj: CodeType,
     breakpoint_lines: set[int],
+    conditions: Mapping[int, str] | None = None,
 ) -> tuple[bool, CodeType]:
     """Inject breakpoint bytecode into a code object.
 
     Args:
         code_obj: The code object to modify
         breakpoint_lines: Set of line numbers with breakpoints
+        conditions: Optional breakpoint conditions to compile inline, by line
 
     Returns:
         tuple: (success, modified_code_obj)
 
     """
-    return _bytecode_modifier.inject_breakpoints(code_obj, breakpoint_lines)
+    return _bytecode_modifier.inject_breakpoints(code_obj, breakpoint_lines, conditions=conditions)
 
 
 def compute_cache_key(code_obj: CodeType, breakpoint_lines: set[int]) -> tuple[int, int, int]:
@@ -809,26 +1004,24 @@ def invalidate_bytecode_cache_for_file(filepath: str) -> int:
 
     Returns the number of removed entries.  This helper is called by
     :func:`cache_manager.invalidate_breakpoints` when breakpoints change or a
-    file is reloaded.  It also removes the corresponding entry from
-    ``CacheManager`` to keep both caches in sync.
+    file is reloaded.  Originals whose variants are evicted are also removed
+    from ``CacheManager`` and their code-extra metadata is cleared to keep the
+    caches in sync.
     """
-    removed = 0
     # use the top-level import_module defined above
     frame_evaluator = import_module("dapper._frame_eval._frame_evaluator")
 
-    for code_obj in list(_bytecode_modifier.modified_code_objects.keys()):
-        if getattr(code_obj, "co_filename", "") == filepath:
-            fps = list(_bytecode_modifier.modified_code_objects.pop(code_obj).keys())
-            removed += len(fps)
-            # also evict code-extra metadata and CacheManager entry
-            try:
-                frame_evaluator._clear_code_extra_metadata(code_obj)
-            except Exception:
-                pass
-            try:
-                CacheManager._remove_cached_code(code_obj)
-            except Exception:
-                pass
+    removed, emptied = _bytecode_modifier.modified_code_objects.invalidate_file(filepath)
+    for code_obj in emptied:
+        # also evict code-extra metadata and CacheManager entry
+        try:
+            frame_evaluator._clear_code_extra_metadata(code_obj)
+        except Exception:
+            pass
+        try:
+            CacheManager._remove_cached_code(code_obj)
+        except Exception:
+            pass
     return removed
 
 
@@ -837,6 +1030,22 @@ def clear_bytecode_cache() -> None:
     _bytecode_modifier.modified_code_objects.clear()
 
 
+def enable_bytecode_disk_cache(cache_dir: str | os.PathLike[str] | None = None) -> Path:
+    """Persist instrumented bytecode under *cache_dir* across sessions.
+
+    Without *cache_dir* the platform user cache directory is used (for
+    example ``~/.cache/dapper/bytecode``).  Returns the active directory.
+    """
+    disk_cache = BytecodeDiskCache(cache_dir, meta_version=_BYTECODE_META_VERSION)
+    _bytecode_modifier.disk_cache = disk_cache
+    return disk_cache.cache_dir
+
+
+def disable_bytecode_disk_cache() -> None:
+    """Stop reading and writing the persistent bytecode cache."""
+    _bytecode_modifier.disk_cache = None
+
+
 def get_bytecode_info(code_obj: CodeType) -> BytecodeInfo | BytecodeErrorInfo:
     """Get information about a code object's bytecode.
 
@@ -885,11 +1094,17 @@ def set_optimization_enabled(enabled: bool) -> None:
 
 
 def get_cache_stats() -> dict[str, Any]:
-    """Get statistics about the bytecode modification cache."""
-    total = sum(len(v) for v in _bytecode_modifier.modified_code_objects.values())
+    """Get statistics about the bytecode modification cache.
+
+    Besides occupancy, the result carries the LRU caps, an estimate of the
+    bytes retained by cached variants (``estimated_bytes``) and hit, miss,
+    eviction and garbage-collected-origin counters.  ``disk_cache`` holds the
+    persistent cache counters, or ``None`` when it is disabled.
+    """
+    disk_cache = _bytecode_modifier.disk_cache
     return {
-        "cached_code_objects": total,
-        "unique_origins": len(_bytecode_modifier.modified_code_objects),
+        **_bytecode_modifier.modified_code_objects.get_stats(),
         "breakpoint_counter": _bytecode_modifier.breakpoint_counter,
         "optimization_enabled": _bytecode_modifier.optimization_enabled,
+        "disk_cache": disk_cache.get_stats() if disk_cache is not None else None,
     }
@@ -6,8 +6,8 @@ CPython 3.12.  When active this backend:
 
 * Claims the :data:`sys.monitoring.DEBUGGER_ID` (0) tool slot so no other
   consumer of that slot can conflict.
-* Registers callbacks for ``LINE``, ``CALL``, ``PY_START``, and
-  ``PY_RETURN`` events.
+* Registers callbacks for ``LINE``, ``PY_START``, and ``PY_RETURN``
+  events.
 * Maintains a per-filename *code-object registry* populated lazily by
   ``PY_START`` events so that ``set_local_events()`` can be called on
   every relevant code object when breakpoints change.
@@ -19,9 +19,20 @@ CPython 3.12.  When active this backend:
   overhead for non-breakpoint lines (one-time cost per offset).
 * Evaluates conditional breakpoints via
   :class:`~dapper._frame_eval.condition_evaluator.ConditionEvaluator`.
-* Handles ``CALL`` events for *function breakpoints*.
+* Implements *function breakpoints* with local ``PY_START`` events armed
+  only on the code objects the breakpoint names resolve to, so calls into
+  any other code never reach a callback.
+* Implements *exception breakpoints* with ``RAISE`` (raised filter) and
+  ``PY_UNWIND`` (uncaught filter) events, which only fire when an
+  exception is actually in flight.
 * Supports ``STEP_IN`` / ``STEP_OVER`` / ``STEP_OUT`` / ``CONTINUE``
   semantics via a combination of global and per-code-object event flags.
+  Once :meth:`SysMonitoringBackend.capture_step_context` names the stepping
+  thread, ``LINE`` / ``PY_RETURN`` are armed only on the code objects that
+  thread runs, and other threads leave every callback after a thread-ident
+  check.  ``STEP_OVER`` / ``STEP_OUT`` arm only the stepped code object and
+  match the stepped frame by identity, so calls made from the stepped line
+  (including recursive calls of the same code) run without callbacks.
 
 Thread-safety
 -------------
@@ -40,23 +51,37 @@ in :mod:`~dapper._frame_eval.frame_eval_main` — they will fall back to
 
 from __future__ import annotations
 
+import bdb
 from collections import defaultdict
 import dis
 import logging
+from pathlib import Path
 import sys
 import threading
 from typing import TYPE_CHECKING
 from typing import Any
+import weakref
 
+from dapper._frame_eval.code_index import register_code_object
 from dapper._frame_eval.condition_evaluator import ConditionEvaluator
 from dapper._frame_eval.tracing_backend import TracingBackend
+from dapper.core.function_breakpoint_index import FunctionBreakpointIndex
+from dapper.core.just_my_code import is_user_path
+from dapper.core.line_index import code_object_lines
+from dapper.utils.internal_threads import ThreadEventCounts
+from dapper.utils.internal_threads import _internal_idents
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
     # ``CodeType`` is only used in type annotations; importing at runtime
     # would require the ``types`` module which is always available but the
     # name is only needed for typing.  Placing it in a TYPE_CHECKING block
     # keeps runtime imports minimal and satisfies ruff's TC003 rule.
     from types import CodeType
+    from types import FrameType
+    from types import TracebackType
 
 
 logger = logging.getLogger(__name__)
@@ -83,6 +108,16 @@ _DISABLE = sys.monitoring.DISABLE  # type: ignore[attr-defined]
 #: Tool identity reserved for debuggers by CPython.
 DEBUGGER_ID: int = sys.monitoring.DEBUGGER_ID  # type: ignore[attr-defined]
 
+#: Events needed by the ``raised`` / ``uncaught`` exception filters.
+_RAISED_EVENTS = _events.RAISE
+_UNCAUGHT_EVENTS = _events.PY_UNWIND
+
+# Frames from these files sit *below* user code (the BDB run loop, thread
+# bootstrap and dapper itself).  An exception unwinding into one of them has
+# escaped every user handler.
+_DAPPER_ROOT = str(Path(__file__).resolve().parent.parent)
+_UNWIND_BOUNDARY_FILES = frozenset({bdb.__file__, threading.__file__})
+
 # ---------------------------------------------------------------------------
 # Stepping mode string tokens (matches the rest of the dapper codebase)
 # ---------------------------------------------------------------------------
@@ -91,6 +126,8 @@ _STEP_OVER = "STEP_OVER"
 _STEP_OUT = "STEP_OUT"
 _CONTINUE = "CONTINUE"
 
+_get_ident = threading.get_ident
+
 
 class SysMonitoringBackend(TracingBackend):
     """Tracing backend powered by ``sys.monitoring`` (Python ≥ 3.12).
@@ -110,8 +147,11 @@ class SysMonitoringBackend(TracingBackend):
         # Conditional expressions: (filename, line) → expression string.
         self._conditions: dict[tuple[str, int], str] = {}
 
-        # Function breakpoint qualified names.
+        # Function breakpoint names, and the code objects they resolved to so
+        # far; those carry a local ``PY_START`` event.
         self._function_breakpoints: frozenset[str] = frozenset()
+        self._function_index = FunctionBreakpointIndex()
+        self._function_codes: frozenset[CodeType] = frozenset()
         self._read_watch_names: frozenset[str] = frozenset()
         self._instruction_map_cache: dict[CodeType, dict[int, tuple[str, Any]]] = {}
 
@@ -123,19 +163,44 @@ class SysMonitoringBackend(TracingBackend):
         # Condition evaluator (thread-safe internally).
         self._condition_evaluator = ConditionEvaluator()
 
+        # Exception breakpoint events currently enabled (a subset of
+        # ``_RAISED_EVENTS | _UNCAUGHT_EVENTS``); OR-ed into every global
+        # event mask so stepping changes do not drop them.
+        self._exception_events: int = 0
+        self._dispatch_guard = threading.local()
+
         # Stepping state.
         self._step_mode: str = _CONTINUE
         # Code object active when the stepping command was issued — used for
         # STEP_OVER (enable LINE only here) and STEP_OUT (disable LINE here).
         self._step_code: CodeType | None = None
-
+        # Thread being stepped, when known.  Stepping is then confined to
+        # the code objects that thread entered: code -> armed step events.
+        self._step_thread: int | None = None
+        self._step_codes: dict[CodeType, int] = {}
+        # Frame a STEP_OVER / STEP_OUT applies to, when known: LINE and
+        # PY_RETURN events from other frames of the same code are ignored.
+        self._step_frame: FrameType | None = None
+        # Code objects that returned DISABLE for LINE / PY_RETURN since the
+        # last restart_events(); arming a step on one of them needs a restart.
+        # Weak, so code of unloaded or reloaded modules is not kept alive.
+        self._disabled_codes: weakref.WeakSet[CodeType] = weakref.WeakSet()
+
+        # Targeted pause: thread -> code objects that were on its stack when
+        # the pause was requested, and the union of those code objects,
+        # which carry a local ``LINE`` event until the pause lands.
+        self._pause_threads: dict[int, frozenset[CodeType]] = {}
+        self._pause_codes: frozenset[CodeType] = frozenset()
+
+        # Callbacks by thread; dapper's own threads are turned away.
+        self._thread_events = ThreadEventCounts()
         # Diagnostic counters.
         self._stats: dict[str, int] = {
             "line_callbacks": 0,
             "line_hits": 0,
             "line_disabled": 0,
-            "call_callbacks": 0,
-            "call_hits": 0,
+            "pause_hits": 0,
+            "function_hits": 0,
             "py_start_callbacks": 0,
             "py_return_callbacks": 0,
             "condition_evaluations": 0,
@@ -143,6 +208,9 @@ class SysMonitoringBackend(TracingBackend):
             "instruction_callbacks": 0,
             "instruction_hits": 0,
             "instruction_disabled": 0,
+            "raise_callbacks": 0,
+            "unwind_callbacks": 0,
+            "exception_hits": 0,
         }
 
     # ------------------------------------------------------------------
@@ -171,7 +239,6 @@ class SysMonitoringBackend(TracingBackend):
 
             # Register per-event callbacks.
             _monitoring.register_callback(DEBUGGER_ID, _events.LINE, self._on_line)
-            _monitoring.register_callback(DEBUGGER_ID, _events.CALL, self._on_call)
             _monitoring.register_callback(DEBUGGER_ID, _events.PY_START, self._on_py_start)
             _monitoring.register_callback(DEBUGGER_ID, _events.PY_RETURN, self._on_py_return)
             _monitoring.register_callback(
@@ -179,15 +246,18 @@ class SysMonitoringBackend(TracingBackend):
                 _events.INSTRUCTION,
                 self._on_instruction,
             )
+            _monitoring.register_callback(DEBUGGER_ID, _events.RAISE, self._on_raise)
+            _monitoring.register_callback(DEBUGGER_ID, _events.PY_UNWIND, self._on_py_unwind)
 
             # Enable PY_START globally so newly entered functions are
             # discovered and added to the code registry.
-            _monitoring.set_events(DEBUGGER_ID, _events.PY_START)
+            self._set_global_events(_events.PY_START)
 
             self._debugger = debugger_instance
             setattr(debugger_instance, _DEBUGGER_BACKLINK_ATTR, self)
             self._installed = True
             self.sync_read_watchpoints()
+            self._sync_exception_filters(debugger_instance)
             logger.debug("SysMonitoringBackend installed (DEBUGGER_ID=%d)", DEBUGGER_ID)
 
     def shutdown(self) -> None:
@@ -202,10 +272,11 @@ class SysMonitoringBackend(TracingBackend):
                 try:
                     for event in (
                         _events.LINE,
-                        _events.CALL,
                         _events.PY_START,
                         _events.PY_RETURN,
                         _events.INSTRUCTION,
+                        _events.RAISE,
+                        _events.PY_UNWIND,
                     ):
                         _monitoring.register_callback(DEBUGGER_ID, event, None)
                 except Exception:
@@ -220,10 +291,19 @@ class SysMonitoringBackend(TracingBackend):
                 self._breakpoints.clear()
                 self._conditions.clear()
                 self._function_breakpoints = frozenset()
+                self._function_index.set_names(())
+                self._function_codes = frozenset()
                 self._read_watch_names = frozenset()
                 self._instruction_map_cache.clear()
+                self._exception_events = 0
                 self._step_mode = _CONTINUE
                 self._step_code = None
+                self._step_thread = None
+                self._step_codes.clear()
+                self._step_frame = None
+                self._disabled_codes.clear()
+                self._pause_threads.clear()
+                self._pause_codes = frozenset()
                 if (
                     debugger is not None
                     and getattr(
@@ -253,16 +333,27 @@ class SysMonitoringBackend(TracingBackend):
                 breakpoints for the file.
 
         """
+        self.update_breakpoints_batch({filepath: lines})
+
+    def update_breakpoints_batch(self, updates: Mapping[str, set[int]]) -> None:
+        """Update line breakpoints for several files with one event restart.
+
+        Equivalent to calling :meth:`update_breakpoints` per file, but the
+        process-global :func:`sys.monitoring.restart_events` runs only once.
+        """
+        if not updates:
+            return
         with self._lock:
-            if lines:
-                self._breakpoints[filepath] = frozenset(lines)
-            else:
-                self._breakpoints.pop(filepath, None)
-                # Prune stale per-line conditions.
-                for key in [k for k in self._conditions if k[0] == filepath]:
-                    del self._conditions[key]
+            for filepath, lines in updates.items():
+                if lines:
+                    self._breakpoints[filepath] = frozenset(lines)
+                else:
+                    self._breakpoints.pop(filepath, None)
+                    # Prune stale per-line conditions.
+                    for key in [k for k in self._conditions if k[0] == filepath]:
+                        del self._conditions[key]
 
-            self._apply_local_events(filepath)
+                self._apply_local_events(filepath)
 
         # restart_events() is a process-global call (affects all tool IDs);
         # call it outside the lock to minimise contention.
@@ -307,21 +398,38 @@ class SysMonitoringBackend(TracingBackend):
             else:
                 self._conditions.pop(key, None)
 
+    def _line_events_for(self, code: CodeType, bp_lines: frozenset[int] | None) -> int:
+        """Return the local events *code* needs for the breakpoints *bp_lines*.
+
+        ``LINE`` is armed only on code objects that own one of the lines, so
+        other functions in the same file run without any callbacks.
+        """
+        if bp_lines and not bp_lines.isdisjoint(code_object_lines(code)):
+            return _events.LINE
+        return _events.NO_EVENTS
+
     def _apply_local_events(self, filepath: str) -> None:
-        """Enable / disable ``LINE`` on all code objects for *filepath*.
+        """Enable / disable ``LINE`` on the code objects for *filepath*.
 
         Must be called with ``self._lock`` held.
         """
         code_objs = self._code_registry.get(filepath)
         if not code_objs:
             return
-        has_bps = filepath in self._breakpoints
-        target_events = _events.LINE if has_bps else _events.NO_EVENTS
+        bp_lines = self._breakpoints.get(filepath)
         # perform the whole loop under one try/except to avoid PERF203
         code = None
         try:
             for code in code_objs:
-                _monitoring.set_local_events(DEBUGGER_ID, code, target_events)
+                events = self._line_events_for(code, bp_lines)
+                if code is self._step_code and self._step_mode == _STEP_OVER:
+                    events = _events.LINE
+                events |= (
+                    self._function_events(code)
+                    | self._step_codes.get(code, _events.NO_EVENTS)
+                    | self._pause_events(code)
+                )
+                _monitoring.set_local_events(DEBUGGER_ID, code, events)
         except Exception as exc:
             logger.debug("set_local_events failed for %r: %s", getattr(code, "co_name", None), exc)
 
@@ -337,73 +445,174 @@ class SysMonitoringBackend(TracingBackend):
         ``STEP_IN``
             Enable ``LINE`` globally so every line in every frame fires.
         ``STEP_OVER``
-            Enable ``LINE`` only on the *current* code object
-            (:meth:`capture_step_context` must have been called beforehand);
-            enable ``PY_RETURN`` globally to detect frame exit.
+            Arm ``LINE`` and ``PY_RETURN`` on the *current* code object only
+            (:meth:`capture_step_context` must have been called beforehand).
         ``STEP_OUT``
-            Disable ``LINE`` on the current code object; enable ``PY_RETURN``
-            globally.
+            Arm ``PY_RETURN`` on the current code object only.
         ``CONTINUE`` (or anything else / ``None``)
             Disable global events; re-activate ``LINE`` only for files with
             active breakpoints.
+
+        ``STEP_OVER`` / ``STEP_OUT`` leave the global mask at ``PY_START``,
+        so calls made while stepping over a line never reach a callback;
+        when the captured frame returns the step continues in its caller.
+        Without a captured code object they fall back to a global
+        ``PY_RETURN`` that ends the step at the first return.
+
+        When :meth:`capture_step_context` recorded a thread and a code
+        object, ``STEP_IN`` is thread-scoped as well: ``LINE`` /
+        ``PY_RETURN`` are armed on the current code object and on each code
+        object the stepping thread enters, and other threads never stop.
         """
         mode_str = str(mode).upper() if mode is not None else _CONTINUE
 
         with self._lock:
+            self._disarm_step_codes()
             self._step_mode = mode_str
+            scoped = self._step_thread is not None and self._step_code is not None
 
-            if mode_str == _STEP_IN:
-                _monitoring.set_events(
-                    DEBUGGER_ID,
-                    _events.LINE | _events.PY_START | _events.PY_RETURN,
-                )
+            if mode_str in (_STEP_OVER, _STEP_OUT) and self._step_code is not None:
+                self._set_global_events(_events.PY_START)
+                step_events = _events.PY_RETURN
+                if mode_str == _STEP_OVER:
+                    step_events |= _events.LINE
+                self._arm_step_code(self._step_code, step_events)
+
+            elif scoped and mode_str == _STEP_IN:
+                self._set_global_events(_events.PY_START)
+                self._arm_step_code(self._step_code, _events.LINE | _events.PY_RETURN)
+                # Re-offer PY_START for code that already ran so the
+                # stepping thread's callees can be armed.
+                self._restart_events()
 
-            elif mode_str == _STEP_OVER:
-                _monitoring.set_events(DEBUGGER_ID, _events.PY_START | _events.PY_RETURN)
-                if self._step_code is not None:
-                    try:
-                        _monitoring.set_local_events(DEBUGGER_ID, self._step_code, _events.LINE)
-                    except Exception as exc:
-                        logger.debug("set_local_events STEP_OVER failed: %s", exc)
-                        # Fall back to global LINE so stepping still works.
-                        _monitoring.set_events(
-                            DEBUGGER_ID,
-                            _events.LINE | _events.PY_START | _events.PY_RETURN,
-                        )
-
-            elif mode_str == _STEP_OUT:
-                _monitoring.set_events(DEBUGGER_ID, _events.PY_START | _events.PY_RETURN)
-                if self._step_code is not None:
-                    try:
-                        _monitoring.set_local_events(
-                            DEBUGGER_ID,
-                            self._step_code,
-                            _events.NO_EVENTS,
-                        )
-                    except Exception as exc:
-                        logger.debug("set_local_events STEP_OUT failed: %s", exc)
+            elif mode_str == _STEP_IN:
+                self._set_global_events(_events.LINE | _events.PY_START | _events.PY_RETURN)
+
+            elif mode_str in (_STEP_OVER, _STEP_OUT):
+                self._set_global_events(_events.PY_START | _events.PY_RETURN)
 
             else:  # CONTINUE / unknown
                 self._step_mode = _CONTINUE
                 self._step_code = None
-                # Restore PY_START globally; per-file LINE events only.
-                _monitoring.set_events(DEBUGGER_ID, _events.PY_START)
+                self._step_thread = None
+                self._step_frame = None
+                # Restore PY_START globally; per-file LINE events only.  No
+                # restart_events(): offsets disabled while stepping stay
+                # disabled, and a later step re-enables what it needs.
+                self._set_global_events(_events.PY_START)
                 for fp in list(self._breakpoints):
                     self._apply_local_events(fp)
-                try:
-                    _monitoring.restart_events()
-                except Exception as exc:
-                    logger.debug("restart_events() after CONTINUE failed: %s", exc)
 
-    def capture_step_context(self, code: CodeType | None) -> None:
-        """Record the code object active when a stepping command is issued.
+    def capture_step_context(
+        self,
+        code: CodeType | None,
+        thread_id: int | None,
+        frame: FrameType | None = None,
+    ) -> None:
+        """Record the code object, thread and frame a stepping command applies to.
 
-        Should be called by the debugger immediately *after* invoking
+        Should be called by the debugger *before* invoking
         :meth:`set_stepping` so that ``STEP_OVER`` / ``STEP_OUT`` know
-        which code object to watch.
+        which code object to watch.  *thread_id* is the thread the step was
+        requested for (the stepping command runs on the IPC thread, not on
+        it); with a thread recorded, stepping is confined to it, and
+        ``None`` steps every thread.  With *frame*, only that frame of the
+        code object ends a ``STEP_OVER`` / ``STEP_OUT``, so recursive calls
+        are stepped over; *code* then defaults to the frame's code object.
         """
         with self._lock:
-            self._step_code = code
+            self._step_code = frame.f_code if code is None and frame is not None else code
+            self._step_thread = thread_id
+            self._step_frame = frame
+
+    def _arm_step_code(self, code: CodeType, step_events: int) -> None:
+        """Add *step_events* to *code*'s local events for the current step.
+
+        Must be called with ``self._lock`` held.
+        """
+        self._step_codes[code] = self._step_codes.get(code, _events.NO_EVENTS) | step_events
+        try:
+            _monitoring.set_local_events(DEBUGGER_ID, code, self._local_events_for(code))
+        except Exception as exc:
+            logger.debug("set_local_events failed for step code %r: %s", code.co_name, exc)
+        if code in self._disabled_codes:
+            # Offsets that returned DISABLE stay silent until a restart.
+            self._restart_events()
+
+    def _disarm_step_codes(self) -> None:
+        """Drop the stepping events armed by the previous step.
+
+        Must be called with ``self._lock`` held.
+        """
+        codes = self._step_codes
+        if not codes:
+            return
+        self._step_codes = {}
+        code = None
+        try:
+            for code in codes:
+                _monitoring.set_local_events(DEBUGGER_ID, code, self._local_events_for(code))
+        except Exception as exc:
+            logger.debug("set_local_events failed for %r: %s", getattr(code, "co_name", None), exc)
+
+    # ------------------------------------------------------------------
+    # Targeted pause
+    # ------------------------------------------------------------------
+
+    def arm_pause(self, thread_id: int, codes: Iterable[CodeType]) -> None:
+        """Arm local ``LINE`` events for a pause of *thread_id*.
+
+        *codes* are the code objects on the thread's stack; the first line
+        the thread runs in any of them is handed to the debugger's
+        ``user_line``.  Other threads running the same code objects get a
+        callback that returns at once; no global event is enabled.
+        """
+        with self._lock:
+            armed = frozenset(codes)
+            self._pause_threads[thread_id] = armed
+            self._pause_codes = frozenset().union(*self._pause_threads.values())
+            restart = False
+            code = None
+            try:
+                for code in armed:
+                    _monitoring.set_local_events(DEBUGGER_ID, code, self._local_events_for(code))
+                    restart = restart or code in self._disabled_codes
+            except Exception as exc:
+                logger.debug(
+                    "set_local_events failed for pause code %r: %s",
+                    getattr(code, "co_name", None),
+                    exc,
+                )
+            if restart:
+                # Offsets that returned DISABLE stay silent until a restart.
+                self._restart_events()
+
+    def disarm_pause(self, thread_id: int) -> None:
+        """Drop the ``LINE`` events armed for a pause of *thread_id*."""
+        with self._lock:
+            codes = self._pause_threads.pop(thread_id, None)
+            if not codes:
+                return
+            self._pause_codes = frozenset().union(*self._pause_threads.values())
+            code = None
+            try:
+                for code in codes:
+                    _monitoring.set_local_events(DEBUGGER_ID, code, self._local_events_for(code))
+            except Exception as exc:
+                logger.debug(
+                    "set_local_events failed for %r: %s", getattr(code, "co_name", None), exc
+                )
+
+    def _pause_events(self, code: CodeType) -> int:
+        """Return ``LINE`` when *code* is armed for a pause."""
+        return _events.LINE if code in self._pause_codes else _events.NO_EVENTS
+
+    def _restart_events(self) -> None:
+        self._disabled_codes.clear()
+        try:
+            _monitoring.restart_events()
+        except Exception as exc:
+            logger.debug("restart_events() failed: %s", exc)
 
     # ------------------------------------------------------------------
     # TracingBackend — exception breakpoints
@@ -412,10 +621,45 @@ class SysMonitoringBackend(TracingBackend):
     def set_exception_breakpoints(self, filters: list[str]) -> None:
         """Configure exception breakpoint filters.
 
-        Exception breakpoints are wired in **Phase 3**; this is a no-op
-        placeholder so the :class:`TracingBackend` contract is satisfied.
+        ``raised`` enables ``RAISE``; ``uncaught`` enables
+        ``PY_UNWIND``.  These events fire only while an exception is
+        propagating, so code that does not raise runs at full speed.  The
+        final stop decision is made by the debugger's
+        :class:`~dapper.core.exception_handler.ExceptionHandler`.
         """
-        # Phase 3: register RAISE / EXCEPTION_HANDLED callbacks here.
+        wanted = 0
+        if "raised" in filters:
+            wanted |= _RAISED_EVENTS
+        if "uncaught" in filters:
+            wanted |= _UNCAUGHT_EVENTS
+
+        with self._lock:
+            if wanted == self._exception_events:
+                return
+            current = _monitoring.get_events(DEBUGGER_ID) & ~self._exception_events
+            self._exception_events = wanted
+            if self._installed:
+                _monitoring.set_events(DEBUGGER_ID, current | wanted)
+
+    def _sync_exception_filters(self, debugger: object) -> None:
+        """Adopt exception filters configured before this backend was installed."""
+        config = getattr(getattr(debugger, "exception_handler", None), "config", None)
+        filters = [
+            name
+            for name, attr in (("raised", "break_on_raised"), ("uncaught", "break_on_uncaught"))
+            if getattr(config, attr, False) is True
+        ]
+        if filters:
+            self.set_exception_breakpoints(filters)
+
+    @property
+    def handles_exception_breakpoints(self) -> bool:
+        """Whether exception filters are serviced by this backend's events."""
+        return self._installed and bool(self._exception_events)
+
+    def _set_global_events(self, event_set: int) -> None:
+        """Replace the global event mask, keeping exception-filter events on."""
+        _monitoring.set_events(DEBUGGER_ID, event_set | self._exception_events)
 
     # ------------------------------------------------------------------
     # TracingBackend — statistics
@@ -434,6 +678,7 @@ class SysMonitoringBackend(TracingBackend):
                 "known_code_objects": sum(len(v) for v in self._code_registry.values()),
                 "function_breakpoints": len(self._function_breakpoints),
                 "counters": dict(self._stats),
+                "thread_events": self._thread_events.breakdown(),
                 # Keys expected by callers that check IntegrationStatistics shape:
                 "config": {
                     "enabled": self._installed,
@@ -455,50 +700,109 @@ class SysMonitoringBackend(TracingBackend):
     # ------------------------------------------------------------------
 
     def update_function_breakpoints(self, names: set[str]) -> None:
-        """Set the active function-breakpoint qualified names.
-
-        Not part of the :class:`TracingBackend` ABC; called by the adapter
-        layer when the ``setFunctionBreakpoints`` DAP request is received.
+        """Set the active function-breakpoint names.
+
+        Not part of the :class:`TracingBackend` ABC; called when the
+        ``setFunctionBreakpoints`` DAP request is received.  Names are
+        resolved lazily: :func:`sys.monitoring.restart_events` re-offers
+        ``PY_START`` for code objects that already ran, and
+        :meth:`_on_py_start` arms a local ``PY_START`` on each code object
+        a name resolves to.
         """
         with self._lock:
             self._function_breakpoints = frozenset(names)
-            current = _monitoring.get_events(DEBUGGER_ID)
-            if names:
-                _monitoring.set_events(DEBUGGER_ID, current | _events.CALL)
-            # Remove CALL unless stepping requires it.
-            elif self._step_mode == _CONTINUE:
-                _monitoring.set_events(DEBUGGER_ID, current & ~_events.CALL)
+            self._function_index.set_names(sorted(names))
+            previous = self._function_codes
+            self._function_codes = frozenset()
+            code = None
+            try:
+                for code in previous:
+                    _monitoring.set_local_events(DEBUGGER_ID, code, self._local_events_for(code))
+            except Exception as exc:
+                logger.debug(
+                    "set_local_events failed for %r: %s", getattr(code, "co_name", None), exc
+                )
+
+        try:
+            _monitoring.restart_events()
+        except Exception as exc:
+            logger.debug("restart_events() in update_function_breakpoints failed: %s", exc)
+
+    def _function_events(self, code: CodeType) -> int:
+        """Return ``PY_START`` when *code* is a resolved function breakpoint."""
+        return _events.PY_START if code in self._function_codes else _events.NO_EVENTS
+
+    def _local_events_for(self, code: CodeType) -> int:
+        """Return every local event *code* needs, including a scoped step's."""
+        return (
+            self._line_events_for(code, self._breakpoints.get(code.co_filename))
+            | self._function_events(code)
+            | self._step_codes.get(code, _events.NO_EVENTS)
+            | self._pause_events(code)
+        )
+
+    def _dispatch_function_breakpoint(self, frame: Any) -> None:
+        """Hand a call into a function-breakpoint code object to the debugger."""
+        self._stats["function_hits"] += 1
+        debugger = self._debugger
+        if debugger is not None and hasattr(debugger, "user_call"):
+            try:
+                debugger.user_call(frame, None)
+            except Exception as exc:
+                logger.debug("user_call() raised: %s", exc)
 
     # ------------------------------------------------------------------
     # sys.monitoring event callbacks (2.2, 2.4, 2.5, 2.6)
     # ------------------------------------------------------------------
 
-    def _on_line(self, code: CodeType, line_number: int) -> object:
+    def _on_line(self, code: CodeType, line_number: int) -> object:  # noqa: PLR0911, PLR0912
         """``LINE`` event callback.
 
         Called by the CPython evaluation loop just before the instruction
         at *line_number* in *code* is executed.
 
         Returns :data:`sys.monitoring.DISABLE` when the line is neither a
-        registered breakpoint nor covered by an active stepping mode; this
-        suppresses future callbacks for the same bytecode offset (one-time
-        cost).
+        registered breakpoint nor covered by an active stepping mode or a
+        pending pause; this suppresses future callbacks for the same
+        bytecode offset (one-time cost).
 
         The user frame is ``sys._getframe(1)`` from this callback because
         the evaluation loop (C code) is the immediate Python-level caller.
         """
+        ident = _get_ident()
+        internal = ident in _internal_idents
+        if internal:
+            self._thread_events.gate(ident)
+        step_thread = self._step_thread
+        # dapper's own threads are handled like threads that are not being
+        # stepped, and never reach the debugger.
+        foreign_thread = internal or (step_thread is not None and step_thread != ident)
         self._stats["line_callbacks"] += 1
         filename = code.co_filename
 
         bp_lines = self._breakpoints.get(filename)
         is_breakpoint_line = bp_lines is not None and line_number in bp_lines
-        is_stepping = self._step_mode != _CONTINUE
+        is_stepping = self._step_mode != _CONTINUE and not foreign_thread
+
+        # Other threads running a paused thread's code keep the event
+        # enabled for the thread being paused.
+        if code in self._pause_codes and (
+            self._dispatch_pause(ident, internal) or not (is_breakpoint_line or is_stepping)
+        ):
+            return None
 
         if not is_breakpoint_line and not is_stepping:
+            if foreign_thread and code in self._step_codes:
+                # Another thread running the stepping thread's code: the
+                # event must stay enabled for the stepping thread.
+                return None
             self._stats["line_disabled"] += 1
+            self._disabled_codes.add(code)
             return _DISABLE
 
         if is_breakpoint_line:
+            if internal:
+                return None
             # Evaluate condition if present.
             condition = self._conditions.get((filename, line_number))
             if condition is not None:
@@ -524,8 +828,13 @@ class SysMonitoringBackend(TracingBackend):
             return None
 
         # Stepping path (not a registered breakpoint).
-        self._stats["line_hits"] += 1
         frame = sys._getframe(1)  # noqa: SLF001
+        step_frame = self._step_frame
+        if self._step_mode == _STEP_OVER and step_frame is not None and frame is not step_frame:
+            # A recursive call of the stepped code (or another thread
+            # running it): keep the event for the stepped frame.
+            return None
+        self._stats["line_hits"] += 1
         debugger = self._debugger
         if debugger is not None and hasattr(debugger, "user_line"):
             try:
@@ -534,91 +843,140 @@ class SysMonitoringBackend(TracingBackend):
                 logger.debug("user_line() (stepping) raised: %s", exc)
         return None
 
-    def _on_call(
-        self,
-        _code: CodeType,
-        _instruction_offset: int,
-        callable_: object,
-        arg0: object,
-    ) -> object:
-        """``CALL`` event callback — function breakpoints (2.6).
-
-        Matches *callable_* against :attr:`_function_breakpoints` by
-        ``__qualname__`` (preferred) then ``__name__``.  Returns
-        :data:`sys.monitoring.DISABLE` when no match is found.
-        """
-        self._stats["call_callbacks"] += 1
-        fp_names = self._function_breakpoints  # immutable snapshot
-        if not fp_names:
-            return _DISABLE
-
-        qualname: str | None = getattr(callable_, "__qualname__", None) or getattr(
-            callable_,
-            "__name__",
-            None,
-        )
-        if qualname in fp_names:
-            self._stats["call_hits"] += 1
-            frame = sys._getframe(1)  # noqa: SLF001
-            debugger = self._debugger
-            if debugger is not None and hasattr(debugger, "user_call"):
-                try:
-                    debugger.user_call(frame, arg0)
-                except Exception as exc:
-                    logger.debug("user_call() raised: %s", exc)
-            return None
-
-        return _DISABLE
+    def _dispatch_pause(self, ident: int, internal: bool) -> bool:
+        """Hand the current line to the debugger if *ident* has a pending pause."""
+        if internal or ident not in self._pause_threads:
+            return False
+        self._stats["pause_hits"] += 1
+        debugger = self._debugger
+        if debugger is not None and hasattr(debugger, "user_line"):
+            try:
+                # Called from _on_line: the user frame is two levels up.
+                debugger.user_line(sys._getframe(2))  # noqa: SLF001
+            except Exception as exc:
+                logger.debug("user_line() (pause) raised: %s", exc)
+        return True
 
     def _on_py_start(self, code: CodeType, _instruction_offset: int) -> object:
-        """``PY_START`` callback — code-object registry (2.4).
+        """``PY_START`` callback — code-object registry (2.4) and function breakpoints.
 
         Called the first time (per-offset) a frame for *code* is entered.
-        Registers *code* in the code registry and optionally enables
-        ``LINE`` events for its file.
-
-        Always returns :data:`sys.monitoring.DISABLE` so the VM does not
-        call this callback again for the same ``(code, offset)`` pair:
-        the code object is now known, so future entries are irrelevant for
-        registry purposes.
+        Registers *code* in the code registry (and the shared live
+        code-object index), optionally enables ``LINE`` events for it, and
+        resolves it against the function-breakpoint names.
+
+        Returns :data:`sys.monitoring.DISABLE` so the VM does not call this
+        callback again for the same ``(code, offset)`` pair, except for
+        function-breakpoint code objects: those keep a local ``PY_START``
+        event and report every call to :meth:`DebuggerBDB.user_call`.
         """
+        ident = _get_ident()
+        if ident in _internal_idents:
+            self._thread_events.gate(ident)
+            # Nothing is registered or dispatched from dapper's own threads;
+            # only dapper's own code is disabled outright.
+            return _DISABLE if code.co_filename.startswith(_DAPPER_ROOT) else None
         self._stats["py_start_callbacks"] += 1
+        if code in self._function_codes:
+            frame = sys._getframe(1)  # noqa: SLF001
+            if self._function_index.match(frame) is not None:
+                self._dispatch_function_breakpoint(frame)
+            return None
+
+        stepping_into = self._step_thread is not None and self._step_mode == _STEP_IN
+        if stepping_into and self._step_thread != ident:
+            # Keep PY_START enabled for the stepping thread, but do no work.
+            return None
+
         filename = code.co_filename
+        register_code_object(code)
+
+        frame = None
+        watched = False
+        if self._function_index.may_match(code):
+            frame = sys._getframe(1)  # noqa: SLF001
+            if self._function_index.match(frame) is None:
+                frame = None
+            # Inherited methods match per call: keep watching them.
+            watched = self._function_index.watches(code)
 
         with self._lock:
             self._code_registry[filename].add(code)
-            if filename in self._breakpoints:
+            if watched:
+                self._function_codes = self._function_codes | {code}
+            events = self._local_events_for(code)
+            if events:
                 try:
-                    _monitoring.set_local_events(DEBUGGER_ID, code, _events.LINE)
+                    _monitoring.set_local_events(DEBUGGER_ID, code, events)
                 except Exception as exc:
                     logger.debug("PY_START set_local_events failed for %r: %s", code.co_name, exc)
 
+        if frame is not None:
+            self._dispatch_function_breakpoint(frame)
+        if watched:
+            return None
+        if stepping_into:
+            with self._lock:
+                self._arm_step_code(code, _events.LINE | _events.PY_RETURN)
+            return None
         return _DISABLE
 
-    def _on_py_return(self, _code: CodeType, _instruction_offset: int, _retval: object) -> object:
+    def _on_py_return(self, code: CodeType, _instruction_offset: int, _retval: object) -> object:  # noqa: PLR0911
         """``PY_RETURN`` callback — stepping boundary detection (2.5).
 
-        Used for ``STEP_OVER`` and ``STEP_OUT``: when the monitored frame
-        returns, we switch to ``STEP_IN`` mode so the next ``LINE`` event
-        in the caller fires :meth:`user_line`.
+        Used for ``STEP_OVER`` and ``STEP_OUT``: when the stepped frame
+        returns, the step continues in its caller.  Only the stepped code
+        object carries a local ``PY_RETURN``; returns of its other frames
+        (recursion) are ignored when the stepped frame is known.
         """
-        self._stats["py_return_callbacks"] += 1
+        ident = _get_ident()
+        if ident in _internal_idents:
+            self._thread_events.gate(ident)
+            return None
+        step_thread = self._step_thread
+        if step_thread is not None and step_thread != ident:
+            return None
         step_mode = self._step_mode
-
         if step_mode == _CONTINUE:
+            if step_thread is not None:
+                return None
+            self._disabled_codes.add(code)
             return _DISABLE
 
+        if step_thread is not None or code in self._step_codes:
+            frame = sys._getframe(1)  # noqa: SLF001
+            step_frame = self._step_frame
+            if step_frame is not None and frame is not step_frame:
+                return None
+            self._stats["py_return_callbacks"] += 1
+            self._step_into_caller(frame.f_back, step_mode)
+            return None
+
+        self._stats["py_return_callbacks"] += 1
         if step_mode in (_STEP_OVER, _STEP_OUT):
             with self._lock:
                 self._step_mode = _STEP_IN
                 self._step_code = None
-                _monitoring.set_events(
-                    DEBUGGER_ID,
-                    _events.LINE | _events.PY_START | _events.PY_RETURN,
-                )
+                self._set_global_events(_events.LINE | _events.PY_START | _events.PY_RETURN)
 
         return None
 
+    def _step_into_caller(self, caller: Any, step_mode: str) -> None:
+        """Continue a step in *caller* after the stepped frame returned.
+
+        A ``STEP_IN`` keeps stepping into calls; ``STEP_OVER`` and
+        ``STEP_OUT`` become a ``STEP_OVER`` of the caller frame.
+        """
+        with self._lock:
+            next_mode = _STEP_IN if step_mode == _STEP_IN else _STEP_OVER
+            if next_mode == _STEP_OVER:
+                self._disarm_step_codes()
+            self._step_mode = next_mode
+            self._step_code = caller.f_code if caller is not None else None
+            self._step_frame = caller if next_mode == _STEP_OVER else None
+            if self._step_code is not None:
+                self._arm_step_code(self._step_code, _events.LINE | _events.PY_RETURN)
+
     def _instruction_map_for_code(self, code: CodeType) -> dict[int, tuple[str, Any]]:
         mapping = self._instruction_map_cache.get(code)
         if mapping is not None:
@@ -630,8 +988,12 @@ class SysMonitoringBackend(TracingBackend):
         self._instruction_map_cache[code] = mapping
         return mapping
 
-    def _on_instruction(self, code: CodeType, instruction_offset: int) -> object:
+    def _on_instruction(self, code: CodeType, instruction_offset: int) -> object:  # noqa: PLR0911
         """Handle instruction callbacks and stop on watched variable read accesses."""
+        ident = _get_ident()
+        if ident in _internal_idents:
+            self._thread_events.gate(ident)
+            return None
         self._stats["instruction_callbacks"] += 1
 
         watched_names = self._read_watch_names
@@ -664,3 +1026,119 @@ class SysMonitoringBackend(TracingBackend):
         except Exception as exc:
             logger.debug("handle_read_watch_access() raised: %s", exc)
         return None
+
+    def _on_raise(self, code: CodeType, _instruction_offset: int, exc: BaseException) -> object:
+        """``RAISE`` callback — the ``raised`` exception filter.
+
+        ``RAISE`` fires again in every frame the exception propagates
+        through, each time after that frame was added to the traceback, so
+        the exception is reported once: at the raise site, or under
+        Just-My-Code at the first user frame it reaches (an exception raised
+        inside the stdlib or site-packages stops where user code called in).
+        Bare ``raise`` statements emit ``RERAISE`` instead and are therefore
+        never reported twice.
+        """
+        ident = _get_ident()
+        if ident in _internal_idents:
+            self._thread_events.gate(ident)
+            return None
+        self._stats["raise_callbacks"] += 1
+        if not self._exception_events & _RAISED_EVENTS:
+            return None
+        if code.co_filename.startswith(_DAPPER_ROOT):
+            return None
+        just_my_code = getattr(self._debugger, "just_my_code", True)
+        if not _reports_raise(exc.__traceback__, just_my_code=just_my_code):
+            return None
+        self._dispatch_exception(sys._getframe(1), exc, uncaught=False)  # noqa: SLF001
+        return None
+
+    def _on_py_unwind(
+        self, _code: CodeType, _instruction_offset: int, exc: BaseException
+    ) -> object:
+        """``PY_UNWIND`` callback — the ``uncaught`` exception filter.
+
+        An exception is uncaught once it unwinds out of the outermost user
+        frame into the debugger / thread bootstrap.  ``EXCEPTION_HANDLED`` is
+        not a usable "caught" signal because it also fires on entry to
+        ``finally`` blocks that re-raise.
+        """
+        ident = _get_ident()
+        if ident in _internal_idents:
+            self._thread_events.gate(ident)
+            return None
+        self._stats["unwind_callbacks"] += 1
+        if not self._exception_events & _UNCAUGHT_EVENTS:
+            return None
+        frame = sys._getframe(1)  # noqa: SLF001
+        if not _is_unwind_boundary(frame):
+            return None
+        self._dispatch_exception(_raise_site(exc, frame), exc, uncaught=True)
+        return None
+
+    def _dispatch_exception(self, frame: Any, exc: BaseException, *, uncaught: bool) -> None:
+        debugger = self._debugger
+        user_exception = getattr(debugger, "user_exception", None)
+        guard = self._dispatch_guard
+        # Exceptions raised while the debugger itself is paused (evaluate,
+        # variable repr, ...) must not re-enter the stop machinery.
+        if user_exception is None or getattr(guard, "active", False):
+            return
+        self._stats["exception_hits"] += 1
+        guard.active = True
+        try:
+            user_exception(frame, (type(exc), exc, exc.__traceback__), uncaught=uncaught)
+        except Exception as exc_:
+            logger.debug("user_exception() raised: %s", exc_)
+        finally:
+            guard.active = False
+
+
+def _is_unwind_boundary(frame: Any) -> bool:
+    """Return True when *frame*'s caller is not user code (or does not exist)."""
+    filename = frame.f_code.co_filename
+    if filename in _UNWIND_BOUNDARY_FILES or filename.startswith(_DAPPER_ROOT):
+        return False
+    caller = frame.f_back
+    if caller is None:
+        return True
+    filename = caller.f_code.co_filename
+    return filename in _UNWIND_BOUNDARY_FILES or filename.startswith(_DAPPER_ROOT)
+
+
+def _reports_raise(tb: TracebackType | None, *, just_my_code: bool) -> bool:
+    """Return True when the ``RAISE`` event for traceback *tb* is reported.
+
+    *tb* starts at the frame the event fired in and continues into the
+    frames the exception came from.  Without Just-My-Code only the raise
+    site is reported; with it, the event in a user frame none of whose
+    deeper frames is user code.
+    """
+    if tb is None:
+        return True
+    if not just_my_code:
+        return tb.tb_next is None
+    if not is_user_path(tb.tb_frame.f_code.co_filename):
+        return False
+    tb = tb.tb_next
+    while tb is not None:
+        if is_user_path(tb.tb_frame.f_code.co_filename):
+            return False
+        tb = tb.tb_next
+    return True
+
+
+def _raise_site(exc: BaseException, default: Any) -> Any:
+    """Return the innermost user frame in *exc*'s traceback.
+
+    Falls back to the innermost frame of any kind, then to *default*.
+    """
+    site = default
+    user_site = None
+    tb = exc.__traceback__
+    while tb is not None:
+        site = tb.tb_frame
+        if is_user_path(site.f_code.co_filename):
+            user_site = site
+        tb = tb.tb_next
+    return user_site if user_site is not None else site
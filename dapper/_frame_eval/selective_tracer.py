@@ -20,7 +20,11 @@ from typing import TypedDict
 from dapper._frame_eval.cache_manager import get_breakpoints
 from dapper._frame_eval.cache_manager import invalidate_breakpoints
 from dapper._frame_eval.cache_manager import set_breakpoints
+from dapper._frame_eval.code_index import register_code_object
 from dapper._frame_eval.condition_evaluator import get_condition_evaluator
+from dapper.core.line_index import code_object_lines
+from dapper.utils.internal_threads import ThreadEventCounts
+from dapper.utils.internal_threads import _internal_idents
 
 
 def _safe_int(value: object, default: int) -> int:
@@ -275,9 +279,9 @@ class FrameTraceAnalyzer:
     ) -> set[int]:
         """Return tracked breakpoint lines that belong to *code_obj*."""
         try:
-            code_lines = {line for _, _, line in code_obj.co_lines() if line is not None}
+            code_lines = code_object_lines(code_obj)
         except Exception:
-            code_lines = set()
+            code_lines = frozenset()
 
         if code_lines:
             return file_breakpoints.intersection(code_lines)
@@ -550,6 +554,7 @@ class SelectiveTraceDispatcher:
             "dispatched_calls": 0,
             "skipped_calls": 0,
         }
+        self.thread_events = ThreadEventCounts()
         self._lock = threading.RLock()
 
     def set_debugger_trace_func(
@@ -572,6 +577,10 @@ class SelectiveTraceDispatcher:
             Trace function or None if frame should not be traced
 
         """
+        ident = threading.get_ident()
+        if ident in _internal_idents:
+            self.thread_events.gate(ident)
+            return None
         with self._lock:
             self._dispatch_stats["total_calls"] += 1
             trace_func = self.debugger_trace_func
@@ -621,6 +630,7 @@ class SelectiveTraceDispatcher:
                 "skip_rate": skipped / total if total > 0 else 0,
             },
             "analyzer_stats": analyzer_stats,
+            "thread_events": self.thread_events.breakdown(),
         }
 
     def clear_statistics(self) -> None:
@@ -630,6 +640,7 @@ class SelectiveTraceDispatcher:
             "dispatched_calls": 0,
             "skipped_calls": 0,
         }
+        self.thread_events.clear()
         self.analyzer.clear_statistics()
 
 
@@ -798,7 +809,12 @@ def should_trace_code_location(
     *,
     allow_current_eval_frame: bool = False,
 ) -> TraceDecision:
-    """Return the shared tracing decision for a code object location."""
+    """Return the shared tracing decision for a code object location.
+
+    Every code object seen here is also recorded in the live code-object index
+    so eager instrumentation can find it later without scanning modules.
+    """
+    register_code_object(code_obj)
     return _trace_manager.dispatcher.analyzer.should_trace_code(
         code_obj,
         lineno,
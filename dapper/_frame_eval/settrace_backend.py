@@ -109,6 +109,7 @@ class SettraceBackend(TracingBackend):
                     "performance_monitoring": False,
                     "fallback_on_error": False,
                     "eager_instrumentation": False,
+                    "inline_conditions": False,
                 },
                 integration_stats={},
                 performance_data={},
@@ -74,6 +74,7 @@ def _dispatch_trace_callback(
 def _get_code_extra_metadata(code_obj: CodeType) -> Any: ...
 def _get_current_eval_frame_address() -> int: ...
 def _get_modified_code_for_evaluation(code_obj: CodeType) -> CodeType | None: ...
+def _has_cached_skip_decision(code_obj: CodeType) -> bool: ...
 def _set_thread_trace_func(trace_func: Any) -> None: ...
 def _store_code_extra_metadata(code_obj: CodeType, metadata: Any) -> bool: ...
 def _store_modified_code_for_evaluation(
@@ -1,11 +1,27 @@
 """Adapter components for Dapper debug adapter."""
 
-from dapper.adapter.lifecycle import BackendLifecycleState
-from dapper.adapter.lifecycle import LifecycleManager
-from dapper.adapter.lifecycle import LifecycleTransitionError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from dapper.adapter.lifecycle import BackendLifecycleState
+    from dapper.adapter.lifecycle import LifecycleManager
+    from dapper.adapter.lifecycle import LifecycleTransitionError
 
 __all__ = [
     "BackendLifecycleState",
     "LifecycleManager",
     "LifecycleTransitionError",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BackendLifecycleState": "dapper.adapter.lifecycle",
+        "LifecycleManager": "dapper.adapter.lifecycle",
+        "LifecycleTransitionError": "dapper.adapter.lifecycle",
+    },
+)
@@ -37,6 +37,7 @@ from dapper.core.breakpoints_controller import BreakpointController
 from dapper.ipc.connections.pipe import NamedPipeServerConnection
 from dapper.ipc.connections.tcp import TCPServerConnection
 from dapper.utils.events import EventEmitter
+from dapper.utils.internal_threads import InternalThread
 from dapper.utils.threadsafe_async import schedule_coroutine_threadsafe
 
 logger = logging.getLogger(__name__)
@@ -193,7 +194,7 @@ class AdapterThread:
         if self._thread and self._thread.is_alive():
             return
 
-        self._thread = threading.Thread(
+        self._thread = InternalThread(
             target=self._run_adapter_loop,
             name="DapperAdapterThread",
             daemon=True,
@@ -69,11 +69,21 @@ class _PyDebuggerEventRouter:
         self._debugger.schedule_program_exit(exit_code)
 
     def handle_event_stacktrace(self, data: dict[str, Any]) -> None:
-        """Cache stack trace data from the debuggee."""
+        """Cache stack trace data from the debuggee.
+
+        Only a complete stack is cached.  A page of a deeper stack would
+        later be served, and paged again, as if it were the whole stack, so
+        it drops the thread's cached stack instead.
+        """
         thread_id = data.get("threadId", 1)
         stack_frames = data.get("stackFrames", [])
+        start_frame = data.get("startFrame", 0)
+        total_frames = data.get("totalFrames", len(stack_frames))
         with self._debugger.lock:
-            self._debugger.session_facade.cache_stack_frames(thread_id, stack_frames)
+            if start_frame == 0 and len(stack_frames) >= total_frames:
+                self._debugger.session_facade.cache_stack_frames(thread_id, stack_frames)
+            else:
+                self._debugger.session_facade.discard_stack_frames(thread_id)
 
     def handle_event_variables(self, data: dict[str, Any]) -> None:
         """Cache variables payload from the debuggee."""
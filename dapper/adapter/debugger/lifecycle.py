@@ -5,11 +5,12 @@ import logging
 import os
 from pathlib import Path
 import sys
-import threading
 from typing import TYPE_CHECKING
 
 from dapper.core.inprocess_debugger import InProcessDebugger
 from dapper.ipc import TransportConfig
+from dapper.shared.source_watcher import start_session_source_watcher
+from dapper.utils.internal_threads import InternalThread
 
 if TYPE_CHECKING:
     from dapper.adapter.debugger.py_debugger import PyDebugger
@@ -78,8 +79,12 @@ class _PyDebuggerLifecycleManager:
             debug_args.append("--no-just-my-code")
         if config.strict_expression_watch_policy:
             debug_args.append("--strict-expression-watch-policy")
+        if config.non_stop:
+            debug_args.append("--non-stop")
         if config.subprocess_auto_attach:
             debug_args.append("--subprocess-auto-attach")
+            if config.subprocess_scalable:
+                debug_args.append("--subprocess-scalable")
 
         transport_config = TransportConfig(
             transport=config.ipc.transport,
@@ -107,13 +112,14 @@ class _PyDebuggerLifecycleManager:
         """
         start_target = self._debugger._start_debuggee_process
         if working_directory is None and environment is None:
-            threading.Thread(
+            InternalThread(
                 target=start_target,
                 args=(debug_args,),
                 daemon=True,
+                name="dapper-debuggee-start",
             ).start()
         else:
-            threading.Thread(
+            InternalThread(
                 target=start_target,
                 kwargs={
                     "debug_args": debug_args,
@@ -121,6 +127,7 @@ class _PyDebuggerLifecycleManager:
                     "environment": environment,
                 },
                 daemon=True,
+                name="dapper-debuggee-start",
             ).start()
 
     async def launch(self, config: DapperConfig) -> None:
@@ -199,6 +206,7 @@ class _PyDebuggerLifecycleManager:
         inproc = InProcessDebugger(
             just_my_code=config.just_my_code,
             strict_expression_watch_policy=config.strict_expression_watch_policy,
+            non_stop=config.non_stop,
         )
         self._debugger.create_inprocess_bridge(
             inproc,
@@ -208,6 +216,7 @@ class _PyDebuggerLifecycleManager:
             on_output=self._debugger.handle_inprocess_output,
         )
         self._debugger.create_inprocess_backend()
+        start_session_source_watcher()
 
         self._debugger.program_running = True
         proc_event = {
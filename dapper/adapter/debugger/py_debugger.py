@@ -31,6 +31,7 @@ from dapper.core.asyncio_task_inspector import AsyncioTaskRegistry
 from dapper.core.breakpoint_manager import BreakpointManager
 from dapper.core.variable_manager import VariableManager
 from dapper.ipc.ipc_manager import IPCManager
+from dapper.shared import debug_shared
 
 try:
     # Optional integration module; may not be present on all platforms.
@@ -57,17 +58,21 @@ if TYPE_CHECKING:
     from dapper.protocol.capabilities import ExceptionFilterOptions
     from dapper.protocol.capabilities import ExceptionOptions
     from dapper.protocol.debugger_protocol import Variable
+    from dapper.protocol.requests import AgentSnapshotArguments
+    from dapper.protocol.requests import AgentSnapshotResponseBody
     from dapper.protocol.requests import ContinueResponseBody
     from dapper.protocol.requests import DataBreakpointInfoResponseBody
     from dapper.protocol.requests import EvaluateResponseBody
     from dapper.protocol.requests import ExceptionInfoResponseBody
     from dapper.protocol.requests import FunctionBreakpoint
     from dapper.protocol.requests import GotoTarget
+    from dapper.protocol.requests import HotReloadBatchResponseBody
     from dapper.protocol.requests import HotReloadOptions
     from dapper.protocol.requests import HotReloadResponseBody
     from dapper.protocol.requests import Module
     from dapper.protocol.requests import SetExpressionResponseBody
     from dapper.protocol.requests import SetVariableResponseBody
+    from dapper.protocol.requests import SourceRegistryStatsResponseBody
     from dapper.protocol.requests import StackTraceResponseBody
     from dapper.protocol.structures import Breakpoint
     from dapper.protocol.structures import Scope
@@ -975,6 +980,52 @@ class PyDebugger(_PyDebuggerSessionCompatMixin):
         """Reload a Python module in-place without restarting the session."""
         return await self._hot_reload_service.reload_module(path, options)
 
+    async def hot_reload_batch(
+        self,
+        paths: list[str] | None,
+        options: HotReloadOptions | None = None,
+    ) -> HotReloadBatchResponseBody:
+        """Reload several modules at once; ``None`` reloads edited user sources."""
+        return await self._hot_reload_service.reload_batch(paths, options)
+
+    async def source_registry_stats(self) -> SourceRegistryStatsResponseBody:
+        """Return statistics of the debuggee's in-memory source registry."""
+        backend = self._external_backend
+        if backend is not None:
+            return await backend.source_registry_stats()
+        stats = debug_shared.get_active_session().sources.get_dynamic_source_stats()
+        return cast("SourceRegistryStatsResponseBody", stats)
+
+    async def agent_snapshot(self, args: AgentSnapshotArguments) -> AgentSnapshotResponseBody:
+        """Build an agent snapshot in the external debuggee.
+
+        In-process sessions have no debuggee-side builder; the request
+        handler assembles their snapshot from the regular DAP queries.
+        """
+        backend = self._external_backend
+        if backend is None:
+            msg = "Agent snapshots are built in the debuggee; no external backend is active"
+            raise RuntimeError(msg)
+        return await backend.agent_snapshot(args)
+
+    async def variable_tree(
+        self,
+        variables_reference: int,
+        *,
+        depth: int,
+        max_items: int,
+    ) -> dict[str, Any]:
+        """Expand a variable subtree in the external debuggee in one round trip.
+
+        Raises:
+            RuntimeError: If no external backend is active.
+        """
+        backend = self._external_backend
+        if backend is None:
+            msg = "Variable trees are expanded in the debuggee; no external backend is active"
+            raise RuntimeError(msg)
+        return await backend.variable_tree(variables_reference, depth=depth, max_items=max_items)
+
     async def evaluate_expression(
         self,
         expression: str,
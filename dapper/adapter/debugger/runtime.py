@@ -3,7 +3,6 @@ from __future__ import annotations
 # ruff: noqa: SLF001
 import logging
 import subprocess
-import threading
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
@@ -11,6 +10,7 @@ from typing import cast
 from dapper.adapter.external_backend import ExternalProcessBackend
 from dapper.adapter.inprocess_backend import InProcessBackend
 from dapper.adapter.inprocess_bridge import InProcessBridge
+from dapper.utils.internal_threads import InternalThread
 from dapper.utils.threadsafe_async import run_coroutine_fire_and_forget_threadsafe
 
 if TYPE_CHECKING:
@@ -75,15 +75,17 @@ class _PyDebuggerRuntimeManager:
 
             stdout = cast("Any", self._debugger.process.stdout)
             stderr = cast("Any", self._debugger.process.stderr)
-            threading.Thread(
+            InternalThread(
                 target=self.read_output,
                 args=(stdout, "stdout"),
                 daemon=True,
+                name="dapper-output-stdout",
             ).start()
-            threading.Thread(
+            InternalThread(
                 target=self.read_output,
                 args=(stderr, "stderr"),
                 daemon=True,
+                name="dapper-output-stderr",
             ).start()
 
             exit_code = self._debugger.process.wait()
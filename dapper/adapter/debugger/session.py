@@ -111,6 +111,10 @@ class _PyDebuggerSessionFacade:
         with self._lock:
             return self._current_stack_frames.get(thread_id)
 
+    def discard_stack_frames(self, thread_id: int) -> None:
+        with self._lock:
+            self._current_stack_frames.pop(thread_id, None)
+
     def clear_data_watch_containers(self) -> None:
         with self._lock:
             self._data_watches.clear()
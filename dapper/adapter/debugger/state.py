@@ -118,7 +118,16 @@ class _PyDebuggerStateManager:
             {"progressId": progress_id, "title": "Setting breakpoints"},
         )
 
-        await backend.set_breakpoints(path, spec_list)
+        backend_result = await backend.set_breakpoints(path, spec_list)
+        # Batched launcher updates report real per-line verification.
+        verified_by_line = {
+            bp.get("line"): bool(bp.get("verified"))
+            for bp in backend_result or []
+            if isinstance(bp, dict) and "verified" in bp
+        }
+        for bp in storage_list:
+            if bp.get("line") in verified_by_line:
+                bp["verified"] = verified_by_line[bp.get("line")]
         self._debugger.forward_breakpoint_events(storage_list)
 
         self._debugger.emit_event("progressEnd", {"progressId": progress_id})
@@ -27,16 +27,20 @@ if TYPE_CHECKING:
 
     from dapper.config import DapperConfig
     from dapper.ipc.ipc_manager import IPCManager
+    from dapper.protocol.requests import AgentSnapshotArguments
+    from dapper.protocol.requests import AgentSnapshotResponseBody
     from dapper.protocol.requests import CompletionsResponseBody
     from dapper.protocol.requests import ContinueResponseBody
     from dapper.protocol.requests import EvaluateResponseBody
     from dapper.protocol.requests import GotoTarget
+    from dapper.protocol.requests import HotReloadBatchResponseBody
     from dapper.protocol.requests import HotReloadResponseBody
     from dapper.protocol.requests import SetBreakpointsResponseBody
     from dapper.protocol.requests import SetExceptionBreakpointsResponseBody
     from dapper.protocol.requests import SetExpressionResponseBody
     from dapper.protocol.requests import SetFunctionBreakpointsResponseBody
     from dapper.protocol.requests import SetVariableResponseBody
+    from dapper.protocol.requests import SourceRegistryStatsResponseBody
     from dapper.protocol.requests import StackTraceResponseBody
 
 logger = logging.getLogger(__name__)
@@ -53,6 +57,19 @@ def _command_response_timeout_seconds() -> float | None:
     return value
 
 
+def _breakpoint_batch_window_seconds() -> float:
+    """Return how long ``setBreakpoints`` requests are collected before sending.
+
+    A value of ``0`` disables coalescing and sends each request on its own.
+    """
+    raw = str(os.getenv("DAPPER_BREAKPOINT_BATCH_WINDOW_SECONDS", "0.005")).strip()
+    try:
+        value = float(raw)
+    except ValueError:
+        return 0.0
+    return max(value, 0.0)
+
+
 class _SetExpressionDispatchArgs(TypedDict):
     expression: str
     value: str
@@ -66,6 +83,22 @@ class _HotReloadDispatchArgs(TypedDict, total=False):
     options: dict[str, Any]
 
 
+class _HotReloadBatchDispatchArgs(TypedDict, total=False):
+    """Arguments for the 'hot_reload_batch' dispatch entry."""
+
+    paths: list[str] | None
+    options: dict[str, Any]
+
+
+class _VariableTreeDispatchArgs(TypedDict, total=False):
+    """Arguments for the 'variable_tree' dispatch entry."""
+
+    variables_reference: int
+    depth: int
+    max_items: int
+    max_bytes: int
+
+
 class _EmptyBody(TypedDict, total=False):
     """TypedDict for DAP commands whose response body carries no fields."""
 
@@ -116,6 +149,13 @@ class ExternalProcessBackend(BaseBackend):
         self._lock = lock
         self._get_next_command_id = get_next_command_id
 
+        # Pending ``setBreakpoints`` requests waiting to be sent as one
+        # ``dapper/setBreakpointsBatch`` command, and the task that flushes them.
+        self._breakpoint_batch: list[
+            tuple[dict[str, Any], asyncio.Future[SetBreakpointsResponseBody]]
+        ] = []
+        self._breakpoint_flush_task: asyncio.Task[None] | None = None
+
         # Register cleanup callbacks
         self._lifecycle.add_cleanup_callback(self._cleanup_ipc)
         self._lifecycle.add_cleanup_callback(self._cleanup_commands)
@@ -144,6 +184,10 @@ class ExternalProcessBackend(BaseBackend):
             "configuration_done": self._dispatch_configuration_done,
             "terminate": self._dispatch_terminate,
             "hot_reload": self._dispatch_hot_reload,
+            "hot_reload_batch": self._dispatch_hot_reload_batch,
+            "source_registry_stats": self._dispatch_source_registry_stats,
+            "agent_snapshot": self._dispatch_agent_snapshot,
+            "variable_tree": self._dispatch_variable_tree,
         }
 
     def _cleanup_ipc(self) -> None:
@@ -161,6 +205,10 @@ class ExternalProcessBackend(BaseBackend):
                     if not future.done():
                         future.cancel()
                 self._pending_commands.clear()
+            for _arguments, future in self._breakpoint_batch:
+                if not future.done():
+                    future.cancel()
+            self._breakpoint_batch.clear()
         except Exception:
             logger.exception("Failed to cleanup pending commands")
 
@@ -199,19 +247,71 @@ class ExternalProcessBackend(BaseBackend):
         return {name: _wrap(handler) for name, handler in self._dispatch_map.items()}
 
     async def _dispatch_set_breakpoints(self, args: dict[str, Any]) -> SetBreakpointsResponseBody:
-        cmd = {
-            "command": "setBreakpoints",
-            "arguments": {
-                "source": {"path": args["path"]},
-                "breakpoints": [dict(bp) for bp in args["breakpoints"]],
-            },
+        arguments = {
+            "source": {"path": args["path"]},
+            "breakpoints": [dict(bp) for bp in args["breakpoints"]],
         }
-        await self._send_command(cmd)
+        window = _breakpoint_batch_window_seconds()
+        if window <= 0:
+            await self._send_command({"command": "setBreakpoints", "arguments": arguments})
+            return self._set_breakpoints_body(arguments, None)
+
+        # Coalesce a burst of per-file requests (e.g. workspace restore) into
+        # a single launcher round trip; see ``_flush_breakpoint_batch``.
+        future: asyncio.Future[SetBreakpointsResponseBody] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._breakpoint_batch.append((arguments, future))
+        if self._breakpoint_flush_task is None:
+            self._breakpoint_flush_task = asyncio.get_running_loop().create_task(
+                self._flush_breakpoint_batch(window)
+            )
+        return await future
+
+    async def _flush_breakpoint_batch(self, window: float) -> None:
+        """Send the collected ``setBreakpoints`` requests and resolve their futures."""
+        await asyncio.sleep(window)
+        batch, self._breakpoint_batch = self._breakpoint_batch, []
+        self._breakpoint_flush_task = None
+        if not batch:
+            return
+
+        results: list[Any] = [None] * len(batch)
+        try:
+            if len(batch) == 1:
+                await self._send_command({"command": "setBreakpoints", "arguments": batch[0][0]})
+            else:
+                cmd = {
+                    "command": "dapper/setBreakpointsBatch",
+                    "arguments": {"files": [arguments for arguments, _ in batch]},
+                }
+                response = await self._send_command(cmd, expect_response=True)
+                files = self._extract_body(response, {}).get("files")
+                if isinstance(files, list) and len(files) == len(batch):
+                    results = files
+        except Exception as exc:
+            for _arguments, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (arguments, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(self._set_breakpoints_body(arguments, result))
+
+    @staticmethod
+    def _set_breakpoints_body(
+        arguments: dict[str, Any],
+        result: dict[str, Any] | None,
+    ) -> SetBreakpointsResponseBody:
+        """Build a per-file body from a batch *result*, or assume verified."""
+        if isinstance(result, dict) and isinstance(result.get("breakpoints"), list):
+            return cast("SetBreakpointsResponseBody", {"breakpoints": result["breakpoints"]})
         return cast(
             "SetBreakpointsResponseBody",
             {
                 "breakpoints": [
-                    {"verified": True, "line": bp.get("line")} for bp in args["breakpoints"]
+                    {"verified": True, "line": bp.get("line")} for bp in arguments["breakpoints"]
                 ]
             },
         )
@@ -474,6 +574,85 @@ class ExternalProcessBackend(BaseBackend):
         body = self._extract_body(response, _default)
         return cast("HotReloadResponseBody", body)
 
+    async def _dispatch_hot_reload_batch(
+        self, args: _HotReloadBatchDispatchArgs
+    ) -> HotReloadBatchResponseBody:
+        """Send a 'hotReloadBatch' command to the debuggee and await its response.
+
+        Raises:
+            RuntimeError: If the debuggee signals ``success=False``.
+        """
+        arguments: dict[str, Any] = {"options": args.get("options") or {}}
+        paths = args.get("paths")
+        if paths is not None:
+            arguments["paths"] = list(paths)
+        response = await self._send_command(
+            {"command": "hotReloadBatch", "arguments": arguments}, expect_response=True
+        )
+        if response is not None and response.get("success") is False:
+            msg = str(response.get("message") or "hotReloadBatch failed in debuggee process")
+            raise RuntimeError(msg)
+
+        _default: dict[str, Any] = {
+            "reloadedModules": [],
+            "reloadedPaths": [],
+            "reboundFrames": 0,
+            "updatedFrameCodes": 0,
+            "patchedReferrers": 0,
+            "warnings": [],
+        }
+        body = self._extract_body(response, _default)
+        return cast("HotReloadBatchResponseBody", body)
+
+    async def _dispatch_source_registry_stats(
+        self, *_args: Any, **_kwargs: Any
+    ) -> SourceRegistryStatsResponseBody:
+        """Fetch the debuggee's dynamic source registry statistics."""
+        response = await self._send_command(
+            {"command": "sourceRegistryStats"}, expect_response=True
+        )
+        body = self._extract_body(response, {})
+        return cast("SourceRegistryStatsResponseBody", body)
+
+    async def _dispatch_agent_snapshot(
+        self, args: AgentSnapshotArguments
+    ) -> AgentSnapshotResponseBody:
+        """Build the agent snapshot in the debuggee, where frame fingerprints live.
+
+        Raises:
+            RuntimeError: If the debuggee signals ``success=False``.
+        """
+        response = await self._send_command(
+            {"command": "dapper/agentSnapshot", "arguments": dict(args)}, expect_response=True
+        )
+        if response is not None and response.get("success") is False:
+            msg = str(response.get("message") or "agentSnapshot failed in debuggee process")
+            raise RuntimeError(msg)
+        body = self._extract_body(response, {})
+        return cast("AgentSnapshotResponseBody", body)
+
+    async def _dispatch_variable_tree(self, args: _VariableTreeDispatchArgs) -> dict[str, Any]:
+        """Expand a variable subtree in the debuggee with one round trip.
+
+        Raises:
+            RuntimeError: If the debuggee signals ``success=False``.
+        """
+        arguments: dict[str, Any] = {"variablesReference": args["variables_reference"]}
+        for key, wire_key in (
+            ("depth", "depth"),
+            ("max_items", "maxItems"),
+            ("max_bytes", "maxBytes"),
+        ):
+            if key in args:
+                arguments[wire_key] = args[key]
+        response = await self._send_command(
+            {"command": "variableTree", "arguments": arguments}, expect_response=True
+        )
+        if response is not None and response.get("success") is False:
+            msg = str(response.get("message") or "variableTree failed in debuggee process")
+            raise RuntimeError(msg)
+        return self._extract_body(response, {"variables": [], "nodes": 0, "truncated": False})
+
     async def _execute_command(
         self,
         command: str,
@@ -553,3 +732,33 @@ class ExternalProcessBackend(BaseBackend):
         _ = config  # Mark as intentionally unused
         await self.initialize()
         logger.info("External process debugging session attached")
+
+    # ------------------------------------------------------------------
+    # Dapper extensions served by the debuggee
+    # ------------------------------------------------------------------
+    async def source_registry_stats(self) -> SourceRegistryStatsResponseBody:
+        """Return the debuggee's dynamic source registry statistics."""
+        body = await self._execute_with_timeout("source_registry_stats")
+        return cast("SourceRegistryStatsResponseBody", body)
+
+    async def agent_snapshot(self, args: AgentSnapshotArguments) -> AgentSnapshotResponseBody:
+        """Build an agent snapshot in the debuggee, where frame fingerprints live."""
+        body = await self._execute_with_timeout("agent_snapshot", dict(args))
+        return cast("AgentSnapshotResponseBody", body)
+
+    async def variable_tree(
+        self,
+        variables_reference: int,
+        *,
+        depth: int,
+        max_items: int,
+    ) -> dict[str, Any]:
+        """Expand a variable subtree in the debuggee with one round trip.
+
+        Returns the ``variableTree`` body: ``variables``, ``nodes`` and
+        ``truncated``.
+        """
+        return await self._execute_with_timeout(
+            "variable_tree",
+            {"variables_reference": variables_reference, "depth": depth, "max_items": max_items},
+        )
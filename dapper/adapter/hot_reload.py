@@ -27,8 +27,11 @@ except Exception:  # pragma: no cover - optional frame-eval integration
     _update_breakpoints = None
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from dapper.adapter.debugger.py_debugger import PyDebugger
     from dapper.adapter.external_backend import ExternalProcessBackend
+    from dapper.protocol.requests import HotReloadBatchResponseBody
     from dapper.protocol.requests import HotReloadOptions
     from dapper.protocol.requests import HotReloadResponseBody
     from dapper.protocol.structures import SourceBreakpoint
@@ -232,6 +235,87 @@ class HotReloadService:
 
         return body
 
+    async def reload_batch(
+        self,
+        paths: list[str] | None,
+        options: HotReloadOptions | None = None,
+    ) -> HotReloadBatchResponseBody:
+        """Reload several files as one batch in the debuggee and return results.
+
+        The debuggee side runs
+        :func:`~dapper.shared.reload_helpers.perform_batch_reload` (directly
+        for in-process sessions, via the ``hotReloadBatch`` IPC command
+        otherwise).  The adapter then does the bookkeeping of
+        :meth:`reload_module` once for the batch.  ``paths=None`` reloads the
+        user sources edited since the previous reload.
+        """
+        start = time.perf_counter()
+        label = ", ".join(paths) if paths else "<changed sources>"
+        try:
+            if self._debugger.get_inprocess_backend() is not None:
+                from dapper.shared import reload_helpers  # noqa: PLC0415
+
+                raw: dict[str, Any] = dict(
+                    reload_helpers.perform_batch_reload(
+                        paths,
+                        options,
+                        get_frames_fn=cast(
+                            "Callable[[], list[types.FrameType]]", self._iter_live_frames
+                        ),
+                    )
+                )
+            else:
+                backend: ExternalProcessBackend | None = self._debugger.get_external_backend()
+                if backend is None:
+                    self._raise_runtime_error(
+                        "No external-process backend is available for hot reload"
+                    )
+                raw = await backend._execute_command(  # noqa: SLF001
+                    "hot_reload_batch",
+                    {"paths": paths, "options": options or {}},
+                )
+
+            modules = [str(m) for m in raw.get("reloadedModules") or []]
+            reloaded_paths = [str(p) for p in raw.get("reloadedPaths") or []]
+            warnings = [str(w) for w in raw.get("warnings") or []]
+
+            self._invalidate_variable_caches(warnings)
+            for path in reloaded_paths:
+                self._invalidate_frame_eval_cache(path, warnings)
+                breakpoint_lines = await self._reapply_breakpoints(path)
+                if breakpoint_lines:
+                    self._update_frame_eval_breakpoints(path, breakpoint_lines, warnings)
+
+            body: HotReloadBatchResponseBody = {
+                "reloadedModules": modules,
+                "reloadedPaths": reloaded_paths,
+                "reboundFrames": int(raw.get("reboundFrames", 0)),
+                "updatedFrameCodes": int(raw.get("updatedFrameCodes", 0)),
+                "patchedReferrers": int(raw.get("patchedReferrers", 0)),
+                "warnings": warnings,
+                "durationMs": (time.perf_counter() - start) * 1000.0,
+            }
+            self._emit_batch_reload_events(body)
+            self._record_hot_reload_success(
+                module_name=", ".join(modules),
+                path=", ".join(reloaded_paths),
+                rebound_frames=body["reboundFrames"],
+                updated_frame_codes=body["updatedFrameCodes"],
+                warning_count=len(warnings),
+                duration_ms=body["durationMs"],
+            )
+        except Exception as exc:
+            self._record_hot_reload_failure(
+                module_name="<batch>",
+                path=label,
+                error_type=type(exc).__name__,
+                error_message=str(exc),
+                duration_ms=(time.perf_counter() - start) * 1000.0,
+            )
+            raise
+
+        return body
+
     def _resolve_reload_target(self, path: str) -> tuple[Path, str, ModuleType]:
         resolved = Path(path).resolve(strict=True)
         self._assert_reloadable_source(resolved)
@@ -330,6 +414,32 @@ class HotReloadService:
         }
         self._debugger.emit_event("dapper/hotReloadResult", event_payload)
 
+    def _emit_batch_reload_events(self, body: HotReloadBatchResponseBody) -> None:
+        modules = body.get("reloadedModules", [])
+        paths = body.get("reloadedPaths", [])
+        for module_name, path in zip(modules, paths):
+            resolved = Path(path)
+            source = self._debugger._source_introspection.make_source(  # noqa: SLF001
+                resolved,
+                origin=f"module:{module_name}",
+                name=resolved.name,
+            )
+            self._debugger.emit_event("loadedSource", {"reason": "changed", "source": source})
+
+        event_payload = {
+            "module": modules[0] if modules else "",
+            "path": paths[0] if paths else "",
+            "modules": modules,
+            "paths": paths,
+            "reboundFrames": body.get("reboundFrames", 0),
+            "updatedFrameCodes": body.get("updatedFrameCodes", 0),
+            "patchedInstances": 0,
+            "patchedReferrers": body.get("patchedReferrers", 0),
+            "warnings": body.get("warnings", []),
+            "durationMs": body.get("durationMs", 0.0),
+        }
+        self._debugger.emit_event("dapper/hotReloadResult", event_payload)
+
     def _record_hot_reload_success(
         self,
         *,
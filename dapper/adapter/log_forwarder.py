@@ -10,11 +10,11 @@ This module provides:
 from __future__ import annotations
 
 import logging
-import threading
 import time
 from typing import TYPE_CHECKING
 from typing import Any
 
+from dapper.utils.internal_threads import InternalTimer
 from dapper.utils.threadsafe_async import SendEvent
 from dapper.utils.threadsafe_async import send_event_threadsafe
 
@@ -94,7 +94,7 @@ class TelemetryForwarder:
         self._send_event = send_event
         self._loop = loop
         self._interval = interval_seconds
-        self._timer: threading.Timer | None = None
+        self._timer: InternalTimer | None = None
         self._running = False
 
     def start(self) -> None:
@@ -120,7 +120,7 @@ class TelemetryForwarder:
     def _schedule_next(self) -> None:
         if not self._running:
             return
-        self._timer = threading.Timer(self._interval, self._tick)
+        self._timer = InternalTimer(self._interval, self._tick, name="dapper-telemetry")
         self._timer.daemon = True
         self._timer.start()
 
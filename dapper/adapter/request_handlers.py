@@ -37,6 +37,7 @@ from dapper.protocol.requests import EvaluateResponse
 from dapper.protocol.requests import ExceptionInfoResponse
 from dapper.protocol.requests import GotoResponse
 from dapper.protocol.requests import GotoTargetsResponse
+from dapper.protocol.requests import HotReloadBatchResponse
 from dapper.protocol.requests import HotReloadResponse
 from dapper.protocol.requests import LaunchResponse
 from dapper.protocol.requests import LoadedSourcesResponse
@@ -52,6 +53,7 @@ from dapper.protocol.requests import SetExceptionBreakpointsResponse
 from dapper.protocol.requests import SetExpressionResponse
 from dapper.protocol.requests import SetFunctionBreakpointsResponse
 from dapper.protocol.requests import SetVariableResponse
+from dapper.protocol.requests import SourceRegistryStatsResponse
 from dapper.protocol.requests import SourceResponse
 from dapper.protocol.requests import StackTraceResponse
 from dapper.protocol.requests import StepInResponse
@@ -60,6 +62,7 @@ from dapper.protocol.requests import TerminateResponse
 from dapper.protocol.requests import ThreadsResponse
 from dapper.protocol.requests import VariablesResponse
 from dapper.shared import debug_shared
+from dapper.shared.agent_snapshot import AgentSnapshotTracker
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -70,7 +73,9 @@ if TYPE_CHECKING:
     from dapper.protocol.capabilities import ExceptionFilterOptions
     from dapper.protocol.requests import AgentEvalRequest
     from dapper.protocol.requests import AgentInspectRequest
+    from dapper.protocol.requests import AgentSnapshotArguments
     from dapper.protocol.requests import AgentSnapshotRequest
+    from dapper.protocol.requests import AgentSnapshotResponseBody
     from dapper.protocol.requests import AttachRequest
     from dapper.protocol.requests import CompletionItem
     from dapper.protocol.requests import CompletionsRequest
@@ -87,6 +92,8 @@ if TYPE_CHECKING:
     from dapper.protocol.requests import GotoTargetsRequest
     from dapper.protocol.requests import GotoTargetsResponseBody
     from dapper.protocol.requests import HotReloadArguments
+    from dapper.protocol.requests import HotReloadBatchRequest
+    from dapper.protocol.requests import HotReloadBatchResponseBody
     from dapper.protocol.requests import HotReloadOptions
     from dapper.protocol.requests import HotReloadRequest
     from dapper.protocol.requests import HotReloadResponseBody
@@ -106,6 +113,7 @@ if TYPE_CHECKING:
     from dapper.protocol.requests import SetExpressionRequest
     from dapper.protocol.requests import SetFunctionBreakpointsRequest
     from dapper.protocol.requests import SetVariableRequest
+    from dapper.protocol.requests import SourceRegistryStatsRequest
     from dapper.protocol.requests import SourceRequest
     from dapper.protocol.requests import SourceResponseBody
     from dapper.protocol.requests import StackTraceRequest
@@ -131,6 +139,9 @@ class RequestHandler:
 
     def __init__(self, server: DebugAdapterServer):
         self.server = server
+        # Checkpoints for agent snapshots assembled in the adapter (in-process
+        # sessions); external debuggees keep their own.
+        self._agent_snapshots = AgentSnapshotTracker()
 
     async def handle_request(self, request: DAPRequest) -> DAPResponse | None:
         """Handle a DAP request and return a response."""
@@ -478,16 +489,8 @@ class RequestHandler:
                 message="Missing source path",
             )
 
-        # Guard: debugger must be stopped on at least one thread.
         debugger = self.server.debugger
-        session_facade = getattr(debugger, "_session_facade", None)
-        if session_facade is not None and callable(getattr(session_facade, "iter_threads", None)):
-            thread_items = session_facade.iter_threads()
-        else:
-            thread_items = []
-
-        is_stopped = any(t.is_stopped for _, t in thread_items) or debugger.stopped_event.is_set()
-        if not is_stopped:
+        if not self._debugger_is_stopped():
             return self._make_response(
                 request,
                 "dapper/hotReload",
@@ -522,6 +525,106 @@ class RequestHandler:
                 message=f"Hot reload failed: {e!s}",
             )
 
+    async def _handle_dapper_hot_reload_batch(
+        self,
+        request: HotReloadBatchRequest,
+    ) -> HotReloadBatchResponse:
+        """Handle the 'dapper/hotReloadBatch' custom request.
+
+        Reloads several sources as one operation: dependency-ordered module
+        reloads, one live-frame walk and one pass patching references held
+        outside frames.  Without ``sources`` the debuggee reloads every
+        loaded user source edited since the previous reload.  Files that
+        cannot be reloaded are reported in body.warnings.
+        """
+        raw_arguments = request.get("arguments")
+        args = raw_arguments if isinstance(raw_arguments, dict) else {}
+        paths: list[str] | None = None
+        raw_sources = args.get("sources")
+        if isinstance(raw_sources, list):
+            paths = [
+                src["path"]
+                for src in raw_sources
+                if isinstance(src, dict) and isinstance(src.get("path"), str) and src["path"]
+            ]
+            if not paths:
+                return self._make_response(
+                    request,
+                    "dapper/hotReloadBatch",
+                    HotReloadBatchResponse,
+                    success=False,
+                    message="Missing source paths",
+                )
+        raw_options = args.get("options")
+        options: HotReloadOptions = raw_options if isinstance(raw_options, dict) else {}
+
+        if not self._debugger_is_stopped():
+            return self._make_response(
+                request,
+                "dapper/hotReloadBatch",
+                HotReloadBatchResponse,
+                success=False,
+                message="Hot reload requires the debugger to be stopped",
+            )
+
+        try:
+            body: HotReloadBatchResponseBody = await self.server.debugger.hot_reload_batch(
+                paths, options
+            )
+            return self._make_response(
+                request,
+                "dapper/hotReloadBatch",
+                HotReloadBatchResponse,
+                body=body,
+            )
+        except Exception as e:
+            logger.exception("Error handling dapper/hotReloadBatch request")
+            return self._make_response(
+                request,
+                "dapper/hotReloadBatch",
+                HotReloadBatchResponse,
+                success=False,
+                message=f"Hot reload failed: {e!s}",
+            )
+
+    async def _handle_dapper_source_registry_stats(
+        self,
+        request: SourceRegistryStatsRequest,
+    ) -> SourceRegistryStatsResponse:
+        """Handle 'dapper/sourceRegistryStats'.
+
+        Reports entry counts, stored versus raw bytes, the eviction budget and
+        hit/eviction/compression counters of the debuggee's registry of
+        in-memory sources (eval/exec strings, templates).
+        """
+        try:
+            body = await self.server.debugger.source_registry_stats()
+        except Exception as e:
+            logger.exception("Error handling dapper/sourceRegistryStats request")
+            return self._make_response(
+                request,
+                "dapper/sourceRegistryStats",
+                SourceRegistryStatsResponse,
+                success=False,
+                message=f"Source registry statistics unavailable: {e!s}",
+            )
+        return self._make_response(
+            request,
+            "dapper/sourceRegistryStats",
+            SourceRegistryStatsResponse,
+            body=body,
+        )
+
+    def _debugger_is_stopped(self) -> bool:
+        """Return True when the debugger is stopped on at least one thread."""
+        debugger = self.server.debugger
+        session_facade = getattr(debugger, "_session_facade", None)
+        if session_facade is not None and callable(getattr(session_facade, "iter_threads", None)):
+            thread_items = session_facade.iter_threads()
+        else:
+            thread_items = []
+        return any(t.is_stopped for _, t in thread_items) or debugger.stopped_event.is_set()
+
     def _extract_hot_reload_request_data(
         self,
         request: HotReloadRequest,
@@ -562,9 +665,14 @@ class RequestHandler:
         """Handle 'dapper/agentSnapshot': return compact debug state for LLM agents.
 
         Assembles threads, stack frames, and top-frame variables into a single
-        response so agents avoid multiple DAP round-trips.
+        response so agents avoid multiple DAP round-trips.  With
+        ``sinceCheckpoint`` only the changes since that checkpoint are sent.
+        External debuggees build the snapshot themselves, next to the frames.
         """
         args = request.get("arguments") or {}
+        if self.server.debugger.get_external_backend() is not None:
+            return await self._forward_agent_snapshot(request, args)
+
         target_thread_id: int | None = args.get("threadId")
         depth = min(args.get("depth", 5), 100)
         max_vars = min(args.get("maxVariables", 50), 200)
@@ -597,13 +705,10 @@ class RequestHandler:
             else "<unknown>"
         )
 
-        return self._make_response(
-            request,
-            "dapper/agentSnapshot",
-            AgentSnapshotResponse,
-            body={
-                "checkpoint": 0,
+        body = self._agent_snapshots.build_response_body(
+            {
                 "stopReason": stop_reason,
+                "threadId": tid,
                 "location": location,
                 "callStack": call_stack,
                 "locals": top_locals,
@@ -611,6 +716,35 @@ class RequestHandler:
                 "stoppedThreads": stopped_ids,
                 "runningThreads": running_ids,
             },
+            args.get("sinceCheckpoint"),
+        )
+        return self._make_response(
+            request,
+            "dapper/agentSnapshot",
+            AgentSnapshotResponse,
+            body=cast("AgentSnapshotResponseBody", body),
+        )
+
+    async def _forward_agent_snapshot(
+        self,
+        request: AgentSnapshotRequest,
+        args: AgentSnapshotArguments,
+    ) -> AgentSnapshotResponse:
+        try:
+            body = await self.server.debugger.agent_snapshot(args)
+        except Exception as e:
+            return self._make_response(
+                request,
+                "dapper/agentSnapshot",
+                AgentSnapshotResponse,
+                success=False,
+                message=str(e),
+            )
+        return self._make_response(
+            request,
+            "dapper/agentSnapshot",
+            AgentSnapshotResponse,
+            body=body,
         )
 
     def _gather_thread_state(
@@ -644,20 +778,26 @@ class RequestHandler:
         tid: int,
         depth: int,
         just_my_code: bool,
-    ) -> list[StackFrame]:
-        """Fetch stack frames for a thread, optionally filtering library frames."""
+    ) -> list[tuple[StackFrame, int]]:
+        """Fetch stack frames for a thread, optionally filtering library frames.
+
+        Each frame is paired with its distance from the bottom of the full
+        stack, which stays the same while frames are pushed above it.
+        """
         try:
             stack_result = await self.server.debugger.get_stack_trace(tid, 0, depth)
             raw = stack_result.get("stackFrames", [])
+            total = stack_result.get("totalFrames", len(raw))
         except Exception:
-            raw = []
+            raw, total = [], 0
+        frames = [(frame, total - i) for i, frame in enumerate(raw)]
         if just_my_code:
-            raw = [f for f in raw if not self._is_library_frame(f)]
-        return raw
+            frames = [(f, level) for f, level in frames if not self._is_library_frame(f)]
+        return frames
 
     async def _build_agent_call_stack(
         self,
-        raw_frames: list[StackFrame],
+        raw_frames: list[tuple[StackFrame, int]],
         depth: int,
         max_vars: int,
     ) -> tuple[list[dict[str, Any]], dict[str, str], dict[str, str]]:
@@ -666,13 +806,16 @@ class RequestHandler:
         top_locals: dict[str, str] = {}
         top_globals: dict[str, str] = {}
 
-        for i, frame in enumerate(raw_frames[:depth]):
+        for i, (frame, level) in enumerate(raw_frames[:depth]):
             source = frame.get("source") or {}
             entry: dict[str, Any] = {
                 "name": frame["name"],
                 "file": source.get("path", source.get("name", "<unknown>")),
                 "line": frame["line"],
             }
+            # Frame ids are reallocated on every stop, so key frames by code
+            # location and distance from the bottom of the full stack.
+            entry["frameKey"] = hash((entry["file"], entry["name"], level))
             if i == 0:
                 locs, globs = await self._collect_frame_variables(frame, max_vars)
                 top_locals, top_globals = locs, globs
@@ -820,8 +963,27 @@ class RequestHandler:
         }
 
         var_ref = eval_result.get("variablesReference", 0)
+        body: dict[str, Any] = {"root": root}
         if var_ref and max_depth > 0:
-            children = await self._expand_variable_tree(var_ref, max_depth - 1, max_items)
+            if self.server.debugger.get_external_backend() is not None:
+                # External debuggees expand the whole tree in one IPC round trip.
+                try:
+                    tree = await self.server.debugger.variable_tree(
+                        var_ref, depth=max_depth, max_items=max_items
+                    )
+                except Exception as e:
+                    return self._make_response(
+                        request,
+                        "dapper/agentInspect",
+                        AgentInspectResponse,
+                        success=False,
+                        message=f"Variable expansion failed: {e!s}",
+                    )
+                children = self._agent_tree_nodes(tree.get("variables", []))
+                if tree.get("truncated"):
+                    body["truncated"] = True
+            else:
+                children = await self._expand_variable_tree(var_ref, max_depth - 1, max_items)
             if children:
                 root["children"] = children
 
@@ -829,7 +991,7 @@ class RequestHandler:
             request,
             "dapper/agentInspect",
             AgentInspectResponse,
-            body={"root": root},
+            body=body,
         )
 
     async def _expand_variable_tree(
@@ -861,6 +1023,24 @@ class RequestHandler:
             nodes.append(node)
         return nodes
 
+    @classmethod
+    def _agent_tree_nodes(cls, variables: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Reduce a ``variableTree`` result to the compact agent node shape."""
+        nodes: list[dict[str, Any]] = []
+        for var in variables:
+            node: dict[str, Any] = {
+                "name": var.get("name", "?"),
+                "type": var.get("type", ""),
+                "value": var.get("value", ""),
+            }
+            if var.get("cycle"):
+                node["cycle"] = True
+            children = cls._agent_tree_nodes(var.get("children", []))
+            if children:
+                node["children"] = children
+            nodes.append(node)
+        return nodes
+
     async def _resolve_frame_id_by_index(self, frame_index: int) -> int | None:
         """Resolve a stack frame ID from a zero-based frame index.
 
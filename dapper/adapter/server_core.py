@@ -27,6 +27,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Requests handled concurrently with their immediate successors of the same
+# kind, so a burst (one ``setBreakpoints`` per file on workspace restore) can
+# be coalesced by the backend into a single launcher round trip.
+_COALESCIBLE_COMMANDS = frozenset({"setBreakpoints"})
+
 
 class DebugAdapterServer:
     """Server implementation that handles DAP protocol communication.
@@ -48,6 +53,7 @@ class DebugAdapterServer:
         self._debugger = PyDebugger(self, self.loop)
         self.running = False
         self.sequence_number = 0
+        self._coalescible_tasks: set[asyncio.Task[None]] = set()
         self.protocol_handler = ProtocolFactory()
 
         # Install structured log forwarding to the extension
@@ -131,6 +137,14 @@ class DebugAdapterServer:
                     logger.info("Client disconnected")
                     break
 
+                if self._is_coalescible(message):
+                    task = asyncio.ensure_future(self._handle_request(message))
+                    self._coalescible_tasks.add(task)
+                    task.add_done_callback(self._coalescible_tasks.discard)
+                    continue
+
+                # Keep request ordering: everything after a burst waits for it.
+                await self._drain_coalescible_tasks()
                 await self._process_message(message)
             except asyncio.CancelledError:
                 logger.info("Message loop cancelled")
@@ -146,8 +160,18 @@ class DebugAdapterServer:
                     )
                     await self.send_message(cast("dict[str, Any]", resp))
 
+        await self._drain_coalescible_tasks()
         logger.info("Message loop ended")
 
+    @staticmethod
+    def _is_coalescible(message: dict[str, Any]) -> bool:
+        return message.get("type") == "request" and message.get("command") in _COALESCIBLE_COMMANDS
+
+    async def _drain_coalescible_tasks(self) -> None:
+        """Wait for in-flight coalescible requests before handling anything else."""
+        if self._coalescible_tasks:
+            await asyncio.gather(*self._coalescible_tasks, return_exceptions=True)
+
     async def _process_message(self, message: dict[str, Any]) -> None:
         """Process an incoming DAP message"""
         if "type" not in message:
@@ -13,11 +13,17 @@ Architecture:
        - os.execv/execve (when running Python)
 
     2. Each child process is launched with dapper's debug_launcher prepended,
-       configured to connect back to the parent's IPC server on a new port.
+       configured to connect back to the parent's IPC server on a new port
+       (or on one shared port, routed by the child's session id).
 
     3. The SubprocessManager notifies the VS Code extension via a custom event
        ('dapper/childProcess') so it can spawn a new debug session for the child.
 
+Scalable mode (``SubprocessConfig.scalable``) targets worker pools with many
+children: there is no child cap, a single reaper thread watches every child
+(``pidfd`` where available, polling otherwise) and children start *dormant*,
+running untraced until a client attaches a session to them.
+
 Usage:
     manager = SubprocessManager(debugger, send_event, ipc_config)
     manager.enable()  # Patches subprocess APIs
@@ -38,6 +44,7 @@ import logging
 import multiprocessing
 import os
 from pathlib import Path
+import selectors
 import shlex
 import subprocess
 import sys
@@ -45,9 +52,12 @@ import threading
 from typing import Callable
 import uuid
 
+from dapper.utils.internal_threads import InternalThread
+
 logger = logging.getLogger(__name__)
 
 PYTHON_INVOCATION_MIN_ARGS = 2
+REAPER_POLL_INTERVAL = 0.25
 
 
 @dataclass
@@ -72,7 +82,8 @@ class SubprocessConfig:
 
     enabled: bool = False
     auto_attach: bool = True
-    max_children: int = 10
+    max_children: int | None = 10
+    scalable: bool = False
     ipc_host: str = "localhost"
     ipc_port_range: tuple[int, int] = (5700, 5799)
     shared_ipc_port: int | None = None
@@ -83,6 +94,160 @@ class SubprocessConfig:
     enable_process_pool_scaffold: bool = True
 
 
+class ChildReaper:
+    """Report child-process exits from a single background thread.
+
+    On Linux each child is watched through a ``pidfd`` that becomes readable
+    when it exits; elsewhere the tracked ``Popen`` objects are polled.  The
+    children are reaped through their ``Popen`` objects, never with
+    ``os.waitpid(-1)``, so the debuggee's own ``wait()`` calls keep working.
+    """
+
+    def __init__(
+        self,
+        on_exit: Callable[[int], None],
+        *,
+        poll_interval: float = REAPER_POLL_INTERVAL,
+        use_pidfd: bool | None = None,
+    ) -> None:
+        self._on_exit = on_exit
+        self._poll_interval = poll_interval
+        self._use_pidfd = hasattr(os, "pidfd_open") if use_pidfd is None else use_pidfd
+        self._lock = threading.Lock()
+        self._pending: dict[int, object] = {}
+        self._added: list[int] = []
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._wake_fds: tuple[int, int] | None = None
+
+    @property
+    def tracked(self) -> int:
+        """Number of children currently being watched."""
+        with self._lock:
+            return len(self._pending)
+
+    def track(self, popen_obj: object, pid: int) -> None:
+        """Start watching *popen_obj*; ``on_exit(pid)`` runs once it exits."""
+        if not callable(getattr(popen_obj, "poll", None)):
+            return
+        with self._lock:
+            if self._stopped:
+                return
+            self._pending[pid] = popen_obj
+            self._added.append(pid)
+            if self._thread is None:
+                if self._use_pidfd:
+                    self._wake_fds = os.pipe()
+                self._thread = InternalThread(
+                    target=self._run_pidfd if self._use_pidfd else self._run_polling,
+                    name="dapper-child-reaper",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._wake()
+
+    def stop(self) -> None:
+        """Stop the reaper thread; children still running are no longer watched."""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        self._wake()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        if self._wake_fds is not None:
+            for fd in self._wake_fds:
+                with suppress(OSError):
+                    os.close(fd)
+            self._wake_fds = None
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+        if self._wake_fds is not None:
+            with suppress(OSError):
+                os.write(self._wake_fds[1], b"\0")
+
+    def _finish(self, pid: int) -> None:
+        with self._lock:
+            popen_obj = self._pending.pop(pid, None)
+        if popen_obj is None:
+            return
+        try:
+            popen_obj.poll()  # type: ignore[attr-defined]
+        except Exception:
+            logger.debug("Child poll failed for pid=%s", pid, exc_info=True)
+        try:
+            self._on_exit(pid)
+        except Exception:
+            logger.debug("Child exit callback failed for pid=%s", pid, exc_info=True)
+
+    def _exited(self, pid: int) -> bool:
+        with self._lock:
+            popen_obj = self._pending.get(pid)
+        if popen_obj is None:
+            return False
+        try:
+            return popen_obj.poll() is not None  # type: ignore[attr-defined]
+        except Exception:
+            return True
+
+    def _run_polling(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+                self._added.clear()
+                pids = list(self._pending)
+            for pid in pids:
+                if self._exited(pid):
+                    self._finish(pid)
+            # Idle (no children) until the next track(); otherwise poll.
+            self._wakeup.wait(None if not pids else self._poll_interval)
+            self._wakeup.clear()
+
+    def _run_pidfd(self) -> None:
+        assert self._wake_fds is not None
+        wake_r = self._wake_fds[0]
+        with selectors.DefaultSelector() as selector:
+            selector.register(wake_r, selectors.EVENT_READ, None)
+            try:
+                while True:
+                    with self._lock:
+                        if self._stopped:
+                            return
+                        added, self._added = self._added, []
+                    if not self._watch_pidfds(selector, added):
+                        break
+                    for key, _mask in selector.select():
+                        if key.data is None:
+                            with suppress(OSError):
+                                os.read(wake_r, 4096)
+                            continue
+                        selector.unregister(key.fd)
+                        os.close(key.fd)
+                        self._finish(key.data)
+            finally:
+                for key in list(selector.get_map().values()):
+                    if key.data is not None:
+                        with suppress(OSError):
+                            os.close(key.fd)
+        # The kernel refused pidfds; every pending child is polled instead.
+        logger.debug("pidfd_open unavailable, child reaper falls back to polling")
+        self._run_polling()
+
+    def _watch_pidfds(self, selector: selectors.BaseSelector, pids: list[int]) -> bool:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)  # type: ignore[attr-defined]
+            except ProcessLookupError:
+                self._finish(pid)
+                continue
+            except OSError:
+                return False
+            selector.register(fd, selectors.EVENT_READ, pid)
+        return True
+
+
 class SubprocessManager:
     """Manages detection and debugging of child processes.
 
@@ -106,6 +271,7 @@ class SubprocessManager:
         self._original_mp_process = None
         self._original_mp_process_start = None
         self._original_process_pool_submit = None
+        self._reaper: ChildReaper | None = None
 
     @property
     def enabled(self) -> bool:
@@ -185,6 +351,11 @@ class SubprocessManager:
             return
 
         logger.info("Enabling subprocess debugging")
+        if self._config.scalable and self._config.shared_ipc_port is None:
+            logger.warning(
+                "Scalable subprocess debugging without a shared IPC port; "
+                "children fall back to per-child ports"
+            )
         self._patch_subprocess()
         if self._config.enable_multiprocessing_scaffold:
             self._patch_multiprocessing()
@@ -222,10 +393,11 @@ class SubprocessManager:
 
         Notifies the VS Code extension so it can start a new debug session.
         """
+        limit = None if self._config.scalable else self._config.max_children
         with self._lock:
-            if len(self._children) >= self._config.max_children:
+            if limit is not None and len(self._children) >= limit:
                 logger.warning(
-                    f"Maximum child process limit ({self._config.max_children}) reached, "
+                    f"Maximum child process limit ({limit}) reached, "
                     f"ignoring child process {info.pid}"
                 )
                 return
@@ -247,6 +419,7 @@ class SubprocessManager:
                 "parentPid": info.parent_pid,
                 "sessionId": info.session_id,
                 "parentSessionId": info.parent_session_id,
+                "dormant": self._config.scalable,
             },
         )
 
@@ -267,6 +440,14 @@ class SubprocessManager:
 
     def _track_child_exit(self, popen_obj: object, pid: int) -> None:
         """Track a child process and emit an exited event when it terminates."""
+        if self._config.scalable:
+            with self._lock:
+                if self._reaper is None:
+                    self._reaper = ChildReaper(self.on_child_exited)
+                reaper = self._reaper
+            reaper.track(popen_obj, pid)
+            return
+
         wait_fn = getattr(popen_obj, "wait", None)
         if not callable(wait_fn):
             return
@@ -279,7 +460,7 @@ class SubprocessManager:
             finally:
                 self.on_child_exited(pid)
 
-        threading.Thread(target=_wait_and_notify, daemon=True).start()
+        InternalThread(target=_wait_and_notify, daemon=True, name="dapper-child-wait").start()
 
     def _allocate_port(self) -> int:
         """Allocate the next available IPC port for a child process."""
@@ -345,6 +526,8 @@ class SubprocessManager:
             str(port),
             "--subprocess",
         ]
+        if self._config.scalable:
+            launcher_args.append("--subprocess-dormant")
 
         if mode == "program":
             launcher_args.extend(["--program", entry_value])
@@ -520,4 +703,7 @@ class SubprocessManager:
         """Clean up all resources."""
         self.disable()
         with self._lock:
+            reaper, self._reaper = self._reaper, None
             self._children.clear()
+        if reaper is not None:
+            reaper.stop()
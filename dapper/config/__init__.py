@@ -1,14 +1,21 @@
 """Configuration management for Dapper debug adapter."""
 
-from dapper.config.config_manager import ConfigContext
-from dapper.config.config_manager import get_config
-from dapper.config.config_manager import reset_config
-from dapper.config.config_manager import set_config
-from dapper.config.config_manager import update_config
-from dapper.config.dapper_config import DEFAULT_CONFIG
-from dapper.config.dapper_config import DapperConfig
-from dapper.config.dapper_config import DebuggeeConfig
-from dapper.config.dapper_config import IPCConfig
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from dapper.config.config_manager import ConfigContext
+    from dapper.config.config_manager import get_config
+    from dapper.config.config_manager import reset_config
+    from dapper.config.config_manager import set_config
+    from dapper.config.config_manager import update_config
+    from dapper.config.dapper_config import DEFAULT_CONFIG
+    from dapper.config.dapper_config import DapperConfig
+    from dapper.config.dapper_config import DebuggeeConfig
+    from dapper.config.dapper_config import IPCConfig
 
 __all__ = [
     "DEFAULT_CONFIG",
@@ -21,3 +28,18 @@ __all__ = [
     "set_config",
     "update_config",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConfigContext": "dapper.config.config_manager",
+        "get_config": "dapper.config.config_manager",
+        "reset_config": "dapper.config.config_manager",
+        "set_config": "dapper.config.config_manager",
+        "update_config": "dapper.config.config_manager",
+        "DEFAULT_CONFIG": "dapper.config.dapper_config",
+        "DapperConfig": "dapper.config.dapper_config",
+        "DebuggeeConfig": "dapper.config.dapper_config",
+        "IPCConfig": "dapper.config.dapper_config",
+    },
+)
@@ -85,9 +85,17 @@ class DapperConfig:
     # When False (default), expression watchpoints use permissive evaluation.
     strict_expression_watch_policy: bool = False
 
+    # Non-stop mode: a thread that stops leaves the other threads running;
+    # continue and step requests resume only their ``threadId``.
+    non_stop: bool = False
+
     # Auto-attach to Python child processes spawned by the debuggee.
     subprocess_auto_attach: bool = False
 
+    # Scale auto-attach to worker pools: no child cap, a single reaper thread
+    # and children that run untraced until a client attaches to them.
+    subprocess_scalable: bool = False
+
     @classmethod
     def from_launch_request(cls, request: LaunchRequest) -> DapperConfig:
         """Create config from launch request arguments."""
@@ -126,7 +134,9 @@ class DapperConfig:
             in_process=_get("inProcess", default=False),
             just_my_code=_get("justMyCode", default=True),
             strict_expression_watch_policy=_get("strictExpressionWatchPolicy", default=False),
+            non_stop=_get("nonStop", default=False),
             subprocess_auto_attach=_get("subprocessAutoAttach", default=False),
+            subprocess_scalable=_get("subprocessScalable", default=False),
             debuggee=debuggee,
             ipc=ipc,
         )
@@ -220,7 +230,9 @@ class DapperConfig:
             "stopOnEntry": self.debuggee.stop_on_entry,
             "noDebug": self.debuggee.no_debug,
             "inProcess": self.in_process,
+            "nonStop": self.non_stop,
             "subprocessAutoAttach": self.subprocess_auto_attach,
+            "subprocessScalable": self.subprocess_scalable,
         }
 
         # Add IPC-specific kwargs
@@ -3,27 +3,34 @@
 This module provides the core debugging functionality built on Python's bdb module.
 """
 
-from dapper.core.breakpoint_manager import BreakpointManager
-from dapper.core.breakpoint_manager import LineBreakpointMeta
-from dapper.core.breakpoint_resolver import BreakpointMeta
-from dapper.core.breakpoint_resolver import BreakpointResolver
-from dapper.core.breakpoint_resolver import ResolveAction
-from dapper.core.breakpoint_resolver import ResolveResult
-from dapper.core.breakpoint_resolver import get_resolver
-from dapper.core.breakpoints_controller import BreakpointController
-from dapper.core.breakpoints_controller import DataBreakpointSpec
-from dapper.core.breakpoints_controller import FunctionBreakpointSpec
-from dapper.core.breakpoints_controller import LineBreakpointSpec
-from dapper.core.data_breakpoint_state import DataBreakpointState
-from dapper.core.debugger_bdb import DebuggerBDB
-from dapper.core.exception_handler import ExceptionBreakpointConfig
-from dapper.core.exception_handler import ExceptionHandler
-from dapper.core.inprocess_debugger import InProcessDebugger
-from dapper.core.stepping_controller import SteppingController
-from dapper.core.stepping_controller import StopReason
-from dapper.core.thread_tracker import StackFrame
-from dapper.core.thread_tracker import ThreadTracker
-from dapper.core.variable_manager import VariableManager
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from dapper.core.breakpoint_manager import BreakpointManager
+    from dapper.core.breakpoint_manager import LineBreakpointMeta
+    from dapper.core.breakpoint_resolver import BreakpointMeta
+    from dapper.core.breakpoint_resolver import BreakpointResolver
+    from dapper.core.breakpoint_resolver import ResolveAction
+    from dapper.core.breakpoint_resolver import ResolveResult
+    from dapper.core.breakpoint_resolver import get_resolver
+    from dapper.core.breakpoints_controller import BreakpointController
+    from dapper.core.breakpoints_controller import DataBreakpointSpec
+    from dapper.core.breakpoints_controller import FunctionBreakpointSpec
+    from dapper.core.breakpoints_controller import LineBreakpointSpec
+    from dapper.core.data_breakpoint_state import DataBreakpointState
+    from dapper.core.debugger_bdb import DebuggerBDB
+    from dapper.core.exception_handler import ExceptionBreakpointConfig
+    from dapper.core.exception_handler import ExceptionHandler
+    from dapper.core.inprocess_debugger import InProcessDebugger
+    from dapper.core.stepping_controller import SteppingController
+    from dapper.core.stepping_controller import StopReason
+    from dapper.core.thread_tracker import StackFrame
+    from dapper.core.thread_tracker import ThreadTracker
+    from dapper.core.variable_manager import VariableManager
 
 __all__ = [
     # Breakpoint controller
@@ -57,3 +64,30 @@ __all__ = [
     "VariableManager",
     "get_resolver",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BreakpointManager": "dapper.core.breakpoint_manager",
+        "LineBreakpointMeta": "dapper.core.breakpoint_manager",
+        "BreakpointMeta": "dapper.core.breakpoint_resolver",
+        "BreakpointResolver": "dapper.core.breakpoint_resolver",
+        "ResolveAction": "dapper.core.breakpoint_resolver",
+        "ResolveResult": "dapper.core.breakpoint_resolver",
+        "get_resolver": "dapper.core.breakpoint_resolver",
+        "BreakpointController": "dapper.core.breakpoints_controller",
+        "DataBreakpointSpec": "dapper.core.breakpoints_controller",
+        "FunctionBreakpointSpec": "dapper.core.breakpoints_controller",
+        "LineBreakpointSpec": "dapper.core.breakpoints_controller",
+        "DataBreakpointState": "dapper.core.data_breakpoint_state",
+        "DebuggerBDB": "dapper.core.debugger_bdb",
+        "ExceptionBreakpointConfig": "dapper.core.exception_handler",
+        "ExceptionHandler": "dapper.core.exception_handler",
+        "InProcessDebugger": "dapper.core.inprocess_debugger",
+        "SteppingController": "dapper.core.stepping_controller",
+        "StopReason": "dapper.core.stepping_controller",
+        "StackFrame": "dapper.core.thread_tracker",
+        "ThreadTracker": "dapper.core.thread_tracker",
+        "VariableManager": "dapper.core.variable_manager",
+    },
+)
@@ -4,6 +4,7 @@ Helpers and utilities for debug launcher."""
 from __future__ import annotations
 
 import ast
+from bisect import bisect_right
 import dis
 from itertools import chain
 import linecache
@@ -11,6 +12,7 @@ import types
 from typing import Any
 from typing import TypeVar
 from typing import cast
+import weakref
 
 T = TypeVar("T")
 
@@ -51,34 +53,101 @@ def frame_may_handle_exception(f: types.FrameType) -> bool | None:
     return res
 
 
+# ---------------------------------------------------------------------------
+# Handler-coverage indexes
+#
+# An exception propagating through a deep stack asks "is this handled here?"
+# once per frame.  Decoding the exception table or parsing the module every
+# time dominates that cost, so both sources are reduced to lookup structures
+# on first use and cached: per code object (weakly) for the exception table,
+# per file (invalidated with linecache) for the AST fallback.
+# ---------------------------------------------------------------------------
+
+# code object -> {line: covered} or None when the table cannot be decoded
+_exception_table_index: weakref.WeakKeyDictionary[types.CodeType, dict[int, bool] | None] = (
+    weakref.WeakKeyDictionary()
+)
+# filename -> (linecache lines the index was built from, sorted try ranges)
+_ast_handler_index: dict[str, tuple[list[str], tuple[list[int], list[int]]]] = {}
+
+
+def clear_handler_coverage_caches() -> None:
+    """Drop all cached handler-coverage indexes."""
+    _exception_table_index.clear()
+    _ast_handler_index.clear()
+
+
+def _build_exception_table_index(code: types.CodeType) -> dict[int, bool] | None:
+    ex_table = getattr(code, "co_exceptiontable", None)
+    unpack = getattr(dis, "_unpack_exception_table", None)
+    if not ex_table or unpack is None:
+        return None
+    try:
+        entries = unpack(ex_table)
+    except Exception:
+        return None
+    line_to_offset: dict[int, int] = {}
+    for offset, ln in dis.findlinestarts(code):
+        line_to_offset.setdefault(ln, offset)
+    ranges = [(start, end) for start, end, _target, _depth, _kind in entries]
+    return {
+        ln: any(start <= offset < end for start, end in ranges)
+        for ln, offset in line_to_offset.items()
+    }
+
+
 def frame_has_exception_table_handler(
     code: types.CodeType | None,
     lineno: int | None,
 ) -> bool | None:
-    result: bool | None = None
+    if not isinstance(code, types.CodeType) or lineno is None:
+        return None
     try:
-        ex_table = getattr(code, "co_exceptiontable", None)
-        unpack = getattr(dis, "_unpack_exception_table", None)
-        if ex_table and unpack is not None:
-            try:
-                entries = unpack(ex_table)
-            except Exception:
-                entries = None
-            line_to_offset: dict[int, int] = {}
-            if isinstance(code, types.CodeType):
-                for offset, ln in dis.findlinestarts(code):
-                    line_to_offset.setdefault(ln, offset)
-            if entries is not None and lineno is not None and lineno in line_to_offset:
-                offset = line_to_offset[lineno]
-                for start, end, _target, _depth, _kind in entries:
-                    if start <= offset < end:
-                        result = True
-                        break
-                if result is None:
-                    result = False
+        try:
+            index = _exception_table_index[code]
+        except KeyError:
+            index = _exception_table_index[code] = _build_exception_table_index(code)
     except Exception:
-        result = None
-    return result
+        return None
+    if index is None:
+        return None
+    return index.get(lineno)
+
+
+def _build_ast_handler_index(
+    source_lines: list[str], filename: str
+) -> tuple[list[int], list[int]]:
+    """Return ``(starts, ends)`` of ``try`` statements with handlers, sorted by start."""
+    tree = ast.parse("".join(source_lines), filename=filename)
+    spans: list[tuple[int, int]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Try) or not node.handlers:
+            continue
+        start = get_int(node, "lineno", None)
+        if start is None:
+            continue
+        end = get_int(node, "end_lineno", None)
+        if end is None:
+            nums = [
+                n
+                for n in (
+                    get_int(child, "lineno", start)
+                    for child in chain(node.body, node.handlers, node.orelse, node.finalbody)
+                )
+                if n
+            ]
+            end = max(nums) if nums else start
+        spans.append((start, end))
+    spans.sort()
+    # Running maximum of end lines lets a bisect on start answer containment.
+    starts: list[int] = []
+    max_ends: list[int] = []
+    reach = 0
+    for start, end in spans:
+        reach = max(reach, end)
+        starts.append(start)
+        max_ends.append(reach)
+    return starts, max_ends
 
 
 def frame_has_ast_handler(code: types.CodeType | None, lineno: int | None) -> bool | None:
@@ -95,30 +164,16 @@ def frame_has_ast_handler(code: types.CodeType | None, lineno: int | None) -> bo
         source_lines = linecache.getlines(filename) if filename else []
         if not source_lines:
             return None
-        all_lines = "".join(source_lines)
-        tree = ast.parse(all_lines, filename=filename or "<unknown>")
-        result = None
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Try):
-                continue
-            start = get_int(node, "lineno", None)
-            if start is None:
-                continue
-            end = get_int(node, "end_lineno", None)
-            if end is None:
-                nums = filter(
-                    None,
-                    (
-                        get_int(n, "lineno", start)
-                        for n in chain(node.body, node.handlers, node.orelse, node.finalbody)
-                    ),
-                )
-                end = max(nums) if nums else start
-            if lineno is not None and start <= lineno <= end and node.handlers:
-                result = True
-                break
-        if result is None:
-            result = False
+        assert filename is not None
+        cached = _ast_handler_index.get(filename)
+        if cached is not None and cached[0] is source_lines:
+            starts, max_ends = cached[1]
+        else:
+            starts, max_ends = _build_ast_handler_index(source_lines, filename)
+            _ast_handler_index[filename] = (source_lines, (starts, max_ends))
+        if lineno is None:
+            return False
+        i = bisect_right(starts, lineno)
+        return bool(i and max_ends[i - 1] >= lineno)
     except Exception:
-        result = None
-    return result
+        return None
@@ -70,24 +70,3 @@ def format_log_message(template: str, frame: types.FrameType) -> str:
     s = re.sub(r"\{([^{}]+)\}", repl, s)
     # Restore the original literal braces
     return s.replace(left_placeholder, "{").replace(right_placeholder, "}")
-
-
-def get_function_candidate_names(frame: types.FrameType) -> set[str]:
-    names: set[str] = set()
-    code = getattr(frame, "f_code", None)
-    if not code:
-        return names
-    func = getattr(code, "co_name", None) or ""
-    mod = frame.f_globals.get("__name__", "")
-    names.add(func)
-    if mod:
-        names.add(f"{mod}.{func}")
-    self_obj = frame.f_locals.get("self") if isinstance(frame.f_locals, dict) else None
-    if self_obj is not None:
-        cls = getattr(self_obj, "__class__", None)
-        cls_name = getattr(cls, "__name__", None)
-        if cls_name:
-            names.add(f"{cls_name}.{func}")
-            if mod:
-                names.add(f"{mod}.{cls_name}.{func}")
-    return names
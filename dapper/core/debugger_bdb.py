@@ -7,6 +7,7 @@ import bdb
 from collections.abc import Mapping
 import contextlib
 import logging
+import sys
 import threading
 import types
 from typing import TYPE_CHECKING
@@ -17,15 +18,21 @@ from dapper.core.breakpoint_manager import BreakpointManager
 from dapper.core.breakpoint_resolver import BreakpointResolver
 from dapper.core.breakpoint_resolver import ResolveAction
 from dapper.core.data_breakpoint_state import DataBreakpointState
-from dapper.core.debug_utils import get_function_candidate_names
 from dapper.core.exception_handler import ExceptionHandler
+from dapper.core.function_breakpoint_index import FunctionBreakpointIndex
 from dapper.core.just_my_code import is_user_frame
 from dapper.core.just_my_code import is_user_path
+from dapper.core.line_index import next_executable_line
+from dapper.core.pause_controller import PauseController
 from dapper.core.stepping_controller import StepGranularity
 from dapper.core.stepping_controller import SteppingController
+from dapper.core.thread_tracker import STOP_FRAME_BUDGET
 from dapper.core.thread_tracker import ThreadTracker
 from dapper.core.variable_manager import VariableManager
 from dapper.shared.runtime_source_registry import annotate_stack_frames_with_source_refs
+from dapper.utils.internal_threads import ThreadEventCounts
+from dapper.utils.internal_threads import _internal_idents
+from dapper.utils.internal_threads import is_internal_thread
 from dapper.utils.logging_levels import TRACE
 from dapper.utils.logging_message_summary import summarize_debugger_bdb_event
 from dapper.utils.logging_names import DAPPER_LOGGER_BDB
@@ -35,11 +42,6 @@ if TYPE_CHECKING:
     from dapper.protocol.requests import GotoTarget
     from dapper.protocol.structures import StackFrame
 
-try:
-    from dapper._frame_eval.debugger_integration import integrate_debugger_bdb
-except ImportError:  # pragma: no cover - optional integration
-    integrate_debugger_bdb = None
-
 logger = logging.getLogger(DAPPER_LOGGER_BDB)
 
 # Filename substrings that identify asyncio / event-loop internal frames.
@@ -101,6 +103,7 @@ class DebuggerBDB(bdb.Bdb):
         process_commands: Callable[[], Any] = _noop_process_commands,
         just_my_code: bool = True,
         strict_expression_watch_policy: bool = False,
+        non_stop: bool = False,
     ):
         super().__init__(skip)
         # Use injected callbacks or fall back to no-ops
@@ -111,11 +114,17 @@ class DebuggerBDB(bdb.Bdb):
         # as subtle in stack traces (debugpy-compatible ``justMyCode`` semantics).
         self.just_my_code = just_my_code
 
+        # Non-stop mode: a stopped thread leaves the others running, waits for
+        # its own resume and reports ``allThreadsStopped=False``.
+        self.non_stop = non_stop
+
         # Unified breakpoint resolver for condition/hit/log evaluation
         self.breakpoint_resolver = BreakpointResolver()
 
         # Centralized breakpoint state management
         self.bp_manager = BreakpointManager()
+        # Function-breakpoint names resolved per code object
+        self.function_breakpoint_index = FunctionBreakpointIndex()
 
         self.is_terminated = False
         self.breakpoints = {}
@@ -138,6 +147,11 @@ class DebuggerBDB(bdb.Bdb):
 
         # Consolidated thread and frame tracking
         self.thread_tracker = ThreadTracker()
+        self.thread_tracker.frame_annotator = self._annotate_stack_frames
+        # Call events turned away from dapper's own threads.
+        self.thread_events = ThreadEventCounts()
+        # Pause requests waiting for their thread to reach a checkpoint.
+        self.pause_controller = PauseController()
 
         # Legacy stack attribute (DebuggerLike protocol); prefer thread_tracker.
         self.stack: list[Any] | None = None
@@ -153,6 +167,101 @@ class DebuggerBDB(bdb.Bdb):
         self.data_bp_state = DataBreakpointState()
         self.data_bp_state.set_strict_expression_watch_policy(strict_expression_watch_policy)
 
+    # ------------------------------------------------------------------
+    # Internal-thread gating
+    # ------------------------------------------------------------------
+
+    def dispatch_call(self, frame: types.FrameType, arg: Any) -> Any:
+        """Give frames of dapper's internal threads no local trace function.
+
+        Only the ``call`` event is gated: a frame turned away here never
+        produces ``line`` / ``return`` events, so the per-line path pays
+        nothing.  Turned-away events are counted in :attr:`thread_events`.
+        """
+        ident = threading.get_ident()
+        if ident in _internal_idents:
+            self.thread_events.gate(ident)
+            return None
+        return super().dispatch_call(frame, arg)
+
+    # ------------------------------------------------------------------
+    # Targeted pause
+    # ------------------------------------------------------------------
+
+    def pause(self, thread_id: int) -> bool:
+        """Ask the running thread *thread_id* to stop at its next checkpoint.
+
+        The checkpoint is armed on the code currently on the thread's stack
+        (its user code under Just My Code): local ``LINE`` events with the
+        sys.monitoring backend, frame trace functions otherwise.  Other
+        threads keep running without new events, and a thread blocked in
+        native code stops as soon as it returns to one of those frames.
+
+        Returns:
+            False when nothing was armed: the thread is unknown, is the
+            calling thread, or is one of dapper's own threads.
+
+        """
+        if thread_id == threading.get_ident() or is_internal_thread(thread_id):
+            return False
+        top = sys._current_frames().get(thread_id)  # noqa: SLF001
+        if top is None:
+            return False
+        frames: list[types.FrameType] = []
+        while top is not None:
+            frames.append(top)
+            top = top.f_back
+        if self.just_my_code:
+            frames = [frame for frame in frames if is_user_frame(frame)] or frames
+
+        self.pause_controller.request(thread_id)
+        monitoring_backend = getattr(self, "_sys_monitoring_backend", None)
+        arm = getattr(monitoring_backend, "arm_pause", None)
+        if callable(arm):
+            arm(thread_id, {frame.f_code for frame in frames})
+        else:
+            # Line events reach these frames as long as the thread has a
+            # trace function; stop_here() then lets them through.
+            for frame in frames:
+                frame.f_trace = self.trace_dispatch
+                frame.f_trace_lines = True
+        return True
+
+    def cancel_pause(self, thread_id: int | None = None) -> None:
+        """Drop the pause requested for *thread_id* (default: every thread)."""
+        requested = list(self.pause_controller.requests) if thread_id is None else [thread_id]
+        self.pause_controller.cancel(thread_id)
+        for tid in requested:
+            self._disarm_pause(tid)
+
+    def _disarm_pause(self, thread_id: int) -> None:
+        monitoring_backend = getattr(self, "_sys_monitoring_backend", None)
+        disarm = getattr(monitoring_backend, "disarm_pause", None)
+        if callable(disarm):
+            disarm(thread_id)
+
+    def _check_pause(self, frame: types.FrameType) -> bool:
+        """Stop at *frame* for a pending pause of the current thread.
+
+        Returns:
+            True when the event was handled for the pause: the thread
+            stopped, or it is in library code and keeps running to a
+            user-code checkpoint.
+
+        """
+        thread_id = threading.get_ident()
+        if not self.pause_controller.is_requested(thread_id):
+            return False
+        if self.just_my_code and not is_user_frame(frame):
+            return True
+        if self.pause_controller.consume(thread_id) is None:
+            return False
+        self._disarm_pause(thread_id)
+        self._ensure_thread_registered(thread_id)
+        self._emit_stopped_event(frame, thread_id, "pause")
+        self._wait_until_resumed(thread_id, clear_frames=True)
+        return True
+
     # ------------------------------------------------------------------
     # BDB overrides for function breakpoint support
     # ------------------------------------------------------------------
@@ -164,23 +273,65 @@ class DebuggerBDB(bdb.Bdb):
         trace function to remain installed even when ``self.breaks`` is
         empty.
         """
-        return (
-            self.bp_manager.has_function_breakpoints()
-            or self.exception_handler.config.is_enabled()
-        )
+        return self.bp_manager.has_function_breakpoints() or self._exceptions_need_tracing()
+
+    def _exceptions_need_tracing(self) -> bool:
+        """Return True when exception breakpoints rely on the trace function."""
+        return self.exception_handler.config.is_enabled() and not self._exceptions_via_monitoring()
+
+    def _exceptions_via_monitoring(self) -> bool:
+        """Return True when the sys.monitoring backend delivers exception events."""
+        backend = getattr(self, "_sys_monitoring_backend", None)
+        return bool(getattr(backend, "handles_exception_breakpoints", False))
+
+    def _match_function_breakpoint(self, frame: types.FrameType) -> str | None:
+        """Return the function-breakpoint name selecting *frame*, if any.
+
+        The index is rebuilt whenever ``bp_manager.function_names`` changed
+        since the last lookup; otherwise this is a set lookup for code that
+        cannot match and a dict lookup for code that was already resolved.
+        """
+        names = self.bp_manager.function_names
+        if not names:
+            return None
+        index = self.function_breakpoint_index
+        if index.names != names:
+            index.set_names(names)
+        return index.match(frame)
 
     def break_anywhere(self, frame: types.FrameType) -> bool:
         """Extend BDB to consider function and exception breakpoints.
 
         The base implementation only checks ``self.breaks`` (line
-        breakpoints).  When function or exception breakpoints are
-        registered we must keep tracing active so that ``dispatch_call``
-        and ``dispatch_exception`` still fire.
+        breakpoints).  Exception breakpoints keep every frame traced so
+        that ``dispatch_exception`` still fires; function breakpoints only
+        keep the frames whose code they resolve to, so ``dispatch_call``
+        reaches :meth:`user_call` without tracing unrelated code.
         """
-        if self._needs_tracing_active():
+        if self._exceptions_need_tracing():
+            return True
+        if self._match_function_breakpoint(frame) is not None:
             return True
         return super().break_anywhere(frame)
 
+    def stop_here(self, frame: types.FrameType) -> bool:
+        """Confine stepping to the thread the step was requested for.
+
+        bdb keeps one step state for the whole process, so without this
+        every thread would stop at (and pay line tracing for) the step.
+        The thread check comes first so other threads bail out before any
+        frame inspection, and ``dispatch_call`` does not trace their new
+        frames unless a breakpoint needs them.  A thread with a pending
+        pause stops anywhere, see :meth:`pause`.
+        """
+        thread_id = threading.get_ident()
+        if self.pause_controller.requests and self.pause_controller.is_requested(thread_id):
+            return True
+        step_thread = self.stepping_controller.step_thread_id
+        if step_thread is not None and step_thread != thread_id:
+            return False
+        return super().stop_here(frame)
+
     def set_continue(self) -> None:
         """Keep tracing active when function/exception breakpoints exist.
 
@@ -188,6 +339,11 @@ class DebuggerBDB(bdb.Bdb):
         ``self.breaks`` is empty.  If function or exception breakpoints
         are registered we must preserve tracing.
         """
+        self.stepping_controller.set_step_thread(None)
+        monitoring_backend = getattr(self, "_sys_monitoring_backend", None)
+        set_stepping = getattr(monitoring_backend, "set_stepping", None)
+        if callable(set_stepping):
+            set_stepping("CONTINUE")
         if self._needs_tracing_active() and not self.breaks:
             # Set the stop info so we only stop at breakpoints (or
             # function calls via break_anywhere), but do NOT remove the
@@ -206,6 +362,9 @@ class DebuggerBDB(bdb.Bdb):
         breakpoints are enabled we need ``user_exception`` to fire for
         *any* frame so that ``should_break`` can evaluate the exception.
         """
+        if self._exceptions_via_monitoring():
+            # RAISE / PY_UNWIND callbacks already report exceptions.
+            return self.trace_dispatch
         if self.exception_handler.config.is_enabled() and not self.stop_here(frame):
             # Bypass the base dispatch which would skip this frame:
             # call user_exception directly.
@@ -260,17 +419,24 @@ class DebuggerBDB(bdb.Bdb):
     def goto_targets(self, frame_id: int, line: int) -> list[GotoTarget]:
         """Resolve goto targets for a frame/line pair.
 
-        Current implementation exposes a single line-level target when the
-        frame is known and line is positive.
+        The target is the first line at or after *line* that the frame's own
+        code object has bytecode for, since a jump can only land there.
         """
         frame = self.thread_tracker.get_frame(int(frame_id))
         if frame is None:
             return []
         try:
-            target_line = int(line)
+            requested = int(line)
         except Exception:
             return []
-        if target_line <= 0:
+        if requested <= 0:
+            return []
+        code = getattr(frame, "f_code", None)
+        if isinstance(code, types.CodeType):
+            target_line = next_executable_line(code, requested)
+        else:
+            target_line = requested
+        if target_line is None:
             return []
         target: GotoTarget = {
             "id": target_line,
@@ -565,7 +731,7 @@ class DebuggerBDB(bdb.Bdb):
         thread_id = threading.get_ident()
         self._ensure_thread_registered(thread_id)
         self._emit_stopped_event(frame, thread_id, "breakpoint")
-        self.process_commands()
+        self._wait_until_resumed(thread_id)
         # NOTE: the resume command (continue/step/etc.) dispatched during
         # process_commands already called the appropriate set_continue /
         # set_next / set_step / set_return on this debugger instance.
@@ -592,20 +758,33 @@ class DebuggerBDB(bdb.Bdb):
             thread=thread_id,
         )
         self.stepping_controller.current_frame = frame
-        self.thread_tracker.stopped_thread_ids.add(thread_id)
+        self.thread_tracker.mark_stopped(thread_id, frame)
         stack_frames: list[StackFrame] = self._get_stack_frames(frame)
         self.thread_tracker.frames_by_thread[thread_id] = stack_frames
 
         event_args = {
             "threadId": thread_id,
             "reason": reason,
-            "allThreadsStopped": True,
+            "allThreadsStopped": not self.non_stop,
         }
         if description:
             event_args["description"] = description
 
         self.send_message("stopped", **event_args)
 
+    def _wait_until_resumed(self, thread_id: int, *, clear_frames: bool = False) -> None:
+        """Process client commands until *thread_id* is resumed.
+
+        In non-stop mode other threads may still be stopped, so only this
+        thread's stop state is dropped; otherwise *clear_frames* evicts every
+        frame reference.
+        """
+        self.process_commands()
+        if self.non_stop:
+            self.thread_tracker.release_thread(thread_id)
+        elif clear_frames:
+            self.thread_tracker.clear_frames()
+
     def user_line(self, frame: types.FrameType) -> None:
         filename = frame.f_code.co_filename
         line = frame.f_lineno
@@ -618,6 +797,9 @@ class DebuggerBDB(bdb.Bdb):
             line=line,
         )
 
+        if self.pause_controller.requests and self._check_pause(frame):
+            return
+
         # Async-aware stepping: when we're stepping over/into an await expression
         # the event loop resumes before the user coroutine does.  Skip any
         # internal asyncio / concurrent.futures frames so the debugger stops at
@@ -711,8 +893,7 @@ class DebuggerBDB(bdb.Bdb):
         reason = self.stepping_controller.consume_stop_state().value
 
         self._emit_stopped_event(frame, thread_id, reason)
-        self.process_commands()
-        self.thread_tracker.clear_frames()
+        self._wait_until_resumed(thread_id, clear_frames=True)
 
     def user_opcode(self, frame: types.FrameType) -> None:
         """Stop at each bytecode instruction during instruction-level stepping.
@@ -744,22 +925,32 @@ class DebuggerBDB(bdb.Bdb):
         reason = self.stepping_controller.consume_stop_state().value
 
         self._emit_stopped_event(frame, thread_id, reason)
-        self.process_commands()
-        self.thread_tracker.clear_frames()
+        self._wait_until_resumed(thread_id, clear_frames=True)
 
     def user_exception(
         self,
         frame: types.FrameType,
         exc_info: tuple[type[BaseException], BaseException, types.TracebackType | None],
+        *,
+        uncaught: bool | None = None,
     ) -> None:
-        """Handle exception breakpoints using the exception handler."""
+        """Handle exception breakpoints using the exception handler.
+
+        *uncaught* is supplied by backends that observe unwinding directly;
+        see :meth:`ExceptionHandler.should_break`.
+        """
+        exc_type, exc_value, _tb = exc_info
+        # Type-name filters that cannot match are rejected before any frame
+        # inspection or logging; most exceptions stop here.
+        if self.exception_handler.rejects_type(exc_type):
+            return
+
         # Just My Code: skip exceptions raised inside library/frozen frames.
         # These are often intentional control-flow exceptions (e.g. KeyError
         # inside importlib) that will be caught before ever reaching user code.
         if self.just_my_code and not is_user_frame(frame):
             return
 
-        exc_type, exc_value, _tb = exc_info
         exc_name = exc_type.__name__ if exc_type else "?"
         _log_debug_event(
             "user_exception.check",
@@ -771,7 +962,13 @@ class DebuggerBDB(bdb.Bdb):
             file=frame.f_code.co_filename,
             line=frame.f_lineno,
         )
-        if not self.exception_handler.should_break(frame, exc_info=exc_info):
+        if uncaught is None:
+            should_break = self.exception_handler.should_break(frame, exc_info=exc_info)
+        else:
+            should_break = self.exception_handler.should_break(
+                frame, exc_info=exc_info, uncaught=uncaught
+            )
+        if not should_break:
             _log_debug_event(
                 "user_exception.skip",
                 "user_exception: should_break=False, ignoring %s at %s:%s",
@@ -803,7 +1000,7 @@ class DebuggerBDB(bdb.Bdb):
 
         # Emit stopped event
         self.stepping_controller.current_frame = frame
-        self.thread_tracker.stopped_thread_ids.add(thread_id)
+        self.thread_tracker.mark_stopped(thread_id, frame)
         stack_frames: list[StackFrame] = self._get_stack_frames(frame)
         self.thread_tracker.frames_by_thread[thread_id] = stack_frames
 
@@ -812,17 +1009,24 @@ class DebuggerBDB(bdb.Bdb):
             threadId=thread_id,
             reason="exception",
             text=self.exception_handler.get_exception_text(exc_info),
-            allThreadsStopped=True,
+            allThreadsStopped=not self.non_stop,
         )
-        self.process_commands()
+        self._wait_until_resumed(thread_id)
 
     def _get_stack_frames(self, frame: types.FrameType) -> list[StackFrame]:
-        """Build stack frames for the given frame using the thread tracker."""
-        stack_frames = self.thread_tracker.build_stack_frames(frame)
+        """Build the top stack frames of a stop using the thread tracker.
+
+        Only :data:`STOP_FRAME_BUDGET` frames are built here; deeper ones are
+        built by ``ThreadTracker.materialize_frames`` when a request needs them.
+        """
+        stack_frames = self.thread_tracker.build_stack_frames(frame, max_depth=STOP_FRAME_BUDGET)
+        self._annotate_stack_frames(stack_frames)
+        return stack_frames
+
+    def _annotate_stack_frames(self, stack_frames: list[StackFrame]) -> None:
         annotate_stack_frames_with_source_refs(stack_frames)  # type: ignore[arg-type]
         if self.just_my_code:
             _annotate_library_frames(stack_frames)
-        return stack_frames
 
     def set_custom_breakpoint(
         self,
@@ -848,6 +1052,7 @@ class DebuggerBDB(bdb.Bdb):
     def clear_all_function_breakpoints(self):
         self.bp_manager.function_names = []
         self.bp_manager.function_meta.clear()
+        self.function_breakpoint_index.set_names(())
 
     # ---------------- Breakpoint housekeeping helpers -----------------
     def clear_breaks_for_file(self, path: str) -> None:
@@ -898,15 +1103,7 @@ class DebuggerBDB(bdb.Bdb):
         # Reference argument_list to avoid static analyzers reporting it as unused
         _ = argument_list
 
-        if not self.bp_manager.function_names and not self.bp_manager.function_meta:
-            return
-
-        candidates = get_function_candidate_names(frame)
-        match_name = None
-        for name in self.bp_manager.function_names:
-            if name in candidates:
-                match_name = name
-                break
+        match_name = self._match_function_breakpoint(frame)
         if match_name is None:
             return
 
@@ -926,4 +1123,4 @@ class DebuggerBDB(bdb.Bdb):
         thread_id = threading.get_ident()
         self._ensure_thread_registered(thread_id)
         self._emit_stopped_event(frame, thread_id, "function breakpoint")
-        self.process_commands()
+        self._wait_until_resumed(thread_id)
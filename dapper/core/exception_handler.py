@@ -8,8 +8,13 @@ This module provides logic for:
 
 from __future__ import annotations
 
+import builtins
+from collections import ChainMap
+from collections.abc import Mapping
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
+import re
 import traceback
 from typing import TYPE_CHECKING
 from typing import Any
@@ -22,6 +27,101 @@ if TYPE_CHECKING:
     from dapper.protocol.debugger_protocol import ExceptionInfo
 
 
+_DOTTED_NAME = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+
+
+class ExceptionCondition:
+    """A pre-compiled exception filter condition.
+
+    A condition that is a (dotted) name is first compared against the
+    exception's class hierarchy by name.  Names of builtin exception types
+    that do not match are rejected without evaluating anything; other
+    conditions are evaluated as an expression in the frame's namespace.
+    """
+
+    __slots__ = ("builtin_type", "code", "source", "type_name")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        text = source.strip()
+        self.type_name: str | None = text if _DOTTED_NAME.fullmatch(text) else None
+        candidate = getattr(builtins, text, None) if self.type_name else None
+        self.builtin_type: type[BaseException] | None = (
+            candidate
+            if isinstance(candidate, type) and issubclass(candidate, BaseException)
+            else None
+        )
+        try:
+            self.code: types.CodeType | None = compile(text, "<exception-condition>", "eval")
+        except SyntaxError:
+            self.code = None
+
+    def rejects_type(self, exc_type: type[BaseException] | None) -> bool:
+        """Return True when the condition cannot match *exc_type* (no eval needed)."""
+        return (
+            self.builtin_type is not None
+            and exc_type is not None
+            and not self._names_type(exc_type)
+        )
+
+    def matches(
+        self,
+        frame: types.FrameType | Any,
+        exc_info: tuple[type[BaseException], BaseException, Any] | None,
+    ) -> bool:
+        """Return True when the condition accepts the exception in *frame*."""
+        exc_type = exc_info[0] if exc_info is not None else None
+        if self.type_name is not None and exc_type is not None:
+            try:
+                if self._names_type(exc_type):
+                    return True
+            except (AttributeError, TypeError):
+                pass
+            if self.builtin_type is not None:
+                return False
+        if self.code is None:
+            return False
+        result = self._evaluate(frame)
+        if isinstance(result, type) and issubclass(result, BaseException):
+            # A name that resolves to an exception class filters by type.
+            return exc_type is not None and issubclass(exc_type, result)
+        return bool(result)
+
+    def _evaluate(self, frame: types.FrameType | Any) -> Any:
+        f_globals = getattr(frame, "f_globals", None)
+        if not isinstance(f_globals, dict):
+            f_globals = {}
+        f_locals = getattr(frame, "f_locals", None)
+        if not isinstance(f_locals, Mapping):
+            f_locals = {}
+        try:
+            # Locals resolve before globals, as in the frame itself; writes
+            # (walrus) land in the leading scratch dict, never in the frame.
+            return eval(self.code, f_globals, ChainMap({}, f_locals))
+        except NameError:
+            # Nested scopes (comprehensions, lambdas) only see globals, so
+            # retry with the merged namespace the old evaluator used.
+            try:
+                return eval(self.code, {**f_globals, **f_locals})
+            except Exception:
+                return False
+        except Exception:
+            return False
+
+    def _names_type(self, exc_type: type[BaseException]) -> bool:
+        name = self.type_name
+        return any(
+            name in (cls.__name__, f"{cls.__module__}.{cls.__qualname__}")
+            for cls in exc_type.__mro__
+        )
+
+
+@lru_cache(maxsize=128)
+def compile_exception_condition(condition: str) -> ExceptionCondition:
+    """Return the (cached) compiled form of an exception filter *condition*."""
+    return ExceptionCondition(condition)
+
+
 @dataclass
 class ExceptionBreakpointConfig:
     """Configuration for exception breakpoints.
@@ -78,6 +178,8 @@ class ExceptionHandler:
         self,
         frame: types.FrameType | Any,
         exc_info: tuple[type[BaseException], BaseException, Any] | None = None,
+        *,
+        uncaught: bool | None = None,
     ) -> bool:
         """Determine if execution should break for this exception.
 
@@ -85,6 +187,9 @@ class ExceptionHandler:
             frame: The frame where the exception occurred.
             exc_info: Optional (exc_type, exc_value, exc_traceback) tuple.
                 Used to evaluate condition expressions on exception filters.
+            uncaught: Whether the exception is known to escape user code, as
+                observed by a backend that watches unwinding.  ``None``
+                falls back to inspecting *frame* for a matching handler.
 
         Returns:
             True if we should break on this exception.
@@ -101,14 +206,34 @@ class ExceptionHandler:
 
         # "uncaught" mode only breaks if exception won't be handled
         if self.config.break_on_uncaught:
-            # Ask the helper whether the current frame will handle this exception
-            # True or None means it's handled, so we don't break
-            res = frame_may_handle_exception(frame)
-            if res is False:
+            if uncaught is None:
+                # Ask the helper whether the current frame will handle this exception
+                # True or None means it's handled, so we don't break
+                uncaught = frame_may_handle_exception(frame) is False
+            if uncaught:
                 return self._matches_condition(self.config.uncaught_condition, frame, exc_info)
 
         return False
 
+    def rejects_type(self, exc_type: type[BaseException] | None) -> bool:
+        """Return True when filters are enabled but none can match *exc_type*.
+
+        Only type-name conditions are consulted, so this is cheap enough to
+        run before any frame or stack inspection.
+        """
+        config = self.config
+        rejected = False
+        for enabled, condition in (
+            (config.break_on_raised, config.raised_condition),
+            (config.break_on_uncaught, config.uncaught_condition),
+        ):
+            if not enabled:
+                continue
+            if not condition or not compile_exception_condition(condition).rejects_type(exc_type):
+                return False
+            rejected = True
+        return rejected
+
     @staticmethod
     def _matches_condition(
         condition: str | None,
@@ -125,29 +250,7 @@ class ExceptionHandler:
         """
         if not condition:
             return True
-
-        # Try matching as an exception type name first
-        if exc_info is not None:
-            exc_type = exc_info[0]
-            # Check if the condition matches the exception type name or any
-            # parent in the MRO (e.g. "OSError" matches "FileNotFoundError")
-            try:
-                mro_names = [cls.__name__ for cls in exc_type.__mro__]
-                if condition.strip() in mro_names:
-                    return True
-            except (AttributeError, TypeError):
-                pass
-
-        # Fallback: evaluate as expression in the frame context
-        try:
-            ns = {}
-            if hasattr(frame, "f_globals"):
-                ns.update(frame.f_globals)
-            if hasattr(frame, "f_locals"):
-                ns.update(frame.f_locals)
-            return bool(eval(condition, ns))
-        except Exception:
-            return False
+        return compile_exception_condition(condition).matches(frame, exc_info)
 
     def get_break_mode(self) -> str:
         """Get the DAP break mode string.
@@ -241,4 +344,9 @@ class ExceptionHandler:
         self.exception_info_by_thread.clear()
 
 
-__all__ = ["ExceptionBreakpointConfig", "ExceptionHandler"]
+__all__ = [
+    "ExceptionBreakpointConfig",
+    "ExceptionCondition",
+    "ExceptionHandler",
+    "compile_exception_condition",
+]
@@ -0,0 +1,179 @@
+"""Resolve function-breakpoint names to the code objects they name.
+
+A function breakpoint is a name such as ``func``, ``module.func``,
+``Class.method`` or ``module.Class.method``.  Matching that name against
+every call is what made function breakpoints expensive, so
+:class:`FunctionBreakpointIndex` turns the question around: each code
+object is classified once, the first time it starts, and the answer is
+cached for as long as the breakpoint names stay the same.  The exception
+is a method a ``Class.method`` name does not select by its defining class:
+a subclass may inherit it, so the class of ``self`` / ``cls`` is checked on
+each of its calls.
+
+Only code whose ``co_name`` is the last component of some breakpoint name
+is ever classified; for everything else :meth:`FunctionBreakpointIndex.match`
+is a single set lookup.  Newly imported code needs no special handling: its
+code objects are classified on their first call like any other.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    import types
+
+
+def _owner_name(code: types.CodeType) -> str | None:
+    """Return the name of the class *code* is defined in, if known statically."""
+    qualname = getattr(code, "co_qualname", None)  # Python 3.11+
+    if qualname is not None:
+        parts = qualname.split(".")
+        if len(parts) > 1 and parts[-2] != "<locals>":
+            return parts[-2]
+    return None
+
+
+def _binds_owner(code: types.CodeType) -> bool:
+    """Return True when *code*'s first argument is ``self`` or ``cls``."""
+    return code.co_argcount > 0 and code.co_varnames[0] in ("self", "cls")
+
+
+def function_breakpoint_keys(frame: types.FrameType) -> set[str]:
+    """Return every function-breakpoint name that designates *frame*'s code.
+
+    Only data of the code object and its module is used, so the result is
+    the same for every call; see :func:`runtime_owner_keys` for the class
+    of ``self`` / ``cls``.
+    """
+    code = frame.f_code
+    name = code.co_name
+    module = frame.f_globals.get("__name__", "")
+    keys = {name}
+    qualname = getattr(code, "co_qualname", None)
+    if qualname:
+        keys.add(qualname)
+    owner = _owner_name(code)
+    if owner:
+        keys.add(f"{owner}.{name}")
+    if module:
+        keys.update([f"{module}.{key}" for key in keys])
+    return keys
+
+
+def runtime_owner_keys(frame: types.FrameType) -> set[str]:
+    """Return the ``Class.method`` names of this call's ``self`` / ``cls`` class.
+
+    An inherited method is selected by the name of the subclass it was
+    called on (``Sub.method`` for ``Sub().method()``), which only the
+    running frame knows.
+    """
+    code = frame.f_code
+    first = code.co_varnames[0]
+    try:
+        bound = frame.f_locals.get(first)
+    except Exception:
+        return set()
+    if first == "cls":
+        if not isinstance(bound, type):
+            return set()
+        owner = bound
+    else:
+        owner = type(bound)
+    owners = {owner.__name__}
+    if not hasattr(code, "co_qualname"):
+        # Before 3.11 the defining class is not on the code object either.
+        defining = _defining_class(owner, code)
+        if defining is not None:
+            owners.add(defining.__name__)
+    names = {f"{owner_name}.{code.co_name}" for owner_name in owners}
+    module = frame.f_globals.get("__name__", "")
+    if module:
+        names.update([f"{module}.{name}" for name in names])
+    return names
+
+
+def _defining_class(owner: type, code: types.CodeType) -> type | None:
+    """Return the class in *owner*'s MRO whose attribute runs *code*."""
+    for klass in getattr(owner, "__mro__", ()):
+        attr = vars(klass).get(code.co_name)
+        func = getattr(attr, "__func__", attr)
+        if getattr(func, "__code__", None) is code:
+            return klass
+    return None
+
+
+class FunctionBreakpointIndex:
+    """Cache of which code objects a set of function-breakpoint names selects."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._names: list[str] = []
+        # Last dotted component of every name: the only ``co_name`` values
+        # that can possibly match.
+        self._tails: frozenset[str] = frozenset()
+        # code object -> matched breakpoint name, None for a known miss, or
+        # the ``Class.method`` names to test against the class of ``self`` /
+        # ``cls`` on every call (methods a subclass may inherit).
+        self._resolved: dict[types.CodeType, str | tuple[str, ...] | None] = {}
+
+    @property
+    def names(self) -> list[str]:
+        """Names the index currently resolves."""
+        return self._names
+
+    def set_names(self, names: Iterable[str]) -> None:
+        """Replace the breakpoint names and forget every earlier resolution."""
+        names = list(dict.fromkeys(names))
+        with self._lock:
+            self._names = names
+            self._tails = frozenset(name.rsplit(".", 1)[-1] for name in names)
+            self._resolved = {}
+
+    def may_match(self, code: types.CodeType) -> bool:
+        """Cheap pre-check: False means *code* can never match any name."""
+        return code.co_name in self._tails
+
+    def match(self, frame: types.FrameType) -> str | None:
+        """Return the breakpoint name selecting *frame*'s code, or ``None``."""
+        code = frame.f_code
+        if code.co_name not in self._tails:
+            return None
+        resolved = self._resolved
+        if code in resolved:
+            entry = resolved[code]
+        else:
+            entry = self._classify(frame)
+            with self._lock:
+                if resolved is self._resolved:
+                    resolved[code] = entry
+        if isinstance(entry, tuple):
+            keys = runtime_owner_keys(frame)
+            return next((n for n in entry if n in keys), None)
+        return entry
+
+    def watches(self, code: types.CodeType) -> bool:
+        """Return True when calls of *code* may hit a breakpoint.
+
+        True for code resolved to a name, and for methods whose match
+        depends on the class they are called on.  Only meaningful after
+        :meth:`match` saw *code*.
+        """
+        return self._resolved.get(code) is not None
+
+    def resolved_codes(self) -> set[types.CodeType]:
+        """Return the code objects resolved to a breakpoint so far."""
+        with self._lock:
+            return {code for code, entry in self._resolved.items() if entry is not None}
+
+    def _classify(self, frame: types.FrameType) -> str | tuple[str, ...] | None:
+        code = frame.f_code
+        keys = function_breakpoint_keys(frame)
+        name = next((n for n in self._names if n in keys), None)
+        if name is not None or not _binds_owner(code):
+            return name
+        suffix = f".{code.co_name}"
+        owned = tuple(n for n in self._names if n.endswith(suffix))
+        return owned or None
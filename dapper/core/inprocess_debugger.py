@@ -84,6 +84,7 @@ class InProcessDebugger:
         *,
         just_my_code: bool = True,
         strict_expression_watch_policy: bool = False,
+        non_stop: bool = False,
     ) -> None:
         # Optional event callbacks (set by adapter).
         self.on_stopped = EventEmitter()
@@ -96,6 +97,7 @@ class InProcessDebugger:
             process_commands=process_queued_commands,
             just_my_code=just_my_code,
             strict_expression_watch_policy=strict_expression_watch_policy,
+            non_stop=non_stop,
         )
         self.command_lock = threading.RLock()
 
@@ -249,9 +251,13 @@ class InProcessDebugger:
                     dbg.thread_tracker.stopped_thread_ids.remove(thread_id)
                 except Exception:
                     pass
-            if not dbg.thread_tracker.stopped_thread_ids:
+            non_stop = getattr(dbg, "non_stop", False)
+            if non_stop:
+                if dbg.stepping_controller.step_thread_id in (None, thread_id):
+                    dbg.set_continue()
+            elif not dbg.thread_tracker.stopped_thread_ids:
                 dbg.set_continue()
-            return cast("ContinueResponseBody", {"allThreadsContinued": True})
+            return cast("ContinueResponseBody", {"allThreadsContinued": not non_stop})
 
     def next_(self, thread_id: int, *, granularity: str = "line") -> None:
         with self.command_lock:
@@ -346,18 +352,15 @@ class InProcessDebugger:
         start_frame: int = 0,
         levels: int = 0,
     ) -> StackTraceResponseBody:
-        dbg = self.debugger
-        frames_by_thread = dbg.thread_tracker.frames_by_thread
-        if thread_id not in frames_by_thread:
+        tracker = self.debugger.thread_tracker
+        if thread_id not in tracker.frames_by_thread:
             return cast("StackTraceResponseBody", {"stackFrames": [], "totalFrames": 0})
 
-        frames = frames_by_thread[thread_id]
-        total_frames = len(frames)
-        if levels > 0:
-            end_frame = min(start_frame + levels, total_frames)
-            frames_to_send = frames[start_frame:end_frame]
-        else:
-            frames_to_send = frames[start_frame:]
+        # Frames below the stop-time budget are only built once requested.
+        end_frame = start_frame + levels if levels > 0 else None
+        frames = tracker.materialize_frames(thread_id, end_frame)
+        total_frames = tracker.total_frames(thread_id)
+        frames_to_send = frames[start_frame:end_frame]
         return cast(
             "StackTraceResponseBody",
             {
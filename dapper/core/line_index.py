@@ -0,0 +1,124 @@
+"""Executable-line index shared by breakpoint and goto resolution.
+
+A line is executable when some code object compiled from the file maps
+bytecode to it in its ``co_lines()`` table.  ``breakpointLocations`` (sent by
+editors whenever a file is opened or scrolled), ``gotoTargets``, bytecode
+breakpoint injection and ``sys.monitoring`` arming all need that answer, so
+it is computed here once and cached:
+
+- :func:`code_object_lines` caches the lines of a single code object (not
+  its nested ones) for as long as the code object lives.
+- :func:`executable_lines` compiles a file once per version — its
+  ``(st_mtime_ns, st_size)`` on disk, or the identity of its
+  :mod:`linecache` entry for sources that only exist in memory — and keeps
+  the union of the lines of every nested code object.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from bisect import bisect_right
+import dis
+import linecache
+import os
+import threading
+from typing import TYPE_CHECKING
+import weakref
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    import types
+
+_code_lines: weakref.WeakKeyDictionary[types.CodeType, frozenset[int]] = (
+    weakref.WeakKeyDictionary()
+)
+# path -> (version, sorted executable lines)
+_file_index: dict[str, tuple[object, tuple[int, ...]]] = {}
+_lock = threading.Lock()
+
+
+def clear_line_index_caches() -> None:
+    """Drop all cached code-object and per-file line indexes."""
+    with _lock:
+        _code_lines.clear()
+        _file_index.clear()
+
+
+def _raw_code_lines(code: types.CodeType) -> Iterable[int | None]:
+    co_lines = getattr(code, "co_lines", None)
+    if co_lines is None:  # Python 3.9
+        return (line for _offset, line in dis.findlinestarts(code))
+    return (line for _start, _end, line in co_lines())
+
+
+def code_object_lines(code: types.CodeType) -> frozenset[int]:
+    """Return the lines *code* itself has bytecode for (nested code excluded)."""
+    cached = _code_lines.get(code)
+    if cached is not None:
+        return cached
+    lines = frozenset(line for line in _raw_code_lines(code) if line is not None and line > 0)
+    with _lock:
+        _code_lines[code] = lines
+    return lines
+
+
+def _collect_lines(code: types.CodeType, out: set[int]) -> None:
+    out.update(code_object_lines(code))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _collect_lines(const, out)
+
+
+def _file_version(path: str) -> object | None:
+    """Return a token that changes whenever the source of *path* changes."""
+    try:
+        st = os.stat(path)  # noqa: PTH116
+    except (OSError, ValueError):
+        # In-memory sources: linecache replaces the list when they change.
+        return linecache.getlines(path) or None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_source(path: str, version: object) -> str:
+    if isinstance(version, list):
+        return "".join(version)
+    with open(path, encoding="utf-8") as f:  # noqa: PTH123
+        return f.read()
+
+
+def executable_lines(path: str) -> tuple[int, ...] | None:
+    """Return the sorted executable lines of *path*.
+
+    Returns ``None`` when the source cannot be read or compiled, so callers
+    can fall back to their own best-effort answer.
+    """
+    version = _file_version(path)
+    if version is None:
+        return None
+    cached = _file_index.get(path)
+    if cached is not None and (cached[0] is version or cached[0] == version):
+        return cached[1]
+    try:
+        code = compile(_read_source(path, version), path, "exec")
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+    out: set[int] = set()
+    _collect_lines(code, out)
+    lines = tuple(sorted(out))
+    with _lock:
+        _file_index[path] = (version, lines)
+    return lines
+
+
+def lines_in_range(path: str, start: int, end: int) -> list[int] | None:
+    """Return the executable lines of *path* within ``start..end`` inclusive."""
+    lines = executable_lines(path)
+    if lines is None:
+        return None
+    return list(lines[bisect_left(lines, start) : bisect_right(lines, end)])
+
+
+def next_executable_line(code: types.CodeType, line: int) -> int | None:
+    """Return the first line at or after *line* that *code* has bytecode for."""
+    candidates = [ln for ln in code_object_lines(code) if ln >= line]
+    return min(candidates) if candidates else None
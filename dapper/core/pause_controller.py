@@ -0,0 +1,129 @@
+"""PauseController: Pending pause requests for running threads.
+
+A DAP ``pause`` arrives on the command thread while the target thread is
+running.  The debugger records the request here and arms a checkpoint on
+the target's current stack (local ``LINE`` events or frame trace
+functions); the target stops itself at the next checkpoint it reaches.
+
+This module provides:
+1. Recording, consuming and cancelling per-thread pause requests
+2. Reporting a request that has not landed in time (thread in native code)
+3. Pause latency statistics
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+import threading
+import time
+from typing import TypedDict
+
+# How long a pause may take to reach a checkpoint before the stop is
+# reported from a snapshot of the thread's stack.
+PAUSE_REPORT_TIMEOUT = 0.25
+
+
+class PauseStatistics(TypedDict):
+    """Pause latency counters."""
+
+    requested: int
+    landed: int
+    reported_from_snapshot: int
+    cancelled: int
+    last_latency: float | None
+    max_latency: float
+
+
+@dataclass
+class PauseRequest:
+    """A pause requested for one thread."""
+
+    requested_at: float
+    reported: bool = False
+
+
+@dataclass
+class PauseController:
+    """Tracks pause requests by thread ID.
+
+    Attributes:
+        requests: Mapping of thread ID to its pending pause request.
+        stats: Pause latency counters.
+
+    """
+
+    requests: dict[int, PauseRequest] = field(default_factory=dict)
+    stats: PauseStatistics = field(
+        default_factory=lambda: {
+            "requested": 0,
+            "landed": 0,
+            "reported_from_snapshot": 0,
+            "cancelled": 0,
+            "last_latency": None,
+            "max_latency": 0.0,
+        }
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def request(self, thread_id: int) -> None:
+        """Record a pause request for *thread_id*; an earlier one is kept."""
+        with self._lock:
+            if thread_id not in self.requests:
+                self.requests[thread_id] = PauseRequest(time.perf_counter())
+                self.stats["requested"] += 1
+
+    def is_requested(self, thread_id: int) -> bool:
+        """Check whether *thread_id* has a pending pause request."""
+        return thread_id in self.requests
+
+    def consume(self, thread_id: int) -> PauseRequest | None:
+        """Take the pending request of *thread_id* as it stops; record its latency."""
+        with self._lock:
+            request = self.requests.pop(thread_id, None)
+            if request is None:
+                return None
+            latency = time.perf_counter() - request.requested_at
+            self.stats["landed"] += 1
+            self.stats["last_latency"] = latency
+            self.stats["max_latency"] = max(self.stats["max_latency"], latency)
+            return request
+
+    def mark_reported(self, thread_id: int) -> bool:
+        """Mark a request that has not landed as reported from a snapshot.
+
+        Returns:
+            True if the request was still pending and not reported yet.
+
+        """
+        with self._lock:
+            request = self.requests.get(thread_id)
+            if request is None or request.reported:
+                return False
+            request.reported = True
+            self.stats["reported_from_snapshot"] += 1
+            return True
+
+    def cancel(self, thread_id: int | None = None) -> bool:
+        """Drop the request of *thread_id* (default: every request).
+
+        Returns:
+            True if any request was dropped.
+
+        """
+        with self._lock:
+            if thread_id is None:
+                dropped = len(self.requests)
+                self.requests.clear()
+            else:
+                dropped = int(self.requests.pop(thread_id, None) is not None)
+            self.stats["cancelled"] += dropped
+            return bool(dropped)
+
+    def statistics(self) -> PauseStatistics:
+        """Return a copy of the pause latency counters."""
+        with self._lock:
+            return PauseStatistics(**self.stats)
+
+
+__all__ = ["PAUSE_REPORT_TIMEOUT", "PauseController", "PauseRequest", "PauseStatistics"]
@@ -57,6 +57,7 @@ class SteppingController:
     - stepping: whether we're in step mode
     - stop_on_entry: whether to stop at program entry
     - current_frame: the frame we're currently stopped at
+    - step_thread_id: the thread a step applies to
 
     The controller provides a clean API for:
     - Setting stepping modes
@@ -67,6 +68,8 @@ class SteppingController:
         stepping: Whether the debugger is in stepping mode.
         stop_on_entry: Whether to stop at program entry.
         current_frame: The frame we're currently stopped at (if any).
+        step_thread_id: Ident of the thread being stepped; other threads
+            never stop for a step.  ``None`` lets any thread stop.
 
     """
 
@@ -79,6 +82,7 @@ class SteppingController:
     async_step_over: bool = False
     # DAP stepGranularity requested by the client for the current step.
     granularity: StepGranularity = field(default=StepGranularity.LINE)
+    step_thread_id: int | None = None
 
     def is_stepping(self) -> bool:
         """Check if currently in stepping mode."""
@@ -158,6 +162,10 @@ class SteppingController:
         """
         self.async_step_over = value
 
+    def set_step_thread(self, thread_id: int | None) -> None:
+        """Confine the next step to *thread_id* (``None`` for any thread)."""
+        self.step_thread_id = thread_id
+
     def clear(self) -> None:
         """Clear all stepping state."""
         self.stepping = False
@@ -165,6 +173,7 @@ class SteppingController:
         self.current_frame = None
         self.async_step_over = False
         self.granularity = StepGranularity.LINE
+        self.step_thread_id = None
 
     def request_step(self) -> None:
         """Request a step operation (step into).
@@ -4,7 +4,8 @@ This module provides a unified API for:
 1. Tracking registered threads and their names
 2. Managing stopped/running thread state
 3. Allocating and tracking frame IDs
-4. Storing stack frames per thread
+4. Storing stack frames per thread, built lazily below a stop-time budget
+5. Per-thread stop frames and resume events (non-stop mode)
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from typing import Any
 from typing import Union
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     import types
 
 from dapper.protocol.structures import StackFrame as StackFrameDict
@@ -28,6 +30,14 @@ FrameType = Union["types.FrameType", Any]
 # Safety limit for stack walking to avoid infinite loops on mocked frames
 MAX_STACK_DEPTH = 128
 
+# Frames built eagerly when a thread stops.  Deeper frames are built from
+# the live frame chain only once a request asks for them, so the cost of a
+# stop does not grow with the depth of the stack.
+STOP_FRAME_BUDGET = 20
+
+# Safety limit for walking the unbuilt rest of a stack.
+MAX_LAZY_STACK_DEPTH = 100_000
+
 
 @dataclass
 class StackFrame:
@@ -66,12 +76,25 @@ class ThreadTracker:
     - next_frame_id: counter for frame IDs
     - frame_id_to_frame: mapping of frame_id -> actual frame object
 
+    Each stop also records the frame the thread stopped at and a fresh
+    resume event, so in non-stop mode every stopped thread can wait for
+    (and be stepped from) its own stop independently of the others.
+
+    A stop only builds the top :data:`STOP_FRAME_BUDGET` frames.  The rest
+    of the stack stays reachable from the ``f_back`` of the deepest built
+    frame; :meth:`materialize_frames` builds it on request and
+    :meth:`total_frames` counts it without building it.
+
     Attributes:
         threads: Mapping of thread ID to thread name.
         stopped_thread_ids: Set of thread IDs that are currently stopped.
         frames_by_thread: Mapping of thread ID to list of stack frame dicts.
         frame_id_to_frame: Mapping of frame ID to actual Python frame object.
         next_frame_id: Next frame ID to allocate.
+        stop_frames: Mapping of thread ID to the frame it is stopped at.
+        resume_events: Mapping of thread ID to the event that resumes it.
+        frame_totals: Mapping of thread ID to its top frame ID and stack depth.
+        frame_annotator: Called with frames built by :meth:`materialize_frames`.
 
     """
 
@@ -80,6 +103,10 @@ class ThreadTracker:
     frames_by_thread: dict[int, list[StackFrameDict]] = field(default_factory=dict)
     frame_id_to_frame: dict[int, FrameType] = field(default_factory=dict)
     next_frame_id: int = 1
+    stop_frames: dict[int, FrameType] = field(default_factory=dict)
+    resume_events: dict[int, threading.Event] = field(default_factory=dict)
+    frame_totals: dict[int, tuple[int, int]] = field(default_factory=dict)
+    frame_annotator: Callable[[list[StackFrameDict]], None] | None = None
 
     def is_thread_registered(self, thread_id: int) -> bool:
         """Check if a thread is registered."""
@@ -111,9 +138,16 @@ class ThreadTracker:
         """Check if a thread is currently stopped."""
         return thread_id in self.stopped_thread_ids
 
-    def mark_stopped(self, thread_id: int) -> None:
-        """Mark a thread as stopped."""
+    def mark_stopped(self, thread_id: int, frame: FrameType | None = None) -> None:
+        """Mark a thread as stopped, optionally at *frame*.
+
+        A new resume event is created for every stop, so a resume signalled
+        for an earlier stop can never release this one.
+        """
         self.stopped_thread_ids.add(thread_id)
+        if frame is not None:
+            self.stop_frames[thread_id] = frame
+        self.resume_events[thread_id] = threading.Event()
 
     def mark_continued(self, thread_id: int) -> bool:
         """Mark a thread as continued (no longer stopped).
@@ -127,6 +161,44 @@ class ThreadTracker:
             return True
         return False
 
+    def resume_thread(self, thread_id: int) -> bool:
+        """Release *thread_id* from :meth:`wait_for_resume`.
+
+        Returns:
+            True if the thread had a pending stop to release.
+
+        """
+        event = self.resume_events.get(thread_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+
+    def resume_all_threads(self) -> None:
+        """Release every thread waiting in :meth:`wait_for_resume`."""
+        for event in list(self.resume_events.values()):
+            event.set()
+
+    def wait_for_resume(self, thread_id: int, timeout: float | None = None) -> bool:
+        """Block until *thread_id* is resumed; False if *timeout* expired first."""
+        event = self.resume_events.get(thread_id)
+        if event is None:
+            return True
+        return event.wait(timeout)
+
+    def release_thread(self, thread_id: int) -> None:
+        """Forget the stop state of a resumed thread.
+
+        Unlike :meth:`clear_frames` this leaves the frames of every other
+        stopped thread valid.
+        """
+        self.stopped_thread_ids.discard(thread_id)
+        self.stop_frames.pop(thread_id, None)
+        self.resume_events.pop(thread_id, None)
+        self.frame_totals.pop(thread_id, None)
+        for stack_frame in self.frames_by_thread.pop(thread_id, []):
+            self.frame_id_to_frame.pop(stack_frame["id"], None)
+
     def has_stopped_threads(self) -> bool:
         """Check if any threads are currently stopped."""
         return bool(self.stopped_thread_ids)
@@ -157,6 +229,8 @@ class ThreadTracker:
         """
         self.frame_id_to_frame.clear()
         self.frames_by_thread.clear()
+        self.stop_frames.clear()
+        self.frame_totals.clear()
 
     def store_stack_frames(self, thread_id: int, frames: list[StackFrameDict]) -> None:
         """Store the stack frames for a thread."""
@@ -166,6 +240,76 @@ class ThreadTracker:
         """Get the stack frames for a thread."""
         return self.frames_by_thread.get(thread_id, [])
 
+    def _frame_after(self, frames: list[StackFrameDict]) -> FrameType | None:
+        """Return the live frame below the deepest of *frames*, if known."""
+        last = frames[-1]
+        frame_id = last.get("id") if isinstance(last, dict) else None
+        frame = self.frame_id_to_frame.get(frame_id) if isinstance(frame_id, int) else None
+        if frame is None:
+            return None
+        try:
+            return getattr(frame, "f_back", None)
+        except Exception:
+            return None
+
+    def total_frames(self, thread_id: int) -> int:
+        """Return the depth of *thread_id*'s stack, built or not.
+
+        The unbuilt frames are counted by walking ``f_back`` once per stop;
+        the result is cached until the stored frames are replaced.
+        """
+        frames = self.frames_by_thread.get(thread_id)
+        if not frames:
+            return 0
+        top = frames[0]
+        key = top.get("id") if isinstance(top, dict) else None
+        cached = self.frame_totals.get(thread_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        total = len(frames)
+        current = self._frame_after(frames)
+        visited: set[int] = set()
+        while current is not None and total < MAX_LAZY_STACK_DEPTH:
+            if id(current) in visited:
+                break
+            visited.add(id(current))
+            total += 1
+            try:
+                current = getattr(current, "f_back", None)
+            except Exception:
+                break
+        if isinstance(key, int):
+            self.frame_totals[thread_id] = (key, total)
+        return total
+
+    def materialize_frames(self, thread_id: int, count: int | None = None) -> list[StackFrameDict]:
+        """Build the stored frames of *thread_id* out to *count* (default: all).
+
+        Frames are appended to :attr:`frames_by_thread` in place, registered,
+        and passed to :attr:`frame_annotator`.
+
+        Returns:
+            The stored frames of the thread.
+
+        """
+        frames = self.frames_by_thread.get(thread_id)
+        if not frames:
+            return frames if frames is not None else []
+        if count is None:
+            count = self.total_frames(thread_id)
+        missing = count - len(frames)
+        if missing <= 0:
+            return frames
+        tail = self._frame_after(frames)
+        if tail is None:
+            return frames
+        more = self.build_stack_frames(tail, max_depth=missing)
+        if more and self.frame_annotator is not None:
+            self.frame_annotator(more)
+        frames.extend(more)
+        return frames
+
     def build_stack_frames(
         self,
         frame: types.FrameType | Any | None,
@@ -285,7 +429,10 @@ class ThreadTracker:
         self.stopped_thread_ids.clear()
         self.frames_by_thread.clear()
         self.frame_id_to_frame.clear()
+        self.stop_frames.clear()
+        self.resume_events.clear()
+        self.frame_totals.clear()
         self.next_frame_id = 1
 
 
-__all__ = ["StackFrame", "ThreadTracker"]
+__all__ = ["STOP_FRAME_BUDGET", "StackFrame", "ThreadTracker"]
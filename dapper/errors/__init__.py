@@ -1,24 +1,31 @@
 """Error handling for Dapper debug adapter."""
 
-from dapper.errors.dapper_errors import BackendError
-from dapper.errors.dapper_errors import ConfigurationError
-from dapper.errors.dapper_errors import DapperError
-from dapper.errors.dapper_errors import DapperTimeoutError
-from dapper.errors.dapper_errors import DebuggerError
-from dapper.errors.dapper_errors import ErrorHandler
-from dapper.errors.dapper_errors import IPCError
-from dapper.errors.dapper_errors import ProtocolError
-from dapper.errors.dapper_errors import create_dap_response
-from dapper.errors.dapper_errors import default_error_handler
-from dapper.errors.dapper_errors import handle_error
-from dapper.errors.error_patterns import ErrorContext
-from dapper.errors.error_patterns import async_handle_adapter_errors
-from dapper.errors.error_patterns import async_handle_backend_errors
-from dapper.errors.error_patterns import async_handle_debugger_errors
-from dapper.errors.error_patterns import handle_adapter_errors
-from dapper.errors.error_patterns import handle_backend_errors
-from dapper.errors.error_patterns import handle_debugger_errors
-from dapper.errors.error_patterns import handle_protocol_errors
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from dapper.errors.dapper_errors import BackendError
+    from dapper.errors.dapper_errors import ConfigurationError
+    from dapper.errors.dapper_errors import DapperError
+    from dapper.errors.dapper_errors import DapperTimeoutError
+    from dapper.errors.dapper_errors import DebuggerError
+    from dapper.errors.dapper_errors import ErrorHandler
+    from dapper.errors.dapper_errors import IPCError
+    from dapper.errors.dapper_errors import ProtocolError
+    from dapper.errors.dapper_errors import create_dap_response
+    from dapper.errors.dapper_errors import default_error_handler
+    from dapper.errors.dapper_errors import handle_error
+    from dapper.errors.error_patterns import ErrorContext
+    from dapper.errors.error_patterns import async_handle_adapter_errors
+    from dapper.errors.error_patterns import async_handle_backend_errors
+    from dapper.errors.error_patterns import async_handle_debugger_errors
+    from dapper.errors.error_patterns import handle_adapter_errors
+    from dapper.errors.error_patterns import handle_backend_errors
+    from dapper.errors.error_patterns import handle_debugger_errors
+    from dapper.errors.error_patterns import handle_protocol_errors
 
 __all__ = [
     "BackendError",
@@ -41,3 +48,28 @@ __all__ = [
     "handle_error",
     "handle_protocol_errors",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BackendError": "dapper.errors.dapper_errors",
+        "ConfigurationError": "dapper.errors.dapper_errors",
+        "DapperError": "dapper.errors.dapper_errors",
+        "DapperTimeoutError": "dapper.errors.dapper_errors",
+        "DebuggerError": "dapper.errors.dapper_errors",
+        "ErrorHandler": "dapper.errors.dapper_errors",
+        "IPCError": "dapper.errors.dapper_errors",
+        "ProtocolError": "dapper.errors.dapper_errors",
+        "create_dap_response": "dapper.errors.dapper_errors",
+        "default_error_handler": "dapper.errors.dapper_errors",
+        "handle_error": "dapper.errors.dapper_errors",
+        "ErrorContext": "dapper.errors.error_patterns",
+        "async_handle_adapter_errors": "dapper.errors.error_patterns",
+        "async_handle_backend_errors": "dapper.errors.error_patterns",
+        "async_handle_debugger_errors": "dapper.errors.error_patterns",
+        "handle_adapter_errors": "dapper.errors.error_patterns",
+        "handle_backend_errors": "dapper.errors.error_patterns",
+        "handle_debugger_errors": "dapper.errors.error_patterns",
+        "handle_protocol_errors": "dapper.errors.error_patterns",
+    },
+)
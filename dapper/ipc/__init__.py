@@ -4,12 +4,28 @@ This module provides inter-process communication functionality with
 a clean, maintainable architecture using the factory pattern.
 """
 
-from dapper.ipc.ipc_manager import IPCManager
-from dapper.ipc.transport_factory import TransportConfig
-from dapper.ipc.transport_factory import TransportFactory
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from dapper.ipc.ipc_manager import IPCManager
+    from dapper.ipc.transport_factory import TransportConfig
+    from dapper.ipc.transport_factory import TransportFactory
 
 __all__ = [
     "IPCManager",
     "TransportConfig",
     "TransportFactory",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "IPCManager": "dapper.ipc.ipc_manager",
+        "TransportConfig": "dapper.ipc.transport_factory",
+        "TransportFactory": "dapper.ipc.transport_factory",
+    },
+)
@@ -6,6 +6,8 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Any
 
+from dapper.ipc.ipc_binary import ENCODING_JSON
+
 
 class ConnectionBase(ABC):
     """Base class for all connection types."""
@@ -14,6 +16,8 @@ class ConnectionBase(ABC):
         self.reader = None
         self.writer = None
         self._is_connected = False
+        # Payload encoding used for outgoing binary frames (see ipc_binary)
+        self.payload_encoding = ENCODING_JSON
 
     @property
     def is_connected(self) -> bool:
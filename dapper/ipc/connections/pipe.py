@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 from multiprocessing import connection as mp_conn
 import os
@@ -14,15 +13,16 @@ from typing import Any
 
 from dapper.ipc.connections.base import ConnectionBase
 from dapper.ipc.ipc_binary import HEADER_SIZE
-from dapper.ipc.ipc_binary import pack_frame
-from dapper.ipc.ipc_binary import unpack_header
+from dapper.ipc.ipc_binary import KIND_COMMAND
+from dapper.ipc.ipc_binary import MAGIC
+from dapper.ipc.ipc_binary import decode_message
+from dapper.ipc.ipc_binary import encode_frame_parts
+from dapper.ipc.ipc_binary import encoding_from_environment
+from dapper.ipc.ipc_binary import unpack_frame_header
 from dapper.utils.logging_levels import TRACE
 from dapper.utils.logging_message_summary import summarize_dap_message
 from dapper.utils.logging_names import DAPPER_LOGGER_TRANSPORT
 
-# Binary frame kind for adapter→launcher commands
-_KIND_COMMAND = 2
-
 logger = logging.getLogger(DAPPER_LOGGER_TRANSPORT)
 traffic_logger = logger
 
@@ -45,6 +45,7 @@ class NamedPipeServerConnection(ConnectionBase):
         self.listener: mp_conn.Listener | None = None
         self.client: mp_conn.Connection | None = None
         self._pipe_conn: mp_conn.Connection | None = None
+        self.payload_encoding = encoding_from_environment()
 
     def _get_pipe_path(self, name: str) -> str:
         return rf"\\.\pipe\{name}" if sys.platform == "win32" else f"/tmp/{name}"
@@ -147,6 +148,14 @@ class NamedPipeServerConnection(ConnectionBase):
         self._is_connected = False
         logger.info("Named pipe connection closed")
 
+    @staticmethod
+    def _decode_frame(data: bytes) -> Any:
+        """Decode a message received as one buffer via ``Connection.recv_bytes``."""
+        if data[:2] == MAGIC and len(data) >= HEADER_SIZE:
+            _kind, encoding, length = unpack_frame_header(data[:HEADER_SIZE])
+            return decode_message(data[HEADER_SIZE : HEADER_SIZE + length], encoding)
+        return decode_message(data)
+
     async def read_message(self) -> dict[str, Any] | None:  # noqa: PLR0911
         if sys.platform == "win32" and self._pipe_conn is not None:
             loop = asyncio.get_running_loop()
@@ -175,7 +184,7 @@ class NamedPipeServerConnection(ConnectionBase):
             else:
                 payload = str(incoming).encode("utf-8")
 
-            message = json.loads(payload.decode("utf-8"))
+            message = self._decode_frame(payload)
             traffic_logger.log(TRACE, "recv %s", summarize_dap_message(message))
             return message
 
@@ -191,7 +200,7 @@ class NamedPipeServerConnection(ConnectionBase):
             return None
 
         try:
-            _kind, length = unpack_header(header_data)
+            _kind, encoding, length = unpack_frame_header(header_data)
         except ValueError:
             logger.exception("Failed to unpack binary header")
             return None
@@ -203,18 +212,18 @@ class NamedPipeServerConnection(ConnectionBase):
             if not payload_bytes:
                 return None
 
-        message = json.loads(payload_bytes.decode("utf-8"))
+        message = decode_message(payload_bytes, encoding)
         traffic_logger.log(TRACE, "recv %s", summarize_dap_message(message))
         return message
 
     async def write_message(self, message: dict[str, Any]) -> None:
         """Write a binary DAP message to the named pipe connection."""
-        content = json.dumps(message).encode("utf-8")
-        payload = pack_frame(_KIND_COMMAND, content)
+        parts = encode_frame_parts(KIND_COMMAND, message, self.payload_encoding)
 
         if sys.platform == "win32" and self._pipe_conn is not None:
+            # Connection.send_bytes needs a single buffer
             loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._pipe_conn.send_bytes, payload)
+            await loop.run_in_executor(None, self._pipe_conn.send_bytes, b"".join(parts))
             traffic_logger.log(TRACE, "send %s", summarize_dap_message(message))
             return
 
@@ -222,12 +231,12 @@ class NamedPipeServerConnection(ConnectionBase):
             raise RuntimeError("No active connection")
 
         if getattr(self, "writer", None):
-            self.writer.write(payload)
+            self.writer.writelines(parts)
             await self.writer.drain()
         else:
             pf = self.pipe_file
             assert pf is not None
-            pf.write(payload)
+            pf.writelines(parts)
             pf.flush()
 
         traffic_logger.log(TRACE, "send %s", summarize_dap_message(message))
@@ -5,21 +5,21 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import ipaddress
-import json
 import logging
 import socket
 from typing import Any
 
 from dapper.ipc.connections.base import ConnectionBase
-from dapper.ipc.ipc_binary import pack_frame
-from dapper.ipc.ipc_binary import unpack_header
+from dapper.ipc.ipc_binary import HEADER_SIZE
+from dapper.ipc.ipc_binary import KIND_COMMAND
+from dapper.ipc.ipc_binary import decode_message
+from dapper.ipc.ipc_binary import encode_frame_parts
+from dapper.ipc.ipc_binary import encoding_from_environment
+from dapper.ipc.ipc_binary import unpack_frame_header
 from dapper.utils.logging_levels import TRACE
 from dapper.utils.logging_message_summary import summarize_dap_message
 from dapper.utils.logging_names import DAPPER_LOGGER_TRANSPORT
 
-# Binary frame kind for adapter→launcher commands
-_KIND_COMMAND = 2
-
 logger = logging.getLogger(DAPPER_LOGGER_TRANSPORT)
 traffic_logger = logger
 
@@ -48,6 +48,7 @@ class TCPServerConnection(ConnectionBase):
         self.server: asyncio.Server | None = None
         self._client_connected: asyncio.Future[bool] | None = None
         self.socket: Any = None  # For backward compatibility
+        self.payload_encoding = encoding_from_environment()
         self._warn_if_not_loopback(self.host)
 
     @staticmethod
@@ -237,12 +238,12 @@ class TCPServerConnection(ConnectionBase):
         """Read a binary frame message."""
         # Read header first
         try:
-            header_data = await self.reader.readexactly(8)
+            header_data = await self.reader.readexactly(HEADER_SIZE)
         except asyncio.IncompleteReadError:
             return None
 
         try:
-            _kind, length = unpack_header(header_data)
+            _kind, encoding, length = unpack_frame_header(header_data)
         except ValueError:
             logger.exception("Failed to unpack binary header")
             return None
@@ -256,12 +257,12 @@ class TCPServerConnection(ConnectionBase):
             except asyncio.IncompleteReadError:
                 return None
 
-        # Parse JSON payload
+        # Parse payload
         try:
-            message = json.loads(payload.decode("utf-8"))
+            message = decode_message(payload, encoding)
             traffic_logger.log(TRACE, "recv %s", summarize_dap_message(message))
-        except json.JSONDecodeError:
-            logger.exception("Failed to decode binary message JSON")
+        except (ValueError, EOFError, TypeError):
+            logger.exception("Failed to decode binary message payload")
             return None
         else:
             return message
@@ -273,9 +274,8 @@ class TCPServerConnection(ConnectionBase):
             msg = "No active connection"
             raise RuntimeError(msg)
 
-        content = json.dumps(message).encode("utf-8")
-        frame = pack_frame(_KIND_COMMAND, content)
-        self.writer.write(frame)
+        # Header and payload go out as one vectored write, without joining them
+        self.writer.writelines(encode_frame_parts(KIND_COMMAND, message, self.payload_encoding))
 
         await self.writer.drain()
         traffic_logger.log(TRACE, "send %s", summarize_dap_message(message))
@@ -9,7 +9,6 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
-import threading
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
@@ -17,6 +16,7 @@ from typing import cast
 
 from dapper.ipc.transport_factory import TransportConfig
 from dapper.ipc.transport_factory import TransportFactory
+from dapper.utils.internal_threads import InternalThread
 from dapper.utils.logging_levels import TRACE
 
 if TYPE_CHECKING:
@@ -50,7 +50,7 @@ class IPCManager:
 
     def __init__(self) -> None:
         self._connection: ConnectionBase | None = None
-        self._reader_thread: threading.Thread | None = None
+        self._reader_thread: InternalThread | None = None
         self._message_handler: Callable[[dict[str, Any]], None] | None = None
         self._enabled = False
         self._should_accept = False
@@ -117,7 +117,7 @@ class IPCManager:
         self._should_accept = accept
 
         # Start reader thread
-        self._reader_thread = threading.Thread(
+        self._reader_thread = InternalThread(
             target=self._read_messages,
             daemon=True,
             name="IPC-Reader",
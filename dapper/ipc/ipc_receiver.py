@@ -7,7 +7,6 @@ the debuggee process.
 
 from __future__ import annotations
 
-import json
 import logging
 from queue import Empty
 import traceback
@@ -17,8 +16,10 @@ from typing import Callable
 from typing import cast
 
 from dapper.ipc.ipc_binary import HEADER_SIZE
+from dapper.ipc.ipc_binary import KIND_COMMAND
+from dapper.ipc.ipc_binary import decode_message
 from dapper.ipc.ipc_binary import read_exact
-from dapper.ipc.ipc_binary import unpack_header
+from dapper.ipc.ipc_binary import unpack_frame_header
 from dapper.shared import debug_shared
 from dapper.shared.command_handlers import COMMAND_HANDLERS
 
@@ -162,7 +163,6 @@ def _receive_binary_commands(
 ) -> None:
     """Read binary DP-framed commands from ``ipc_rfile``."""
 
-    KIND_COMMAND = 2  # noqa: N806
     # ``require_ipc`` in the caller already ensures ``ipc_rfile`` is not None,
     # but the attribute is typed ``Any | None`` so mypy/ruff complain.  Cast
     # to ``BinaryIO`` for clarity and assert to satisfy the type checker.
@@ -180,7 +180,7 @@ def _receive_binary_commands(
             return
 
         try:
-            kind, length = unpack_header(header)
+            kind, encoding, length = unpack_frame_header(header)
         except Exception as e:
             _send_error(f"Bad frame header: {e!s}", active_session, error_sender=error_sender)
             continue
@@ -196,7 +196,9 @@ def _receive_binary_commands(
 
         if kind == KIND_COMMAND:
             try:
-                command = json.loads(payload.decode("utf-8"))
+                command = decode_message(payload, encoding)
+                # Reply in whatever encoding the adapter chose.
+                active_session.ipc_encoding = encoding
                 active_session.command_queue.put(command)
                 with debug_shared.use_session(active_session):
                     active_session.dispatch_debug_command(command)
@@ -27,6 +27,9 @@ import uuid
 
 from dapper.launcher import debug_launcher
 from dapper.shared import debug_shared
+from dapper.utils.internal_threads import InternalThread
+from dapper.utils.internal_threads import internal_thread_idents
+from dapper.utils.internal_threads import user_thread_trace
 
 logger = logging.getLogger(__name__)
 
@@ -132,7 +135,7 @@ def _schedule_script_cleanup(script_path: str, *, delay_seconds: float = 30.0) -
             logger.debug("Failed to remove remote-exec script %s", script_path, exc_info=True)
 
     atexit.register(lambda: path.unlink(missing_ok=True))
-    threading.Thread(target=_cleanup, daemon=True, name="dapper-attach-script-cleanup").start()
+    InternalThread(target=_cleanup, daemon=True, name="dapper-attach-script-cleanup").start()
 
 
 def _write_remote_exec_script(payload: AttachByPidPayload) -> str:
@@ -325,15 +328,18 @@ def _install_live_tracing() -> None:
         raise RuntimeError(msg)
 
     trace_fn = cast("Any", debugger).trace_dispatch
-    threading.settrace(trace_fn)
-    sys.settrace(trace_fn)
+    threading.settrace(user_thread_trace(trace_fn))
 
     current_frames = getattr(sys, "_current_frames", None)
     if not callable(current_frames):
         return
 
     frames_by_thread = cast("dict[int, Any]", current_frames())
+    internal = internal_thread_idents()
     for thread_id, frame in frames_by_thread.items():
+        if thread_id in internal:
+            # The command listener and this bootstrap thread are dapper's own.
+            continue
         debugger.thread_tracker.threads.setdefault(thread_id, _thread_name(thread_id))
         current = frame
         while current is not None:
@@ -407,7 +413,7 @@ def bootstrap_from_remote_exec(payload_json: str) -> None:
     payload_data = json.loads(payload_json)
     payload = AttachByPidPayload.from_remote_exec_dict(payload_data)
 
-    bootstrap_thread = threading.Thread(
+    bootstrap_thread = InternalThread(
         target=_bootstrap_attached_process,
         args=(payload,),
         daemon=True,
@@ -6,9 +6,9 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import bdb
 from datetime import datetime
 from datetime import timezone
-import json
 import logging
 from multiprocessing import connection as _mpc
 import os
@@ -18,24 +18,32 @@ import sys
 import tempfile
 import threading
 import traceback
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 import uuid
 
-from dapper.adapter.subprocess_manager import SubprocessConfig
-from dapper.adapter.subprocess_manager import SubprocessManager
 from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.ipc.ipc_binary import ENCODING_JSON
 from dapper.ipc.ipc_binary import HEADER_SIZE
+from dapper.ipc.ipc_binary import decode_message
 from dapper.ipc.ipc_binary import read_exact
-from dapper.ipc.ipc_binary import unpack_header
+from dapper.ipc.ipc_binary import unpack_frame_header
 from dapper.launcher.launcher_ipc import connector as default_connector
 from dapper.shared import debug_shared
 from dapper.shared.command_handlers import handle_debug_command
+from dapper.shared.source_watcher import start_session_source_watcher
+from dapper.utils.internal_threads import InternalThread
+from dapper.utils.internal_threads import internal_thread_idents
+from dapper.utils.internal_threads import user_thread_trace
 from dapper.utils.logging_config import configure_package_file_logging
 from dapper.utils.logging_config import configure_root_console_logging
 from dapper.utils.logging_levels import TRACE
 from dapper.utils.logging_names import DAPPER_LOGGER_LAUNCHER
 
+if TYPE_CHECKING:
+    from dapper.adapter.subprocess_manager import SubprocessManager
+
 """
 Debug launcher entry point. Delegates to split modules.
 """
@@ -128,10 +136,16 @@ def setup_session_log_file(
 send_debug_message = debug_shared.send_debug_message
 
 
-def _handle_command_bytes(payload: bytes, session: Any | None = None) -> None:
+def _handle_command_bytes(
+    payload: bytes,
+    session: Any | None = None,
+    encoding: int = ENCODING_JSON,
+) -> None:
     active_session = session if session is not None else debug_shared.get_active_session()
     try:
-        command = json.loads(payload.decode("utf-8"))
+        command = decode_message(payload, encoding)
+        # Reply in whatever encoding the adapter chose.
+        active_session.ipc_encoding = encoding
         active_session.command_queue.put(command)
         handle_debug_command(command, session=active_session)
     except Exception as e:
@@ -152,14 +166,14 @@ def _recv_binary_from_pipe(conn: _mpc.Connection, session: Any | None = None) ->
             active_session.exit_if_alive(0)
             return
         try:
-            kind, length = unpack_header(data[:HEADER_SIZE])
+            kind, encoding, length = unpack_frame_header(data[:HEADER_SIZE])
         except Exception as e:
             with debug_shared.use_session(active_session):
                 send_debug_message("error", message=f"Bad frame header: {e!s}")
             continue
         payload = data[HEADER_SIZE : HEADER_SIZE + length]
         if kind == KIND_COMMAND:
-            _handle_command_bytes(payload, active_session)
+            _handle_command_bytes(payload, active_session, encoding)
 
 
 def _recv_binary_from_stream(rfile: Any, session: Any | None = None) -> None:
@@ -175,7 +189,7 @@ def _recv_binary_from_stream(rfile: Any, session: Any | None = None) -> None:
             active_session.exit_if_alive(0)
             return
         try:
-            kind, length = unpack_header(header)
+            kind, encoding, length = unpack_frame_header(header)
         except Exception as e:
             with debug_shared.use_session(active_session):
                 send_debug_message("error", message=f"Bad frame header: {e!s}")
@@ -190,7 +204,7 @@ def _recv_binary_from_stream(rfile: Any, session: Any | None = None) -> None:
             return
         if kind == KIND_COMMAND:
             try:
-                _handle_command_bytes(payload, active_session)
+                _handle_command_bytes(payload, active_session, encoding)
             except SystemExit:
                 # The terminate handler raises SystemExit after sending the
                 # response.  Let the thread exit cleanly instead of leaving
@@ -265,6 +279,11 @@ def parse_args():
         action="store_true",
         help="Enable strict expression watchpoint policy checks",
     )
+    parser.add_argument(
+        "--non-stop",
+        action="store_true",
+        help="Suspend and resume threads individually instead of reporting all stopped",
+    )
     parser.add_argument(
         "--ipc",
         choices=["tcp", "unix", "pipe"],
@@ -292,6 +311,22 @@ def parse_args():
         type=int,
         help="Shared IPC TCP port used by auto-attached Python subprocesses.",
     )
+    parser.add_argument(
+        "--subprocess-scalable",
+        action="store_true",
+        help=(
+            "Scale subprocess auto-attach to many children: no child cap, one reaper "
+            "thread and dormant children."
+        ),
+    )
+    parser.add_argument(
+        "--subprocess-dormant",
+        action="store_true",
+        help=(
+            "Run the target untraced until the client finishes configuring this "
+            "session (requires Python 3.12+; ignored otherwise)."
+        ),
+    )
     parser.add_argument(
         "--session-id",
         type=str,
@@ -379,7 +414,12 @@ def setup_ipc_from_args(args: Any, session: Any | None = None) -> None:
 def start_command_listener(session: Any | None = None) -> threading.Thread:
     """Start the background thread that listens for incoming commands."""
     active_session = session if session is not None else debug_shared.get_active_session()
-    thread = threading.Thread(target=receive_debug_commands, args=(active_session,), daemon=True)
+    thread = InternalThread(
+        target=receive_debug_commands,
+        args=(active_session,),
+        daemon=True,
+        name="dapper-command-listener",
+    )
     thread.start()
     return thread
 
@@ -389,6 +429,7 @@ def configure_debugger(
     session: Any | None = None,
     just_my_code: bool = True,
     strict_expression_watch_policy: bool = False,
+    non_stop: bool = False,
 ) -> DebuggerBDB:
     """Create and configure the debugger, storing it on shared state."""
     active_session = session if session is not None else debug_shared.get_active_session()
@@ -397,6 +438,7 @@ def configure_debugger(
         process_commands=active_session.process_queued_commands_launcher,
         just_my_code=just_my_code,
         strict_expression_watch_policy=strict_expression_watch_policy,
+        non_stop=non_stop,
     )
     if stop_on_entry:
         dbg.stepping_controller.stop_on_entry = True
@@ -483,6 +525,97 @@ def _run_target(
     raise RuntimeError(msg)
 
 
+class _DormantRunner:
+    """Stand-in for the debugger's ``run`` that executes the target untraced.
+
+    :func:`_run_target` prepares ``sys.argv``, ``sys.path`` and the compiled
+    code exactly as for a traced run, so breakpoints match once
+    :func:`activate_dormant_debugger` installs tracing.
+    """
+
+    def __init__(self, debugger: Any) -> None:
+        self._debugger = debugger
+
+    def run(self, cmd: Any, run_globals: dict[str, Any] | None = None) -> None:
+        if run_globals is None:
+            import __main__  # noqa: PLC0415
+
+            run_globals = __main__.__dict__
+        if isinstance(cmd, str):
+            cmd = compile(cmd, "<string>", "exec")
+        try:
+            exec(cmd, run_globals)
+        except bdb.BdbQuit:
+            pass
+        finally:
+            self._debugger.quitting = True
+            sys.settrace(None)
+
+
+def supports_dormant_children() -> bool:
+    """Return True when tracing can be installed into already-running threads."""
+    return hasattr(threading, "settrace_all_threads")
+
+
+def activate_dormant_debugger(session: Any) -> None:
+    """Install the session's debugger on every running thread.
+
+    Called from a background thread once the client has configured a dormant
+    child; live frames get ``f_trace`` so breakpoints in functions that are
+    already executing are hit too.
+    """
+    dbg = session.debugger
+    if dbg is None:
+        return
+    trace_fn = dbg.trace_dispatch
+    dbg.reset()
+    # Dapper's own threads drop the trace on their next call instead of
+    # running it, and their frames are left untraced.
+    threading.settrace_all_threads(user_thread_trace(trace_fn))  # type: ignore[attr-defined]
+    sys.settrace(None)
+    internal = internal_thread_idents() | {threading.get_ident()}
+    for thread_id, frame in sys._current_frames().items():  # noqa: SLF001
+        if thread_id in internal:
+            continue
+        current = frame
+        while current is not None:
+            current.f_trace = trace_fn
+            current = current.f_back
+    logger.info("Dormant session activated")
+
+
+def _activate_when_configured(session: Any) -> None:
+    session.configuration_done_event.wait()
+    try:
+        activate_dormant_debugger(session)
+    except Exception:
+        logger.exception("Failed to activate dormant session")
+
+
+def run_dormant(
+    target_value: str,
+    program_args: list[str],
+    session: Any,
+    *,
+    target_kind: str = "program",
+) -> None:
+    """Run the target untraced, activating the debugger on ``configurationDone``."""
+    InternalThread(
+        target=_activate_when_configured,
+        args=(session,),
+        daemon=True,
+        name="dapper-dormant-activation",
+    ).start()
+    with debug_shared.use_session(session):
+        _run_target(
+            _DormantRunner(session.debugger),
+            session,
+            target_value,
+            program_args,
+            target_kind=target_kind,
+        )
+
+
 def _register_terminal_crash_handler() -> None:
     """Keep the terminal open when the launcher exits due to an unhandled exception.
 
@@ -610,6 +743,10 @@ def main():  # noqa: PLR0912, PLR0915
     subprocess_manager: SubprocessManager | None = None
 
     if getattr(args, "subprocess_auto_attach", False):
+        # Imported on demand: most debuggees never spawn Python children.
+        from dapper.adapter.subprocess_manager import SubprocessConfig  # noqa: PLC0415
+        from dapper.adapter.subprocess_manager import SubprocessManager  # noqa: PLC0415
+
         subprocess_manager = SubprocessManager(
             send_event=lambda event_name, payload: send_debug_message(event_name, **payload),
             config=SubprocessConfig(
@@ -617,6 +754,7 @@ def main():  # noqa: PLR0912, PLR0915
                 auto_attach=True,
                 ipc_host=args.ipc_host or "127.0.0.1",
                 shared_ipc_port=getattr(args, "subprocess_ipc_port", None),
+                scalable=getattr(args, "subprocess_scalable", False),
                 session_id=session.session_id,
                 parent_session_id=session.parent_session_id,
             ),
@@ -646,6 +784,7 @@ def main():  # noqa: PLR0912, PLR0915
             session=session,
             just_my_code=not args.no_just_my_code,
             strict_expression_watch_policy=getattr(args, "strict_expression_watch_policy", False),
+            non_stop=getattr(args, "non_stop", False),
         )
         logger.info(
             "Debugger configured (stop_at_entry=%s, no_debug=%s, just_my_code=%s)",
@@ -653,6 +792,20 @@ def main():  # noqa: PLR0912, PLR0915
             session.no_debug,
             not args.no_just_my_code,
         )
+        if not session.no_debug:
+            # Report modules as they are imported rather than rescanning
+            # sys.modules on every modules/loadedSources request.
+            session.loaded_modules.install(
+                send_event=lambda event_name, payload: send_debug_message(event_name, **payload)
+            )
+            # Baseline for hotReloadBatch without paths: edits made from now
+            # on are reloaded, including those before the first reload.
+            start_session_source_watcher()
+
+        dormant = getattr(args, "subprocess_dormant", False) and not session.no_debug
+        if dormant and not supports_dormant_children():
+            logger.info("Dormant start needs Python 3.12+; waiting for configuration instead")
+            dormant = False
 
         if session.no_debug:
             logger.info("Running without debugging: %s=%s", target_kind, target_value)
@@ -661,6 +814,12 @@ def main():  # noqa: PLR0912, PLR0915
                 run_program(target_value, program_args)
             else:
                 run_program(target_value, program_args, target_kind=target_kind)
+        elif dormant:
+            # Worker pools spawn many children; each one runs untraced until
+            # the client actually attaches a session and sends configurationDone.
+            session.debugger_configured_event.set()
+            logger.info("Running dormant: %s=%s", target_kind, target_value)
+            run_dormant(target_value, program_args, session, target_kind=target_kind)
         else:
             # Wait for the adapter to finish sending setBreakpoints / configurationDone
             # before starting the program so all breakpoints are in place.
@@ -701,6 +860,9 @@ def main():  # noqa: PLR0912, PLR0915
             except KeyboardInterrupt:
                 logger.info("Program interrupted by KeyboardInterrupt")
     finally:
+        # No module events after the session ends, and no import hook left
+        # behind in sys.meta_path.
+        session.loaded_modules.uninstall()
         # Notify the adapter that the program has finished so the debug
         # session in VS Code terminates instead of hanging indefinitely.
         logger.info("Sending exited/terminated events")
@@ -140,8 +140,19 @@ class ThreadTrackerLike(Protocol):
     frames_by_thread: dict[int, list[Any]]
     frame_id_to_frame: dict[int, Any]
     threads: dict[int, Any]
+    stop_frames: dict[int, Any]
 
-    def build_stack_frames(self, frame: Any) -> list[Any]: ...
+    def build_stack_frames(self, frame: Any, max_depth: int = ...) -> list[Any]: ...
+
+    def materialize_frames(self, thread_id: int, count: int | None = None) -> list[Any]: ...
+
+    def total_frames(self, thread_id: int) -> int: ...
+
+    def resume_thread(self, thread_id: int) -> bool: ...
+
+    def resume_all_threads(self) -> None: ...
+
+    def wait_for_resume(self, thread_id: int, timeout: float | None = None) -> bool: ...
 
 
 class SupportsThreadTracker(Protocol):
@@ -154,6 +165,7 @@ class SupportsSteppingCommands(Protocol):
     """Debugger shape that exposes stepping state and commands consumed by handlers."""
 
     stepping_controller: Any  # supports .stepping and .current_frame
+    non_stop: bool
 
     def set_continue(self) -> None: ...
 
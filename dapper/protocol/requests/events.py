@@ -82,6 +82,11 @@ class HotReloadResultEventBody(TypedDict, total=False):
     warnings: list[str]
     durationMs: float
     # Wall-clock duration of the entire reload operation in milliseconds.
+    modules: list[str]
+    paths: list[str]
+    patchedReferrers: int
+    # Batch reloads only: every reloaded module/path (module and path hold
+    # the first) and the number of patched non-frame references.
 
 
 class HotReloadResultEvent(TypedDict):
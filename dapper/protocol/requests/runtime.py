@@ -1,11 +1,12 @@
 """Runtime-related requests:
 threads, loaded sources, variables/stack/etc., exceptions, pause/restart,
-hotReload extension.
+hotReload / hotReloadBatch extensions.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Literal
 from typing import TypedDict
 
@@ -478,6 +479,59 @@ class HotReloadResponse(TypedDict):
     body: NotRequired[HotReloadResponseBody]
 
 
+class HotReloadBatchArguments(TypedDict):
+    """Arguments for the 'dapper/hotReloadBatch' request."""
+
+    sources: NotRequired[list[Source]]
+    # Source files to reload together.  Omit to reload every loaded user
+    # source edited since the previous hot reload.
+
+    options: NotRequired[HotReloadOptions]
+    # Same behaviour overrides as 'dapper/hotReload'.
+
+
+class HotReloadBatchRequest(TypedDict):
+    """Request to reload several Python modules as one operation."""
+
+    seq: int
+    type: Literal["request"]
+    command: Literal["dapper/hotReloadBatch"]
+    arguments: NotRequired[HotReloadBatchArguments]
+
+
+class HotReloadBatchResponseBody(TypedDict, total=False):
+    """Body of a successful 'dapper/hotReloadBatch' response."""
+
+    reloadedModules: list[str]
+    # Reloaded module names, in the (dependency) order they were reloaded.
+
+    reloadedPaths: list[str]
+    # Absolute paths of the reloaded files, parallel to reloadedModules.
+
+    reboundFrames: int
+    updatedFrameCodes: int
+    # As for 'dapper/hotReload', counted over the whole batch.
+
+    patchedReferrers: int
+    # References to replaced functions patched outside stack frames
+    # (registries, from-imports, bound methods, closure cells, classes).
+
+    warnings: list[str]
+    durationMs: float
+
+
+class HotReloadBatchResponse(TypedDict):
+    """Response to the 'dapper/hotReloadBatch' request."""
+
+    seq: int
+    type: Literal["response"]
+    request_seq: int
+    success: bool
+    command: Literal["dapper/hotReloadBatch"]
+    message: NotRequired[str]
+    body: NotRequired[HotReloadBatchResponseBody]
+
+
 # ---------------------------------------------------------------------------
 # Agent Snapshot (custom extension: dapper/agentSnapshot)
 # ---------------------------------------------------------------------------
@@ -498,6 +552,10 @@ class AgentSnapshotArguments(TypedDict, total=False):
     justMyCode: bool
     # Filter stack frames to user code only. Default: True.
 
+    sinceCheckpoint: int
+    # Return only what changed since this checkpoint (a delta) when the
+    # debuggee still remembers it; otherwise a full snapshot is returned.
+
 
 class AgentSnapshotRequest(TypedDict):
     """Request a compact debug state snapshot optimised for LLM consumption."""
@@ -514,6 +572,8 @@ class AgentStackFrameSummary(TypedDict, total=False):
     name: str
     file: str
     line: int
+    frameKey: int
+    # Identifies the frame across snapshots; used to merge deltas.
     locals: dict[str, str]
     # Variable name → repr value string, truncated for context efficiency.
 
@@ -522,14 +582,28 @@ class AgentSnapshotResponseBody(TypedDict, total=False):
     """Body of a successful 'dapper/agentSnapshot' response."""
 
     checkpoint: int
+    # Increases whenever the reported state changes; repeated snapshots of
+    # unchanged state share a checkpoint.
+    delta: bool
+    # True when the body only holds changes since ``baseCheckpoint``.
+    baseCheckpoint: int
     stopReason: str
     threadId: int
     location: str
     callStack: list[AgentStackFrameSummary]
+    # In a delta: only new or changed frames, without their locals.
+    frameOrder: list[int]
+    # Delta only: frame keys of the whole stack, top first.
     locals: dict[str, str]
     globals: dict[str, str]
+    # In a delta: only new or changed values.
+    removedLocals: list[str]
+    removedGlobals: list[str]
     stoppedThreads: list[int]
     runningThreads: list[int]
+    threadsAdded: list[int]
+    threadsRemoved: list[int]
+    # Delta only: threads started or exited since ``baseCheckpoint``.
 
 
 class AgentSnapshotResponse(TypedDict):
@@ -635,12 +709,16 @@ class AgentInspectNode(TypedDict, total=False):
     type: str
     value: str
     children: list[AgentInspectNode]
+    cycle: bool
+    # Set on a node that refers back to one of its ancestors (not expanded).
 
 
 class AgentInspectResponseBody(TypedDict, total=False):
     """Body of a successful 'dapper/agentInspect' response."""
 
     root: AgentInspectNode
+    truncated: bool
+    # Set when the debuggee stopped expanding at its item or byte budget.
 
 
 class AgentInspectResponse(TypedDict):
@@ -653,3 +731,58 @@ class AgentInspectResponse(TypedDict):
     command: Literal["dapper/agentInspect"]
     message: NotRequired[str]
     body: NotRequired[AgentInspectResponseBody]
+
+
+# ---------------------------------------------------------------------------
+# Dynamic source registry statistics (custom extension)
+# ---------------------------------------------------------------------------
+
+
+class SourceRegistryStatsRequest(TypedDict):
+    """Request for the debuggee's in-memory (eval/exec/template) source registry stats."""
+
+    seq: int
+    type: Literal["request"]
+    command: Literal["dapper/sourceRegistryStats"]
+    arguments: NotRequired[dict[str, Any]]
+
+
+class SourceRegistryStatsResponseBody(TypedDict, total=False):
+    """Body of a successful 'dapper/sourceRegistryStats' response."""
+
+    entries: int
+    compressedEntries: int
+    pinnedEntries: int
+    # Entries protected from eviction (explicit pins, breakpoint files and
+    # sources executing in a live frame).
+
+    storedBytes: int
+    # Bytes currently held, counting compressed entries at compressed size.
+
+    rawBytes: int
+    # Uncompressed UTF-8 size of all entries.
+
+    maxBytes: int
+    # Eviction budget; 0 means unbounded.
+
+    hotBytes: int
+    # Uncompressed entries beyond this many bytes get compressed.
+
+    compression: bool
+    hits: int
+    misses: int
+    evictions: int
+    compressions: int
+    inflations: int
+
+
+class SourceRegistryStatsResponse(TypedDict):
+    """Response to the 'dapper/sourceRegistryStats' request."""
+
+    seq: int
+    type: Literal["response"]
+    request_seq: int
+    success: bool
+    command: Literal["dapper/sourceRegistryStats"]
+    message: NotRequired[str]
+    body: NotRequired[SourceRegistryStatsResponseBody]
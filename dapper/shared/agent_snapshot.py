@@ -0,0 +1,170 @@
+"""Checkpoints and delta encoding for ``dapper/agentSnapshot``.
+
+Automated agents poll ``dapper/agentSnapshot`` after every step, and most of
+each snapshot (outer frames, unchanged locals, globals) repeats the previous
+one.  Every snapshot is therefore reduced to a :class:`SnapshotFingerprint`:
+one ``(frameKey, content hash)`` pair per frame, one hash per reported
+variable value and the set of live threads.  :class:`AgentSnapshotTracker`
+numbers distinct fingerprints with monotonically increasing checkpoints and
+keeps the most recent ones, so a request carrying ``sinceCheckpoint`` can be
+answered with :func:`snapshot_delta` — only new or changed frames, changed
+or removed variables and started or exited threads — without storing or
+re-sending the earlier snapshots themselves.
+
+Merging a delta into the snapshot of its ``baseCheckpoint``:
+
+- ``frameOrder`` lists the frame keys of the new stack, top first; frames not
+  in ``callStack`` are unchanged and taken from the base snapshot.
+- ``locals``/``globals`` hold new or changed values; names in
+  ``removedLocals``/``removedGlobals`` are gone.
+- ``threadsAdded``/``threadsRemoved`` adjust the base thread set;
+  ``stoppedThreads``/``runningThreads`` are always complete.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+DEFAULT_HISTORY = 16
+
+# Keys copied verbatim from the full snapshot into every delta.
+_ALWAYS_SENT = ("stopReason", "threadId", "location", "stoppedThreads", "runningThreads")
+
+
+@dataclass(frozen=True)
+class SnapshotFingerprint:
+    """Compact, comparable summary of one agent snapshot."""
+
+    thread_id: int
+    stop_reason: str
+    frames: tuple[tuple[int, int], ...]
+    locals: Mapping[str, int]
+    globals: Mapping[str, int]
+    threads: frozenset[int]
+
+
+def frame_content_hash(entry: Mapping[str, Any]) -> int:
+    """Hash the reported fields of a call-stack entry (not its locals)."""
+    return hash((entry.get("name"), entry.get("file"), entry.get("line")))
+
+
+def fingerprint_snapshot(body: Mapping[str, Any]) -> SnapshotFingerprint:
+    """Build the fingerprint of a full snapshot *body*.
+
+    Every ``callStack`` entry must carry a ``frameKey`` identifying its frame
+    across stops.
+    """
+    threads = list(body.get("stoppedThreads", ())) + list(body.get("runningThreads", ()))
+    return SnapshotFingerprint(
+        thread_id=body.get("threadId", 0),
+        stop_reason=body.get("stopReason", ""),
+        frames=tuple(
+            (entry["frameKey"], frame_content_hash(entry)) for entry in body.get("callStack", ())
+        ),
+        locals={name: hash(value) for name, value in body.get("locals", {}).items()},
+        globals={name: hash(value) for name, value in body.get("globals", {}).items()},
+        threads=frozenset(threads),
+    )
+
+
+def _value_changes(
+    values: Mapping[str, str],
+    current: Mapping[str, int],
+    base: Mapping[str, int],
+) -> tuple[dict[str, str], list[str]]:
+    changed = {name: values[name] for name, digest in current.items() if base.get(name) != digest}
+    removed = [name for name in base if name not in current]
+    return changed, removed
+
+
+def snapshot_delta(
+    body: Mapping[str, Any],
+    current: SnapshotFingerprint,
+    base: SnapshotFingerprint,
+) -> dict[str, Any]:
+    """Return the parts of full snapshot *body* that differ from *base*."""
+    base_frames = set(base.frames)
+    delta: dict[str, Any] = {key: body[key] for key in _ALWAYS_SENT if key in body}
+    delta["frameOrder"] = [key for key, _digest in current.frames]
+    delta["callStack"] = [
+        {k: v for k, v in entry.items() if k != "locals"}
+        for entry, frame in zip(body.get("callStack", ()), current.frames)
+        if frame not in base_frames
+    ]
+    delta["locals"], delta["removedLocals"] = _value_changes(
+        body.get("locals", {}), current.locals, base.locals
+    )
+    delta["globals"], delta["removedGlobals"] = _value_changes(
+        body.get("globals", {}), current.globals, base.globals
+    )
+    delta["threadsAdded"] = sorted(current.threads - base.threads)
+    delta["threadsRemoved"] = sorted(base.threads - current.threads)
+    return delta
+
+
+class AgentSnapshotTracker:
+    """Assign checkpoints to snapshots and answer ``sinceCheckpoint`` requests.
+
+    A snapshot identical to the latest one keeps its checkpoint, so repeated
+    polls while nothing changes return an empty delta.  Only the last
+    *history* fingerprints are kept; older checkpoints get a full snapshot.
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY) -> None:
+        self._history = max(1, history)
+        self._fingerprints: OrderedDict[int, SnapshotFingerprint] = OrderedDict()
+        self._checkpoint = 0
+        self._lock = threading.Lock()
+
+    @property
+    def checkpoint(self) -> int:
+        """The most recently assigned checkpoint (0 before the first snapshot)."""
+        return self._checkpoint
+
+    def commit(self, fingerprint: SnapshotFingerprint) -> int:
+        """Record *fingerprint* and return its checkpoint."""
+        with self._lock:
+            latest = self._fingerprints.get(self._checkpoint)
+            if latest is not None and latest == fingerprint:
+                return self._checkpoint
+            self._checkpoint += 1
+            self._fingerprints[self._checkpoint] = fingerprint
+            while len(self._fingerprints) > self._history:
+                self._fingerprints.popitem(last=False)
+            return self._checkpoint
+
+    def get(self, checkpoint: int) -> SnapshotFingerprint | None:
+        """Return the fingerprint recorded for *checkpoint*, if still kept."""
+        with self._lock:
+            return self._fingerprints.get(checkpoint)
+
+    def build_response_body(
+        self,
+        body: dict[str, Any],
+        since_checkpoint: int | None = None,
+    ) -> dict[str, Any]:
+        """Checkpoint full snapshot *body*; return a delta when possible.
+
+        A delta is returned only when *since_checkpoint* is still kept and
+        refers to a snapshot of the same thread; otherwise *body* is returned
+        with its ``checkpoint`` filled in.
+        """
+        fingerprint = fingerprint_snapshot(body)
+        base = self.get(since_checkpoint) if since_checkpoint is not None else None
+        checkpoint = self.commit(fingerprint)
+        if base is None or base.thread_id != fingerprint.thread_id:
+            body["checkpoint"] = checkpoint
+            body["delta"] = False
+            return body
+        delta = snapshot_delta(body, fingerprint, base)
+        delta["checkpoint"] = checkpoint
+        delta["baseCheckpoint"] = since_checkpoint
+        delta["delta"] = True
+        return delta
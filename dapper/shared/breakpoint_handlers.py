@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-import dis
-import linecache
 import logging
+import threading
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import NamedTuple
 
+from dapper.core.line_index import lines_in_range
+
 if TYPE_CHECKING:
     from dapper.shared.command_handler_helpers import Payload
     from dapper.shared.debug_shared import DebugSession
 
 _log = logging.getLogger(__name__)
 
+# Serialises line-breakpoint updates so a batch is applied atomically with
+# respect to single-file updates issued from other threads (e.g. hot reload).
+_line_breakpoint_lock = threading.RLock()
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -62,20 +67,8 @@ def _register_function_breakpoint(dbg: Any, name: str, meta: _BpMeta) -> None:
 # ---------------------------------------------------------------------------
 
 
-def handle_set_breakpoints_impl(
-    session: DebugSession,
-    arguments: Payload | None,
-) -> Payload | None:
-    """Handle setBreakpoints command implementation."""
-    arguments = arguments or {}
-    source = arguments.get("source", {})
-    bps = arguments.get("breakpoints", [])
-    path = source.get("path")
-
-    dbg = session.debugger
-    if not (path and dbg):
-        return None
-
+def _apply_file_breakpoints(dbg: Any, path: str, bps: list[Payload]) -> list[Payload]:
+    """Replace the line breakpoints of *path* and return per-breakpoint verification."""
     _clear_file_breakpoints(dbg, path)
 
     verified_bps: list[Payload] = []
@@ -94,10 +87,92 @@ def handle_set_breakpoints_impl(
             log_message=meta.log_message,
         )
         verified_bps.append({"verified": verified, "line": line})
+    return verified_bps
+
+
+def _sync_tracing_backend(dbg: Any, updates: dict[str, set[int]]) -> None:
+    """Push line-breakpoint changes to an installed tracing backend, if any.
+
+    All files are handed over in one call so the backend can refresh its
+    event state once per update rather than once per file.  Single-file
+    ``setBreakpoints`` goes through here too, so the backend ends up in the
+    same state whether or not the adapter coalesced the request.
+    """
+    if not updates:
+        return
+    backend = getattr(dbg, "_sys_monitoring_backend", None)
+    if backend is None:
+        return
+    try:
+        update_batch = getattr(backend, "update_breakpoints_batch", None)
+        if update_batch is not None:
+            update_batch(updates)
+        else:
+            for path, lines in updates.items():
+                backend.update_breakpoints(path, lines)
+    except Exception:
+        _log.debug("Failed to sync breakpoints to tracing backend", exc_info=True)
+
+
+def _verified_lines(verified_bps: list[Payload]) -> set[int]:
+    return {int(bp["line"]) for bp in verified_bps if bp.get("verified")}
+
+
+def handle_set_breakpoints_impl(
+    session: DebugSession,
+    arguments: Payload | None,
+) -> Payload | None:
+    """Handle setBreakpoints command implementation."""
+    arguments = arguments or {}
+    source = arguments.get("source", {})
+    bps = arguments.get("breakpoints", [])
+    path = source.get("path")
+
+    dbg = session.debugger
+    if not (path and dbg):
+        return None
+
+    with _line_breakpoint_lock:
+        verified_bps = _apply_file_breakpoints(dbg, path, bps)
+        _sync_tracing_backend(dbg, {path: _verified_lines(verified_bps)})
 
     return {"success": True, "body": {"breakpoints": verified_bps}}
 
 
+def handle_set_breakpoints_batch_impl(
+    session: DebugSession,
+    arguments: Payload | None,
+) -> Payload | None:
+    """Handle ``dapper/setBreakpointsBatch``: many ``setBreakpoints`` in one command.
+
+    ``arguments["files"]`` is a list of ``setBreakpoints`` argument payloads
+    (``{"source": {...}, "breakpoints": [...]}``).  All files are applied
+    under one lock and the tracing backend is refreshed once.  The response
+    body carries one ``{"breakpoints": [...]}`` entry per file, in order.
+    """
+    arguments = arguments or {}
+    files = arguments.get("files", [])
+
+    dbg = session.debugger
+    if not dbg:
+        return None
+
+    results: list[Payload] = []
+    updates: dict[str, set[int]] = {}
+    with _line_breakpoint_lock:
+        for entry in files:
+            path = (entry.get("source") or {}).get("path")
+            if not path:
+                results.append({"breakpoints": []})
+                continue
+            verified_bps = _apply_file_breakpoints(dbg, path, entry.get("breakpoints", []))
+            updates[path] = _verified_lines(verified_bps)
+            results.append({"breakpoints": verified_bps})
+        _sync_tracing_backend(dbg, updates)
+
+    return {"success": True, "body": {"files": results}}
+
+
 def _try_set_break(
     dbg: Any,
     path: str,
@@ -138,6 +213,13 @@ def handle_set_function_breakpoints_impl(
         _register_function_breakpoint(dbg, name, _extract_bp_metadata(bp))
         registered_names.add(name)
 
+    backend = getattr(dbg, "_sys_monitoring_backend", None)
+    if backend is not None:
+        try:
+            backend.update_function_breakpoints(registered_names)
+        except Exception:
+            _log.debug("Failed to sync function breakpoints to tracing backend", exc_info=True)
+
     results: list[Payload] = [
         {"verified": bool(bp.get("name") and bp.get("name") in registered_names)} for bp in bps
     ]
@@ -180,6 +262,13 @@ def handle_set_exception_breakpoints_impl(
     except (AttributeError, TypeError, ValueError):
         verified_all = False
 
+    backend = getattr(dbg, "_sys_monitoring_backend", None)
+    if backend is not None:
+        try:
+            backend.set_exception_breakpoints(filters)
+        except Exception:
+            _log.debug("Failed to sync exception filters to tracing backend", exc_info=True)
+
     body = {"breakpoints": [{"verified": verified_all} for _ in filters]}
     return {"success": True, "body": body}
 
@@ -189,8 +278,8 @@ def handle_breakpoint_locations_impl(
 ) -> dict[str, Any]:
     """Handle breakpointLocations request.
 
-    Returns valid breakable lines within the given source range using
-    Python's code-object line number table.
+    Returns valid breakable lines within the given source range from the
+    cached per-file ``co_lines`` index.
     """
 
     arguments = arguments or {}
@@ -204,39 +293,10 @@ def handle_breakpoint_locations_impl(
     if not path:
         return {"success": True, "body": {"breakpoints": locations}}
 
-    try:
-        # Read and compile the source to get the line-number table
-        source_text = linecache.getlines(path)
-        if not source_text:
-            # File not in cache — try reading directly
-            with open(path, encoding="utf-8") as f:  # noqa: PTH123
-                source_text = f.readlines()
-        code = compile("".join(source_text), path, "exec")
-        # Collect all lines that have associated bytecode
-        valid_lines: set[int] = set()
-        _collect_code_lines(code, valid_lines, dis)
-
-        locations = [
-            {"line": line_no}
-            for line_no in sorted(valid_lines)
-            if start_line <= line_no <= end_line
-        ]
-    except Exception:
+    valid_lines = lines_in_range(path, start_line, end_line)
+    if valid_lines is None:
         # Fallback: return every line in the range (best-effort)
-        locations = [{"line": ln} for ln in range(start_line, end_line + 1)]
+        valid_lines = list(range(start_line, end_line + 1))
+    locations = [{"line": line_no} for line_no in valid_lines]
 
     return {"success": True, "body": {"breakpoints": locations}}
-
-
-def _collect_code_lines(
-    code: Any,
-    out: set[int],
-    dis_module: Any,
-) -> None:
-    """Recursively collect lines from a code object and its nested code objects."""
-    for _offset, line in dis_module.findlinestarts(code):
-        if line is not None:
-            out.add(line)
-    for const in code.co_consts:
-        if hasattr(const, "co_code"):
-            _collect_code_lines(const, out, dis_module)
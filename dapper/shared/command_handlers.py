@@ -40,6 +40,7 @@ from dapper.shared import source_handlers
 from dapper.shared import stack_handlers
 from dapper.shared import stepping_handlers
 from dapper.shared import variable_handlers
+from dapper.shared.agent_snapshot import frame_content_hash
 from dapper.shared.value_conversion import convert_value_with_context
 from dapper.shared.value_conversion import evaluate_with_policy
 from dapper.utils.logging_levels import TRACE
@@ -200,7 +201,7 @@ def handle_debug_command(
                 # Signal resume for stepping/continue/terminate commands so the
                 # debugger thread unblocks from process_queued_commands_launcher.
                 if cmd in _RESUME_COMMANDS:
-                    active_session.signal_resume()
+                    active_session.signal_resume(_resume_thread_id(cmd, arguments))
             else:
                 logger.warning("[id=%s] unknown command: %s", cmd_id, cmd)
                 active_session.safe_send(
@@ -211,6 +212,16 @@ def handle_debug_command(
                 )
 
 
+def _resume_thread_id(cmd: str, arguments: Any) -> int | None:
+    """Return the thread a resume command applies to, or ``None`` for all threads."""
+    if cmd == "terminate" or not isinstance(arguments, dict):
+        return None
+    try:
+        return int(arguments["threadId"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def _get_thread_ident() -> int:
     """Return the current thread id."""
     return command_handler_helpers.get_thread_ident(threading)
@@ -267,6 +278,20 @@ def _cmd_set_breakpoints(
         session.safe_send_response(success=False, message="No active debugger")
 
 
+@command_handler("dapper/setBreakpointsBatch")
+def _cmd_set_breakpoints_batch(arguments: dict[str, Any] | None) -> None:
+    session = _active_session()
+    files = (arguments or {}).get("files", []) if isinstance(arguments, dict) else []
+    logger.debug("[id=%s] setBreakpointsBatch: files=%d", session.request_id, len(files))
+    result = None
+    if session.debugger:
+        result = breakpoint_handlers.handle_set_breakpoints_batch_impl(session, arguments)
+    if result:
+        session.safe_send_response(**result)
+    else:
+        session.safe_send_response(success=False, message="No active debugger")
+
+
 @command_handler("setFunctionBreakpoints")
 def _cmd_set_function_breakpoints(arguments: SetFunctionBreakpointsArguments) -> None:
     session = _active_session()
@@ -300,7 +325,7 @@ def _cmd_continue(arguments: ContinueArguments | dict[str, Any] | None) -> None:
     if session.debugger:
         stepping_handlers.handle_continue_impl(session, cast("dict[str, Any] | None", arguments))
     # always ack the request
-    session.safe_send_response(success=True)
+    session.safe_send_response(success=True, body={"allThreadsContinued": not session.non_stop})
 
 
 @command_handler("next")
@@ -465,6 +490,44 @@ def _cmd_scopes(arguments: ScopesArguments | None) -> None:
         session.safe_send_response(success=False, message="No active debugger")
 
 
+def _make_variable_fn(
+    runtime_dbg: DebuggerLike | None,
+    name: str,
+    value: object,
+    frame: object | None,
+) -> dict[str, Any]:
+    return command_handler_helpers.make_variable(
+        runtime_dbg,
+        name,
+        value,
+        frame,
+    )
+
+
+def _resolve_variables_for_reference(
+    runtime_dbg: CommandHandlerDebuggerLike | None,
+    frame_info: object,
+) -> list[dict[str, Any]]:
+    def _extract_from_mapping(
+        helper_dbg: DebuggerLike | None,
+        mapping: dict[str, object],
+        frame: object,
+    ) -> list[dict[str, Any]]:
+        return command_handler_helpers.extract_variables_from_mapping(
+            helper_dbg,
+            mapping,
+            frame,
+            make_variable_fn=_make_variable_fn,
+        )
+
+    return command_handler_helpers.resolve_variables_for_reference(
+        runtime_dbg,
+        frame_info,
+        make_variable_fn=_make_variable_fn,
+        extract_variables_from_mapping_fn=_extract_from_mapping,
+    )
+
+
 @command_handler("variables")
 def _cmd_variables(arguments: VariablesArguments | dict[str, Any] | None) -> None:
     session = _active_session()
@@ -473,43 +536,6 @@ def _cmd_variables(arguments: VariablesArguments | dict[str, Any] | None) -> Non
         session.safe_send_response(success=False, message="No active debugger")
         return
 
-    # helpers used by the variable resolver
-    def _make_variable_fn(
-        runtime_dbg: DebuggerLike | None,
-        name: str,
-        value: object,
-        frame: object | None,
-    ) -> dict[str, Any]:
-        return command_handler_helpers.make_variable(
-            runtime_dbg,
-            name,
-            value,
-            frame,
-        )
-
-    def _resolve_variables_for_reference(
-        runtime_dbg: CommandHandlerDebuggerLike | None,
-        frame_info: object,
-    ) -> list[dict[str, Any]]:
-        def _extract_from_mapping(
-            helper_dbg: DebuggerLike | None,
-            mapping: dict[str, object],
-            frame: object,
-        ) -> list[dict[str, Any]]:
-            return command_handler_helpers.extract_variables_from_mapping(
-                helper_dbg,
-                mapping,
-                frame,
-                make_variable_fn=_make_variable_fn,
-            )
-
-        return command_handler_helpers.resolve_variables_for_reference(
-            runtime_dbg,
-            frame_info,
-            make_variable_fn=_make_variable_fn,
-            extract_variables_from_mapping_fn=_extract_from_mapping,
-        )
-
     result = variable_handlers.handle_variables_impl(
         session,
         cast("dict[str, Any] | None", arguments),
@@ -524,6 +550,22 @@ def _cmd_variables(arguments: VariablesArguments | dict[str, Any] | None) -> Non
         session.safe_send_response(success=False, message="No active debugger")
 
 
+@command_handler("variableTree")
+def _cmd_variable_tree(arguments: dict[str, Any] | None) -> None:
+    """Expand a variable and its descendants in a single response."""
+    session = _active_session()
+    if not session.debugger:
+        session.safe_send_response(success=False, message="No active debugger")
+        return
+    session.safe_send_response(
+        **variable_handlers.handle_variable_tree_impl(
+            session,
+            arguments,
+            _resolve_variables_for_reference,
+        )
+    )
+
+
 @command_handler("setVariable")
 def _cmd_set_variable(arguments: SetVariableArguments | dict[str, Any] | None) -> None:
     session = _active_session()
@@ -818,6 +860,35 @@ def _cmd_hot_reload(arguments: dict[str, Any] | None) -> None:
         session.safe_send_response(success=False, message=str(exc))
 
 
+@command_handler("hotReloadBatch")
+def _cmd_hot_reload_batch(arguments: dict[str, Any] | None) -> None:
+    """Handle the 'hotReloadBatch' command in the debuggee process.
+
+    Reloads every file in ``arguments["paths"]`` (or, when omitted, every
+    loaded user source edited since the previous reload) as one batch.
+    """
+    from dapper.shared import reload_helpers  # noqa: PLC0415
+
+    session = _active_session()
+    args: dict[str, Any] = arguments or {}
+    raw_paths = args.get("paths")
+    paths = [str(p) for p in raw_paths] if isinstance(raw_paths, list) else None
+    options: HotReloadOptions | None = cast("HotReloadOptions | None", args.get("options"))
+
+    try:
+        result = reload_helpers.perform_batch_reload(paths, options)
+        session.safe_send_response(success=True, body=dict(result))
+    except Exception as exc:
+        session.safe_send_response(success=False, message=str(exc))
+
+
+@command_handler("sourceRegistryStats")
+def _cmd_source_registry_stats(_arguments: dict[str, Any] | None = None) -> None:
+    """Report size and eviction counters of the dynamic source registry."""
+    session = _active_session()
+    session.safe_send_response(success=True, body=dict(session.sources.get_dynamic_source_stats()))
+
+
 # ---------------------------------------------------------------------------
 # Agent snapshot / eval / inspect command handlers
 # ---------------------------------------------------------------------------
@@ -877,7 +948,7 @@ def _get_frame_by_index(dbg: Any, frame_index: int) -> Any:
     if not stopped_ids:
         return None
     tid = stopped_ids[0]
-    frames = list(tracker.frames_by_thread.get(tid, []))
+    frames = tracker.materialize_frames(tid, frame_index + 1)
     if frame_index < len(frames):
         frame_id = frames[frame_index].get("id")
         return tracker.frame_id_to_frame.get(frame_id) if frame_id is not None else None
@@ -899,12 +970,17 @@ def _evaluate_agent_expression(expr: str, frame: Any) -> dict[str, Any]:
 
 @command_handler("dapper/agentSnapshot")
 def _cmd_agent_snapshot(arguments: dict[str, Any] | None) -> None:
-    """Return a compact debug snapshot for LLM agents (threads, callstack, locals)."""
+    """Return a compact debug snapshot for LLM agents (threads, callstack, locals).
+
+    With ``sinceCheckpoint`` only the changes since that checkpoint are sent;
+    see :mod:`dapper.shared.agent_snapshot`.
+    """
     args = arguments or {}
     target_tid: int | None = args.get("threadId")
     depth = min(int(args.get("depth", 5)), 100)
     max_vars = min(int(args.get("maxVariables", 50)), 200)
     just_my_code = args.get("justMyCode", True)
+    since_checkpoint: int | None = args.get("sinceCheckpoint")
 
     session = _active_session()
     dbg = session.debugger
@@ -930,6 +1006,8 @@ def _cmd_agent_snapshot(arguments: dict[str, Any] | None) -> None:
 
     tid = target_tid if target_tid in stopped_ids else stopped_ids[0]
 
+    # Library frames are filtered out below, so justMyCode needs the whole stack.
+    tracker.materialize_frames(tid, None if just_my_code else depth)
     raw_frames: list[dict[str, Any]] = list(tracker.frames_by_thread.get(tid, []))
     if just_my_code:
         raw_frames = [f for f in raw_frames if not _is_library_frame_dict(f)]
@@ -946,23 +1024,25 @@ def _cmd_agent_snapshot(arguments: dict[str, Any] | None) -> None:
             "file": source.get("path") or source.get("name") or "<unknown>",
             "line": frame_dict.get("line", 0),
         }
-        if i == 0:
-            frame_id = frame_dict.get("id")
-            actual_frame = (
-                tracker.frame_id_to_frame.get(frame_id) if frame_id is not None else None
+        frame_id = frame_dict.get("id")
+        actual_frame = tracker.frame_id_to_frame.get(frame_id) if frame_id is not None else None
+        # DAP frame ids are reallocated on every stop; the frame object's
+        # identity is what stays stable while the frame is alive.
+        entry["frameKey"] = (
+            id(actual_frame) if actual_frame is not None else frame_content_hash(entry)
+        )
+        if i == 0 and actual_frame is not None:
+            top_locals = _extract_vars(actual_frame.f_locals, max_vars)
+            top_globals = _extract_vars(
+                {
+                    k: v
+                    for k, v in actual_frame.f_globals.items()
+                    if not k.startswith("_") and k not in _SKIP_GLOBALS
+                },
+                max_vars,
             )
-            if actual_frame is not None:
-                top_locals = _extract_vars(actual_frame.f_locals, max_vars)
-                top_globals = _extract_vars(
-                    {
-                        k: v
-                        for k, v in actual_frame.f_globals.items()
-                        if not k.startswith("_") and k not in _SKIP_GLOBALS
-                    },
-                    max_vars,
-                )
-                if top_locals:
-                    entry["locals"] = top_locals
+            if top_locals:
+                entry["locals"] = top_locals
         call_stack.append(entry)
 
     location = (
@@ -989,10 +1069,8 @@ def _cmd_agent_snapshot(arguments: dict[str, Any] | None) -> None:
         len(running_ids),
         stop_reason,
     )
-    session.safe_send_response(
-        success=True,
-        body={
-            "checkpoint": 0,
+    body = session.agent_snapshots.build_response_body(
+        {
             "stopReason": stop_reason,
             "threadId": tid,
             "location": location,
@@ -1002,7 +1080,9 @@ def _cmd_agent_snapshot(arguments: dict[str, Any] | None) -> None:
             "stoppedThreads": stopped_ids,
             "runningThreads": running_ids,
         },
+        since_checkpoint,
     )
+    session.safe_send_response(success=True, body=body)
 
 
 @command_handler("dapper/agentEval")
@@ -5,13 +5,14 @@ from __future__ import annotations
 
 import contextlib
 import contextvars
+import functools
 import itertools
-import json
 import logging
 import os
 from pathlib import Path
 import queue
 import re
+import socket
 import sys
 import threading
 from typing import TYPE_CHECKING
@@ -20,12 +21,18 @@ from typing import Callable
 from typing import TypedDict
 from typing import cast
 from urllib.parse import urlparse
-from urllib.request import url2pathname
 
-from dapper.ipc.ipc_binary import pack_frame  # lightweight util
+from dapper.ipc.ipc_binary import ENCODING_JSON  # lightweight util
+from dapper.ipc.ipc_binary import KIND_EVENT
+from dapper.ipc.ipc_binary import encode_frame_parts
+from dapper.shared.agent_snapshot import AgentSnapshotTracker
+from dapper.shared.loaded_module_registry import LoadedModuleRegistry
 from dapper.shared.runtime_source_registry import RuntimeSourceEntry
 from dapper.shared.runtime_source_registry import RuntimeSourceRegistry
+from dapper.shared.runtime_source_registry import RuntimeSourceRegistryStats
+from dapper.shared.runtime_source_registry import is_synthetic_filename
 from dapper.utils.events import EventEmitter
+from dapper.utils.internal_threads import InternalThread
 from dapper.utils.logging_levels import TRACE
 from dapper.utils.logging_message_summary import format_dap_message
 from dapper.utils.logging_message_summary import summarize_dap_message
@@ -34,6 +41,7 @@ from dapper.utils.logging_names import DAPPER_LOGGER_SESSION
 from dapper.utils.logging_names import DAPPER_LOGGER_TRANSPORT
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from collections.abc import Iterator
     from typing import Protocol
 
@@ -103,6 +111,9 @@ class SessionTransport:
         self.ipc_rfile: Any | None = None
         self.ipc_wfile: Any | None = None
         self.ipc_pipe_conn: Any | None = None
+        # Payload encoding for outgoing frames; mirrors the encoding of the
+        # last command received from the adapter (see ``dapper.ipc.ipc_binary``).
+        self.ipc_encoding: int = ENCODING_JSON
         self.on_debug_message = EventEmitter()
         # Lock protecting IPC write operations.  Both the command-receiver
         # thread (which calls ``safe_send_response``) and the debugger main
@@ -207,22 +218,36 @@ class SessionTransport:
         self.require_ipc()
         self.require_ipc_write_channel()
 
-        payload = json.dumps(message).encode("utf-8")
-        frame = pack_frame(1, payload)
+        parts = encode_frame_parts(KIND_EVENT, message, self.ipc_encoding)
 
         with self._write_lock:
             conn = self.ipc_pipe_conn
             if conn is not None:
-                conn.send_bytes(frame)
+                conn.send_bytes(b"".join(parts))
+                return
+
+            sock = self.ipc_sock
+            if isinstance(sock, socket.socket) and hasattr(sock, "sendmsg"):
+                # Scatter/gather: header and payload leave in one syscall
+                # without being joined into a fresh buffer first.
+                _sendmsg_all(sock, parts)
                 return
 
             wfile = self.ipc_wfile
             assert wfile is not None  # guaranteed by require_ipc_write_channel
-            wfile.write(frame)
+            wfile.write(b"".join(parts))
             with contextlib.suppress(Exception):
                 wfile.flush()
 
 
+def _sendmsg_all(sock: socket.socket, parts: tuple[bytes, bytes]) -> None:
+    """Send *parts* with ``sendmsg``, finishing any short write with ``sendall``."""
+    sent = sock.sendmsg(parts)
+    total = len(parts[0]) + len(parts[1])
+    if sent < total:
+        sock.sendall(memoryview(b"".join(parts))[sent:])
+
+
 class SourceCatalog:
     """Session-scoped sourceReference registry and file-content resolution."""
 
@@ -293,6 +318,14 @@ class SourceCatalog:
         """Return all registered dynamic (in-memory) source entries."""
         return self._dynamic.all_entries()
 
+    def set_dynamic_pin_provider(self, provider: Callable[[], Iterable[str]] | None) -> None:
+        """Install the callable naming dynamic sources that must not be evicted."""
+        self._dynamic.set_pin_provider(provider)
+
+    def get_dynamic_source_stats(self) -> RuntimeSourceRegistryStats:
+        """Return size and eviction statistics of the dynamic source registry."""
+        return self._dynamic.stats()
+
     def get_or_register_dynamic_from_linecache(
         self,
         path: str,
@@ -329,6 +362,12 @@ class SourceCatalog:
         path = meta.get("path")
         if not path:
             return None
+        if is_synthetic_filename(path):
+            # Evicted from the bounded registry: restore it from linecache
+            # under the same reference when the text is still there.
+            entry = self._dynamic.get_or_register_from_linecache(path, ref_hint=ref)
+            if entry is not None:
+                return entry.source_text
         return self.get_source_content_by_path(path)
 
     def register_source_provider(self, provider: Callable[[str], str | None]) -> int:
@@ -364,6 +403,10 @@ class SourceCatalog:
         if parsed.scheme.lower() != "file":
             return path_or_uri, False
 
+        # urllib.request pulls in http.client, ssl and email; only file://
+        # URIs need it, so keep it out of the launcher's startup imports.
+        from urllib.request import url2pathname  # noqa: PLC0415
+
         normalized_path = url2pathname(parsed.path)
         if parsed.netloc:
             if parsed.netloc.lower() == "localhost":
@@ -514,8 +557,11 @@ class DebugSession:
 
         self.transport = SessionTransport()
         self.sources = SourceCatalog()
+        self.sources.set_dynamic_pin_provider(self._breakpoint_source_paths)
+        self.loaded_modules = LoadedModuleRegistry()
         self.dispatcher = CommandDispatcher()
         self.process_control = ProcessControl()
+        self.agent_snapshots = AgentSnapshotTracker()
 
     def run_cleanup(self) -> None:
         """Run session cleanup exactly once when configured."""
@@ -528,9 +574,29 @@ class DebugSession:
         except Exception:
             logger.debug("Session cleanup failed", exc_info=True)
 
-    def signal_resume(self) -> None:
-        """Signal the resume event to unblock the debugger thread."""
-        logger.debug("signal_resume: unblocking debugger thread (session_id=%s)", self.session_id)
+    @property
+    def non_stop(self) -> bool:
+        """Whether the debugger suspends and resumes threads individually."""
+        return getattr(self.debugger, "non_stop", False) is True
+
+    def signal_resume(self, thread_id: int | None = None) -> None:
+        """Signal the resume event to unblock the debugger thread.
+
+        In non-stop mode only *thread_id* is resumed; without a thread id
+        every stopped thread is.
+        """
+        logger.debug(
+            "signal_resume: unblocking debugger thread %s (session_id=%s)",
+            thread_id,
+            self.session_id,
+        )
+        if self.non_stop:
+            tracker = self.debugger.thread_tracker  # type: ignore[union-attr]
+            if thread_id is None:
+                tracker.resume_all_threads()
+            else:
+                tracker.resume_thread(thread_id)
+            return
         self._resume_event.set()
 
     def exit_if_alive(self, code: int = 0) -> None:
@@ -633,6 +699,14 @@ class DebugSession:
     def ipc_pipe_conn(self, value: Any | None) -> None:
         self.transport.ipc_pipe_conn = value
 
+    @property
+    def ipc_encoding(self) -> int:
+        return self.transport.ipc_encoding
+
+    @ipc_encoding.setter
+    def ipc_encoding(self, value: int) -> None:
+        self.transport.ipc_encoding = value
+
     @property
     def on_debug_message(self) -> EventEmitter:
         return self.transport.on_debug_message
@@ -705,13 +779,24 @@ class DebugSession:
         ``handle_debug_command``.  This method simply waits for one of those
         dispatches to signal ``_resume_event``, which happens when a resume
         command (continue, next, stepIn, stepOut, terminate) is handled.
+
+        In non-stop mode the calling thread waits on its own resume event
+        instead, so resuming one thread leaves the other stopped threads
+        waiting.
         """
         logger.debug(
             "process_queued_commands_launcher: waiting for resume (session_id=%s)", self.session_id
         )
-        self._resume_event.clear()
+        if self.non_stop:
+            wait = functools.partial(
+                self.debugger.thread_tracker.wait_for_resume,  # type: ignore[union-attr]
+                threading.get_ident(),
+            )
+        else:
+            self._resume_event.clear()
+            wait = self._resume_event.wait
         while not self.is_terminated:
-            if self._resume_event.wait(timeout=0.5):
+            if wait(timeout=0.5):
                 logger.debug(
                     "process_queued_commands_launcher: resume signalled (session_id=%s)",
                     self.session_id,
@@ -745,7 +830,7 @@ class DebugSession:
                 logger.debug("command receiver already started")
                 return
 
-            self.command_thread = threading.Thread(
+            self.command_thread = InternalThread(
                 target=ipc_receiver.receive_debug_commands,
                 daemon=True,
                 name="dapper-recv-cmd",
@@ -813,6 +898,11 @@ class DebugSession:
         """Return all registered dynamic (in-memory) source entries."""
         return self.sources.get_dynamic_sources()
 
+    def _breakpoint_source_paths(self) -> list[str]:
+        """Files with line breakpoints; their dynamic sources stay pinned."""
+        breaks = getattr(self.debugger, "breaks", None)
+        return list(breaks) if isinstance(breaks, dict) else []
+
 
 # Module-level singleton instance used throughout the codebase
 state = DebugSession()
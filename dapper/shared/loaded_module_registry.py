@@ -0,0 +1,296 @@
+"""Incrementally maintained registry of loaded modules and source files.
+
+``modules`` and ``loadedSources`` requests used to walk all of
+``sys.modules`` and ``linecache.cache`` on every request, resolving each
+path on disk (several syscalls per entry) and sorting the whole result.  In
+a process with thousands of modules every editor refresh paid for that.
+
+:class:`LoadedModuleRegistry` records each module once, the first time it
+is seen, with its path resolved once, and keeps the entries sorted as they
+arrive so a page of modules is a slice.  New modules are noticed in two
+ways:
+
+- once :meth:`LoadedModuleRegistry.install` has run, a ``sys.meta_path``
+  watcher notes every import.  Finders run before the module executes and
+  Python has no hook for the end of an import, so a noted module is
+  recorded (and DAP ``module`` / ``loadedSource`` events are emitted for
+  it) when the next import starts or the next refresh runs, whichever
+  comes first;
+- :meth:`LoadedModuleRegistry.refresh`, called by the request handlers,
+  records the imports the watcher noted.  It only compares module names
+  with ``sys.modules`` (a set difference, which costs no syscalls) when
+  the size of ``sys.modules`` no longer matches what was recorded, i.e.
+  when modules were added or removed without an import, or on every call
+  when the watcher is not installed.
+
+The launcher installs the watcher when a debug session starts and
+uninstalls it when the session ends.
+
+Like :mod:`dapper.shared.runtime_source_registry`, this module has no
+imports from ``dapper.shared.debug_shared``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import linecache
+from pathlib import Path
+import sys
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from dapper.protocol.requests import Module
+    from dapper.protocol.structures import Source
+
+_SOURCE_SUFFIXES = (".py", ".pyw")
+# Path fragments that mark a module as library (not user) code.
+_LIBRARY_PATH_PARTS = ("site-packages", "lib/python", "lib\\python", "Lib")
+
+
+def _resolve(raw: str) -> str:
+    return str(Path(raw).resolve())
+
+
+def _is_user_code(path: str) -> bool:
+    lowered = path.lower()
+    return not any(part in lowered for part in _LIBRARY_PATH_PARTS)
+
+
+def _is_initializing(module: ModuleType) -> bool:
+    spec = getattr(module, "__spec__", None)
+    return bool(getattr(spec, "_initializing", False))
+
+
+class _ImportWatcher:
+    """``sys.meta_path`` entry that reports imports and never finds anything."""
+
+    def __init__(self, registry: LoadedModuleRegistry) -> None:
+        self._registry = registry
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> None:
+        del path, target
+        self._registry.note_import(fullname)
+
+
+class LoadedModuleRegistry:
+    """Modules and source files of the process, recorded as they load."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._modules: dict[str, Module] = {}
+        self._module_names: list[str] = []  # sorted
+        self._sources: dict[str, Source] = {}  # resolved path -> Source
+        self._source_keys: list[tuple[str, str]] = []  # sorted (name, path)
+        self._source_owner: dict[str, str] = {}  # path -> module that added it
+        self._linecache_seen: set[str] = set()
+        # Names bound to None in sys.modules at the last comparison; they
+        # count towards its size without being recorded.
+        self._absent: set[str] = set()
+        self._main_program: str | None = None
+        self._pending: list[str] = []
+        self._watcher: _ImportWatcher | None = None
+        self._send_event: Callable[[str, dict[str, Any]], None] | None = None
+
+    # ------------------------------------------------------------------
+    # Import watching
+    # ------------------------------------------------------------------
+
+    @property
+    def installed(self) -> bool:
+        return self._watcher is not None
+
+    def install(self, send_event: Callable[[str, dict[str, Any]], None] | None = None) -> None:
+        """Start watching imports, emitting events through *send_event*.
+
+        Modules that are already loaded are recorded without events.
+        """
+        with self._lock:
+            self.refresh()
+            self._send_event = send_event
+            if self._watcher is None:
+                self._watcher = _ImportWatcher(self)
+                sys.meta_path.insert(0, self._watcher)
+
+    def uninstall(self) -> None:
+        """Stop watching imports; recorded entries are kept."""
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+            self._send_event = None
+            self._pending.clear()
+        if watcher is not None:
+            try:
+                sys.meta_path.remove(watcher)
+            except ValueError:
+                pass
+
+    def note_import(self, name: str) -> None:
+        """Record imports noted earlier that have finished, then note *name*."""
+        if not getattr(self._local, "busy", False):
+            self._local.busy = True
+            try:
+                self._record_finished_imports()
+            finally:
+                self._local.busy = False
+        with self._lock:
+            self._pending.append(name)
+
+    def _record_finished_imports(self) -> None:
+        events: list[tuple[str, dict[str, Any]]] = []
+        with self._lock:
+            self._take_finished_imports(events)
+            send_event = self._send_event
+        if send_event is not None:
+            for event, body in events:
+                send_event(event, body)
+
+    def _take_finished_imports(self, events: list[tuple[str, dict[str, Any]]]) -> None:
+        pending, self._pending = self._pending, []
+        for name in pending:
+            module = sys.modules.get(name)
+            if module is None:
+                # The import failed; a later refresh catches modules
+                # that appear in sys.modules some other way.
+                continue
+            if _is_initializing(module):
+                self._pending.append(name)
+                continue
+            if name not in self._modules:
+                self._record_module(name, module, events)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def refresh(self, main_program: str | None = None) -> None:
+        """Catch up with ``sys.modules`` and ``linecache`` changes.
+
+        With the import watcher installed, the imports it noted are
+        recorded, and ``sys.modules`` is only compared with the recorded
+        names when its size shows entries that no import accounts for.
+        Either way only names that were not seen before are examined, so
+        the cost is at most a set difference plus one path resolution per
+        new entry.
+        """
+        events: list[tuple[str, dict[str, Any]]] = []
+        with self._lock:
+            if self._watcher is not None:
+                self._take_finished_imports(events)
+            if self._watcher is None or not self._matches_sys_modules():
+                self._pending.clear()
+                self._compare_sys_modules(events)
+            for filename in linecache.cache.keys() - self._linecache_seen:
+                self._linecache_seen.add(filename)
+                self._record_linecache(filename, events)
+            if main_program and main_program != self._main_program:
+                self._main_program = main_program
+                self._record_source(main_program, "main", None, events, must_exist=True)
+            send_event = self._send_event
+        if send_event is not None:
+            for event, body in events:
+                send_event(event, body)
+
+    def _matches_sys_modules(self) -> bool:
+        return len(sys.modules) == len(self._modules) + len(self._absent)
+
+    def _compare_sys_modules(self, events: list[tuple[str, dict[str, Any]]]) -> None:
+        current = sys.modules.copy()
+        names = current.keys()
+        absent: set[str] = set()
+        for name in sorted(names - self._modules.keys()):
+            module = current[name]
+            if module is None:
+                absent.add(name)
+            else:
+                self._record_module(name, module, events)
+        self._absent = absent
+        for name in self._modules.keys() - names:
+            self._forget_module(name, events)
+
+    def _record_module(
+        self, name: str, module: ModuleType, events: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        info: Module = {"id": name, "name": name, "isUserCode": False}
+        try:
+            raw = getattr(module, "__file__", None)
+            path = _resolve(raw) if raw else None
+        except (AttributeError, TypeError, OSError, ValueError):
+            path = None
+        if path is not None:
+            info["path"] = path
+            info["isUserCode"] = _is_user_code(path)
+        self._modules[name] = info
+        bisect.insort(self._module_names, name)
+        events.append(("module", {"reason": "new", "module": info}))
+        if path is not None and path.endswith(_SOURCE_SUFFIXES):
+            origin = getattr(module, "__package__", name)
+            self._record_source(path, f"module:{origin}", name, events)
+
+    def _forget_module(self, name: str, events: list[tuple[str, dict[str, Any]]]) -> None:
+        info = self._modules.pop(name)
+        index = bisect.bisect_left(self._module_names, name)
+        del self._module_names[index]
+        events.append(("module", {"reason": "removed", "module": info}))
+        path = info.get("path")
+        if path is not None and self._source_owner.get(path) == name:
+            del self._source_owner[path]
+            source = self._sources.pop(path)
+            index = bisect.bisect_left(self._source_keys, (source["name"], path))
+            del self._source_keys[index]
+            events.append(("loadedSource", {"reason": "removed", "source": source}))
+
+    def _record_linecache(self, filename: str, events: list[tuple[str, dict[str, Any]]]) -> None:
+        if filename.endswith(_SOURCE_SUFFIXES):
+            self._record_source(filename, "linecache", None, events, must_exist=True)
+
+    def _record_source(
+        self,
+        path: str,
+        origin: str,
+        owner: str | None,
+        events: list[tuple[str, dict[str, Any]]],
+        *,
+        must_exist: bool = False,
+    ) -> None:
+        if must_exist:
+            try:
+                file_path = Path(path).resolve()
+                if not file_path.exists():
+                    return
+            except (OSError, TypeError, ValueError):
+                return
+            path = str(file_path)
+        if path in self._sources:
+            return
+        source: Source = {"name": Path(path).name, "path": path, "origin": origin}
+        self._sources[path] = source
+        if owner is not None:
+            self._source_owner[path] = owner
+        bisect.insort(self._source_keys, (source["name"], path))
+        events.append(("loadedSource", {"reason": "new", "source": source}))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def module_count(self) -> int:
+        return len(self._module_names)
+
+    def modules_page(self, start: int = 0, count: int = 0) -> list[Module]:
+        """Return up to *count* modules (all when 0) from *start*, by name."""
+        with self._lock:
+            stop = start + count if count > 0 else None
+            return [self._modules[name] for name in self._module_names[start:stop]]
+
+    def sources(self) -> list[Source]:
+        """Return every recorded source file, ordered by file name."""
+        with self._lock:
+            return [self._sources[path] for _name, path in self._source_keys]
+
+
+__all__ = ["LoadedModuleRegistry"]
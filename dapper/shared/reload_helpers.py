@@ -9,23 +9,36 @@ The main entry point is :func:`perform_reload`, which orchestrates the full
 sequence: source validation, module resolution, .pyc removal,
 ``importlib.reload``, function/code rebinding across live frames, and optional
 frame-eval cache invalidation.
+
+:func:`perform_batch_reload` reloads several files at once: modules are
+reloaded in import-dependency order and, besides live frames, every other
+holder of an old function (``from x import f`` globals, registries, bound
+methods, closures, old class namespaces) is patched through a referrer index
+built with a single ``gc`` pass per batch.
 """
 
 from __future__ import annotations
 
 import ctypes
+import gc
+import graphlib
 import importlib
 import importlib.machinery
 import linecache
 from pathlib import Path
 import sys
+import time
 import types
 from typing import TYPE_CHECKING
 from typing import TypedDict
 from typing import cast
 
+from dapper.shared.source_watcher import start_session_source_watcher
+
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
 
     from dapper.protocol.requests import HotReloadOptions
 
@@ -64,6 +77,18 @@ class PerformReloadResult(TypedDict):
     warnings: list[str]
 
 
+class PerformBatchReloadResult(TypedDict):
+    """Return value of :func:`perform_batch_reload`."""
+
+    reloadedModules: list[str]
+    reloadedPaths: list[str]
+    reboundFrames: int
+    updatedFrameCodes: int
+    patchedReferrers: int
+    warnings: list[str]
+    durationMs: float
+
+
 class RebindResult(TypedDict):
     """Intermediate result from :func:`rebind_stack_frames`."""
 
@@ -141,6 +166,26 @@ def resolve_module_for_path(path: str) -> tuple[str, ModuleType]:
     raise ValueError(msg)
 
 
+def _modules_by_path(resolved_paths: Collection[str]) -> dict[str, tuple[str, ModuleType]]:
+    """Batch form of :func:`resolve_module_for_path`: one pass over :data:`sys.modules`."""
+    wanted = set(resolved_paths)
+    found: dict[str, tuple[str, ModuleType]] = {}
+    for name, mod in list(sys.modules.items()):
+        mod_file = getattr(mod, "__file__", None)
+        if not isinstance(mod_file, str):
+            continue
+        candidate = mod_file[:-1] if mod_file.endswith(".pyc") else mod_file
+        try:
+            resolved = str(Path(candidate).resolve())
+        except (OSError, ValueError):
+            continue
+        if resolved in wanted and resolved not in found:
+            found[resolved] = (name, mod)
+            if len(found) == len(wanted):
+                break
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Function / code collection
 # ---------------------------------------------------------------------------
@@ -175,6 +220,35 @@ def build_rebind_map(
     return mapping
 
 
+def collect_qualified_functions(module: ModuleType) -> dict[str, FunctionType]:
+    """Return module functions plus methods of classes defined in *module*.
+
+    Keys are qualified names (``"Class.method"``) so that methods of the old
+    and the reloaded class can be paired by :func:`build_rebind_map`.
+    ``staticmethod``/``classmethod`` wrappers are unwrapped.
+    """
+    functions = collect_module_functions(module)
+    module_name = getattr(module, "__name__", None)
+    pending = [
+        v
+        for v in getattr(module, "__dict__", {}).values()
+        if isinstance(v, type) and v.__module__ == module_name
+    ]
+    seen: set[int] = set()
+    while pending:
+        cls = pending.pop()
+        if id(cls) in seen:
+            continue
+        seen.add(id(cls))
+        for attr, value in vars(cls).items():
+            raw = value.__func__ if isinstance(value, (staticmethod, classmethod)) else value
+            if isinstance(raw, FunctionType):
+                functions[f"{cls.__qualname__}.{attr}"] = raw
+            elif isinstance(raw, type) and raw.__module__ == module_name:
+                pending.append(raw)
+    return functions
+
+
 # ---------------------------------------------------------------------------
 # Code-object compatibility gate
 # ---------------------------------------------------------------------------
@@ -326,7 +400,7 @@ def rebind_stack_frames(
     frames: list[types.FrameType],
     rebind_map: RebindMap,
     *,
-    module_name: str,
+    module_name: str | Collection[str],
     update_frame_code: bool,
 ) -> RebindResult:
     """Rebind live stack-frame locals and optionally update ``f_code`` objects.
@@ -336,8 +410,9 @@ def rebind_stack_frames(
     - Replaces any local variable that holds an old function/method with the
       reloaded version, then flushes fast-locals back to the C frame.
 
-    Closure functions from the reloaded module are skipped with a warning
-    because their cell variables cannot be safely re-targeted.
+    Closure functions from the reloaded module (or modules, when
+    *module_name* is a collection) are skipped with a warning because their
+    cell variables cannot be safely re-targeted.
 
     Returns:
         A :class:`RebindResult` dict with ``reboundFrames``,
@@ -346,6 +421,7 @@ def rebind_stack_frames(
     if not rebind_map:
         return RebindResult(reboundFrames=0, updatedFrameCodes=0, warnings=[])
 
+    module_names = {module_name} if isinstance(module_name, str) else set(module_name)
     warnings: list[str] = []
     rebound_frames = 0
     updated_frame_codes = 0
@@ -371,7 +447,7 @@ def rebind_stack_frames(
                 raw_fn = local_value.__func__
             if (
                 raw_fn is not None
-                and getattr(raw_fn, "__module__", None) == module_name
+                and getattr(raw_fn, "__module__", None) in module_names
                 and _is_closure(raw_fn)
             ):
                 fn_name = getattr(raw_fn, "__name__", "<closure>")
@@ -469,6 +545,222 @@ def _get_all_frames() -> list[types.FrameType]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Batch reload: dependency order and referrer patching
+# ---------------------------------------------------------------------------
+
+
+def order_modules_for_reload(
+    modules: dict[str, ModuleType],
+    warnings: list[str] | None = None,
+) -> list[str]:
+    """Return the names in *modules* ordered so dependencies reload first.
+
+    A batch module depends on another when its namespace holds that module or
+    an object defined in it (``import b`` / ``from b import f``).  Import
+    cycles fall back to the given order with a warning.
+    """
+    sorter: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter()
+    for name, module in modules.items():
+        deps: set[str] = set()
+        for value in list(getattr(module, "__dict__", {}).values()):
+            try:
+                dep = value.__name__ if isinstance(value, ModuleType) else value.__module__
+            except Exception:
+                continue
+            if isinstance(dep, str) and dep != name and dep in modules:
+                deps.add(dep)
+        sorter.add(name, *sorted(deps))
+    try:
+        return list(sorter.static_order())
+    except graphlib.CycleError as exc:
+        if warnings is not None:
+            warnings.append(f"Import cycle between reloaded modules: {exc.args[1]}")
+        return list(modules)
+
+
+_WRAPPER_TYPES = (MethodType, staticmethod, classmethod)
+
+# ``id(old_function)`` -> (old_function, objects that refer to it).
+ReferrerIndex = dict[int, tuple[FunctionType, list[object]]]
+
+
+def _holds(container: object, targets: dict[int, object]) -> list[int]:
+    """Return ids of *targets* directly held by a patchable *container*."""
+    if isinstance(container, types.CellType):
+        try:
+            values: Iterable[object] = (container.cell_contents,)
+        except ValueError:
+            return []
+    elif isinstance(container, dict):
+        values = container.values()
+    elif isinstance(container, list):
+        values = container
+    elif isinstance(container, _WRAPPER_TYPES):
+        values = (container.__func__,)
+    else:
+        inst_dict = getattr(container, "__dict__", None)
+        if not isinstance(inst_dict, dict) or isinstance(container, (type, ModuleType)):
+            return []
+        values = inst_dict.values()
+    return [id(v) for v in list(values) if id(v) in targets]
+
+
+def build_referrer_index(
+    functions: Iterable[FunctionType],
+    *,
+    exclude: Collection[int] = (),
+) -> ReferrerIndex:
+    """Index every patchable holder of *functions* with one ``gc`` scan.
+
+    Holders are dicts, lists, closure cells, objects with an instance
+    ``__dict__`` and method/``staticmethod``/``classmethod`` wrappers.  Frames
+    are left to :func:`rebind_stack_frames`; ids in *exclude* (the caller's
+    own bookkeeping containers) are skipped.
+    """
+    targets: dict[int, object] = {id(fn): fn for fn in functions}
+    index: ReferrerIndex = {}
+    if not targets:
+        return index
+    skip = {*exclude, id(functions), id(targets), id(index)}
+    for referrer in gc.get_referrers(*targets.values()):
+        if id(referrer) in skip or isinstance(referrer, types.FrameType):
+            continue
+        for target_id in _holds(referrer, targets):
+            fn = cast("FunctionType", targets[target_id])
+            index.setdefault(target_id, (fn, []))[1].append(referrer)
+    return index
+
+
+def _wrap_like(wrapper: object, new_fn: FunctionType) -> object:
+    if isinstance(wrapper, MethodType):
+        return MethodType(new_fn, wrapper.__self__)
+    return type(wrapper)(new_fn)
+
+
+def _replace_in(container: object, old: object, new: object, owners: dict[int, type]) -> int:
+    """Replace references to *old* held by *container* with *new*."""
+    replaced = 0
+    if isinstance(container, types.CellType):
+        container.cell_contents = new
+        return 1
+    if isinstance(container, list):
+        for i, value in enumerate(container):
+            if value is old:
+                container[i] = new
+                replaced += 1
+        return replaced
+    if isinstance(container, dict):
+        owner = owners.get(id(container))
+        for key, value in list(container.items()):
+            if value is not old:
+                continue
+            if owner is not None:
+                # Class namespaces must go through setattr so the type's
+                # attribute cache is invalidated.
+                setattr(owner, key, new)
+            else:
+                container[key] = new
+            replaced += 1
+        return replaced
+    for key, value in list(vars(container).items()):
+        if value is old:
+            setattr(container, key, new)
+            replaced += 1
+    return replaced
+
+
+def patch_referrers(
+    index: ReferrerIndex,
+    rebind_map: RebindMap,
+    *,
+    exclude: Collection[int] = (),
+) -> tuple[int, list[str]]:
+    """Point every holder in *index* at the reloaded functions.
+
+    Wrappers (bound methods, ``staticmethod``, ``classmethod``) are immutable,
+    so they are rebuilt around the new function and swapped into their own
+    holders; those holders and the owners of class namespaces are found with
+    one more ``gc`` scan.
+
+    Returns:
+        ``(patched_reference_count, warnings)``.
+    """
+    warnings: list[str] = []
+    direct: list[tuple[object, FunctionType, FunctionType]] = []
+    wrappers: dict[int, tuple[object, object]] = {}
+    for target_id, (old_fn, holders) in index.items():
+        new_fn = rebind_map.get(target_id)
+        if new_fn is None:
+            continue
+        for holder in holders:
+            if isinstance(holder, _WRAPPER_TYPES):
+                wrappers[id(holder)] = (holder, _wrap_like(holder, new_fn))
+            else:
+                direct.append((holder, old_fn, new_fn))
+
+    wrapper_holders: list[object] = []
+    if wrappers:
+        skip = {*exclude, id(direct), id(wrappers), *(id(h) for _, h in index.values())}
+        wrapper_holders = [
+            referrer
+            for referrer in gc.get_referrers(*(w for w, _ in wrappers.values()))
+            if id(referrer) not in skip
+            and not isinstance(referrer, types.FrameType)
+            and _holds(referrer, wrappers)
+        ]
+
+    dicts = {id(h): h for h in (*(h for h, _, _ in direct), *wrapper_holders) if type(h) is dict}
+    owners = _class_namespace_owners(dicts)
+
+    patched = 0
+    for holder, old_fn, new_fn in direct:
+        try:
+            patched += _replace_in(holder, old_fn, new_fn, owners)
+        except Exception as exc:  # noqa: PERF203
+            warnings.append(f"Failed to patch a reference to {_describe(old_fn)}: {exc!s}")
+
+    for holder in wrapper_holders:
+        for wrapper_id in _holds(holder, wrappers):
+            old_wrapper, new_wrapper = wrappers[wrapper_id]
+            try:
+                patched += _replace_in(holder, old_wrapper, new_wrapper, owners)
+            except Exception as exc:
+                warnings.append(f"Failed to patch a reference to {old_wrapper!r}: {exc!s}")
+    return patched, warnings
+
+
+def _class_namespace_owners(dicts: dict[int, dict]) -> dict[int, type]:
+    """Map ``id(namespace)`` to its class for the class namespaces in *dicts*."""
+    owners: dict[int, type] = {}
+    if not dicts:
+        return owners
+    for referrer in gc.get_referrers(*dicts.values()):
+        if not isinstance(referrer, type):
+            continue
+        for referent in gc.get_referents(referrer):
+            if type(referent) is dict and id(referent) in dicts:
+                owners[id(referent)] = referrer
+    return owners
+
+
+def _describe(fn: object) -> str:
+    return f"{getattr(fn, '__module__', '?')}.{getattr(fn, '__qualname__', '?')}()"
+
+
+def _mark_reloaded(paths: Iterable[str]) -> None:
+    start_session_source_watcher().mark_current(paths)
+
+
+def changed_sources() -> list[str]:
+    """Return loaded user sources edited since the previous hot reload.
+
+    Edits are measured against the baseline taken when the session started
+    (:func:`~dapper.shared.source_watcher.start_session_source_watcher`).
+    """
+    return sorted(start_session_source_watcher().poll())
+
+
 # ---------------------------------------------------------------------------
 # Top-level orchestration
 # ---------------------------------------------------------------------------
@@ -550,6 +842,7 @@ def perform_reload(
     warnings.extend(rebind_result["warnings"])
 
     _try_invalidate_frame_eval(str(resolved), warnings)
+    _mark_reloaded([str(resolved)])
 
     return PerformReloadResult(
         reloadedModule=getattr(reloaded, "__name__", module_name),
@@ -557,3 +850,133 @@ def perform_reload(
         updatedFrameCodes=rebind_result["updatedFrameCodes"],
         warnings=warnings,
     )
+
+
+def _resolve_batch_modules(
+    paths: Iterable[str],
+    warnings: list[str],
+) -> tuple[dict[str, ModuleType], dict[str, Path]]:
+    """Map each reloadable path to its loaded module; others become warnings."""
+    candidates: dict[str, Path] = {}
+    for path in dict.fromkeys(paths):
+        try:
+            resolved = Path(path).resolve(strict=True)
+            check_reloadable_source(resolved)
+        except (OSError, ValueError) as exc:
+            warnings.append(f"Skipped {path}: {exc!s}")
+            continue
+        candidates[path] = resolved
+
+    loaded = _modules_by_path([str(r) for r in candidates.values()])
+    modules: dict[str, ModuleType] = {}
+    sources: dict[str, Path] = {}
+    for path, resolved in candidates.items():
+        entry = loaded.get(str(resolved))
+        if entry is None:
+            warnings.append(f"Skipped {path}: Module not loaded: {path}")
+            continue
+        modules[entry[0]] = entry[1]
+        sources[entry[0]] = resolved
+    return modules, sources
+
+
+def perform_batch_reload(
+    paths: Iterable[str] | None,
+    options: HotReloadOptions | None,
+    *,
+    get_frames_fn: Callable[[], list[types.FrameType]] | None = None,
+) -> PerformBatchReloadResult:
+    """Reload several Python source files as one operation.
+
+    Compared with calling :func:`perform_reload` once per file:
+
+    * modules are reloaded in dependency order (:func:`order_modules_for_reload`)
+      so a module that does ``from b import f`` picks up the new ``b.f``;
+    * live frames are walked once for the whole batch;
+    * references to the replaced functions held outside frames — registries,
+      ``from``-imports in other modules, bound methods, closure cells and the
+      namespaces of classes defined before the reload — are found with a
+      single :func:`gc.get_referrers` scan and patched
+      (:func:`build_referrer_index`, :func:`patch_referrers`).
+
+    A file that cannot be resolved or whose module fails to re-execute is
+    reported in ``warnings`` and the rest of the batch still proceeds.
+
+    Args:
+        paths: Source files to reload.  ``None`` reloads the loaded user
+            sources edited since the previous hot reload (see
+            :func:`changed_sources`).
+        options: Same per-request overrides as :func:`perform_reload`.
+        get_frames_fn: Same as for :func:`perform_reload`.
+
+    Returns:
+        A fully-populated :class:`PerformBatchReloadResult`.
+    """
+    started = time.perf_counter()
+    if get_frames_fn is None:
+        get_frames_fn = _get_all_frames
+    if paths is None:
+        paths = changed_sources()
+
+    opts: HotReloadOptions = cast("HotReloadOptions", options or {})
+    invalidate_pyc = bool(opts.get("invalidatePycache", True))
+    update_frame_code = bool(opts.get("updateFrameCode", True))
+
+    warnings: list[str] = []
+    modules, sources = _resolve_batch_modules(paths, warnings)
+    importlib.invalidate_caches()
+
+    # Keyed "module:qualname"; keeps the old functions alive until patched.
+    old_functions: dict[str, FunctionType] = {}
+    new_functions: dict[str, FunctionType] = {}
+    reloaded_names: list[str] = []
+    for module_name in order_modules_for_reload(modules, warnings):
+        resolved = sources[module_name]
+        linecache.checkcache(str(resolved))
+        if invalidate_pyc:
+            warnings.extend(delete_stale_pyc(resolved))
+        old_functions.update(
+            (f"{module_name}:{name}", fn)
+            for name, fn in collect_qualified_functions(modules[module_name]).items()
+        )
+        try:
+            reloaded = importlib.reload(modules[module_name])
+        except Exception as exc:
+            warnings.append(f"Failed to reload {module_name}: {exc!s}")
+            continue
+        linecache.checkcache(str(resolved))
+        new_functions.update(
+            (f"{module_name}:{name}", fn)
+            for name, fn in collect_qualified_functions(reloaded).items()
+        )
+        reloaded_names.append(module_name)
+
+    rebind_map = build_rebind_map(old_functions, new_functions)
+    rebind_result = rebind_stack_frames(
+        get_frames_fn(),
+        rebind_map,
+        module_name=reloaded_names,
+        update_frame_code=update_frame_code,
+    )
+    warnings.extend(rebind_result["warnings"])
+
+    replaced = [fn for fn in old_functions.values() if id(fn) in rebind_map]
+    internal = (id(old_functions), id(new_functions), id(replaced), id(rebind_map))
+    index = build_referrer_index(replaced, exclude=internal)
+    patched, patch_warnings = patch_referrers(index, rebind_map, exclude=(*internal, id(index)))
+    warnings.extend(patch_warnings)
+
+    reloaded_paths = [str(sources[name]) for name in reloaded_names]
+    for path in reloaded_paths:
+        _try_invalidate_frame_eval(path, warnings)
+    _mark_reloaded(reloaded_paths)
+
+    return PerformBatchReloadResult(
+        reloadedModules=reloaded_names,
+        reloadedPaths=reloaded_paths,
+        reboundFrames=rebind_result["reboundFrames"],
+        updatedFrameCodes=rebind_result["updatedFrameCodes"],
+        patchedReferrers=patched,
+        warnings=warnings,
+        durationMs=(time.perf_counter() - started) * 1000.0,
+    )
@@ -21,6 +21,27 @@ Typical call flow
    queries this registry before attempting a filesystem read — so the DAP
    client receives the in-memory source.
 
+Memory bounds
+-------------
+Services that generate code continuously (ORMs, template engines,
+``namedtuple``/dataclass factories) would otherwise grow the registry
+forever, so it is bounded:
+
+- entries are kept in least-recently-used order and evicted once the stored
+  size exceeds ``max_bytes`` (``DAPPER_SOURCE_REGISTRY_MAX_BYTES``, default
+  32 MiB);
+- when the uncompressed entries exceed ``hot_bytes`` (a quarter of the
+  budget) the coldest ones are zlib-compressed in place
+  (``DAPPER_SOURCE_REGISTRY_COMPRESS=0`` disables this); reading one inflates
+  it again;
+- sources that are pinned explicitly, reported by the pin provider (the
+  session's breakpoint files) or executing in a live stack frame are never
+  evicted.
+
+An evicted source that :mod:`linecache` still holds is re-registered under
+its old ``sourceReference`` on the next lookup through
+:class:`~dapper.shared.debug_shared.SourceCatalog`.
+
 The module has *no* imports from ``dapper.shared.debug_shared`` at the module
 level to avoid circular dependencies.  The :func:`annotate_stack_frames_with_source_refs`
 helper lazily imports ``debug_shared`` at call time.
@@ -28,11 +49,28 @@ helper lazily imports ``debug_shared`` at call time.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import itertools
 import linecache
+import os
 import re
+import sys
 import threading
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import TypedDict
+import zlib
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+MAX_BYTES_ENV_VAR = "DAPPER_SOURCE_REGISTRY_MAX_BYTES"
+COMPRESS_ENV_VAR = "DAPPER_SOURCE_REGISTRY_COMPRESS"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Sources smaller than this are not worth a zlib round-trip.
+_MIN_COMPRESS_BYTES = 512
 
 # ---------------------------------------------------------------------------
 # Synthetic-filename detection
@@ -77,12 +115,14 @@ class RuntimeSourceEntry:
     Attributes:
         ref:          Integer DAP ``sourceReference``.
         virtual_path: The synthetic filename key (angle-bracket names, URIs …).
-        source_text:  The complete source code as a Unicode string.
+        source_text:  The complete source code as a Unicode string (inflated
+                      on access when the entry is compressed).
         name:         Human-readable display name shown in the DAP client UI.
         origin:       Free-form provenance tag, e.g. ``"eval"``, ``"jinja"``.
+        raw_bytes:    UTF-8 size of the source text.
     """
 
-    __slots__ = ("name", "origin", "ref", "source_text", "virtual_path")
+    __slots__ = ("_compressed", "_text", "name", "origin", "raw_bytes", "ref", "virtual_path")
 
     def __init__(
         self,
@@ -94,17 +134,101 @@ class RuntimeSourceEntry:
     ) -> None:
         self.ref = ref
         self.virtual_path = virtual_path
+        self._compressed: bytes | None = None
         self.source_text = source_text
         self.name = name or virtual_path
         self.origin = origin
 
+    @property
+    def source_text(self) -> str:
+        if self._compressed is not None:
+            return zlib.decompress(self._compressed).decode("utf-8", "surrogatepass")
+        return self._text
+
+    @source_text.setter
+    def source_text(self, value: str) -> None:
+        self._text = value
+        self._compressed = None
+        self.raw_bytes = len(value.encode("utf-8", "surrogatepass"))
+
+    @property
+    def compressed(self) -> bool:
+        """Whether the text is currently held zlib-compressed."""
+        return self._compressed is not None
+
+    @property
+    def stored_bytes(self) -> int:
+        """Bytes charged against the registry budget."""
+        return len(self._compressed) if self._compressed is not None else self.raw_bytes
+
+    def compress(self) -> bool:
+        """Compress the text in place; return False when it would not shrink."""
+        if self._compressed is not None:
+            return True
+        packed = zlib.compress(self._text.encode("utf-8", "surrogatepass"), 6)
+        if len(packed) >= self.raw_bytes:
+            return False
+        self._compressed = packed
+        self._text = ""
+        return True
+
+    def inflate(self) -> None:
+        """Undo :meth:`compress`."""
+        if self._compressed is not None:
+            self.source_text = self.source_text
+
     def __repr__(self) -> str:  # pragma: no cover
         return (
             f"RuntimeSourceEntry(ref={self.ref!r}, virtual_path={self.virtual_path!r}, "
-            f"origin={self.origin!r}, len={len(self.source_text)})"
+            f"origin={self.origin!r}, len={self.raw_bytes}, compressed={self.compressed})"
         )
 
 
+class RuntimeSourceRegistryStats(TypedDict):
+    """Snapshot returned by :meth:`RuntimeSourceRegistry.stats`."""
+
+    entries: int
+    compressedEntries: int
+    pinnedEntries: int
+    storedBytes: int
+    rawBytes: int
+    maxBytes: int
+    hotBytes: int
+    compression: bool
+    hits: int
+    misses: int
+    evictions: int
+    compressions: int
+    inflations: int
+
+
+def _env_max_bytes() -> int:
+    raw = os.getenv(MAX_BYTES_ENV_VAR, "").strip()
+    try:
+        return max(int(raw), 0) if raw else DEFAULT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def _env_compress() -> bool:
+    return os.getenv(COMPRESS_ENV_VAR, "1").strip().lower() not in ("0", "false", "no")
+
+
+def live_frame_filenames() -> set[str]:
+    """Return the synthetic ``co_filename`` of every frame on every thread's stack."""
+    names: set[str] = set()
+    seen: set[int] = set()
+    for frame in list(sys._current_frames().values()):  # noqa: SLF001
+        f = frame
+        while f is not None and id(f) not in seen:
+            seen.add(id(f))
+            filename = f.f_code.co_filename
+            if filename.startswith("<"):
+                names.add(filename)
+            f = f.f_back
+    return names
+
+
 # ---------------------------------------------------------------------------
 # Registry
 # ---------------------------------------------------------------------------
@@ -118,6 +242,10 @@ class RuntimeSourceRegistry:
     in :class:`~dapper.shared.debug_shared.SourceCatalog`; callers that
     need coordinated numbering should pass ``ref_hint`` when registering.
 
+    Storage is bounded as described in the module docstring; the
+    constructor arguments default to the ``DAPPER_SOURCE_REGISTRY_*``
+    environment variables.  ``max_bytes=0`` disables eviction.
+
     Example::
 
         registry = RuntimeSourceRegistry()
@@ -127,11 +255,35 @@ class RuntimeSourceRegistry:
         print(registry.get_source_text(entry.ref))  # "x = 1\\n"
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        hot_bytes: int | None = None,
+        compress: bool | None = None,
+        pin_provider: Callable[[], Iterable[str]] | None = None,
+    ) -> None:
         self._lock = threading.RLock()
         self._next_id = itertools.count(1)
-        self._by_ref: dict[int, RuntimeSourceEntry] = {}
+        # Both ordered least- to most-recently used; _hot holds only the
+        # uncompressed entries so compaction never rescans compressed ones.
+        self._by_ref: OrderedDict[int, RuntimeSourceEntry] = OrderedDict()
+        self._hot: OrderedDict[int, RuntimeSourceEntry] = OrderedDict()
         self._by_path: dict[str, RuntimeSourceEntry] = {}
+        self.max_bytes = _env_max_bytes() if max_bytes is None else max_bytes
+        self.hot_bytes = self.max_bytes // 4 if hot_bytes is None else hot_bytes
+        self.compress = _env_compress() if compress is None else compress
+        self._pin_provider = pin_provider
+        self._pins: dict[str, int] = {}
+        self._stored_bytes = 0
+        self._hot_stored_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "compressions": 0,
+            "inflations": 0,
+        }
 
     # ------------------------------------------------------------------
     # Registration
@@ -170,6 +322,7 @@ class RuntimeSourceRegistry:
         with self._lock:
             existing = self._by_path.get(key)
             if existing is not None:
+                self._touch(existing)
                 return existing
 
             if ref_hint is not None and ref_hint not in self._by_ref:
@@ -187,7 +340,11 @@ class RuntimeSourceRegistry:
                 origin=origin,
             )
             self._by_ref[ref] = entry
+            self._hot[ref] = entry
             self._by_path[key] = entry
+            self._stored_bytes += entry.raw_bytes
+            self._hot_stored_bytes += entry.raw_bytes
+            self._enforce_budget(keep=entry)
             return entry
 
     def update(self, virtual_path: str, source_text: str) -> bool:
@@ -206,7 +363,15 @@ class RuntimeSourceRegistry:
             entry = self._by_path.get(key)
             if entry is None:
                 return False
+            self._touch(entry)
+            self._stored_bytes -= entry.stored_bytes
+            if self._hot.pop(entry.ref, None) is not None:
+                self._hot_stored_bytes -= entry.raw_bytes
             entry.source_text = source_text
+            self._hot[entry.ref] = entry
+            self._stored_bytes += entry.raw_bytes
+            self._hot_stored_bytes += entry.raw_bytes
+            self._enforce_budget(keep=entry)
             return True
 
     # ------------------------------------------------------------------
@@ -214,24 +379,126 @@ class RuntimeSourceRegistry:
     # ------------------------------------------------------------------
 
     def get_by_ref(self, ref: int) -> RuntimeSourceEntry | None:
-        """Return the entry for *ref*, or ``None``."""
+        """Return the entry for *ref* (marking it recently used), or ``None``."""
         with self._lock:
-            return self._by_ref.get(ref)
+            return self._lookup(self._by_ref.get(ref))
 
     def get_by_path(self, virtual_path: str) -> RuntimeSourceEntry | None:
-        """Return the entry for *virtual_path*, or ``None``."""
+        """Return the entry for *virtual_path* (marking it recently used), or ``None``."""
         with self._lock:
-            return self._by_path.get(virtual_path.strip())
+            return self._lookup(self._by_path.get(virtual_path.strip()))
 
     def get_source_text(self, ref: int) -> str | None:
         """Return the source text for *ref*, or ``None``."""
-        entry = self.get_by_ref(ref)
-        return entry.source_text if entry is not None else None
+        with self._lock:
+            entry = self._lookup(self._by_ref.get(ref))
+            return entry.source_text if entry is not None else None
 
     def get_source_text_by_path(self, virtual_path: str) -> str | None:
         """Return the source text for *virtual_path*, or ``None``."""
-        entry = self.get_by_path(virtual_path)
-        return entry.source_text if entry is not None else None
+        with self._lock:
+            entry = self._lookup(self._by_path.get(virtual_path.strip()))
+            return entry.source_text if entry is not None else None
+
+    # ------------------------------------------------------------------
+    # Pinning
+    # ------------------------------------------------------------------
+
+    def pin(self, virtual_path: str) -> None:
+        """Protect *virtual_path* from eviction until a matching :meth:`unpin`."""
+        key = virtual_path.strip()
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, virtual_path: str) -> None:
+        """Release one :meth:`pin` of *virtual_path*."""
+        key = virtual_path.strip()
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+
+    def set_pin_provider(self, provider: Callable[[], Iterable[str]] | None) -> None:
+        """Install a callable returning paths that must not be evicted.
+
+        It is called only when the registry is over budget.
+        """
+        with self._lock:
+            self._pin_provider = provider
+
+    def _pinned_paths(self) -> set[str]:
+        pinned = set(self._pins)
+        pinned |= live_frame_filenames()
+        provider = self._pin_provider
+        if provider is not None:
+            try:
+                pinned.update(provider())
+            except Exception:  # pragma: no cover - defensive
+                pass
+        return pinned
+
+    # ------------------------------------------------------------------
+    # Budget enforcement
+    # ------------------------------------------------------------------
+
+    def _lookup(self, entry: RuntimeSourceEntry | None) -> RuntimeSourceEntry | None:
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        self._touch(entry)
+        if entry.compressed:
+            self._stored_bytes -= entry.stored_bytes
+            entry.inflate()
+            self._stats["inflations"] += 1
+            self._hot[entry.ref] = entry
+            self._stored_bytes += entry.raw_bytes
+            self._hot_stored_bytes += entry.raw_bytes
+            self._enforce_budget(keep=entry)
+        return entry
+
+    def _touch(self, entry: RuntimeSourceEntry) -> None:
+        self._by_ref.move_to_end(entry.ref)
+        if entry.ref in self._hot:
+            self._hot.move_to_end(entry.ref)
+
+    def _enforce_budget(self, keep: RuntimeSourceEntry) -> None:
+        """Compress, then evict, least-recently-used entries other than *keep*."""
+        if self.compress:
+            skipped: list[RuntimeSourceEntry] = []
+            while self._hot_stored_bytes > self.hot_bytes and self._hot:
+                _ref, entry = self._hot.popitem(last=False)
+                if entry is keep:
+                    skipped.append(entry)
+                    continue
+                self._hot_stored_bytes -= entry.raw_bytes
+                if entry.raw_bytes < _MIN_COMPRESS_BYTES or not entry.compress():
+                    # Not worth compressing; it stays charged at full size.
+                    continue
+                self._stored_bytes -= entry.raw_bytes - entry.stored_bytes
+                self._stats["compressions"] += 1
+            for entry in skipped:
+                self._hot[entry.ref] = entry
+
+        if not self.max_bytes or self._stored_bytes <= self.max_bytes:
+            return
+        pinned = self._pinned_paths()
+        for entry in list(self._by_ref.values()):
+            if self._stored_bytes <= self.max_bytes:
+                break
+            if entry is keep or entry.virtual_path in pinned:
+                continue
+            self._remove(entry)
+            self._stats["evictions"] += 1
+
+    def _remove(self, entry: RuntimeSourceEntry) -> None:
+        del self._by_ref[entry.ref]
+        self._by_path.pop(entry.virtual_path, None)
+        self._stored_bytes -= entry.stored_bytes
+        if self._hot.pop(entry.ref, None) is not None:
+            self._hot_stored_bytes -= entry.raw_bytes
 
     # ------------------------------------------------------------------
     # linecache-aware convenience
@@ -242,6 +509,7 @@ class RuntimeSourceRegistry:
         virtual_path: str,
         *,
         origin: str = "linecache-dynamic",
+        ref_hint: int | None = None,
     ) -> RuntimeSourceEntry | None:
         """Attempt to resolve *virtual_path* via :mod:`linecache` and auto-register.
 
@@ -252,6 +520,8 @@ class RuntimeSourceRegistry:
         Args:
             virtual_path: Synthetic filename to look up.
             origin:       Provenance tag stored on the entry.
+            ref_hint:     Passed to :meth:`register` (e.g. to restore an
+                          evicted entry under its old reference).
 
         Returns:
             The (new or existing) :class:`RuntimeSourceEntry`, or ``None``
@@ -265,7 +535,7 @@ class RuntimeSourceRegistry:
         if not lines:
             return None
         source_text = "".join(lines)
-        return self.register(key, source_text, origin=origin)
+        return self.register(key, source_text, origin=origin, ref_hint=ref_hint)
 
     # ------------------------------------------------------------------
     # Introspection
@@ -280,11 +550,35 @@ class RuntimeSourceRegistry:
         with self._lock:
             return len(self._by_ref)
 
+    def stats(self) -> RuntimeSourceRegistryStats:
+        """Return size, budget and hit/eviction counters."""
+        with self._lock:
+            pinned = self._pinned_paths()
+            entries = list(self._by_ref.values())
+            return RuntimeSourceRegistryStats(
+                entries=len(entries),
+                compressedEntries=sum(1 for e in entries if e.compressed),
+                pinnedEntries=sum(1 for e in entries if e.virtual_path in pinned),
+                storedBytes=self._stored_bytes,
+                rawBytes=sum(e.raw_bytes for e in entries),
+                maxBytes=self.max_bytes,
+                hotBytes=self.hot_bytes,
+                compression=self.compress,
+                hits=self._stats["hits"],
+                misses=self._stats["misses"],
+                evictions=self._stats["evictions"],
+                compressions=self._stats["compressions"],
+                inflations=self._stats["inflations"],
+            )
+
     def clear(self) -> None:
         """Remove all entries.  Intended for test tear-down."""
         with self._lock:
             self._by_ref.clear()
+            self._hot.clear()
             self._by_path.clear()
+            self._stored_bytes = 0
+            self._hot_stored_bytes = 0
 
 
 # ---------------------------------------------------------------------------
@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-import linecache
 import mimetypes
-from pathlib import Path
-import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,90 +11,6 @@ if TYPE_CHECKING:
     from dapper.shared.debug_shared import DebugSession
 
 
-def _resolve_path(raw: str) -> tuple[Path, str]:
-    """Resolve *raw* to an absolute `Path` and its string form."""
-    resolved = Path(raw).resolve()
-    return resolved, str(resolved)
-
-
-def _collect_module_sources(seen_paths: set[str]) -> list[Source]:
-    """Collect sources from sys.modules."""
-    from dapper.protocol.structures import Source  # noqa: PLC0415
-
-    sources: list[Source] = []
-
-    for module_name, module in sys.modules.items():
-        if module is None:
-            continue
-
-        try:
-            module_file = getattr(module, "__file__", None)
-            if module_file is None:
-                continue
-
-            module_path, module_file = _resolve_path(module_file)
-
-            if module_file in seen_paths:
-                continue
-            if not module_file.endswith((".py", ".pyw")):
-                continue
-
-            seen_paths.add(module_file)
-
-            origin = getattr(module, "__package__", module_name)
-            source_obj = Source(name=module_path.name, path=module_file, origin=f"module:{origin}")
-            sources.append(source_obj)
-
-        except (AttributeError, TypeError, OSError):
-            continue
-
-    return sources
-
-
-def _collect_linecache_sources(seen_paths: set[str]) -> list[Source]:
-    """Collect sources from linecache."""
-    from dapper.protocol.structures import Source  # noqa: PLC0415
-
-    sources: list[Source] = []
-
-    for filename in linecache.cache:
-        if filename not in seen_paths and filename.endswith((".py", ".pyw")):
-            try:
-                file_path, abs_path = _resolve_path(filename)
-                if abs_path not in seen_paths and file_path.exists():
-                    seen_paths.add(abs_path)
-                    source = Source(name=file_path.name, path=abs_path, origin="linecache")
-                    sources.append(source)
-            except (OSError, TypeError):
-                continue
-
-    return sources
-
-
-def _collect_main_program_source(
-    seen_paths: set[str],
-    state: DebugSession,
-) -> list[Source]:
-    """Collect the main program source if available."""
-    from dapper.protocol.structures import Source  # noqa: PLC0415
-
-    sources: list[Source] = []
-
-    if state.debugger:
-        program_path = state.debugger.program_path
-        if program_path and program_path not in seen_paths:
-            try:
-                program_file_path, abs_path = _resolve_path(program_path)
-                if program_file_path.exists():
-                    sources.append(
-                        Source(name=program_file_path.name, path=abs_path, origin="main")
-                    )
-            except (OSError, TypeError):
-                pass
-
-    return sources
-
-
 def _collect_dynamic_sources(state: DebugSession) -> list[Source]:
     """Collect in-memory (dynamic) sources from the runtime source registry.
 
@@ -123,24 +36,18 @@ def handle_loaded_sources(
     state: DebugSession,
 ) -> None:
     """Handle loadedSources request to return all loaded source files."""
-    seen_paths = set[str]()
+    program_path = state.debugger.program_path if state.debugger else None
+    registry = state.loaded_modules
+    registry.refresh(main_program=program_path)
 
     loaded_sources: list[Source] = []
-    loaded_sources.extend(_collect_module_sources(seen_paths))
-    loaded_sources.extend(_collect_linecache_sources(seen_paths))
-    loaded_sources.extend(_collect_main_program_source(seen_paths, state))
-
-    loaded_sources.sort(key=lambda s: s.get("name", ""))
-
-    for source_item in loaded_sources:
-        path = source_item.get("path")
-        if not path:
-            continue
+    for source_item in registry.sources():
+        path = source_item["path"]
         ref_id = state.get_ref_for_path(path) or state.get_or_create_source_ref(
             path,
             source_item.get("name"),
         )
-        source_item["sourceReference"] = ref_id
+        loaded_sources.append({**source_item, "sourceReference": ref_id})
 
     # Include dynamic (in-memory) sources — these already carry sourceReference.
     loaded_sources.extend(_collect_dynamic_sources(state))
@@ -240,51 +147,19 @@ def handle_modules(
     state: DebugSession,
 ) -> None:
     """Handle modules request to return loaded Python modules."""
-    all_modules: list[Payload] = []
-
-    for module_name, module in sys.modules.items():
-        if module is None:
-            continue
-
-        try:
-            module_info: Payload = {
-                "id": module_name,
-                "name": module_name,
-                "isUserCode": False,
-            }
-
-            module_file = getattr(module, "__file__", None)
-            if module_file:
-                _, path_str = _resolve_path(module_file)
-                module_info["path"] = path_str
-
-                is_user_code = not any(
-                    part in path_str.lower()
-                    for part in ["site-packages", "lib/python", "lib\\python", "Lib"]
-                )
-                module_info["isUserCode"] = is_user_code
-
-            all_modules.append(module_info)
-
-        except (AttributeError, TypeError, OSError):
-            continue
-
-    all_modules.sort(key=lambda module_info: module_info["name"])
+    registry = state.loaded_modules
+    registry.refresh()
 
+    start_module = 0
+    module_count = 0
     if arguments:
         start_module = arguments.get("startModule", 0)
         module_count = arguments.get("moduleCount", 0)
-
-        if module_count > 0:
-            modules = all_modules[start_module : start_module + module_count]
-        else:
-            modules = all_modules[start_module:]
-    else:
-        modules = all_modules
+    modules = registry.modules_page(start_module, module_count)
 
     state.safe_send(
         "response",
         id=state.request_id,
         success=True,
-        body={"modules": modules, "totalModules": len(all_modules)},
+        body={"modules": modules, "totalModules": registry.module_count()},
     )
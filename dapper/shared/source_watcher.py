@@ -0,0 +1,121 @@
+"""Polling detector for edited Python source files.
+
+:class:`SourceWatcher` compares ``os.stat`` results (mtime and size) of a set
+of files against the previous snapshot.  :meth:`SourceWatcher.poll` returns
+every file that changed since the last poll.
+
+:func:`start_session_source_watcher` takes the session's baseline when the
+launcher (or an in-process session) starts, so a ``hotReloadBatch`` without
+explicit paths picks up every edit made since then.
+
+Only the standard library is used: the watcher runs inside the debuggee
+where no file-notification packages can be assumed.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from dapper.core.just_my_code import is_user_path
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from typing import TypeAlias
+
+    # (st_mtime_ns, st_size) — None when the file is missing.
+    _Stamp: TypeAlias = tuple[int, int] | None
+
+
+def loaded_user_sources() -> list[str]:
+    """Return the ``.py`` files of user modules currently in :data:`sys.modules`."""
+    paths: list[str] = []
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if not isinstance(filename, str) or not filename.endswith((".py", ".pyw")):
+            continue
+        if is_user_path(filename):
+            paths.append(os.path.abspath(filename))  # noqa: PTH100
+    return paths
+
+
+def _stamp(path: str) -> _Stamp:
+    try:
+        st = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SourceWatcher:
+    """Detect changed source files by polling their stat results.
+
+    Files returned by *paths_fn* for the first time are recorded without
+    being reported, unless *since_ns* is given and they were modified after
+    it: a module imported after the baseline and edited before the first
+    poll still counts as changed.
+    """
+
+    def __init__(
+        self,
+        paths_fn: Callable[[], Iterable[str]] = loaded_user_sources,
+        *,
+        since_ns: int | None = None,
+    ) -> None:
+        self._paths_fn = paths_fn
+        self._since_ns = since_ns
+        self._stamps: dict[str, _Stamp] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def watched(self) -> int:
+        """Number of files with a recorded snapshot."""
+        with self._lock:
+            return len(self._stamps)
+
+    def poll(self) -> set[str]:
+        """Return files whose mtime or size changed since the previous poll."""
+        changed: set[str] = set()
+        since = self._since_ns
+        paths = list(self._paths_fn())
+        with self._lock:
+            for path in paths:
+                stamp = _stamp(path)
+                if path not in self._stamps:
+                    self._stamps[path] = stamp
+                    if since is not None and stamp is not None and stamp[0] > since:
+                        changed.add(path)
+                elif self._stamps[path] != stamp:
+                    self._stamps[path] = stamp
+                    if stamp is not None:
+                        changed.add(path)
+        return changed
+
+    def mark_current(self, paths: Iterable[str]) -> None:
+        """Record the on-disk state of *paths* as seen (e.g. after reloading them)."""
+        with self._lock:
+            for path in paths:
+                self._stamps[path] = _stamp(path)
+
+
+_session_watcher: SourceWatcher | None = None
+_session_lock = threading.Lock()
+
+
+def start_session_source_watcher() -> SourceWatcher:
+    """Return the session's watcher, taking its baseline on the first call.
+
+    Called when the launcher or an in-process session starts; files loaded
+    later are compared against that moment.
+    """
+    global _session_watcher  # noqa: PLW0603
+    with _session_lock:
+        if _session_watcher is None:
+            watcher = SourceWatcher(since_ns=time.time_ns())
+            watcher.poll()
+            _session_watcher = watcher
+        return _session_watcher
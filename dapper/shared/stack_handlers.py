@@ -37,10 +37,16 @@ def handle_stack_trace_impl(
     dbg = session.debugger
 
     frames: list[StackEntry] | None = None
+    total_frames: int | None = None
     if dbg and isinstance(thread_id, int) and thread_id in dbg.thread_tracker.frames_by_thread:
-        raw_frames = dbg.thread_tracker.frames_by_thread.get(thread_id)
+        tracker = dbg.thread_tracker
+        # Frames below the stop-time budget are only built once requested.
+        end_frame = start_frame + levels if isinstance(levels, int) and levels > 0 else None
+        tracker.materialize_frames(thread_id, end_frame)
+        total_frames = tracker.total_frames(thread_id)
+        raw_frames = tracker.frames_by_thread.get(thread_id)
         if raw_frames is not None:
-            for entry in raw_frames:
+            for entry in raw_frames[start_frame:end_frame]:
                 if isinstance(entry, dict):
                     stack_frames.append(entry)
                 elif hasattr(entry, "to_dict"):
@@ -64,6 +70,7 @@ def handle_stack_trace_impl(
             stack = dbg.stack
             if stack is not None and thread_id == get_thread_ident():
                 frames = stack[start_frame:]
+                total_frames = len(stack)
         if levels is not None and frames is not None:
             frames = frames[:levels]
 
@@ -93,14 +100,19 @@ def handle_stack_trace_impl(
         # DAP clients can fetch the in-memory source via the source request.
         annotate_stack_frames_with_source_refs(stack_frames)
 
+    if total_frames is None:
+        total_frames = len(stack_frames)
+    # startFrame tells the adapter whether the event carries the whole stack
+    # or one page of it.
     session.safe_send(
         "stackTrace",
         threadId=thread_id,
         stackFrames=stack_frames,
-        totalFrames=len(stack_frames),
+        startFrame=start_frame,
+        totalFrames=total_frames,
     )
 
-    return {"success": True, "body": {"stackFrames": stack_frames}}
+    return {"success": True, "body": {"stackFrames": stack_frames, "totalFrames": total_frames}}
 
 
 def handle_threads_impl(
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import inspect
+import logging
 from typing import TYPE_CHECKING
 from typing import Protocol
 
+from dapper.core.pause_controller import PAUSE_REPORT_TIMEOUT
 from dapper.core.stepping_controller import StepGranularity
+from dapper.core.thread_tracker import STOP_FRAME_BUDGET
 from dapper.shared.runtime_source_registry import annotate_stack_frames_with_source_refs
+from dapper.utils.internal_threads import InternalTimer
+
+_log = logging.getLogger(__name__)
 
 # Code-flag constants for coroutine and async-generator functions (Python 3.5+).
 _CO_COROUTINE: int = inspect.CO_COROUTINE
@@ -46,12 +52,50 @@ def handle_continue_impl(session: DebugSession, arguments: Payload | None) -> No
     thread_id = arguments.get("threadId")
 
     dbg = session.debugger
+    cancel_pause = getattr(dbg, "cancel_pause", None)
+    if callable(cancel_pause):
+        # A pause still on its way to a checkpoint must not stop the thread.
+        cancel_pause(thread_id if session.non_stop else None)
     if dbg and thread_id in dbg.thread_tracker.stopped_thread_ids:
         dbg.thread_tracker.stopped_thread_ids.remove(thread_id)
-        if not dbg.thread_tracker.stopped_thread_ids:
+        if session.non_stop:
+            # The other threads keep their own stop state; only leave alone
+            # a step that another thread is still running.
+            if dbg.stepping_controller.step_thread_id in (None, thread_id):
+                dbg.set_continue()
+        elif not dbg.thread_tracker.stopped_thread_ids:
             dbg.set_continue()
 
 
+def _use_stop_frame(dbg: CommandHandlerDebuggerLike, tid: int | None) -> None:
+    """Step *tid* from the frame it stopped at.
+
+    ``stepping_controller.current_frame`` is the frame of the most recent
+    stop, which in non-stop mode may belong to another thread.
+    """
+    frame = dbg.thread_tracker.stop_frames.get(tid) if tid is not None else None
+    if frame is not None:
+        dbg.stepping_controller.current_frame = frame
+
+
+def _step_monitoring_backend(dbg: CommandHandlerDebuggerLike, tid: int | None, mode: str) -> None:
+    """Hand the step to an installed sys.monitoring backend, if any.
+
+    The backend arms ``LINE`` / ``PY_RETURN`` on the stepped code object
+    only, and only *tid* stops in it.  Passing the stop frame keeps a
+    recursive call of the same function from ending a step over or out.
+    """
+    backend = getattr(dbg, "_sys_monitoring_backend", None)
+    if backend is None:
+        return
+    frame = dbg.stepping_controller.current_frame
+    try:
+        backend.capture_step_context(frame.f_code if frame is not None else None, tid, frame)
+        backend.set_stepping(mode)
+    except Exception:
+        _log.debug("Failed to hand the step to the tracing backend", exc_info=True)
+
+
 def handle_next_impl(
     session: DebugSession,
     arguments: Payload | None,
@@ -77,6 +121,9 @@ def handle_next_impl(
         if _thread_is_stopped and tid is not None:
             dbg.thread_tracker.stopped_thread_ids.discard(tid)
         set_dbg_stepping_flag(dbg)
+        dbg.stepping_controller.set_step_thread(tid)
+        if session.non_stop:
+            _use_stop_frame(dbg, tid)
         dbg.stepping_controller.set_granularity(granularity)
         if dbg.stepping_controller.current_frame is not None:
             if _frame_is_coroutine(dbg.stepping_controller.current_frame):
@@ -87,9 +134,11 @@ def handle_next_impl(
                 # at each bytecode instruction via user_opcode.
                 dbg.stepping_controller.current_frame.f_trace_opcodes = True
                 dbg.set_step()
+                _step_monitoring_backend(dbg, tid, "STEP_IN")
             else:
                 # LINE and STATEMENT: step over to the next source line.
                 dbg.set_next(dbg.stepping_controller.current_frame)
+                _step_monitoring_backend(dbg, tid, "STEP_OVER")
 
 
 def handle_step_in_impl(
@@ -116,6 +165,9 @@ def handle_step_in_impl(
         if _thread_is_stopped and tid is not None:
             dbg.thread_tracker.stopped_thread_ids.discard(tid)
         set_dbg_stepping_flag(dbg)
+        dbg.stepping_controller.set_step_thread(tid)
+        if session.non_stop:
+            _use_stop_frame(dbg, tid)
         dbg.stepping_controller.set_granularity(granularity)
         if dbg.stepping_controller.current_frame is not None and _frame_is_coroutine(
             dbg.stepping_controller.current_frame
@@ -126,6 +178,7 @@ def handle_step_in_impl(
             if frame is not None:
                 frame.f_trace_opcodes = True
         dbg.set_step()
+        _step_monitoring_backend(dbg, tid, "STEP_IN")
 
 
 def handle_step_out_impl(
@@ -152,9 +205,13 @@ def handle_step_out_impl(
         if _thread_is_stopped and tid is not None:
             dbg.thread_tracker.stopped_thread_ids.discard(tid)
         set_dbg_stepping_flag(dbg)
+        dbg.stepping_controller.set_step_thread(tid)
+        if session.non_stop:
+            _use_stop_frame(dbg, tid)
         dbg.stepping_controller.set_granularity(granularity)
         if dbg.stepping_controller.current_frame is not None:
             dbg.set_return(dbg.stepping_controller.current_frame)
+            _step_monitoring_backend(dbg, tid, "STEP_OUT")
 
 
 def handle_pause_impl(
@@ -163,9 +220,13 @@ def handle_pause_impl(
     get_thread_ident: GetThreadIdentFn,
     logger: Logger,
 ) -> None:
-    """Handle pause command implementation."""
-    import sys as _sys  # noqa: PLC0415
+    """Handle pause command implementation.
 
+    When the debugger arms a checkpoint on the thread's stack, the thread
+    reports its own stop once it reaches it.  A thread that has not done so
+    after ``PAUSE_REPORT_TIMEOUT`` (blocked in native code) is reported from
+    a snapshot of its stack, and still stops at the checkpoint later.
+    """
     arguments = arguments or {}
     thread_id = arguments.get("threadId")
     try:
@@ -175,16 +236,50 @@ def handle_pause_impl(
 
     dbg = session.debugger
 
+    armed = False
     try:
         pause_fn = getattr(dbg, "pause", None)
         if callable(pause_fn):
             try:
-                pause_fn(thread_id)
+                armed = pause_fn(thread_id) is True
             except Exception:
                 logger.debug("Debugger.pause(thread_id) failed", exc_info=True)
     except Exception:
         pause_fn = None
 
+    if armed:
+        InternalTimer(
+            PAUSE_REPORT_TIMEOUT,
+            _report_pending_pause,
+            args=(session, thread_id, logger),
+            name="dapper-pause-report",
+        ).start()
+        return
+
+    _report_pause_snapshot(session, thread_id, logger)
+
+
+def _report_pending_pause(session: DebugSession, thread_id: int, logger: Logger) -> None:
+    """Report a pause that has not reached its checkpoint in time."""
+    controller = getattr(session.debugger, "pause_controller", None)
+    if controller is None or not controller.mark_reported(thread_id):
+        return
+    _report_pause_snapshot(
+        session, thread_id, logger, description="Waiting for the thread to reach Python code"
+    )
+
+
+def _report_pause_snapshot(
+    session: DebugSession,
+    thread_id: int,
+    logger: Logger,
+    description: str | None = None,
+) -> None:
+    """Report *thread_id* as paused at the frame it is running right now."""
+    import sys as _sys  # noqa: PLC0415
+
+    dbg = session.debugger
+
     try:
         _current_frames = getattr(_sys, "_current_frames", dict)
         frame = _current_frames().get(thread_id)
@@ -200,18 +295,22 @@ def handle_pause_impl(
 
             if frame is not None:
                 try:
-                    stack_frames = dbg.thread_tracker.build_stack_frames(frame)
+                    stack_frames = dbg.thread_tracker.build_stack_frames(
+                        frame, max_depth=STOP_FRAME_BUDGET
+                    )
                     annotate_stack_frames_with_source_refs(stack_frames)
                     dbg.thread_tracker.frames_by_thread[thread_id] = stack_frames
                     dbg.stepping_controller.current_frame = frame
                 except Exception:
                     logger.debug("Failed to build/store stack frames for pause", exc_info=True)
 
-            session.safe_send(
-                "stopped",
-                threadId=thread_id,
-                reason="pause",
-                allThreadsStopped=True,
-            )
+            event_args: Payload = {
+                "threadId": thread_id,
+                "reason": "pause",
+                "allThreadsStopped": not session.non_stop,
+            }
+            if description:
+                event_args["description"] = description
+            session.safe_send("stopped", **event_args)
     except Exception:
         logger.exception("Error handling pause command")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 import sys
 from typing import TYPE_CHECKING
 from typing import Protocol
@@ -64,6 +65,12 @@ class FormatEvaluationErrorFn(Protocol):
 
 _FRAME_DATA_ID_PARTS = 4
 
+DEFAULT_TREE_DEPTH = 2
+DEFAULT_TREE_MAX_ITEMS = 20
+DEFAULT_TREE_MAX_BYTES = 256 * 1024
+# Approximate JSON framing (keys, quotes, braces) of one serialized variable.
+_TREE_NODE_OVERHEAD = 96
+
 
 def _supports_read_watchpoints() -> bool:
     return sys.version_info >= (3, 12) and hasattr(sys, "monitoring")
@@ -137,6 +144,79 @@ def handle_variables_impl(
     return {"success": True, "body": {"variables": variables}}
 
 
+def _ref_identity(entry: object) -> int:
+    """Identify the object behind a ``var_refs`` entry for cycle detection."""
+    if isinstance(entry, tuple) and len(entry) == VAR_REF_TUPLE_SIZE and entry[0] == "object":
+        return id(entry[1])
+    return id(entry)
+
+
+def _estimated_size(variable: Payload) -> int:
+    return _TREE_NODE_OVERHEAD + sum(len(v) for v in variable.values() if isinstance(v, str))
+
+
+def handle_variable_tree_impl(
+    session: DebugSession,
+    arguments: Payload | None,
+    resolve_variables_for_reference: ResolveVariablesForReferenceFn,
+) -> Payload:
+    """Expand a variable reference and its descendants in one response.
+
+    Children are resolved exactly like ``variables`` requests, breadth first,
+    so a byte budget that runs out keeps the shallow levels.  Expanded nodes
+    carry a ``children`` list; a node whose object is one of its own
+    ancestors is marked ``cycle`` and not expanded again.  ``truncated`` is
+    set when ``maxItems`` or ``maxBytes`` cut the tree short.
+    """
+    arguments = arguments or {}
+    root_ref = arguments.get("variablesReference")
+    depth = max(1, int(arguments.get("depth", DEFAULT_TREE_DEPTH)))
+    max_items = max(1, int(arguments.get("maxItems", DEFAULT_TREE_MAX_ITEMS)))
+    budget = int(arguments.get("maxBytes", DEFAULT_TREE_MAX_BYTES))
+
+    dbg = session.debugger
+    var_refs = getattr(getattr(dbg, "var_manager", None), "var_refs", {})
+    if not isinstance(root_ref, int) or root_ref not in var_refs:
+        return {"success": False, "message": f"Unknown variablesReference: {root_ref}"}
+
+    roots: list[Payload] = []
+    truncated = False
+    nodes = 0
+    # (reference to expand, node receiving the children or None for the root,
+    #  level of the children, identities of the ancestors)
+    pending: deque[tuple[int, Payload | None, int, frozenset[int]]] = deque(
+        [(root_ref, None, 1, frozenset({_ref_identity(var_refs[root_ref])}))]
+    )
+    while pending:
+        ref, parent, level, ancestors = pending.popleft()
+        children = resolve_variables_for_reference(dbg, var_refs[ref])
+        if len(children) > max_items:
+            truncated = True
+        out = roots if parent is None else parent.setdefault("children", [])
+        for variable in children[:max_items]:
+            size = _estimated_size(variable)
+            if size > budget:
+                truncated = True
+                pending.clear()
+                break
+            budget -= size
+            nodes += 1
+            out.append(variable)
+            child_ref = variable.get("variablesReference", 0)
+            if not child_ref or level >= depth or child_ref not in var_refs:
+                continue
+            identity = _ref_identity(var_refs[child_ref])
+            if identity in ancestors:
+                variable["cycle"] = True
+                continue
+            pending.append((child_ref, variable, level + 1, ancestors | {identity}))
+
+    return {
+        "success": True,
+        "body": {"variables": roots, "nodes": nodes, "truncated": truncated},
+    }
+
+
 def handle_set_variable_impl(
     session: DebugSession,
     arguments: Payload | None,
@@ -0,0 +1,141 @@
+"""Registry of dapper's own threads, which the debugger never traces.
+
+Dapper does its bookkeeping on background threads: the command listener
+and IPC readers, the source watcher, the telemetry timer, child-process
+reapers and output pumps.  Once tracing is installed for every thread
+(``threading.settrace``, dormant activation, live attach) or
+``sys.monitoring`` callbacks are registered, those threads would
+otherwise be traced, and slowed down, by the debugger they serve.
+
+Threads created as :class:`InternalThread` (or :class:`InternalTimer`)
+are classified as internal:
+
+- they clear their own trace function before running their target, and
+  :func:`user_thread_trace` keeps ``threading.settrace`` hooks from
+  installing one;
+- ``sys.monitoring`` callbacks, which cannot be scoped to threads, and the
+  bdb ``call`` event test the thread ident against the registry first and
+  turn internal threads away before any debugger work is done.
+
+:class:`ThreadEventCounts` counts the events that were turned away, so
+overhead attributed to internal threads can be checked to be zero.  Events
+from user threads are not counted: they pay only the membership test.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType
+
+    TraceFunction = Callable[[FrameType, str, Any], Any]
+
+_get_ident = threading.get_ident
+
+# Idents of running internal threads, mapped to their names.  Membership
+# tests are the hot-path gate, done inline by the tracers, so this is a
+# plain dict mutated only by the threads themselves.
+_internal_idents: dict[int, str] = {}
+
+
+class InternalThread(threading.Thread):
+    """A thread started by dapper itself; it is never traced or monitored."""
+
+    def run(self) -> None:
+        ident = _get_ident()
+        _internal_idents[ident] = self.name
+        sys.settrace(None)
+        try:
+            super().run()
+        finally:
+            _internal_idents.pop(ident, None)
+
+
+class InternalTimer(InternalThread, threading.Timer):
+    """:class:`threading.Timer` running on an internal thread."""
+
+    def __init__(
+        self,
+        interval: float,
+        function: Callable[..., object],
+        args: Any = None,
+        kwargs: Any = None,
+        *,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(interval, function, args=args, kwargs=kwargs)
+        if name is not None:
+            self.name = name
+
+
+def is_internal_thread(ident: int | None = None) -> bool:
+    """Return whether *ident* (default: the current thread) is dapper's own."""
+    if ident is None:
+        return isinstance(threading.current_thread(), InternalThread)
+    return ident in _internal_idents
+
+
+def internal_thread_idents() -> frozenset[int]:
+    """Return the idents of the internal threads that are running."""
+    return frozenset(_internal_idents)
+
+
+def user_thread_trace(trace_fn: TraceFunction) -> TraceFunction:
+    """Wrap *trace_fn* for ``threading.settrace`` so internal threads skip it.
+
+    The wrapper runs once per thread, on its first traced call: internal
+    threads get no trace function at all, other threads get *trace_fn*
+    itself for the rest of their life.
+    """
+
+    def install(frame: FrameType, event: str, arg: Any) -> Any:
+        if is_internal_thread():
+            sys.settrace(None)
+            return None
+        sys.settrace(trace_fn)
+        return trace_fn(frame, event, arg)
+
+    return install
+
+
+class ThreadEventCounts:
+    """Trace / monitoring events turned away from dapper's own threads.
+
+    Tracers test ``ident in _internal_idents`` inline and call :meth:`gate`
+    only on a hit, so events from user threads are never counted.  Counts
+    are kept by thread name (dapper names its threads after their role):
+    they do not grow with thread churn and a recycled ident is not mixed
+    up with the thread that had it before.
+    """
+
+    __slots__ = ("gated",)
+
+    def __init__(self) -> None:
+        self.gated: dict[str, int] = {}
+
+    def gate(self, ident: int) -> None:
+        """Count one event turned away from internal thread *ident*."""
+        name = _internal_idents.get(ident, "?")
+        self.gated[name] = self.gated.get(name, 0) + 1
+
+    def breakdown(self) -> dict[str, int]:
+        """Return the turned-away event counts by thread name."""
+        return dict(self.gated)
+
+    def clear(self) -> None:
+        self.gated.clear()
+
+
+__all__ = [
+    "InternalThread",
+    "InternalTimer",
+    "ThreadEventCounts",
+    "internal_thread_idents",
+    "is_internal_thread",
+    "user_thread_trace",
+]
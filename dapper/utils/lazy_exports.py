@@ -0,0 +1,48 @@
+"""PEP 562 lazy re-exports for package ``__init__`` modules.
+
+Package ``__init__`` modules re-export their public classes for convenience,
+but importing one submodule (``dapper.core.debugger_bdb``) runs the package
+``__init__`` first.  Eager re-exports there would pull every sibling module
+into processes that need only one of them, most notably the debuggee
+launcher.  :func:`lazy_exports` builds module-level ``__getattr__`` and
+``__dir__`` functions that import each exported name on first access::
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"Name": "pkg.module"})
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` resolving *exports* on demand.
+
+    *exports* maps each public name to the module defining it.  A resolved
+    name is stored in the package namespace, so later lookups bypass
+    ``__getattr__`` entirely.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module_name = exports.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,89 @@
+"""Benchmark call-heavy code under the eval-frame hook versus no debugger.
+
+Runs a recursive ``fib`` and a loop of small method calls with no hook
+installed, then with the compiled eval-frame hook installed.  While the
+hook is installed every call first checks the decision cached in the code
+object's ``co_extra`` slot; code without breakpoint lines is handed straight
+back to the default evaluator, so the hooked timings should stay close to
+the baseline.  A breakpoint is set in an unrelated file before the hooked
+runs so the breakpoint lookup is not trivially empty.
+
+Usage::
+
+    python -m scripts.bench_eval_frame_fast_path --fib 25 --calls 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from dapper._frame_eval import _frame_evaluator
+from dapper._frame_eval import cache_manager
+
+
+def fib(n: int) -> int:
+    return n if n <= 1 else fib(n - 1) + fib(n - 2)
+
+
+class Point:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+    def shifted(self, dx: int) -> Point:
+        return Point(self.x + dx)
+
+
+def method_calls(count: int) -> int:
+    point = Point(0)
+    for _ in range(count):
+        point = point.shifted(1)
+    return point.x
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fib", type=int, default=25)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not _frame_evaluator.get_frame_eval_capabilities().get("supports_eval_frame_hook"):
+        sys.exit("the compiled eval-frame hook is not available in this runtime")
+
+    workloads = [
+        (f"fib({args.fib})", fib, args.fib),
+        (f"{args.calls} method calls", method_calls, args.calls),
+    ]
+    baseline = {name: best_of(args.repeat, fn, arg) for name, fn, arg in workloads}
+
+    cache_manager.set_breakpoints("/nonexistent/bench_target.py", {1})
+    if not _frame_evaluator.install_eval_frame_hook():
+        sys.exit("failed to install the eval-frame hook")
+    try:
+        hooked = {name: best_of(args.repeat, fn, arg) for name, fn, arg in workloads}
+        stats = _frame_evaluator._state.get_stats()  # noqa: SLF001
+    finally:
+        _frame_evaluator.uninstall_eval_frame_hook()
+
+    for name, _fn, _arg in workloads:
+        ratio = hooked[name] / baseline[name]
+        print(
+            f"{name:<24} no debugger {baseline[name] * 1000:>9.1f} ms"
+            f"  hook {hooked[name] * 1000:>9.1f} ms  ({ratio:.2f}x)"
+        )
+    print(f"slow-path decisions while hooked: {stats['slow_path_attempts']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark "is this exception handled here?" lookups on deep stacks.
+
+Generates a large module whose functions call each other in a chain, raises
+at the bottom and asks :func:`dapper.core.debug_helpers.frame_may_handle_exception`
+about every frame the exception propagated through - the work the
+``uncaught`` exception filter does on the settrace path.
+
+``cold`` clears the handler-coverage caches before every lookup (the cost
+before they existed); ``warm`` reuses them.
+
+Usage::
+
+    python -m scripts.bench_exception_handler_lookup --functions 500 --depth 50
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import tempfile
+import time
+import types
+
+from dapper.core import debug_helpers
+
+
+def build_module(functions: int) -> str:
+    """Return source for a module of *functions* chained callers with try blocks."""
+    parts = ["def f0(n):\n    raise ValueError(n)\n"]
+    parts.extend(
+        (
+            f"def f{i}(n):\n"
+            "    total = 0\n"
+            "    for j in range(3):\n"
+            "        total += j\n"
+            "    if n % 7 == 0:\n"
+            "        try:\n"
+            "            total -= 1\n"
+            "        except KeyError:\n"
+            "            pass\n"
+            f"    return f{i - 1}(n) + total\n"
+        )
+        for i in range(1, functions)
+    )
+    return "\n".join(parts)
+
+
+def collect_frames(module: types.ModuleType, depth: int) -> list[types.FrameType]:
+    entry = getattr(module, f"f{depth}")
+    try:
+        entry(depth)
+    except ValueError as exc:
+        frames = []
+        tb = exc.__traceback__
+        while tb is not None:
+            frames.append(tb.tb_frame)
+            tb = tb.tb_next
+        return frames
+    msg = "benchmark chain did not raise"
+    raise RuntimeError(msg)
+
+
+def run(frames: list[types.FrameType], iterations: int, *, cold: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for frame in frames:
+            if cold:
+                debug_helpers.clear_handler_coverage_caches()
+            debug_helpers.frame_may_handle_exception(frame)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=1)
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth * 4))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench_deep_module.py"
+        path.write_text(build_module(args.functions), encoding="utf-8")
+        module = types.ModuleType("bench_deep_module")
+        module.__file__ = str(path)
+        exec(compile(path.read_text(encoding="utf-8"), str(path), "exec"), module.__dict__)
+        frames = collect_frames(module, min(args.depth, args.functions - 1))
+
+        lookups = len(frames) * args.iterations
+        print(f"{args.functions} functions, {len(frames)} frames, {args.iterations} propagations")
+        for label, cold in (("cold", True), ("warm", False)):
+            elapsed = run(frames, args.iterations, cold=cold)
+            print(f"{label:<6}{elapsed * 1e6 / lookups:>10.2f} us/frame{elapsed:>10.3f} s total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark reloading many edited modules: one-by-one versus one batch.
+
+Generates a package of modules that import functions from each other, edits
+all of them and reloads them with :func:`dapper.shared.reload_helpers.perform_reload`
+(one call per file, each walking every live frame) and with
+:func:`dapper.shared.reload_helpers.perform_batch_reload` (one frame walk and
+one referrer scan for the whole batch).
+
+Usage::
+
+    python -m scripts.bench_hot_reload_batch --modules 100 --functions 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from dapper.shared import reload_helpers
+
+
+def build_module(index: int, functions: int, version: int) -> str:
+    """Return source for module *index*; it imports ``f0`` from its predecessor."""
+    lines = [f"from bench_reload_{index - 1} import f0 as upstream\n"] if index else []
+    lines.extend(f"def f{i}(x):\n    return x + {version}\n\n" for i in range(functions))
+    lines.append("REGISTRY = {name: fn for name, fn in globals().items() if callable(fn)}\n")
+    return "".join(lines)
+
+
+def write_all(root: Path, modules: int, functions: int, version: int) -> list[str]:
+    paths = []
+    for index in range(modules):
+        path = root / f"bench_reload_{index}.py"
+        path.write_text(build_module(index, functions, version), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=100)
+    parser.add_argument("--functions", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        sys.path.insert(0, tmp)
+        paths = write_all(root, args.modules, args.functions, 0)
+        for index in range(args.modules):
+            importlib.import_module(f"bench_reload_{index}")
+
+        options = {"invalidatePycache": False}
+        write_all(root, args.modules, args.functions, 1)
+        start = time.perf_counter()
+        for path in paths:
+            reload_helpers.perform_reload(path, options)  # type: ignore[arg-type]
+        single = time.perf_counter() - start
+
+        write_all(root, args.modules, args.functions, 2)
+        result = reload_helpers.perform_batch_reload(paths, options)  # type: ignore[arg-type]
+
+        print(f"{args.modules} modules x {args.functions} functions")
+        print(f"one-by-one {single * 1000:>10.1f} ms")
+        print(
+            f"batch      {result['durationMs']:>10.1f} ms"
+            f"  ({result['patchedReferrers']} referrers patched)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare IPC payload encodings on large ``variables`` responses.
+
+Measures messages/s and payload bytes/s for a full encode → frame →
+socket write → read → decode round trip, once per payload encoding.
+
+Usage::
+
+    python -m scripts.bench_ipc_encoding --variables 2000 --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import threading
+import time
+from typing import Any
+
+from dapper.ipc.ipc_binary import ENCODING_JSON
+from dapper.ipc.ipc_binary import ENCODING_MARSHAL
+from dapper.ipc.ipc_binary import HEADER_SIZE
+from dapper.ipc.ipc_binary import KIND_EVENT
+from dapper.ipc.ipc_binary import decode_message
+from dapper.ipc.ipc_binary import encode_frame_parts
+from dapper.ipc.ipc_binary import read_exact
+from dapper.ipc.ipc_binary import unpack_frame_header
+
+ENCODINGS = {"json": ENCODING_JSON, "marshal": ENCODING_MARSHAL}
+
+
+def build_variables_response(count: int) -> dict[str, Any]:
+    """Return a DAP ``variables`` response with *count* entries."""
+    return {
+        "event": "response",
+        "id": 1,
+        "success": True,
+        "body": {
+            "variables": [
+                {
+                    "name": f"item_{i}",
+                    "value": repr({"index": i, "label": f"value-{i}", "ratio": i / 7}),
+                    "type": "dict",
+                    "evaluateName": f"items[{i}]",
+                    "variablesReference": i + 1000,
+                    "presentationHint": {"kind": "data", "attributes": []},
+                }
+                for i in range(count)
+            ]
+        },
+    }
+
+
+def run(message: dict[str, Any], encoding: int, iterations: int) -> tuple[float, int]:
+    """Send *message* ``iterations`` times; return ``(seconds, payload_bytes)``."""
+    left, right = socket.socketpair()
+    total_bytes = 0
+
+    def _reader() -> None:
+        rfile = right.makefile("rb")
+        for _ in range(iterations):
+            _kind, enc, length = unpack_frame_header(read_exact(rfile, HEADER_SIZE))
+            decode_message(read_exact(rfile, length), enc)
+
+    thread = threading.Thread(target=_reader)
+    start = time.perf_counter()
+    thread.start()
+    try:
+        for _ in range(iterations):
+            parts = encode_frame_parts(KIND_EVENT, message, encoding)
+            sent = left.sendmsg(parts)
+            if sent < len(parts[0]) + len(parts[1]):
+                left.sendall(memoryview(b"".join(parts))[sent:])
+            total_bytes += len(parts[1])
+        thread.join()
+    finally:
+        left.close()
+        right.close()
+    return time.perf_counter() - start, total_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variables", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    message = build_variables_response(args.variables)
+    print(f"{args.variables} variables x {args.iterations} messages")
+    print(f"{'encoding':<10}{'msg/s':>12}{'MB/s':>12}{'bytes/msg':>12}")
+    for name, encoding in ENCODINGS.items():
+        elapsed, total_bytes = run(message, encoding, args.iterations)
+        print(
+            f"{name:<10}{args.iterations / elapsed:>12.1f}"
+            f"{total_bytes / elapsed / 1e6:>12.2f}{total_bytes // args.iterations:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark background-thread throughput while another thread is stepped.
+
+One thread is stepped line by line for the whole run (every stop resumes
+with another step after ``--pause`` seconds), while worker threads spin on
+a small loop under the same trace function.  Four runs are compared:
+
+- ``no debugger``: nothing is traced.
+- ``traced, idle``: everything is traced but nobody steps; the floor for
+  a traced worker.
+- ``process-wide``: the step is not confined to a thread, the old
+  behavior.  Each worker runs into the step on its first traced line and
+  trips the spurious-stop guard, whose ``set_continue`` drops the worker's
+  trace function (so it runs fast afterwards) but also cancels the step
+  the stepping thread was in the middle of.
+- ``thread-scoped``: the step is confined to the stepping thread.  The
+  workers' frames are rejected by the first check in ``stop_here``, so
+  they keep running at the ``traced, idle`` rate and never touch the
+  step.
+
+With CPU-bound workers the stepping thread mostly waits for the GIL, so
+expect only tens of stops per second in every mode.
+
+Usage::
+
+    python -m scripts.bench_step_storm --workers 4 --seconds 2 --pause 0.001
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+
+from dapper.core.debugger_bdb import DebuggerBDB
+
+
+def spin(done: threading.Event, loops: list[int], slot: int) -> None:
+    count = 0
+    while not done.is_set():
+        total = 0
+        for i in range(50):
+            total += i
+        count += 1
+    loops[slot] = count
+
+
+def stepped(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+
+def storm(done: threading.Event, pause: float, idle: bool) -> None:
+    while not done.is_set():
+        stepped(20)
+        if idle:
+            time.sleep(pause)
+
+
+def run(workers: int, seconds: float, pause: float, mode: str) -> tuple[int, int, int]:
+    """Return (worker loops, stepping-thread stops, worker stops) for *mode*."""
+    stops: list[int] = []
+    dbg = DebuggerBDB(just_my_code=False)
+
+    def process_commands() -> None:
+        stops.append(threading.get_ident())
+        time.sleep(pause)
+        dbg.stepping_controller.set_stepping()
+        dbg.set_step()
+
+    dbg.process_commands = process_commands
+    done = threading.Event()
+    ready = threading.Event()
+    loops = [0] * workers
+    traced = mode != "no debugger"
+
+    def stepping_thread() -> None:
+        if mode == "thread-scoped":
+            dbg.stepping_controller.set_step_thread(threading.get_ident())
+        if mode != "traced, idle":
+            dbg.stepping_controller.set_stepping()
+            dbg.set_step()
+        ready.set()
+        if traced:
+            sys.settrace(dbg.trace_dispatch)
+        try:
+            storm(done, pause, idle=mode == "traced, idle")
+        finally:
+            sys.settrace(None)
+
+    dbg.reset()
+    stepper = threading.Thread(target=stepping_thread)
+    stepper.start()
+    ready.wait()
+    if traced:
+        threading.settrace(dbg.trace_dispatch)
+    try:
+        threads = [threading.Thread(target=spin, args=(done, loops, i)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+    finally:
+        threading.settrace(None)  # type: ignore[arg-type]
+    time.sleep(seconds)
+    done.set()
+    for thread in [*threads, stepper]:
+        thread.join()
+    own = stops.count(stepper.ident)  # type: ignore[arg-type]
+    return sum(loops), own, len(stops) - own
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="seconds each stop waits before stepping again"
+    )
+    args = parser.parse_args()
+
+    results = {
+        mode: run(args.workers, args.seconds, args.pause, mode)
+        for mode in ("no debugger", "traced, idle", "process-wide", "thread-scoped")
+    }
+    baseline = results["no debugger"][0] or 1
+    for mode, (loops, own, foreign) in results.items():
+        rate = loops / args.seconds
+        print(
+            f"{mode:<14} worker loops/s {rate:>12,.0f}  ({loops / baseline:6.1%})"
+            f"  stepping-thread stops {own:>7,}  worker stops {foreign:>7,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,7 @@ class TestFrameEvalConfig:
             "performance_monitoring": True,
             "fallback_on_error": True,
             "eager_instrumentation": False,
+            "inline_conditions": False,
         }
 
         # Assert
@@ -80,6 +81,7 @@ class TestFrameEvalConfig:
             "performance_monitoring": True,
             "fallback_on_error": True,
             "eager_instrumentation": False,
+            "inline_conditions": False,
         }
 
         for key, expected_value in expected_defaults.items():
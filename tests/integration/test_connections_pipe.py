@@ -39,6 +39,10 @@ class DummyWriter:
         # accept bytes or memoryview
         self.buffer.extend(data)
 
+    def writelines(self, parts):
+        for part in parts:
+            self.write(part)
+
     async def drain(self):
         self._drained += 1
 
@@ -70,6 +74,10 @@ class DummyPipeFile:
         # emulate binary write
         self._buf.extend(data)
 
+    def writelines(self, parts):
+        for part in parts:
+            self.write(part)
+
     def flush(self):
         # no-op for tests
         return None
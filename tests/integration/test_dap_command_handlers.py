@@ -22,6 +22,7 @@ from dapper.shared import lifecycle_handlers
 from dapper.shared import source_handlers
 from dapper.shared import stepping_handlers
 from dapper.shared import variable_handlers
+from dapper.shared.loaded_module_registry import LoadedModuleRegistry
 from dapper.shared.value_conversion import convert_value_with_context
 from tests.dummy_debugger import DummyDebugger
 
@@ -390,6 +391,49 @@ def test_agent_snapshot_returns_selected_thread_id(monkeypatch):
     assert body["locals"] == {"value": "42"}
 
 
+def test_agent_snapshot_since_checkpoint_sends_only_changes(monkeypatch):
+    session, dbg = _active_session_with_debugger(DummyDebugger())
+    tid = 7
+    outer = SimpleNamespace(f_locals={}, f_globals={})
+    top = SimpleNamespace(f_locals={"i": 0, "total": 0}, f_globals={})
+
+    dbg.threads = {tid: object()}
+    dbg.stopped_thread_ids = {tid}
+    dbg.frames_by_thread = {
+        tid: [
+            {"id": 2, "name": "loop", "line": 4, "source": {"path": "/tmp/app.py"}},
+            {"id": 1, "name": "main", "line": 9, "source": {"path": "/tmp/app.py"}},
+        ]
+    }
+    dbg.frame_id_to_frame = {1: outer, 2: top}
+
+    responses: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        session, "safe_send_response", lambda **payload: responses.append(payload) or True
+    )
+
+    dch._cmd_agent_snapshot({"threadId": tid, "justMyCode": False})
+    first = responses[-1]["body"]
+    assert first["delta"] is False
+    assert [f["frameKey"] for f in first["callStack"]] == [id(top), id(outer)]
+
+    # Step: same frames, the loop moved one line and one local changed.
+    dbg.frames_by_thread[tid][0]["line"] = 5
+    top.f_locals["i"] = 1
+    dch._cmd_agent_snapshot(
+        {"threadId": tid, "justMyCode": False, "sinceCheckpoint": first["checkpoint"]}
+    )
+    delta = responses[-1]["body"]
+
+    assert delta["delta"] is True
+    assert delta["baseCheckpoint"] == first["checkpoint"]
+    assert delta["checkpoint"] > first["checkpoint"]
+    assert delta["frameOrder"] == [id(top), id(outer)]
+    assert [f["name"] for f in delta["callStack"]] == ["loop"]
+    assert delta["locals"] == {"i": "1"}
+    assert delta["removedLocals"] == []
+
+
 def test_handle_pause_emits_stopped_and_marks_thread(monkeypatch):
     session, dbg = _active_session_with_debugger(DummyDebugger())
     tid = 12345
@@ -542,15 +586,16 @@ def test_collect_module_and_linecache_and_handle_source(monkeypatch, tmp_path):
     m.__package__ = "mymodpkg"
     sys.modules["__test_mymod__"] = m
 
-    seen = set()
-    sources = source_handlers._collect_module_sources(seen)
-    assert any(s.get("path") and s.get("origin") for s in sources)
+    registry = LoadedModuleRegistry()
+    registry.refresh()
+    assert any(s["origin"] == "module:mymodpkg" for s in registry.sources())
 
     # linecache: ensure cache has the file name
-    linecache.cache[str(p)] = (1, None, [], str(p))
-    seen2 = set()
-    line_sources = source_handlers._collect_linecache_sources(seen2)
-    assert any(s.get("path") for s in line_sources)
+    other = tmp_path / "cached.py"
+    other.write_text("# cached\n")
+    linecache.cache[str(other)] = (1, None, [], str(other))
+    registry.refresh()
+    assert any(s["origin"] == "linecache" for s in registry.sources())
 
     # handle_source by path
     def get_source_content_by_path(_path):
@@ -303,3 +303,78 @@ def test_handle_restart_ignores_non_alive_command_thread(use_debug_session):
     assert command_thread.join_called is False
     assert s.command_thread is None
     assert exec_calls == [(sys.executable, [sys.executable])]
+
+
+class _Node:
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.child: _Node | None = None
+
+
+def _tree_from(session: debug_shared.DebugSession, value: object, **arguments):
+    dbg = session.debugger
+    ref = dbg.var_manager.allocate_ref(value)
+    return variable_handlers.handle_variable_tree_impl(
+        session,
+        {"variablesReference": ref, **arguments},
+        handlers._resolve_variables_for_reference,
+    )
+
+
+def test_variable_tree_expands_nested_values_in_one_call(use_debug_session):
+    s, _dbg = _session_with_debugger(use_debug_session, DummyDebugger())
+    value = {"numbers": [1, 2], "nested": {"inner": {"x": 1}}}
+
+    res = _tree_from(s, value, depth=3)
+
+    assert res["success"] is True
+    top = {v["name"]: v for v in res["body"]["variables"]}
+    assert [c["value"] for c in top["numbers"]["children"]] == ["1", "2"]
+    inner = top["nested"]["children"][0]
+    assert inner["name"] == "inner"
+    assert [c["name"] for c in inner["children"]] == ["x"]
+    assert res["body"]["truncated"] is False
+
+
+def test_variable_tree_respects_depth(use_debug_session):
+    s, _dbg = _session_with_debugger(use_debug_session, DummyDebugger())
+
+    res = _tree_from(s, {"nested": {"inner": {"x": 1}}}, depth=1)
+
+    (nested,) = res["body"]["variables"]
+    assert "children" not in nested
+    assert nested["variablesReference"]
+
+
+def test_variable_tree_marks_cycles(use_debug_session):
+    s, _dbg = _session_with_debugger(use_debug_session, DummyDebugger())
+    node = _Node("a")
+    node.child = node
+
+    res = _tree_from(s, node, depth=5)
+
+    child = next(v for v in res["body"]["variables"] if v["name"] == "child")
+    assert child["cycle"] is True
+    assert "children" not in child
+
+
+def test_variable_tree_caps_items_and_bytes(use_debug_session):
+    s, _dbg = _session_with_debugger(use_debug_session, DummyDebugger())
+
+    by_items = _tree_from(s, list(range(50)), maxItems=10)
+    by_bytes = _tree_from(s, ["x" * 100] * 50, maxBytes=1000)
+
+    assert len(by_items["body"]["variables"]) == 10
+    assert by_items["body"]["truncated"] is True
+    assert 0 < by_bytes["body"]["nodes"] < 50
+    assert by_bytes["body"]["truncated"] is True
+
+
+def test_variable_tree_unknown_reference(use_debug_session):
+    s, _dbg = _session_with_debugger(use_debug_session, DummyDebugger())
+
+    res = variable_handlers.handle_variable_tree_impl(
+        s, {"variablesReference": 999}, handlers._resolve_variables_for_reference
+    )
+
+    assert res["success"] is False
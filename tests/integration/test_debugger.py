@@ -684,6 +684,35 @@ async def test_get_stack_trace(debugger):
     assert result["totalFrames"] == 2
 
 
+@pytest.mark.asyncio
+async def test_stack_trace_event_caches_only_whole_stacks(debugger):
+    """A page of a deeper stack is not served later as the whole stack."""
+    frames = [{"id": i, "name": f"fn{i}", "line": i, "column": 1} for i in range(100)]
+    await debugger.handle_debug_message(
+        {
+            "event": "stackTrace",
+            "threadId": 1,
+            "stackFrames": frames[:3],
+            "startFrame": 0,
+            "totalFrames": 3,
+        }
+    )
+    result = await debugger.get_stack_trace(thread_id=1, start_frame=1, levels=1)
+    assert result == {"stackFrames": [frames[1]], "totalFrames": 3}
+
+    await debugger.handle_debug_message(
+        {
+            "event": "stackTrace",
+            "threadId": 1,
+            "stackFrames": frames[40:60],
+            "startFrame": 40,
+            "totalFrames": 100,
+        }
+    )
+    result = await debugger.get_stack_trace(thread_id=1, start_frame=0, levels=20)
+    assert result == {"stackFrames": [], "totalFrames": 0}
+
+
 # ---------------------------------------------------------------------------
 # Variable Management Tests
 # ---------------------------------------------------------------------------
@@ -44,6 +44,7 @@ class TestFrameEvalConfig:
             "performance_monitoring": True,
             "fallback_on_error": True,
             "eager_instrumentation": False,
+            "inline_conditions": False,
         }
 
         assert isinstance(config["enabled"], bool)
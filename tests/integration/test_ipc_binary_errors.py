@@ -8,6 +8,7 @@ import pytest
 from dapper.ipc.ipc_binary import HEADER_SIZE
 from dapper.ipc.ipc_binary import MAGIC
 from dapper.ipc.ipc_binary import VERSION
+from dapper.ipc.ipc_binary import VERSION_COMPACT
 from dapper.ipc.ipc_binary import pack_frame
 from dapper.ipc.ipc_binary import read_exact
 from dapper.ipc.ipc_binary import unpack_header
@@ -27,7 +28,7 @@ def test_unpack_header_bad_magic():
 
 def test_unpack_header_unsupported_version():
     # construct a header with right magic but wrong version
-    header = MAGIC + bytes([VERSION + 1, 1]) + struct.pack(">I", 0)
+    header = MAGIC + bytes([VERSION_COMPACT + 1, 1]) + struct.pack(">I", 0)
     with pytest.raises(ValueError, match="unsupported version"):
         unpack_header(header)
 
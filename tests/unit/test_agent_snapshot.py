@@ -0,0 +1,125 @@
+"""Tests for agent snapshot checkpoints and delta encoding."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from dapper.shared.agent_snapshot import AgentSnapshotTracker
+from dapper.shared.agent_snapshot import fingerprint_snapshot
+
+
+def _snapshot(**overrides: Any) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "stopReason": "step",
+        "threadId": 1,
+        "location": "/app.py:5 in loop",
+        "callStack": [
+            {"name": "loop", "file": "/app.py", "line": 5, "frameKey": 20},
+            {"name": "main", "file": "/app.py", "line": 30, "frameKey": 10},
+        ],
+        "locals": {"i": "0", "total": "0"},
+        "globals": {"LIMIT": "10"},
+        "stoppedThreads": [1],
+        "runningThreads": [2],
+    }
+    body.update(overrides)
+    return body
+
+
+def _merge(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Apply *delta* to *base* the way a client would."""
+    frames = {f["frameKey"]: f for f in base["callStack"]}
+    frames.update({f["frameKey"]: f for f in delta["callStack"]})
+    merged_locals = {k: v for k, v in base["locals"].items() if k not in delta["removedLocals"]}
+    merged_locals.update(delta["locals"])
+    return {
+        "callStack": [frames[key] for key in delta["frameOrder"]],
+        "locals": merged_locals,
+        "threads": sorted(
+            (
+                set(base["stoppedThreads"])
+                | set(base["runningThreads"])
+                | set(delta["threadsAdded"])
+            )
+            - set(delta["threadsRemoved"])
+        ),
+    }
+
+
+class TestAgentSnapshotTracker:
+    def test_checkpoints_increase_only_when_state_changes(self) -> None:
+        tracker = AgentSnapshotTracker()
+
+        first = tracker.build_response_body(_snapshot())["checkpoint"]
+        again = tracker.build_response_body(_snapshot())["checkpoint"]
+        changed = tracker.build_response_body(_snapshot(locals={"i": "1", "total": "0"}))
+
+        assert first == again == 1
+        assert changed["checkpoint"] == 2
+        assert tracker.checkpoint == 2
+
+    def test_full_snapshot_without_known_base(self) -> None:
+        tracker = AgentSnapshotTracker()
+
+        body = tracker.build_response_body(_snapshot(), since_checkpoint=99)
+
+        assert body["delta"] is False
+        assert body["callStack"][0]["name"] == "loop"
+
+    def test_delta_contains_only_changes(self) -> None:
+        tracker = AgentSnapshotTracker()
+        base = tracker.build_response_body(_snapshot())
+
+        step = _snapshot(
+            callStack=[
+                {"name": "helper", "file": "/app.py", "line": 12, "frameKey": 30},
+                {"name": "loop", "file": "/app.py", "line": 6, "frameKey": 20},
+                {"name": "main", "file": "/app.py", "line": 30, "frameKey": 10},
+            ],
+            locals={"i": "0", "n": "3"},
+            stoppedThreads=[1],
+            runningThreads=[3],
+        )
+        delta = tracker.build_response_body(copy.deepcopy(step), base["checkpoint"])
+
+        assert delta["delta"] is True
+        assert delta["baseCheckpoint"] == base["checkpoint"]
+        assert [f["name"] for f in delta["callStack"]] == ["helper", "loop"]
+        assert delta["locals"] == {"n": "3"}
+        assert delta["removedLocals"] == ["total"]
+        assert delta["globals"] == {}
+        assert delta["threadsAdded"] == [3]
+        assert delta["threadsRemoved"] == [2]
+
+        merged = _merge(base, delta)
+        assert merged["callStack"] == step["callStack"]
+        assert merged["locals"] == step["locals"]
+        assert merged["threads"] == [1, 3]
+
+    def test_unchanged_state_yields_empty_delta(self) -> None:
+        tracker = AgentSnapshotTracker()
+        base = tracker.build_response_body(_snapshot())
+
+        delta = tracker.build_response_body(_snapshot(), base["checkpoint"])
+
+        assert delta["checkpoint"] == base["checkpoint"]
+        assert delta["callStack"] == []
+        assert delta["locals"] == {}
+        assert delta["threadsAdded"] == delta["threadsRemoved"] == []
+
+    def test_other_thread_gets_full_snapshot(self) -> None:
+        tracker = AgentSnapshotTracker()
+        base = tracker.build_response_body(_snapshot())
+
+        body = tracker.build_response_body(_snapshot(threadId=2), base["checkpoint"])
+
+        assert body["delta"] is False
+
+    def test_old_checkpoints_are_forgotten(self) -> None:
+        tracker = AgentSnapshotTracker(history=2)
+        for i in range(4):
+            tracker.build_response_body(_snapshot(locals={"i": str(i)}))
+
+        assert tracker.get(1) is None
+        assert tracker.get(4) == fingerprint_snapshot(_snapshot(locals={"i": "3"}))
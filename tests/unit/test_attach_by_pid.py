@@ -108,7 +108,7 @@ def test_bootstrap_from_remote_exec_starts_background_thread(
         def start(self) -> None:
             started.append({"started": True})
 
-    monkeypatch.setattr(mod.threading, "Thread", FakeThread)
+    monkeypatch.setattr(mod, "InternalThread", FakeThread)
     payload_json = json.dumps(
         {
             "processId": 5,
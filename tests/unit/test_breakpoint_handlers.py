@@ -6,6 +6,7 @@ from typing import Any
 from typing import cast
 from unittest.mock import MagicMock
 
+from dapper.shared.breakpoint_handlers import handle_set_breakpoints_batch_impl
 from dapper.shared.breakpoint_handlers import handle_set_breakpoints_impl
 from dapper.shared.breakpoint_handlers import handle_set_exception_breakpoints_impl
 from dapper.shared.breakpoint_handlers import handle_set_function_breakpoints_impl
@@ -189,6 +190,21 @@ class TestHandleSetBreakpointsImpl:
         assert result is not None
         assert result["body"]["breakpoints"] == []
 
+    def test_verified_lines_synced_to_tracing_backend(self) -> None:
+        # Same backend state whether the request arrived alone or in a batch.
+        dbg = _make_dbg()
+        dbg.set_break.side_effect = [None, "Line /app/main.py:99 does not exist"]
+        backend = MagicMock(spec=["update_breakpoints_batch"])
+        dbg._sys_monitoring_backend = backend
+        session = _make_session(dbg)
+
+        handle_set_breakpoints_impl(
+            session,
+            {"source": {"path": "/app/main.py"}, "breakpoints": [{"line": 3}, {"line": 99}]},
+        )
+
+        backend.update_breakpoints_batch.assert_called_once_with({"/app/main.py": {3}})
+
     def test_arguments_none_treated_as_empty(self) -> None:
         session = _make_session()
         result = handle_set_breakpoints_impl(
@@ -198,6 +214,67 @@ class TestHandleSetBreakpointsImpl:
         assert result is None
 
 
+class TestHandleSetBreakpointsBatchImpl:
+    def test_no_dbg_returns_none(self) -> None:
+        session = _make_session()
+        assert handle_set_breakpoints_batch_impl(session, {"files": []}) is None
+
+    def test_applies_every_file_and_returns_results_in_order(self) -> None:
+        dbg = _make_dbg(set_break_result=None)
+        dbg.set_break.side_effect = lambda path, line, cond=None: (
+            "Line does not exist" if line == 99 else None
+        )
+        session = _make_session(dbg)
+
+        result = handle_set_breakpoints_batch_impl(
+            session,
+            {
+                "files": [
+                    {"source": {"path": "/app/a.py"}, "breakpoints": [{"line": 1}]},
+                    {"source": {}, "breakpoints": [{"line": 2}]},
+                    {
+                        "source": {"path": "/app/b.py"},
+                        "breakpoints": [{"line": 3}, {"line": 99}],
+                    },
+                ]
+            },
+        )
+
+        assert result is not None
+        files = result["body"]["files"]
+        assert files[0]["breakpoints"] == [{"verified": True, "line": 1}]
+        assert files[1]["breakpoints"] == []
+        assert files[2]["breakpoints"] == [
+            {"verified": True, "line": 3},
+            {"verified": False, "line": 99},
+        ]
+        assert [c.args[0] for c in dbg.clear_breaks_for_file.call_args_list] == [
+            "/app/a.py",
+            "/app/b.py",
+        ]
+
+    def test_tracing_backend_refreshed_once_for_whole_batch(self) -> None:
+        dbg = _make_dbg(set_break_result=None)
+        backend = MagicMock()
+        dbg._sys_monitoring_backend = backend
+        session = _make_session(dbg)
+
+        handle_set_breakpoints_batch_impl(
+            session,
+            {
+                "files": [
+                    {"source": {"path": "/app/a.py"}, "breakpoints": [{"line": 1}]},
+                    {"source": {"path": "/app/b.py"}, "breakpoints": []},
+                ]
+            },
+        )
+
+        backend.update_breakpoints_batch.assert_called_once_with(
+            {"/app/a.py": {1}, "/app/b.py": set()}
+        )
+        backend.update_breakpoints.assert_not_called()
+
+
 class TestHandleSetFunctionBreakpointsImpl:
     def test_no_dbg_returns_none(self) -> None:
         session = _make_session()
@@ -225,6 +302,16 @@ class TestHandleSetFunctionBreakpointsImpl:
         handle_set_function_breakpoints_impl(session, {"breakpoints": [{"name": "fn"}]})
         dbg.clear_all_function_breakpoints.assert_called_once()
 
+    def test_syncs_names_to_tracing_backend(self) -> None:
+        dbg = _make_dbg()
+        backend = MagicMock()
+        dbg._sys_monitoring_backend = backend
+        session = _make_session(dbg)
+        handle_set_function_breakpoints_impl(
+            session, {"breakpoints": [{"name": "fn1"}, {"name": "mod.fn2"}]}
+        )
+        backend.update_function_breakpoints.assert_called_once_with({"fn1", "mod.fn2"})
+
     def test_multiple_function_breakpoints(self) -> None:
         dbg = _make_dbg()
         session = _make_session(dbg)
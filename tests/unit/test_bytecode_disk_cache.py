@@ -0,0 +1,127 @@
+"""Tests for the persistent on-disk instrumented-bytecode cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dapper._frame_eval import modify_bytecode as mb
+from dapper._frame_eval._bytecode_disk_cache import CACHE_DIR_ENV_VAR
+from dapper._frame_eval._bytecode_disk_cache import BytecodeDiskCache
+from dapper._frame_eval._bytecode_disk_cache import cache_dir_from_environment
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import CodeType
+
+_SOURCE = "def f():\n    a = 1\n    b = 2\n    return a + b\n"
+
+
+def _code_from_file(path: Path, source: str = _SOURCE) -> CodeType:
+    path.write_text(source)
+    namespace: dict[str, object] = {}
+    exec(compile(source, str(path), "exec"), namespace)
+    return namespace["f"].__code__  # type: ignore[attr-defined]
+
+
+def _entries(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.glob("*/*.dbc"))
+
+
+def test_store_then_load_round_trips_across_instances(tmp_path):
+    code = _code_from_file(tmp_path / "mod.py")
+    lines = {code.co_firstlineno + 1}
+    ok, modified = mb.BytecodeModifier().inject_breakpoints(code, lines)
+    assert ok
+
+    writer = BytecodeDiskCache(tmp_path / "cache", meta_version=1)
+    assert writer.store(code, lines, modified)
+
+    # a fresh instance models a new debug session
+    reader = BytecodeDiskCache(tmp_path / "cache", meta_version=1)
+    loaded = reader.load(code, lines)
+    assert loaded is not None
+    assert loaded.co_code == modified.co_code
+    assert reader.get_stats()["hits"] == 1
+    assert reader.load(code, {code.co_firstlineno + 2}) is None
+    assert reader.get_stats()["misses"] == 1
+
+
+def test_source_change_and_meta_version_change_miss(tmp_path):
+    path = tmp_path / "mod.py"
+    code = _code_from_file(path)
+    lines = {code.co_firstlineno + 1}
+    cache = BytecodeDiskCache(tmp_path / "cache", meta_version=1)
+    assert cache.store(code, lines, code)
+
+    assert BytecodeDiskCache(tmp_path / "cache", meta_version=2).load(code, lines) is None
+
+    edited = _code_from_file(path, _SOURCE.replace("b = 2", "b = 3  # edited"))
+    assert cache.load(edited, lines) is None
+
+
+def test_corrupt_or_mismatched_entry_is_rejected_and_removed(tmp_path):
+    code = _code_from_file(tmp_path / "mod.py")
+    lines = {code.co_firstlineno + 1}
+    cache = BytecodeDiskCache(tmp_path / "cache", meta_version=1)
+
+    cache.store(code, lines, compile("x = 1", "<other>", "exec"))
+    assert cache.load(code, lines) is None
+    assert _entries(tmp_path / "cache") == []
+
+    cache.store(code, lines, code)
+    (entry,) = _entries(tmp_path / "cache")
+    entry.write_bytes(b"garbage")
+    assert cache.load(code, lines) is None
+    assert not entry.exists()
+    assert cache.get_stats()["rejected"] == 2
+
+
+def test_code_without_source_file_is_not_cached(tmp_path):
+    code = compile(_SOURCE, "<string>", "exec")
+    cache = BytecodeDiskCache(tmp_path / "cache", meta_version=1)
+
+    assert cache.entry_key(code, {2}) is None
+    assert not cache.store(code, {2}, code)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_modifier_reuses_disk_entry_without_rewriting(tmp_path, monkeypatch):
+    code = _code_from_file(tmp_path / "mod.py")
+    lines = {code.co_firstlineno + 1}
+    cache_dir = tmp_path / "cache"
+
+    first = mb.BytecodeModifier()
+    first.disk_cache = BytecodeDiskCache(cache_dir, meta_version=mb._BYTECODE_META_VERSION)
+    ok, modified = first.inject_breakpoints(code, lines)
+    assert ok
+    assert len(_entries(cache_dir)) == 1
+
+    second = mb.BytecodeModifier()
+    second.disk_cache = BytecodeDiskCache(cache_dir, meta_version=mb._BYTECODE_META_VERSION)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("bytecode should come from the disk cache")
+
+    monkeypatch.setattr(second, "_find_injection_points", _fail)
+    ok, loaded = second.inject_breakpoints(code, lines)
+    assert ok
+    assert loaded.co_code == modified.co_code
+    assert second.disk_cache.get_stats()["hits"] == 1
+
+
+def test_enable_and_disable_module_helpers(tmp_path):
+    try:
+        assert mb.enable_bytecode_disk_cache(tmp_path) == tmp_path
+        assert mb.get_cache_stats()["disk_cache"]["cache_dir"] == str(tmp_path)
+    finally:
+        mb.disable_bytecode_disk_cache()
+    assert mb.get_cache_stats()["disk_cache"] is None
+
+
+def test_cache_dir_from_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    assert cache_dir_from_environment() is None
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    assert cache_dir_from_environment() == tmp_path
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, "1")
+    assert cache_dir_from_environment() is not None
@@ -373,7 +373,7 @@ def test_rollback_on_rebuild_failure(
     """Simulate a rebuild failure and ensure rollback occurs."""
 
     # force rebuild to reject candidate
-    def fake_rebuild(orig, instrs):
+    def fake_rebuild(orig, instrs, extra_stack=2):
         return False, orig
 
     monkeypatch.setattr(
@@ -462,24 +462,19 @@ def test_module_level_instrumentation(bytecode_modifier: BytecodeModifier) -> No
 
 def test_live_object_instrumentation_and_telemetry(monkeypatch):
     """Ensure the debugger helper instruments a live function and emits telemetry."""
+    from dapper._frame_eval.code_index import CodeObjectIndex
     from dapper._frame_eval.debugger_integration import DebuggerFrameEvalBridge
     from dapper._frame_eval.telemetry import get_frame_eval_telemetry
     from dapper._frame_eval.telemetry import reset_frame_eval_telemetry
 
     bridge = DebuggerFrameEvalBridge()
-    # create a fake module object inserted into sys.modules
-    import sys
-
-    module_name = "__dapper_test_module__"
-    mod = types.ModuleType(module_name)
+    # a fresh index forces the one-time GC seeding to observe ``foo``
+    bridge.code_index = CodeObjectIndex()
 
     def foo():
         x = 1  # breakpoint line
         return x
 
-    cast("Any", mod).foo = foo
-    sys.modules[module_name] = mod
-
     reset_frame_eval_telemetry()
     # instrument by filepath matching foo code
     filepath = foo.__code__.co_filename
@@ -491,8 +486,36 @@ def test_live_object_instrumentation_and_telemetry(monkeypatch):
     snap = get_frame_eval_telemetry()
     assert snap.reason_counts.bytecode_eager_instrumentation > 0
 
-    # cleanup
-    del sys.modules[module_name]
+
+def test_live_instrumentation_covers_methods_and_nested_code():
+    """Methods, closures and lambdas are reachable through the code index."""
+    from dapper._frame_eval.cache_manager import get_func_code_info
+    from dapper._frame_eval.code_index import CodeObjectIndex
+    from dapper._frame_eval.debugger_integration import DebuggerFrameEvalBridge
+
+    class Widget:
+        def method(self):
+            value = 1  # method breakpoint
+            return value
+
+    def outer():
+        def inner():
+            y = 2  # nested breakpoint
+            return y
+
+        return inner
+
+    bridge = DebuggerFrameEvalBridge()
+    bridge.code_index = CodeObjectIndex()
+    bridge.code_index.register(outer.__code__)
+
+    method_code = Widget.method.__code__
+    inner_code = next(c for c in outer.__code__.co_consts if isinstance(c, types.CodeType))
+    lines = {method_code.co_firstlineno + 1, inner_code.co_firstlineno + 1}
+
+    assert bridge._instrument_live_code_objects_for_file(method_code.co_filename, lines)
+    assert get_func_code_info(method_code) is not None
+    assert get_func_code_info(inner_code) is not None
 
 
 def test_recursive_instrumentation(bytecode_modifier: BytecodeModifier) -> None:
@@ -14,14 +14,17 @@ from dapper._frame_eval.cache_manager import BreakpointCache
 from dapper._frame_eval.cache_manager import FuncCodeInfoCache
 from dapper._frame_eval.cache_manager import ThreadLocalCache
 from dapper._frame_eval.cache_manager import _caches
+from dapper._frame_eval.cache_manager import add_breakpoint_generation_listener
 from dapper._frame_eval.cache_manager import cleanup_caches
 from dapper._frame_eval.cache_manager import clear_all_caches
 from dapper._frame_eval.cache_manager import configure_caches
+from dapper._frame_eval.cache_manager import get_breakpoint_generation
 from dapper._frame_eval.cache_manager import get_breakpoints
 from dapper._frame_eval.cache_manager import get_cached_code
 from dapper._frame_eval.cache_manager import get_func_code_info
 from dapper._frame_eval.cache_manager import get_thread_info
 from dapper._frame_eval.cache_manager import invalidate_breakpoints
+from dapper._frame_eval.cache_manager import remove_breakpoint_generation_listener
 from dapper._frame_eval.cache_manager import remove_func_code_info
 from dapper._frame_eval.cache_manager import set_breakpoints
 from dapper._frame_eval.cache_manager import set_cache_enabled
@@ -292,3 +295,25 @@ def test_clear_all_caches_clears_code_extra_metadata() -> None:
     assert get_cached_code(original_code) is None
     assert _get_modified_code_for_evaluation(original_code) is None
     assert _get_code_extra_metadata(original_code) is None
+
+
+def test_breakpoint_generation_advances_only_when_breakpoints_are_set() -> None:
+    """Only setting breakpoints can invalidate cached skip decisions."""
+    calls: list[int] = []
+
+    def listener() -> None:
+        calls.append(get_breakpoint_generation())
+
+    add_breakpoint_generation_listener(listener)
+    try:
+        before = get_breakpoint_generation()
+
+        set_breakpoints("/tmp/generation_test.py", {3})
+        invalidate_breakpoints("/tmp/generation_test.py")
+        clear_all_caches()
+    finally:
+        assert remove_breakpoint_generation_listener(listener)
+
+    assert get_breakpoint_generation() == before + 1
+    assert calls == [before + 1]
+    assert not remove_breakpoint_generation_listener(listener)
@@ -0,0 +1,78 @@
+"""Tests for the filename → live code-object index."""
+
+from __future__ import annotations
+
+import gc
+from typing import TYPE_CHECKING
+
+from dapper._frame_eval.code_index import CodeObjectIndex
+from dapper._frame_eval.code_index import get_code_object_index
+from dapper._frame_eval.selective_tracer import should_trace_code_location
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+
+def _make_code(src: str, filename: str) -> CodeType:
+    return compile(src, filename, "exec")
+
+
+def test_register_includes_nested_code_objects():
+    index = CodeObjectIndex()
+    code = _make_code(
+        "class A:\n    def m(self):\n        return (lambda: 1)()\n",
+        "<index_nested>",
+    )
+
+    index.register(code)
+
+    names = {c.co_name for c in index.get_code_objects("<index_nested>")}
+    assert {"<module>", "A", "m", "<lambda>"} <= names
+    assert index.get_code_objects("<other>") == []
+
+
+def test_register_is_idempotent():
+    index = CodeObjectIndex()
+    code = _make_code("x = 1\n", "<index_idem>")
+
+    index.register(code)
+    index.register(code)
+
+    assert index.get_stats()["registrations"] == 1
+    assert len(index.get_code_objects("<index_idem>")) == 1
+
+
+def test_collected_code_objects_drop_out():
+    index = CodeObjectIndex()
+    code = _make_code("def f():\n    return 1\n", "<index_weak>")
+    index.register(code)
+    assert index.get_code_objects("<index_weak>")
+
+    del code
+    gc.collect()
+
+    assert index.get_code_objects("<index_weak>") == []
+    assert index.get_stats()["indexed_files"] == 0
+
+
+def test_seed_from_gc_runs_once_and_finds_live_functions():
+    namespace: dict[str, object] = {}
+    exec(_make_code("def seeded():\n    return 1\n", "<index_seed>"), namespace)
+    index = CodeObjectIndex()
+
+    added = index.seed_from_gc()
+
+    assert added > 0
+    assert index.is_seeded()
+    names = {c.co_name for c in index.get_code_objects("<index_seed>")}
+    assert "seeded" in names
+    assert index.seed_from_gc() == 0
+    assert index.get_stats()["gc_seed_runs"] == 1
+
+
+def test_trace_decision_path_registers_code_objects():
+    code = _make_code("def g():\n    return 2\n", "<index_decision>")
+
+    should_trace_code_location(code, 1)
+
+    assert code in get_code_object_index().get_code_objects("<index_decision>")
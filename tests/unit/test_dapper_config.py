@@ -69,6 +69,8 @@ class TestDapperConfig:
                     "inProcess": True,
                     "strictExpressionWatchPolicy": True,
                     "subprocessAutoAttach": True,
+                    "subprocessScalable": True,
+                    "nonStop": True,
                     "ipcTransport": "tcp",
                     "ipcPipeName": "test-pipe",
                     "cwd": "/working/dir",
@@ -86,6 +88,8 @@ class TestDapperConfig:
         assert config.in_process is True
         assert config.strict_expression_watch_policy is True
         assert config.subprocess_auto_attach is True
+        assert config.subprocess_scalable is True
+        assert config.non_stop is True
         assert config.ipc.transport == "tcp"
         assert config.ipc.pipe_name == "test-pipe"
         assert config.debuggee.working_directory == "/working/dir"
@@ -225,7 +229,9 @@ class TestDapperConfig:
             "stopOnEntry": True,
             "noDebug": False,
             "inProcess": True,
+            "nonStop": False,
             "subprocessAutoAttach": True,
+            "subprocessScalable": False,
             "ipcTransport": "tcp",
             "ipcPipeName": "test-pipe",
         }
@@ -1,3 +1,4 @@
+import linecache
 import textwrap
 
 from dapper.core import debug_helpers as dh
@@ -171,3 +172,74 @@ def test_frame_may_handle_exception_uses_ast(tmp_path):
     frame_like = types.SimpleNamespace(f_code=code, f_lineno=3)
 
     assert dh.frame_may_handle_exception(cast("Any", frame_like)) is True
+
+
+def test_exception_table_index_is_built_once_per_code(monkeypatch):
+    def target():
+        try:
+            return 1
+        except ValueError:
+            return 2
+
+    code = target.__code__
+    lines = {ln for _offset, ln in dh.dis.findlinestarts(code) if ln is not None}
+    dh.clear_handler_coverage_caches()
+    calls: list[bytes] = []
+
+    def _fake_unpack(table):
+        calls.append(table)
+        return [(0, 1 << 20, 0, 0, False)]
+
+    monkeypatch.setattr(dh.dis, "_unpack_exception_table", _fake_unpack, raising=False)
+
+    for ln in lines:
+        assert dh.frame_has_exception_table_handler(code, ln) is True
+    assert dh.frame_has_exception_table_handler(code, max(lines) + 100) is None
+    assert calls == [code.co_exceptiontable]
+
+
+def test_ast_handler_index_follows_linecache_updates(tmp_path):
+    p = tmp_path / "changing.py"
+    p.write_text("x = 1\ny = 2\n")
+    code = compile(p.read_text(), str(p), "exec")
+    linecache.clearcache()
+    dh.clear_handler_coverage_caches()
+    assert dh.frame_has_ast_handler(code, 2) is False
+
+    p.write_text("try:\n    y = 2\nexcept Exception:\n    pass\n")
+    linecache.clearcache()
+    assert dh.frame_has_ast_handler(code, 2) is True
+    assert dh.frame_has_ast_handler(code, 4) is True
+
+
+def test_ast_handler_nested_and_adjacent_try_blocks(tmp_path):
+    src = textwrap.dedent(
+        """\
+        try:
+            a = 1
+            try:
+                b = 2
+            finally:
+                pass
+            c = 3
+        except Exception:
+            pass
+        d = 4
+        try:
+            e = 5
+        finally:
+            pass
+        """,
+    )
+    p = tmp_path / "nested.py"
+    p.write_text(src)
+    code = compile(src, str(p), "exec")
+    linecache.clearcache()
+    dh.clear_handler_coverage_caches()
+    assert [dh.frame_has_ast_handler(code, n) for n in (2, 4, 7, 10, 12)] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
@@ -28,6 +28,7 @@ from dapper.shared import command_handler_helpers
 from dapper.shared import command_handlers as handlers
 from dapper.shared import debug_shared
 from dapper.shared import lifecycle_handlers
+from dapper.shared import loaded_module_registry
 from dapper.shared import stepping_handlers
 from dapper.shared import variable_handlers
 from dapper.utils.logging_names import DAPPER_LOGGER_LAUNCHER
@@ -104,6 +105,33 @@ class TestDebugLauncherBasic:
         assert args.program == "script.py"
         assert args.arg == ["arg1", "arg2"]  # Changed from args.args to args.arg
         assert args.strict_expression_watch_policy is True
+        assert args.subprocess_dormant is False
+
+    def test_parse_args_subprocess_scaling_flags(self) -> None:
+        """Scalable auto-attach and dormant children have their own flags."""
+        test_args = [
+            "--program",
+            "script.py",
+            "--ipc",
+            "tcp",
+            "--subprocess-auto-attach",
+            "--subprocess-scalable",
+            "--subprocess-dormant",
+        ]
+
+        with patch.object(sys, "argv", ["debug_launcher.py", *test_args]):
+            args = dl.parse_args()
+
+        assert args.subprocess_scalable is True
+        assert args.subprocess_dormant is True
+
+    def test_parse_args_non_stop(self) -> None:
+        test_args = ["--program", "script.py", "--ipc", "tcp", "--non-stop"]
+
+        with patch.object(sys, "argv", ["debug_launcher.py", *test_args]):
+            args = dl.parse_args()
+
+        assert args.non_stop is True
 
     def test_parse_args_requires_ipc(self) -> None:
         """Test that --ipc is required by the launcher CLI."""
@@ -981,6 +1009,60 @@ class TestUtilityFunctions:
         assert isinstance(code_arg, _types.CodeType)
         assert code_arg.co_filename == str(script)
 
+    def test_run_dormant_runs_untraced_and_activates_on_configuration_done(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ) -> None:
+        activated = threading.Event()
+        monkeypatch.setattr(dl, "activate_dormant_debugger", lambda _session: activated.set())
+        fake_dbg = MagicMock()
+        session = debug_shared.DebugSession()
+        session.debugger = fake_dbg
+
+        script = tmp_path / "worker.py"
+        script.write_text("import sys\nran = sys.argv[1:]\n")
+        original_argv = list(sys.argv)
+        original_path = list(sys.path)
+        try:
+            dl.run_dormant(str(script), ["--n", "3"], session)
+        finally:
+            sys.argv = original_argv
+            sys.path[:] = original_path
+
+        fake_dbg.run.assert_not_called()
+        assert fake_dbg.quitting is True
+        assert not activated.is_set()
+        session.configuration_done_event.set()
+        assert activated.wait(timeout=5)
+
+    def test_activate_dormant_debugger_traces_running_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        installed: list[Any] = []
+        monkeypatch.setattr(threading, "settrace_all_threads", installed.append, raising=False)
+        fake_dbg = MagicMock()
+        session = SimpleNamespace(debugger=fake_dbg)
+        release = threading.Event()
+        worker = threading.Thread(target=release.wait, daemon=True)
+        worker.start()
+        try:
+            dl.activate_dormant_debugger(session)
+            worker_frame = sys._current_frames()[worker.ident]  # type: ignore[index]
+            assert worker_frame.f_trace is fake_dbg.trace_dispatch
+        finally:
+            for top in sys._current_frames().values():
+                frame = top
+                while frame is not None:
+                    if frame.f_trace is fake_dbg.trace_dispatch:
+                        frame.f_trace = None
+                    frame = frame.f_back
+            release.set()
+            worker.join()
+
+        # New threads get the trace through an installer that skips dapper's own.
+        assert len(installed) == 1
+        assert installed[0] is not fake_dbg.trace_dispatch
+        fake_dbg.reset.assert_called_once()
+
     def test_run_program_sets_argv_and_inserts_program_dir(self, tmp_path) -> None:
         program_path = tmp_path / "prog.py"
         program_path.write_text("x = 1\n", encoding="utf-8")
@@ -1118,7 +1200,7 @@ class TestUtilityFunctions:
             def start(self):
                 started.append((self.target, self.args, bool(self.daemon)))
 
-        monkeypatch.setattr(dl.threading, "Thread", FakeThread)
+        monkeypatch.setattr(dl, "InternalThread", FakeThread)
 
         session = SimpleNamespace()
         thread = dl.start_command_listener(session=session)
@@ -1324,8 +1406,9 @@ class TestUtilityFunctions:
             session=None,
             just_my_code=True,
             strict_expression_watch_policy=False,
+            non_stop=False,
         ):
-            del stop_on_entry, session, just_my_code, strict_expression_watch_policy
+            del stop_on_entry, session, just_my_code, strict_expression_watch_policy, non_stop
             calls.append("cfg")
 
         monkeypatch.setattr(dl, "parse_args", lambda: args)
@@ -1394,8 +1477,9 @@ class TestUtilityFunctions:
             session=None,
             just_my_code=True,
             strict_expression_watch_policy=False,
+            non_stop=False,
         ):
-            del stop_on_entry, session, just_my_code, strict_expression_watch_policy
+            del stop_on_entry, session, just_my_code, strict_expression_watch_policy, non_stop
             calls.append("cfg")
 
         def _run_with_debugger(program, a, session=None):
@@ -1412,6 +1496,8 @@ class TestUtilityFunctions:
         dl.main()
 
         assert calls == ["ipc", "listener", "cfg", "debug:/tmp/demo.py:['--x']"]
+        # The session's import watcher is removed again on teardown.
+        assert not any(isinstance(f, loaded_module_registry._ImportWatcher) for f in sys.meta_path)
 
     def test_main_propagates_ipc_setup_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
         args = SimpleNamespace(
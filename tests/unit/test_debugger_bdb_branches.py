@@ -21,7 +21,7 @@ def _make_frame(
     locals_map: dict[str, object] | None = None,
     globals_map: dict[str, object] | None = None,
 ) -> FrameType:
-    code = SimpleNamespace(co_name=name, co_filename=filename)
+    code = compile("pass", filename, "exec").replace(co_name=name)
     return cast(
         "FrameType",
         SimpleNamespace(
@@ -49,12 +49,6 @@ def test_user_call_continue_action_does_not_emit_stopped(monkeypatch):
     dbg.bp_manager.function_names = ["target_fn"]
     dbg.bp_manager.function_meta["target_fn"] = {"logMessage": "hello"}
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["target_fn"],
-    )
-
     def resolve_continue(*_args, **_kwargs):
         return SimpleNamespace(action=ResolveAction.CONTINUE)
 
@@ -75,12 +69,6 @@ def test_user_call_stop_action_emits_function_breakpoint(monkeypatch):
     dbg.bp_manager.function_names = ["target_fn"]
     dbg.bp_manager.function_meta["target_fn"] = {}
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["target_fn"],
-    )
-
     def resolve_stop(*_args, **_kwargs):
         return SimpleNamespace(action=ResolveAction.STOP)
 
@@ -96,25 +84,19 @@ def test_user_call_stop_action_emits_function_breakpoint(monkeypatch):
     assert processed == [True]
 
 
-def test_user_call_function_breakpoint_condition_false_does_not_emit_stopped(monkeypatch):
+def test_user_call_function_breakpoint_condition_false_does_not_emit_stopped():
     messages: list[tuple[str, dict[str, object]]] = []
     dbg = DebuggerBDB(send_message=lambda event, **kwargs: messages.append((event, kwargs)))
     dbg.bp_manager.function_names = ["target_fn"]
     dbg.bp_manager.function_meta["target_fn"] = {"condition": "x > 10"}
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["target_fn"],
-    )
-
     dbg.user_call(_make_frame(locals_map={"x": 3}), None)
 
     assert not any(event == "stopped" for event, _ in messages)
     assert dbg.bp_manager.function_meta["target_fn"]["hit"] == 1
 
 
-def test_user_call_function_breakpoint_condition_true_emits_stopped(monkeypatch):
+def test_user_call_function_breakpoint_condition_true_emits_stopped():
     messages: list[tuple[str, dict[str, object]]] = []
     processed: list[bool] = []
     dbg = DebuggerBDB(
@@ -124,12 +106,6 @@ def test_user_call_function_breakpoint_condition_true_emits_stopped(monkeypatch)
     dbg.bp_manager.function_names = ["target_fn"]
     dbg.bp_manager.function_meta["target_fn"] = {"condition": "x > 10"}
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["target_fn"],
-    )
-
     frame = _make_frame(locals_map={"x": 11})
     dbg.botframe = frame  # type: ignore[assignment]
     dbg.user_call(frame, None)
@@ -284,18 +260,26 @@ def test_user_exception_returns_early_when_exception_break_disabled():
     assert messages == []
 
 
-def test_user_call_returns_early_when_no_function_name_matches(monkeypatch):
+def test_exception_filters_do_not_force_tracing_when_monitoring_handles_them():
+    dbg = DebuggerBDB(send_message=lambda *_a, **_k: None)
+    dbg.exception_handler.config.break_on_uncaught = True
+    assert dbg._needs_tracing_active() is True
+
+    dbg._sys_monitoring_backend = SimpleNamespace(handles_exception_breakpoints=True)  # type: ignore[attr-defined]
+    dbg.user_exception = MagicMock()  # type: ignore[method-assign]
+
+    assert dbg._needs_tracing_active() is False
+    frame = _make_frame()
+    assert dbg.dispatch_exception(frame, (ValueError, ValueError("x"), None)) == dbg.trace_dispatch
+    dbg.user_exception.assert_not_called()
+
+
+def test_user_call_returns_early_when_no_function_name_matches():
     messages: list[tuple[str, dict[str, object]]] = []
     dbg = DebuggerBDB(send_message=lambda event, **kwargs: messages.append((event, kwargs)))
     dbg.bp_manager.function_names = ["target_fn"]
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["other_fn"],
-    )
-
-    dbg.user_call(_make_frame(), None)
+    dbg.user_call(_make_frame(name="other_fn"), None)
 
     assert messages == []
 
@@ -306,11 +290,6 @@ def test_user_call_matches_second_function_name(monkeypatch):
     dbg.bp_manager.function_names = ["first_fn", "target_fn"]
     dbg.bp_manager.function_meta["target_fn"] = {}
 
-    monkeypatch.setattr(
-        debugger_bdb_module,
-        "get_function_candidate_names",
-        lambda _frame: ["target_fn"],
-    )
     monkeypatch.setattr(
         dbg.breakpoint_resolver,
         "resolve",
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 from dapper.core.debugger_bdb import DebuggerBDB
 from dapper.core.exception_handler import ExceptionBreakpointConfig
 from dapper.core.exception_handler import ExceptionHandler
+from dapper.core.exception_handler import compile_exception_condition
 
 
 def _capture_exc_info(exc: BaseException) -> tuple:
@@ -118,6 +119,95 @@ class TestShouldBreak:
         # so we should NOT break
         assert result is False
 
+    def test_should_break_uncaught_mode_trusts_observed_unwind(self):
+        """An explicit ``uncaught`` verdict overrides the per-frame guess."""
+        handler = ExceptionHandler()
+        handler.config.break_on_uncaught = True
+        frame = self._make_mock_frame()
+        assert handler.should_break(frame, uncaught=True) is True
+        assert handler.should_break(frame, uncaught=False) is False
+
+
+class _AppError(ValueError):
+    pass
+
+
+class TestExceptionConditions:
+    """Tests for compiled exception filter conditions."""
+
+    def _make_frame(self, **f_locals):
+        code = SimpleNamespace(co_filename="test.py", co_name="test_func")
+        return SimpleNamespace(f_code=code, f_lineno=10, f_globals=globals(), f_locals=f_locals)
+
+    def test_conditions_are_compiled_once(self):
+        """Configuring a condition compiles it; later lookups reuse it."""
+        config = ExceptionBreakpointConfig()
+        config.raised_condition = "retries > 2"
+        compiled = compile_exception_condition("retries > 2")
+        assert compiled.code is not None
+        assert compile_exception_condition("retries > 2") is compiled
+
+    def test_builtin_type_name_rejects_without_eval(self, monkeypatch):
+        """A non-matching builtin type name never reaches eval."""
+        compiled = compile_exception_condition("KeyError")
+        monkeypatch.setattr(compiled, "code", None)
+        assert compiled.rejects_type(ValueError) is True
+        assert compiled.rejects_type(LookupError) is True
+        assert compiled.rejects_type(KeyError) is False
+        frame = self._make_frame()
+        assert (
+            ExceptionHandler._matches_condition("KeyError", frame, _capture_exc_info(ValueError()))
+            is False
+        )
+
+    def test_type_name_matches_mro_and_qualified_name(self):
+        """Names match any class in the MRO, bare or module-qualified."""
+        frame = self._make_frame()
+        exc_info = _capture_exc_info(_AppError())
+        assert ExceptionHandler._matches_condition("ValueError", frame, exc_info) is True
+        assert (
+            ExceptionHandler._matches_condition(f"{__name__}._AppError", frame, exc_info) is True
+        )
+
+    def test_name_resolving_to_exception_class_filters_by_type(self):
+        """A name bound to an exception class in the frame uses issubclass."""
+        frame = self._make_frame(Expected=_AppError)
+        assert (
+            ExceptionHandler._matches_condition("Expected", frame, _capture_exc_info(_AppError()))
+            is True
+        )
+        assert (
+            ExceptionHandler._matches_condition("Expected", frame, _capture_exc_info(TypeError()))
+            is False
+        )
+
+    def test_expression_sees_locals_without_mutating_them(self):
+        """Expressions resolve frame locals and cannot write back into them."""
+        f_locals = {"retries": 3}
+        frame = self._make_frame(**f_locals)
+        exc_info = _capture_exc_info(ValueError())
+        assert ExceptionHandler._matches_condition("(seen := retries) > 2", frame, exc_info)
+        assert "seen" not in frame.f_locals
+        assert ExceptionHandler._matches_condition(
+            "[r for r in [retries] if r > 2]", frame, exc_info
+        )
+        assert ExceptionHandler._matches_condition("retries > 5", frame, exc_info) is False
+        assert ExceptionHandler._matches_condition("missing_name", frame, exc_info) is False
+        assert ExceptionHandler._matches_condition("retries >", frame, exc_info) is False
+
+    def test_handler_rejects_type(self):
+        """rejects_type is True only when every enabled filter rejects."""
+        handler = ExceptionHandler()
+        assert handler.rejects_type(ValueError) is False
+        handler.config.break_on_raised = True
+        handler.config.raised_condition = "KeyError"
+        assert handler.rejects_type(ValueError) is True
+        assert handler.rejects_type(KeyError) is False
+        handler.config.break_on_uncaught = True
+        assert handler.rejects_type(ValueError) is False
+        handler.config.uncaught_condition = "retries > 2"
+        assert handler.rejects_type(ValueError) is False
+
 
 class TestGetBreakMode:
     """Tests for get_break_mode method."""
@@ -305,3 +395,20 @@ class TestIntegrationWithDebuggerBDB:
         assert event == "stopped"
         assert kwargs["reason"] == "exception"
         assert "ValueError" in kwargs["text"]
+
+    def test_user_exception_skips_rejected_types(self, monkeypatch):
+        """A type-name filter that cannot match skips should_break entirely."""
+        dbg = DebuggerBDB()
+        dbg.exception_handler.config.break_on_raised = True
+        dbg.exception_handler.config.raised_condition = "KeyError"
+        calls = []
+        monkeypatch.setattr(
+            dbg.exception_handler, "should_break", lambda *a, **k: calls.append(a) or False
+        )
+        code = SimpleNamespace(co_filename="test.py", co_name="test_func")
+        frame = SimpleNamespace(f_code=code, f_lineno=10, f_back=None)
+
+        dbg.user_exception(frame, _capture_exc_info(ValueError("x")))  # type: ignore[arg-type]
+        assert calls == []
+        dbg.user_exception(frame, _capture_exc_info(KeyError("x")))  # type: ignore[arg-type]
+        assert len(calls) == 1
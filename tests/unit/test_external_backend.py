@@ -11,7 +11,9 @@ from unittest.mock import MagicMock
 import pytest
 
 from dapper.adapter.external_backend import ExternalProcessBackend
+from dapper.adapter.external_backend import _breakpoint_batch_window_seconds
 from dapper.adapter.external_backend import _command_response_timeout_seconds
+from dapper.errors import BackendError
 
 _UNSET = object()
 
@@ -46,6 +48,8 @@ def _make_backend_new() -> ExternalProcessBackend:
     """Bypass __init__ for unit-testing individual dispatch methods."""
     backend = ExternalProcessBackend.__new__(ExternalProcessBackend)
     backend._send_command = AsyncMock(return_value=None)
+    backend._breakpoint_batch = []
+    backend._breakpoint_flush_task = None
     return backend
 
 
@@ -206,6 +210,63 @@ class TestDispatchSetBreakpoints:
         assert result["breakpoints"][1].get("line") == 15
 
 
+class TestSetBreakpointsBatching:
+    def test_window_defaults_on_and_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("DAPPER_BREAKPOINT_BATCH_WINDOW_SECONDS", raising=False)
+        assert _breakpoint_batch_window_seconds() > 0
+        monkeypatch.setenv("DAPPER_BREAKPOINT_BATCH_WINDOW_SECONDS", "0")
+        assert _breakpoint_batch_window_seconds() == 0
+        monkeypatch.setenv("DAPPER_BREAKPOINT_BATCH_WINDOW_SECONDS", "junk")
+        assert _breakpoint_batch_window_seconds() == 0
+
+    @pytest.mark.asyncio
+    async def test_burst_is_sent_as_one_batch_command(self) -> None:
+        backend = _make_backend_new()
+        backend._send_command = AsyncMock(  # type: ignore[method-assign]
+            return_value={
+                "success": True,
+                "body": {
+                    "files": [
+                        {"breakpoints": [{"verified": True, "line": 1}]},
+                        {"breakpoints": [{"verified": False, "line": 2}]},
+                    ]
+                },
+            }
+        )
+
+        first, second = await asyncio.gather(
+            backend._dispatch_set_breakpoints({"path": "/a.py", "breakpoints": [{"line": 1}]}),
+            backend._dispatch_set_breakpoints({"path": "/b.py", "breakpoints": [{"line": 2}]}),
+        )
+
+        backend._send_command.assert_awaited_once()  # type: ignore[union-attr]
+        cmd = backend._send_command.call_args[0][0]  # type: ignore[union-attr]
+        assert cmd["command"] == "dapper/setBreakpointsBatch"
+        assert [f["source"]["path"] for f in cmd["arguments"]["files"]] == ["/a.py", "/b.py"]
+        assert first["breakpoints"] == [{"verified": True, "line": 1}]
+        assert second["breakpoints"] == [{"verified": False, "line": 2}]
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_response_falls_back_to_verified(self) -> None:
+        backend = _make_backend_new()
+        results = await asyncio.gather(
+            backend._dispatch_set_breakpoints({"path": "/a.py", "breakpoints": [{"line": 1}]}),
+            backend._dispatch_set_breakpoints({"path": "/b.py", "breakpoints": [{"line": 2}]}),
+        )
+        assert [r["breakpoints"][0]["verified"] for r in results] == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_send_failure_propagates_to_every_waiter(self) -> None:
+        backend = _make_backend_new()
+        backend._send_command = AsyncMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+        results = await asyncio.gather(
+            backend._dispatch_set_breakpoints({"path": "/a.py", "breakpoints": []}),
+            backend._dispatch_set_breakpoints({"path": "/b.py", "breakpoints": []}),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
 class TestDispatchSetFunctionBreakpoints:
     @pytest.mark.asyncio
     async def test_sends_correct_command(self) -> None:
@@ -664,6 +725,72 @@ class TestDispatchHotReload:
         assert cmd["arguments"]["options"] == {}
 
 
+# ---------------------------------------------------------------------------
+# _dispatch_variable_tree
+# ---------------------------------------------------------------------------
+
+
+class TestDispatchVariableTree:
+    @pytest.mark.asyncio
+    async def test_sends_one_variable_tree_command(self) -> None:
+        backend = _make_backend_new()
+        tree = {"variables": [{"name": "a", "children": []}], "nodes": 1, "truncated": False}
+        backend._send_command = AsyncMock(  # type: ignore[method-assign]
+            return_value={"success": True, "body": tree}
+        )
+        result = await backend._dispatch_variable_tree(
+            {"variables_reference": 7, "depth": 3, "max_items": 5}
+        )
+        backend._send_command.assert_awaited_once()
+        cmd = backend._send_command.call_args[0][0]
+        assert cmd == {
+            "command": "variableTree",
+            "arguments": {"variablesReference": 7, "depth": 3, "maxItems": 5},
+        }
+        assert result == tree
+
+    @pytest.mark.asyncio
+    async def test_raises_runtime_error_on_failure_response(self) -> None:
+        backend = _make_backend_new()
+        backend._send_command = AsyncMock(  # type: ignore[method-assign]
+            return_value={"success": False, "message": "Unknown variablesReference: 7"}
+        )
+        with pytest.raises(RuntimeError, match="Unknown variablesReference"):
+            await backend._dispatch_variable_tree({"variables_reference": 7})
+
+
+# ---------------------------------------------------------------------------
+# Dapper extensions served by the debuggee
+# ---------------------------------------------------------------------------
+
+
+class TestDebuggeeExtensions:
+    @pytest.mark.asyncio
+    async def test_source_registry_stats(self) -> None:
+        backend = _make_backend()
+        await backend.initialize()
+        backend._send_command = AsyncMock(  # type: ignore[method-assign]
+            return_value={"success": True, "body": {"entries": 2}}
+        )
+
+        assert await backend.source_registry_stats() == {"entries": 2}
+        cmd = backend._send_command.call_args[0][0]
+        assert cmd == {"command": "sourceRegistryStats"}
+
+    @pytest.mark.asyncio
+    async def test_agent_snapshot_surfaces_debuggee_failure(self) -> None:
+        backend = _make_backend()
+        await backend.initialize()
+        backend._send_command = AsyncMock(  # type: ignore[method-assign]
+            return_value={"success": False, "message": "No stopped threads"}
+        )
+
+        with pytest.raises(BackendError, match="No stopped threads"):
+            await backend.agent_snapshot({"depth": 3})
+        cmd = backend._send_command.call_args[0][0]
+        assert cmd == {"command": "dapper/agentSnapshot", "arguments": {"depth": 3}}
+
+
 # ---------------------------------------------------------------------------
 # _execute_command
 # ---------------------------------------------------------------------------
@@ -68,3 +68,24 @@ def test_code_extra_metadata_round_trip_for_modified_code() -> None:
     assert m._get_modified_code_for_evaluation(original_code) is modified_code
     assert m._clear_code_extra_metadata(original_code) is True
     assert m._get_code_extra_metadata(original_code) is None
+
+
+@pytest.mark.skipif(not CYTHON_AVAILABLE, reason="Cython module not available")
+def test_skip_decision_is_cached_until_breakpoints_are_set() -> None:
+    """Code without breakpoint lines is skipped from C until breakpoints change."""
+    m = assert_loaded_compiled_frame_evaluator()
+    from dapper._frame_eval.cache_manager import set_breakpoints
+
+    compiled = compile("def target():\n    return 1\n", "/tmp/skip_decision.py", "exec")
+    code = next(c for c in compiled.co_consts if isinstance(c, CodeType))
+    assert m._has_cached_skip_decision(code) is False
+
+    assert m._should_trace_code_for_eval_frame(code, 1) is False
+    assert m._has_cached_skip_decision(code) is True
+
+    m._store_code_extra_metadata(code, {"breakpoint_lines": set()})
+    assert m._has_cached_skip_decision(code) is True
+
+    set_breakpoints("/tmp/other_file.py", {1})
+    assert m._has_cached_skip_decision(code) is False
+    assert m._get_code_extra_metadata(code) == {"breakpoint_lines": set()}
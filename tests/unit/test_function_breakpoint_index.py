@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+
+import pytest
+
+from dapper.core import function_breakpoint_index
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.core.function_breakpoint_index import FunctionBreakpointIndex
+
+SOURCE = textwrap.dedent(
+    """\
+    import sys
+
+    def helper():
+        return sys._getframe()
+
+    class Box:
+        def method(self):
+            return sys._getframe()
+
+        @classmethod
+        def create(cls):
+            return sys._getframe()
+
+    class Crate(Box):
+        pass
+
+    def outer():
+        def inner():
+            return sys._getframe()
+        return inner()
+    """
+)
+
+
+@pytest.fixture
+def frames() -> dict[str, object]:
+    namespace: dict[str, object] = {"__name__": "pkg.mod"}
+    exec(compile(SOURCE, "<fbp-test>", "exec"), namespace)
+    return {
+        "helper": namespace["helper"](),  # type: ignore[operator]
+        "method": namespace["Box"]().method(),  # type: ignore[operator]
+        "inherited": namespace["Crate"]().method(),  # type: ignore[operator]
+        "create": namespace["Box"].create(),  # type: ignore[attr-defined]
+        "inherited_create": namespace["Crate"].create(),  # type: ignore[attr-defined]
+        "inner": namespace["outer"](),  # type: ignore[operator]
+    }
+
+
+@pytest.mark.parametrize(
+    ("name", "frame_key"),
+    [
+        ("helper", "helper"),
+        ("pkg.mod.helper", "helper"),
+        ("method", "method"),
+        ("Box.method", "method"),
+        ("pkg.mod.Box.method", "method"),
+        ("inner", "inner"),
+    ],
+)
+def test_match_accepts_every_name_form(frames, name: str, frame_key: str) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names([name])
+
+    assert index.match(frames[frame_key]) == name
+
+
+def test_match_rejects_other_modules_and_classes(frames) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names(["other.mod.helper", "Crate.method"])
+
+    assert index.match(frames["helper"]) is None
+    assert index.match(frames["method"]) is None
+
+
+@pytest.mark.parametrize("order", [("method", "inherited"), ("inherited", "method")])
+def test_inherited_method_matches_by_runtime_class(frames, order: tuple[str, str]) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names(["Crate.method"])
+
+    # Both frames run the same code object; the first call must not decide.
+    matches = {key: index.match(frames[key]) for key in order}
+
+    assert matches == {"method": None, "inherited": "Crate.method"}
+    assert index.watches(frames["method"].f_code)  # type: ignore[attr-defined]
+
+
+def test_inherited_method_matches_defining_and_module_names(frames) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names(["pkg.mod.Crate.method"])
+    assert index.match(frames["inherited"]) == "pkg.mod.Crate.method"
+
+    index.set_names(["Box.method"])
+    assert index.match(frames["inherited"]) == "Box.method"
+
+
+def test_inherited_classmethod_matches_by_cls(frames) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names(["Crate.create"])
+
+    assert index.match(frames["create"]) is None
+    assert index.match(frames["inherited_create"]) == "Crate.create"
+
+
+def test_match_returns_first_name_in_order(frames) -> None:
+    index = FunctionBreakpointIndex()
+    index.set_names(["pkg.mod.helper", "helper"])
+
+    assert index.match(frames["helper"]) == "pkg.mod.helper"
+
+
+def test_code_objects_are_classified_once(frames, monkeypatch: pytest.MonkeyPatch) -> None:
+    classified: list[str] = []
+    real_keys = function_breakpoint_index.function_breakpoint_keys
+
+    def counting_keys(frame):
+        classified.append(frame.f_code.co_name)
+        return real_keys(frame)
+
+    monkeypatch.setattr(function_breakpoint_index, "function_breakpoint_keys", counting_keys)
+    index = FunctionBreakpointIndex()
+    index.set_names(["Box.method"])
+
+    for _ in range(3):
+        index.match(frames["method"])
+        index.match(frames["helper"])
+
+    assert classified == ["method"]
+    assert index.resolved_codes() == {frames["method"].f_code}  # type: ignore[attr-defined]
+
+    index.set_names(["helper"])
+    assert index.resolved_codes() == set()
+    assert index.match(frames["helper"]) == "helper"
+
+
+def test_break_anywhere_traces_only_resolved_code(frames) -> None:
+    dbg = DebuggerBDB()
+    dbg.bp_manager.function_names = ["Box.method"]
+
+    assert dbg.break_anywhere(frames["method"]) is True  # type: ignore[arg-type]
+    assert dbg.break_anywhere(frames["inherited"]) is True  # type: ignore[arg-type]
+    assert dbg.break_anywhere(frames["helper"]) is False  # type: ignore[arg-type]
+    assert dbg.break_anywhere(sys._getframe()) is False
+
+    # In-place edits, as the request handlers make, are picked up lazily.
+    dbg.bp_manager.function_names.append("helper")
+    assert dbg.break_anywhere(frames["helper"]) is True  # type: ignore[arg-type]
+
+    dbg.clear_all_function_breakpoints()
+    assert dbg.break_anywhere(frames["method"]) is False  # type: ignore[arg-type]
@@ -308,3 +308,41 @@ def test_resolve_module_for_path(tmp_path: Path) -> None:
     assert resolved_module is module
 
     sys.modules.pop(module_name, None)
+
+
+@pytest.mark.asyncio
+async def test_hot_reload_batch_inprocess_reports_every_module(tmp_path: Path) -> None:
+    base_name = f"hot_reload_batch_base_{id(tmp_path)}"
+    user_name = f"hot_reload_batch_user_{id(tmp_path)}"
+    base_file = tmp_path / f"{base_name}.py"
+    user_file = tmp_path / f"{user_name}.py"
+    base_file.write_text("def target():\n    return 1\n", encoding="utf-8")
+    user_file.write_text(f"from {base_name} import target\n", encoding="utf-8")
+    _load_temp_module(base_name, base_file)
+    user = _load_temp_module(user_name, user_file)
+
+    debugger = PyDebugger(Mock())
+    fake_backend = _FakeInProcessBackend()
+    cast("Any", debugger)._inproc_backend = cast("Any", fake_backend)
+    frame = _FrameLike({"fn": user.target})
+    cast("Any", debugger)._hot_reload_service._iter_live_frames = lambda: [frame]
+
+    emitted: list[tuple[str, dict]] = []
+    debugger.emit_event = lambda event, payload: emitted.append((event, payload))
+
+    base_file.write_text("def target():\n    return 2\n", encoding="utf-8")
+    body = await debugger.hot_reload_batch(
+        [str(user_file.resolve()), str(base_file.resolve())], {"invalidatePycache": False}
+    )
+
+    assert body.get("reloadedModules") == [base_name, user_name]
+    assert body.get("reboundFrames") == 1
+    assert frame.f_locals["fn"]() == 2
+    assert user.target() == 2
+    assert [e for e, _ in emitted].count("loadedSource") == 2
+    result = next(p for e, p in emitted if e == "dapper/hotReloadResult")
+    assert result["modules"] == [base_name, user_name]
+    assert result["durationMs"] >= 0.0
+
+    sys.modules.pop(base_name, None)
+    sys.modules.pop(user_name, None)
@@ -0,0 +1,196 @@
+"""Simple breakpoint conditions are compiled into the instrumented code."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dapper._frame_eval import _inline_conditions
+from dapper._frame_eval._bytecode_instructions import get_instructions
+from dapper._frame_eval.modify_bytecode import BytecodeModifier
+
+if TYPE_CHECKING:
+    import types
+
+PROBE_SOURCE = "def probe(x):\n    y = x * 2\n    return y\n"
+BREAKPOINT_LINE = 3
+
+
+def _probe(hits: list[int]) -> types.FunctionType:
+    namespace: dict[str, object] = {"_dapper_breakpoint": hits.append}
+    exec(compile(PROBE_SOURCE, "<probe>", "exec"), namespace)
+    return namespace["probe"]  # type: ignore[return-value]
+
+
+def _instrumented(condition: str | None, hits: list[int]) -> types.FunctionType:
+    probe = _probe(hits)
+    conditions = {BREAKPOINT_LINE: condition} if condition else None
+    success, modified = BytecodeModifier().inject_breakpoints(
+        probe.__code__, {BREAKPOINT_LINE}, conditions=conditions
+    )
+    assert success
+    assert modified is not probe.__code__
+    probe.__code__ = modified
+    return probe
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["x == 3", "not done", "n % 1000 == 0", "-x < 2 * y", "name is None", "x != 'a'"],
+)
+def test_simple_expressions_are_inlinable(expression: str) -> None:
+    assert _inline_conditions.parse_inline_condition(expression) is not None
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "len(x) > 1",
+        "x.attr == 1",
+        "x[0] == 1",
+        "a < b < c",
+        "a and b",
+        "x / 2 == 1",
+        "x % y == 0",
+        "x == [1]",
+        "x ==",
+    ],
+)
+def test_other_expressions_fall_back(expression: str) -> None:
+    assert _inline_conditions.parse_inline_condition(expression) is None
+
+
+def test_condition_is_tested_inline() -> None:
+    hits: list[int] = []
+    probe = _instrumented("x == 3", hits)
+
+    assert [probe(x) for x in range(6)] == [0, 2, 4, 6, 8, 10]
+    assert hits == [BREAKPOINT_LINE]
+
+
+def test_condition_over_later_local_is_tested_inline() -> None:
+    hits: list[int] = []
+    probe = _instrumented("y % 4 == 0", hits)
+
+    for x in range(6):
+        probe(x)
+
+    assert hits == [BREAKPOINT_LINE] * 3
+
+
+@pytest.mark.parametrize("condition", ["len(str(x)) > 5", "missing == 1", "z == 1"])
+def test_non_inlinable_condition_keeps_unguarded_call(condition: str) -> None:
+    hits: list[int] = []
+    probe = _instrumented(condition, hits)
+
+    for x in range(3):
+        probe(x)
+
+    assert hits == [BREAKPOINT_LINE] * 3
+
+
+def test_conditions_get_their_own_cache_variant() -> None:
+    modifier = BytecodeModifier()
+    code = _probe([]).__code__
+
+    _, plain = modifier.inject_breakpoints(code, {BREAKPOINT_LINE})
+    _, guarded = modifier.inject_breakpoints(
+        code, {BREAKPOINT_LINE}, conditions={BREAKPOINT_LINE: "x == 3"}
+    )
+
+    assert guarded is not plain
+    assert len(guarded.co_code) > len(plain.co_code)
+
+
+def test_remove_breakpoints_drops_guard() -> None:
+    modifier = BytecodeModifier()
+    code = _probe([]).__code__
+    _, guarded = modifier.inject_breakpoints(
+        code, {BREAKPOINT_LINE}, conditions={BREAKPOINT_LINE: "x == 3"}
+    )
+
+    cleaned = modifier.remove_breakpoints(guarded)
+
+    assert cleaned.co_code == code.co_code
+
+
+BRANCH_SOURCE = "def probe(x, flag):\n    if flag:\n        z = x\n    return x\n"
+BRANCH_BREAKPOINT_LINE = 4
+
+
+def test_local_stored_in_a_branch_is_not_bound() -> None:
+    hits: list[int] = []
+    namespace: dict[str, object] = {"_dapper_breakpoint": hits.append}
+    exec(compile(BRANCH_SOURCE, "<probe>", "exec"), namespace)
+    probe: types.FunctionType = namespace["probe"]  # type: ignore[assignment]
+    code = probe.__code__
+    instructions = get_instructions(code)
+    assert "z" not in _inline_conditions.bound_locals(code, instructions, len(instructions) - 1)
+
+    success, modified = BytecodeModifier().inject_breakpoints(
+        code, {BRANCH_BREAKPOINT_LINE}, conditions={BRANCH_BREAKPOINT_LINE: "z == 1"}
+    )
+    assert success
+    probe.__code__ = modified
+
+    # Unguarded: z is unbound when flag is false, and the call evaluates it.
+    assert probe(1, False) == 1
+    assert hits == [BRANCH_BREAKPOINT_LINE]
+
+
+@pytest.mark.parametrize(
+    ("condition", "value"), [("x + 1 > 3", "s"), ("x % 3 == 0", "abc"), ("-x < 0", b"")]
+)
+def test_type_mismatch_falls_back_to_the_breakpoint_call(condition: str, value: object) -> None:
+    hits: list[int] = []
+    probe = _instrumented(condition, hits)
+
+    assert probe(value) == value * 2  # type: ignore[operator]
+    assert hits == [BREAKPOINT_LINE]
+
+
+class _EqualsEverything:
+    def __init__(self) -> None:
+        self.compared = 0
+
+    def __eq__(self, other: object) -> bool:
+        self.compared += 1
+        return True
+
+    __hash__ = object.__hash__
+
+    def __mul__(self, other: object) -> _EqualsEverything:
+        return self
+
+
+def test_user_operators_are_left_to_the_breakpoint_call() -> None:
+    hits: list[int] = []
+    probe = _instrumented("x == 3", hits)
+    value = _EqualsEverything()
+
+    probe(value)
+
+    assert value.compared == 0
+    assert hits == [BREAKPOINT_LINE]
+
+
+LOOP_SOURCE = "def total(n):\n    t = 0\n    for i in range(n):\n        t += i\n    return t\n"
+LOOP_BREAKPOINT_LINE = 4
+
+
+def test_breakpoint_inside_a_loop_falls_back_to_tracing() -> None:
+    namespace: dict[str, object] = {}
+    exec(compile(LOOP_SOURCE, "<probe>", "exec"), namespace)
+    total: types.FunctionType = namespace["total"]  # type: ignore[assignment]
+    code = total.__code__
+
+    success, modified = BytecodeModifier().inject_breakpoints(
+        code, {LOOP_BREAKPOINT_LINE}, conditions={LOOP_BREAKPOINT_LINE: "i == 3"}
+    )
+
+    # The rebuild does not relocate the loop's jumps, so the body is left to
+    # the traced path rather than instrumented.
+    assert not success
+    assert modified.co_code == code.co_code
+    assert total(5) == 10
@@ -0,0 +1,118 @@
+"""Dapper's own threads are kept out of tracing and counted separately."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any
+
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.utils.internal_threads import InternalThread
+from dapper.utils.internal_threads import InternalTimer
+from dapper.utils.internal_threads import ThreadEventCounts
+from dapper.utils.internal_threads import internal_thread_idents
+from dapper.utils.internal_threads import is_internal_thread
+from dapper.utils.internal_threads import user_thread_trace
+
+
+def _run_in(thread_cls: type[threading.Thread], fn) -> None:
+    thread = thread_cls(target=fn, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_internal_thread_is_registered_while_running() -> None:
+    seen: list[Any] = []
+
+    def body() -> None:
+        ident = threading.get_ident()
+        seen.append((is_internal_thread(), is_internal_thread(ident), sys.gettrace()))
+        seen.append(ident)
+
+    _run_in(InternalThread, body)
+
+    assert seen[0] == (True, True, None)
+    assert seen[1] not in internal_thread_idents()
+    assert not is_internal_thread()
+
+
+def test_internal_timer_runs_as_internal_thread() -> None:
+    seen: list[bool] = []
+    timer = InternalTimer(0, lambda: seen.append(is_internal_thread()))
+    timer.start()
+    timer.join(timeout=5)
+
+    assert seen == [True]
+
+
+def test_user_thread_trace_skips_internal_threads() -> None:
+    traced: list[str] = []
+
+    def trace_fn(frame, event, arg):
+        traced.append(threading.current_thread().name)
+
+    def body() -> None:
+        pass
+
+    threading.settrace(user_thread_trace(trace_fn))
+    try:
+        _run_in(InternalThread, body)
+        user = threading.Thread(target=body, name="user-thread", daemon=True)
+        user.start()
+        user.join(timeout=5)
+    finally:
+        threading.settrace(None)  # type: ignore[arg-type]
+
+    assert traced
+    assert set(traced) == {"user-thread"}
+
+
+def test_internal_timer_accepts_a_name() -> None:
+    timer = InternalTimer(0, lambda: None, name="dapper-test-timer")
+    timer.start()
+    timer.join(timeout=5)
+
+    assert timer.name == "dapper-test-timer"
+
+
+def test_event_counts_gate_by_thread_name() -> None:
+    counts = ThreadEventCounts()
+
+    def body() -> None:
+        counts.gate(threading.get_ident())
+
+    for _ in range(3):
+        thread = InternalThread(target=body, name="dapper-test-worker", daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+
+    # Churned threads of one role share an entry instead of one per ident.
+    assert counts.breakdown() == {"dapper-test-worker": 3}
+
+    counts.clear()
+    assert counts.breakdown() == {}
+
+
+def test_debugger_call_event_ignores_internal_threads() -> None:
+    dbg = DebuggerBDB()
+    dbg.reset()
+    results: list[Any] = []
+
+    def body() -> None:
+        results.append(dbg.trace_dispatch(sys._getframe(), "call", None))
+
+    _run_in(InternalThread, body)
+
+    assert results == [None]
+    assert list(dbg.thread_events.breakdown().values()) == [1]
+
+
+def test_debugger_does_not_count_user_thread_events() -> None:
+    dbg = DebuggerBDB()
+    dbg.reset()
+    frame = sys._getframe()
+    dbg.trace_dispatch(frame, "call", None)
+    dbg.trace_dispatch(frame, "line", None)
+
+    assert dbg.thread_events.breakdown() == {}
@@ -0,0 +1,156 @@
+"""Tests for compact (version 2) IPC frames and encoding negotiation."""
+
+from __future__ import annotations
+
+import io
+import socket
+from typing import Any
+
+import pytest
+
+from dapper.ipc.connections.tcp import TCPServerConnection
+from dapper.ipc.ipc_binary import ENCODING_ENV_VAR
+from dapper.ipc.ipc_binary import ENCODING_JSON
+from dapper.ipc.ipc_binary import ENCODING_MARSHAL
+from dapper.ipc.ipc_binary import HEADER_SIZE
+from dapper.ipc.ipc_binary import KIND_COMMAND
+from dapper.ipc.ipc_binary import KIND_EVENT
+from dapper.ipc.ipc_binary import VERSION
+from dapper.ipc.ipc_binary import VERSION_COMPACT
+from dapper.ipc.ipc_binary import decode_message
+from dapper.ipc.ipc_binary import encode_frame_parts
+from dapper.ipc.ipc_binary import encoding_from_environment
+from dapper.ipc.ipc_binary import unpack_frame_header
+from dapper.ipc.ipc_binary import unpack_header
+from dapper.launcher import debug_launcher
+from dapper.shared import debug_shared
+
+_VARIABLES = {
+    "event": "response",
+    "id": 7,
+    "success": True,
+    "body": {
+        "variables": [
+            {"name": f"v{i}", "value": repr(i * 1.5), "type": "float", "variablesReference": 0}
+            for i in range(50)
+        ]
+    },
+}
+
+
+def test_json_frames_stay_version_1() -> None:
+    header, payload = encode_frame_parts(KIND_EVENT, {"event": "x"})
+    assert header[2] == VERSION
+    assert unpack_frame_header(header) == (KIND_EVENT, ENCODING_JSON, len(payload))
+
+
+def test_marshal_frame_roundtrip() -> None:
+    header, payload = encode_frame_parts(KIND_COMMAND, _VARIABLES, ENCODING_MARSHAL)
+    assert header[2] == VERSION_COMPACT
+    kind, encoding, length = unpack_frame_header(header)
+    assert (kind, encoding, length) == (KIND_COMMAND, ENCODING_MARSHAL, len(payload))
+    # Legacy two-tuple accessor still reports the plain kind.
+    assert unpack_header(header) == (KIND_COMMAND, len(payload))
+    assert decode_message(payload, encoding) == _VARIABLES
+
+
+def test_marshal_falls_back_to_json_for_unmarshallable_values() -> None:
+    message = {"event": "output", "body": {"obj": object()}}
+    with pytest.raises(TypeError):
+        encode_frame_parts(KIND_EVENT, message, ENCODING_MARSHAL)
+
+    class _Custom(dict):
+        pass
+
+    header, payload = encode_frame_parts(KIND_EVENT, _Custom(a=1), ENCODING_MARSHAL)
+    assert unpack_frame_header(header)[1] == ENCODING_JSON
+    assert decode_message(payload) == {"a": 1}
+
+
+def test_unknown_encoding_nibble_is_rejected() -> None:
+    header, _ = encode_frame_parts(KIND_EVENT, {}, ENCODING_MARSHAL)
+    bad = header[:3] + bytes(((0xF << 4) | KIND_EVENT,)) + header[4:]
+    with pytest.raises(ValueError, match="unsupported payload encoding"):
+        unpack_frame_header(bad)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, ENCODING_JSON), ("marshal", ENCODING_MARSHAL), (" JSON ", ENCODING_JSON), ("x", 0)],
+)
+def test_encoding_from_environment(
+    monkeypatch: pytest.MonkeyPatch, raw: str | None, expected: int
+) -> None:
+    if raw is None:
+        monkeypatch.delenv(ENCODING_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(ENCODING_ENV_VAR, raw)
+    assert encoding_from_environment() == expected
+
+
+class _VectorWriter:
+    def __init__(self) -> None:
+        self.calls: list[list[bytes]] = []
+
+    def writelines(self, parts: Any) -> None:
+        self.calls.append(list(parts))
+
+    async def drain(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_tcp_write_uses_vectored_write_with_configured_encoding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(ENCODING_ENV_VAR, "marshal")
+    conn = TCPServerConnection(host="127.0.0.1", port=0)
+    writer = _VectorWriter()
+    conn.writer = writer  # type: ignore[assignment]
+
+    await conn.write_message({"command": "threads", "seq": 1})
+
+    [(header, payload)] = writer.calls
+    assert len(header) == HEADER_SIZE
+    assert unpack_frame_header(header)[1] == ENCODING_MARSHAL
+    assert decode_message(payload, ENCODING_MARSHAL) == {"command": "threads", "seq": 1}
+
+
+def test_launcher_mirrors_adapter_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = debug_shared.DebugSession()
+    seen: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        debug_launcher, "handle_debug_command", lambda cmd, session=None: seen.append(cmd)
+    )
+
+    _, payload = encode_frame_parts(KIND_COMMAND, {"command": "threads"}, ENCODING_MARSHAL)
+    debug_launcher._handle_command_bytes(payload, session, ENCODING_MARSHAL)
+
+    assert seen == [{"command": "threads"}]
+    assert session.ipc_encoding == ENCODING_MARSHAL
+
+
+def test_session_send_uses_sendmsg_on_sockets() -> None:
+    session = debug_shared.DebugSession()
+    left, right = socket.socketpair()
+    try:
+        session.ipc_enabled = True
+        session.ipc_sock = left
+        session.ipc_wfile = io.BytesIO()  # must not be used when a socket is available
+        session.ipc_encoding = ENCODING_MARSHAL
+
+        session.transport.send("stopped", reason="pause", threadId=1)
+
+        header = right.recv(HEADER_SIZE)
+        kind, encoding, length = unpack_frame_header(header)
+        payload = right.recv(length)
+    finally:
+        left.close()
+        right.close()
+
+    assert (kind, encoding) == (KIND_EVENT, ENCODING_MARSHAL)
+    assert decode_message(payload, encoding) == {
+        "event": "stopped",
+        "body": {"reason": "pause", "threadId": 1},
+    }
+    assert session.ipc_wfile.getvalue() == b""
@@ -0,0 +1,183 @@
+"""Regression tests for the debuggee launcher's startup import set.
+
+Every debuggee (and every auto-attached child process) imports
+``dapper.launcher.debug_launcher`` before running user code, so each module
+it drags in is paid for on every launch.  These tests run
+``python -X importtime`` in a fresh interpreter and fail when the set of
+``dapper`` modules loaded at startup grows, or when known-heavy modules
+(the asyncio adapter stack, frame-eval, ``urllib.request``) leak back in.
+
+If a new module legitimately belongs on the launcher's startup path, add it
+to ``LAUNCHER_STARTUP_MODULES``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import dapper
+import dapper.core
+from dapper.core.debugger_bdb import DebuggerBDB
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+LAUNCHER_STARTUP_MODULES = frozenset(
+    {
+        "dapper",
+        "dapper.core",
+        "dapper.core.breakpoint_manager",
+        "dapper.core.breakpoint_resolver",
+        "dapper.core.data_breakpoint_state",
+        "dapper.core.debug_helpers",
+        "dapper.core.debug_utils",
+        "dapper.core.debugger_bdb",
+        "dapper.core.exception_handler",
+        "dapper.core.function_breakpoint_index",
+        "dapper.core.just_my_code",
+        "dapper.core.line_index",
+        "dapper.core.pause_controller",
+        "dapper.core.stepping_controller",
+        "dapper.core.structured_model",
+        "dapper.core.thread_tracker",
+        "dapper.core.variable_manager",
+        "dapper.ipc",
+        "dapper.ipc.ipc_binary",
+        "dapper.launcher",
+        "dapper.launcher.debug_launcher",
+        "dapper.launcher.launcher_ipc",
+        "dapper.protocol",
+        "dapper.protocol.debugger_protocol",
+        "dapper.protocol.structures",
+        "dapper.shared",
+        "dapper.shared.agent_snapshot",
+        "dapper.shared.breakpoint_handlers",
+        "dapper.shared.command_handler_helpers",
+        "dapper.shared.command_handlers",
+        "dapper.shared.debug_shared",
+        "dapper.shared.lifecycle_handlers",
+        "dapper.shared.loaded_module_registry",
+        "dapper.shared.runtime_source_registry",
+        "dapper.shared.source_handlers",
+        "dapper.shared.source_watcher",
+        "dapper.shared.stack_handlers",
+        "dapper.shared.stepping_handlers",
+        "dapper.shared.value_conversion",
+        "dapper.shared.variable_handlers",
+        "dapper.utils",
+        "dapper.utils.events",
+        "dapper.utils.internal_threads",
+        "dapper.utils.lazy_exports",
+        "dapper.utils.logging_config",
+        "dapper.utils.logging_levels",
+        "dapper.utils.logging_message_summary",
+        "dapper.utils.logging_names",
+    }
+)
+
+# Modules that must only load once a feature needing them is used.
+FORBIDDEN_AT_STARTUP = (
+    "asyncio",
+    "dapper._frame_eval",
+    "dapper.adapter",
+    "http.client",
+    "ssl",
+    "urllib.request",
+)
+
+
+def _startup_imports(statement: str) -> set[str]:
+    """Return the modules imported by *statement* in a fresh interpreter."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO_ROOT,
+        timeout=60,
+        check=True,
+    )
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        name = line.rsplit("|", 1)[-1].strip()
+        if name != "imported package":
+            modules.add(name)
+    return modules
+
+
+def _oldest_supported_python() -> str | None:
+    """Return a Python 3.9 interpreter to smoke-test with, if one is available."""
+    if sys.version_info[:2] == (3, 9):
+        return sys.executable
+    candidate = shutil.which("python3.9")
+    if candidate is None:
+        return None
+    probe = subprocess.run(
+        [candidate, "-c", "import sys; assert sys.version_info[:2] == (3, 9)"],
+        capture_output=True,
+        timeout=30,
+        check=False,
+    )
+    return candidate if probe.returncode == 0 else None
+
+
+def _matches(module: str, prefix: str) -> bool:
+    return module == prefix or module.startswith(prefix + ".")
+
+
+@pytest.fixture(scope="module")
+def launcher_imports() -> set[str]:
+    return _startup_imports("import dapper.launcher.debug_launcher")
+
+
+def test_launcher_dapper_imports_do_not_grow(launcher_imports: set[str]) -> None:
+    dapper_modules = {m for m in launcher_imports if _matches(m, "dapper")}
+    added = sorted(dapper_modules - LAUNCHER_STARTUP_MODULES)
+    assert not added, f"new modules on the launcher startup path: {added}"
+
+
+@pytest.mark.parametrize("prefix", FORBIDDEN_AT_STARTUP)
+def test_launcher_skips_heavy_modules(launcher_imports: set[str], prefix: str) -> None:
+    leaked = sorted(m for m in launcher_imports if _matches(m, prefix))
+    assert not leaked
+
+
+def test_launcher_imports_on_oldest_supported_python() -> None:
+    """Module-level annotations and aliases must not need 3.10+ syntax at runtime."""
+    python = _oldest_supported_python()
+    if python is None:
+        pytest.skip("no Python 3.9 interpreter available")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [python, "-c", "import dapper.launcher.debug_launcher"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO_ROOT,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_package_import_does_not_load_adapter() -> None:
+    imported = _startup_imports("import dapper")
+    assert not any(_matches(m, "dapper.adapter") for m in imported)
+
+
+def test_lazy_exports_resolve_on_access() -> None:
+    assert dapper.core.DebuggerBDB is DebuggerBDB
+    assert "InProcessDebugger" in dir(dapper.core)
+    assert callable(dapper.main)
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = dapper.core.no_such_name
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import linecache
+import os
+import textwrap
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from dapper.core import line_index
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.shared.breakpoint_handlers import handle_breakpoint_locations_impl
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SOURCE = textwrap.dedent(
+    """\
+    import os
+
+    # comment
+    def outer(x):
+        def inner():
+            return x
+
+        return inner()
+
+
+    class Box:
+        value = 1
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    line_index.clear_line_index_caches()
+    yield
+    line_index.clear_line_index_caches()
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    path = tmp_path / "mod.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def test_executable_lines_cover_nested_code_objects(source_file: Path) -> None:
+    lines = line_index.executable_lines(str(source_file))
+
+    assert lines is not None
+    assert {1, 4, 5, 6, 8, 11, 12} <= set(lines)
+    assert 2 not in lines
+    assert 3 not in lines
+    assert list(lines) == sorted(lines)
+
+
+def test_executable_lines_compiles_once_per_version(
+    source_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compiled: list[str] = []
+    real_compile = compile
+
+    def counting_compile(source, filename, mode, *args, **kwargs):
+        compiled.append(filename)
+        return real_compile(source, filename, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.compile", counting_compile)
+    path = str(source_file)
+
+    first = line_index.executable_lines(path)
+    assert line_index.executable_lines(path) is first
+    assert len(compiled) == 1
+
+    source_file.write_text(SOURCE + "print(Box)\n", encoding="utf-8")
+    st = source_file.stat()
+    os.utime(source_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    updated = line_index.executable_lines(path)
+    assert len(compiled) == 2
+    assert updated is not None
+    assert 13 in updated
+
+
+def test_executable_lines_uses_linecache_for_in_memory_sources() -> None:
+    name = "<dapper-line-index-test>"
+    linecache.cache[name] = (len(SOURCE), None, SOURCE.splitlines(True), name)
+    try:
+        assert line_index.lines_in_range(name, 4, 6) == [4, 5, 6]
+    finally:
+        linecache.cache.pop(name, None)
+
+
+def test_executable_lines_returns_none_for_unusable_sources(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n", encoding="utf-8")
+
+    assert line_index.executable_lines(str(broken)) is None
+    assert line_index.executable_lines(str(tmp_path / "missing.py")) is None
+
+
+def test_code_object_lines_exclude_nested_code() -> None:
+    code = compile(SOURCE, "<test>", "exec")
+    outer = next(c for c in code.co_consts if getattr(c, "co_name", None) == "outer")
+
+    lines = line_index.code_object_lines(outer)
+
+    assert 8 in lines
+    assert 6 not in lines
+    assert line_index.code_object_lines(outer) is lines
+    assert line_index.next_executable_line(outer, 7) == 8
+    assert line_index.next_executable_line(outer, 9) is None
+
+
+def test_breakpoint_locations_uses_index(source_file: Path) -> None:
+    result = handle_breakpoint_locations_impl(
+        {"source": {"path": str(source_file)}, "line": 2, "endLine": 6}
+    )
+
+    assert result["body"]["breakpoints"] == [{"line": 4}, {"line": 5}, {"line": 6}]
+
+
+def test_breakpoint_locations_falls_back_to_every_line(tmp_path: Path) -> None:
+    result = handle_breakpoint_locations_impl(
+        {"source": {"path": str(tmp_path / "missing.py")}, "line": 3, "endLine": 4}
+    )
+
+    assert result["body"]["breakpoints"] == [{"line": 3}, {"line": 4}]
+
+
+def test_goto_targets_snap_to_executable_line_in_frame() -> None:
+    code = compile(SOURCE, "<test>", "exec")
+    outer = next(c for c in code.co_consts if getattr(c, "co_name", None) == "outer")
+    dbg = DebuggerBDB()
+    frame = MagicMock()
+    frame.f_code = outer
+    dbg.thread_tracker.get_frame = MagicMock(return_value=frame)
+
+    assert dbg.goto_targets(1, 7) == [{"id": 8, "label": "Line 8", "line": 8}]
+    assert dbg.goto_targets(1, 12) == []
@@ -0,0 +1,158 @@
+"""Modules and loaded sources are recorded once and reported incrementally."""
+
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import pytest
+
+from dapper.shared import loaded_module_registry
+from dapper.shared import source_handlers
+from dapper.shared.debug_shared import DebugSession
+from dapper.shared.loaded_module_registry import LoadedModuleRegistry
+
+
+@pytest.fixture
+def events() -> list[tuple[str, dict[str, Any]]]:
+    return []
+
+
+@pytest.fixture
+def registry(events):
+    registry = LoadedModuleRegistry()
+    registry.install(send_event=lambda event, body: events.append((event, body)))
+    yield registry
+    registry.uninstall()
+
+
+def _reasons(events, marker: str = "") -> list[tuple[str, str, str]]:
+    reasons = [
+        (event, body["reason"], (body.get("module") or body["source"])["name"])
+        for event, body in events
+    ]
+    return [reason for reason in reasons if marker in reason[2]]
+
+
+def test_import_emits_events_once(registry, events, tmp_path, monkeypatch) -> None:
+    for name in ("first_registry_mod", "second_registry_mod"):
+        (tmp_path / f"{name}.py").write_text("VALUE = 1\n")
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    import first_registry_mod  # noqa: F401
+
+    # The module is recorded once the next import starts...
+    import second_registry_mod  # noqa: F401
+
+    assert _reasons(events, "_registry_mod") == [
+        ("module", "new", "first_registry_mod"),
+        ("loadedSource", "new", "first_registry_mod.py"),
+    ]
+    module_event = next(
+        body for _, body in events if body.get("module", {}).get("name") == "first_registry_mod"
+    )
+    assert module_event["module"]["path"] == str((tmp_path / "first_registry_mod.py").resolve())
+
+    # ...or when a request refreshes the registry.
+    registry.refresh()
+    registry.refresh()
+    assert _reasons(events, "_registry_mod")[2:] == [
+        ("module", "new", "second_registry_mod"),
+        ("loadedSource", "new", "second_registry_mod.py"),
+    ]
+
+
+def test_refresh_records_imports_without_comparing_sys_modules(
+    registry, events, tmp_path, monkeypatch
+) -> None:
+    (tmp_path / "watched_registry_mod.py").write_text("VALUE = 1\n")
+    monkeypatch.delitem(sys.modules, "watched_registry_mod", raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry.refresh()
+    compared: list[bool] = []
+    compare = registry._compare_sys_modules
+
+    def counting_compare(found):
+        compared.append(True)
+        compare(found)
+
+    monkeypatch.setattr(registry, "_compare_sys_modules", counting_compare)
+
+    import watched_registry_mod  # noqa: F401
+
+    registry.refresh()
+
+    assert compared == []
+    assert ("module", "new", "watched_registry_mod") in _reasons(events, "watched_registry_mod")
+
+    # A module placed in sys.modules without an import is still found.
+    monkeypatch.setitem(
+        sys.modules, "placed_registry_mod", types.ModuleType("placed_registry_mod")
+    )
+    registry.refresh()
+
+    assert compared == [True]
+    assert ("module", "new", "placed_registry_mod") in _reasons(events, "placed_registry_mod")
+
+
+def test_modules_are_resolved_once(monkeypatch) -> None:
+    resolved: list[str] = []
+    real_resolve = loaded_module_registry._resolve
+
+    def counting_resolve(raw: str) -> str:
+        resolved.append(raw)
+        return real_resolve(raw)
+
+    monkeypatch.setattr(loaded_module_registry, "_resolve", counting_resolve)
+    registry = LoadedModuleRegistry()
+    registry.refresh()
+    first = len(resolved)
+    registry.refresh()
+
+    assert first > 0
+    assert len(resolved) == first
+
+
+def test_removed_modules_are_reported(registry, events, tmp_path, monkeypatch) -> None:
+    path = tmp_path / "gone_mod.py"
+    path.write_text("")
+    module = types.ModuleType("gone_mod")
+    module.__file__ = str(path)
+    monkeypatch.setitem(sys.modules, "gone_mod", module)
+    registry.refresh()
+    assert any(s["path"] == str(path.resolve()) for s in registry.sources())
+
+    monkeypatch.delitem(sys.modules, "gone_mod")
+    registry.refresh()
+
+    assert _reasons(events, "gone_mod")[-2:] == [
+        ("module", "removed", "gone_mod"),
+        ("loadedSource", "removed", "gone_mod.py"),
+    ]
+    assert all(s["path"] != str(path.resolve()) for s in registry.sources())
+
+
+def test_modules_page_is_sorted_slice() -> None:
+    registry = LoadedModuleRegistry()
+    registry.refresh()
+    names = sorted(name for name, module in sys.modules.items() if module is not None)
+
+    assert registry.module_count() == len(names)
+    assert [m["name"] for m in registry.modules_page(2, 3)] == names[2:5]
+    assert [m["name"] for m in registry.modules_page()] == names
+
+
+def test_handle_modules_pages_from_registry() -> None:
+    session = DebugSession()
+    sent: list[dict[str, Any]] = []
+    session.transport.send = lambda _kind, **kwargs: sent.append(kwargs)  # type: ignore[assignment]
+
+    source_handlers.handle_modules({"startModule": 1, "moduleCount": 2}, session)
+
+    body = sent[-1]["body"]
+    assert [m["name"] for m in body["modules"]] == [
+        m["name"] for m in session.loaded_modules.modules_page(1, 2)
+    ]
+    assert body["totalModules"] == session.loaded_modules.module_count()
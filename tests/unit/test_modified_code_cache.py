@@ -0,0 +1,143 @@
+"""Tests for the bounded, weak-keyed modified-code cache."""
+
+import gc
+
+from dapper._frame_eval import modify_bytecode as mb
+from dapper._frame_eval._modified_code_cache import ModifiedCodeCache
+from dapper._frame_eval._modified_code_cache import fingerprint_lines
+
+
+def _fresh_code(name: str = "f"):
+    namespace: dict[str, object] = {}
+    exec(
+        compile(f"def {name}():\n    a = 1\n    b = 2\n    return a + b\n", "<mcc>", "exec"),
+        namespace,
+    )
+    return namespace[name].__code__  # type: ignore[attr-defined]
+
+
+def test_per_code_lru_cap_evicts_oldest_fingerprint():
+    cache = ModifiedCodeCache(max_variants_per_code=2, max_entries=100)
+    code = _fresh_code()
+    variant = _fresh_code("variant")
+
+    for fp in (1, 2, 3):
+        cache.put(code, fp, variant)
+
+    assert cache.fingerprints(code) == [2, 3]
+    assert cache.get(code, 1) is None
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_global_lru_cap_and_recency():
+    cache = ModifiedCodeCache(max_variants_per_code=4, max_entries=2)
+    first, second, third = _fresh_code("a"), _fresh_code("b"), _fresh_code("c")
+
+    cache.put(first, 1, first)
+    cache.put(second, 1, second)
+    assert cache.get(first, 1) is first  # refresh ``first``
+    cache.put(third, 1, third)
+
+    assert cache.get(second, 1) is None
+    assert cache.get(first, 1) is first
+    assert len(cache) == 2
+
+
+def test_collected_origin_releases_variants():
+    cache = ModifiedCodeCache()
+    code = _fresh_code()
+    cache.put(code, 7, _fresh_code("variant"))
+    assert cache.get_stats()["estimated_bytes"] > 0
+
+    del code
+    gc.collect()
+
+    stats = cache.get_stats()
+    assert stats["cached_code_objects"] == 0
+    assert stats["unique_origins"] == 0
+    assert stats["estimated_bytes"] == 0
+    assert stats["collected_origins"] == 1
+
+
+def test_invalidate_file_evicts_every_fingerprint():
+    cache = ModifiedCodeCache()
+    code = _fresh_code()
+    cache.put(code, 1, code)
+    cache.put(code, 2, code)
+
+    removed, emptied = cache.invalidate_file("<other>")
+    assert (removed, emptied) == (0, [])
+
+    removed, emptied = cache.invalidate_file("<mcc>")
+    assert removed == 2
+    assert emptied == [code]
+    assert cache.fingerprints(code) == []
+
+
+def test_module_stats_and_file_invalidation():
+    mb.clear_bytecode_cache()
+    code = _fresh_code()
+    line = code.co_firstlineno + 1
+
+    ok, modified = mb.inject_breakpoint_bytecode(code, {line})
+    assert ok
+    assert modified is not code
+
+    stats = mb.get_cache_stats()
+    assert stats["cached_code_objects"] == 1
+    assert stats["estimated_bytes"] > 0
+    assert stats["max_entries"] >= 1
+
+    assert mb.invalidate_bytecode_cache_for_file("<mcc>") == 1
+    assert mb.get_cache_stats()["cached_code_objects"] == 0
+    assert fingerprint_lines({line}) == mb.compute_cache_key(code, {line})[1]
+
+
+def test_lru_eviction_reports_original_and_variant():
+    evicted: list[tuple[object, object]] = []
+    cache = ModifiedCodeCache(
+        max_variants_per_code=1,
+        max_entries=100,
+        on_evict=lambda original, variant: evicted.append((original, variant)),
+    )
+    code = _fresh_code()
+    first, second = _fresh_code("first"), _fresh_code("second")
+
+    cache.put(code, 1, first)
+    cache.put(code, 2, second)
+
+    assert evicted == [(code, first)]
+
+
+def test_code_with_nested_functions_hits_the_cache():
+    namespace: dict[str, object] = {}
+    source = (
+        "def outer():\n    x = 1\n    def inner():\n        return 2\n    return inner() + x\n"
+    )
+    exec(compile(source, "<mcc-nested>", "exec"), namespace)
+    code = namespace["outer"].__code__  # type: ignore[attr-defined]
+    modifier = mb.BytecodeModifier()
+
+    results = [modifier.inject_breakpoints(code, {2, 4}) for _ in range(5)]
+
+    assert all(ok for ok, _ in results)
+    assert len({id(modified) for _, modified in results}) == 1
+    stats = modifier.modified_code_objects.get_stats()
+    assert stats["misses"] == 2  # outer and inner, once each
+    assert stats["collected_origins"] == 0
+
+
+def test_evicted_variant_is_released_from_the_code_extra_slot():
+    from dapper._frame_eval import _frame_evaluator
+
+    modifier = mb.BytecodeModifier(max_cached_variants=1)
+    first, second = _fresh_code("first"), _fresh_code("second")
+
+    ok, _ = modifier.inject_breakpoints(first, {first.co_firstlineno + 1})
+    assert ok
+    assert _frame_evaluator._get_modified_code_for_evaluation(first) is not None
+
+    ok, _ = modifier.inject_breakpoints(second, {second.co_firstlineno + 1})
+    assert ok
+    assert _frame_evaluator._get_modified_code_for_evaluation(first) is None
+    assert _frame_evaluator._get_modified_code_for_evaluation(second) is not None
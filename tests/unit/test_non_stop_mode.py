@@ -0,0 +1,133 @@
+"""Non-stop mode: threads are suspended and resumed individually."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any
+
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.core.thread_tracker import ThreadTracker
+from dapper.shared import command_handlers
+from dapper.shared.debug_shared import DebugSession
+
+WORKER_SOURCE = "def worker(tag):\n    value = tag\n    return value\n"
+BREAKPOINT_LINE = 2
+
+
+def test_resume_thread_releases_only_that_thread() -> None:
+    tracker = ThreadTracker()
+    tracker.mark_stopped(1)
+    tracker.mark_stopped(2)
+
+    assert tracker.resume_thread(1) is True
+    assert tracker.wait_for_resume(1, timeout=0) is True
+    assert tracker.wait_for_resume(2, timeout=0) is False
+    assert tracker.resume_thread(3) is False
+
+    tracker.resume_all_threads()
+    assert tracker.wait_for_resume(2, timeout=0) is True
+
+
+def test_new_stop_ignores_an_earlier_resume() -> None:
+    tracker = ThreadTracker()
+    tracker.mark_stopped(1)
+    tracker.resume_thread(1)
+    tracker.mark_stopped(1)
+
+    assert tracker.wait_for_resume(1, timeout=0) is False
+
+
+def test_release_thread_keeps_other_threads_frames() -> None:
+    tracker = ThreadTracker()
+    frame = sys._getframe()
+    for thread_id in (1, 2):
+        tracker.mark_stopped(thread_id, frame)
+        tracker.frames_by_thread[thread_id] = tracker.build_stack_frames(frame)
+
+    tracker.release_thread(1)
+
+    assert tracker.stopped_thread_ids == {2}
+    assert tracker.stop_frames == {2: frame}
+    assert 1 not in tracker.resume_events
+    assert all(f["id"] in tracker.frame_id_to_frame for f in tracker.frames_by_thread[2])
+    assert len(tracker.frame_id_to_frame) == len(tracker.frames_by_thread[2])
+
+
+def test_stopped_events_report_other_threads_running() -> None:
+    events: list[dict[str, Any]] = []
+    frame = sys._getframe()
+    for non_stop in (False, True):
+        dbg = DebuggerBDB(
+            send_message=lambda _event, **body: events.append(body), non_stop=non_stop
+        )
+        dbg._emit_stopped_event(frame, threading.get_ident(), "breakpoint")
+
+    assert [event["allThreadsStopped"] for event in events] == [True, False]
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_continue_resumes_only_its_thread(tmp_path) -> None:
+    path = tmp_path / "worker.py"
+    path.write_text(WORKER_SOURCE)
+    namespace: dict[str, Any] = {}
+    exec(compile(WORKER_SOURCE, str(path), "exec"), namespace)
+
+    stopped: list[dict[str, Any]] = []
+    session = DebugSession()
+    dbg = DebuggerBDB(
+        send_message=lambda event, **body: stopped.append(body) if event == "stopped" else None,
+        process_commands=session.process_queued_commands_launcher,
+        just_my_code=False,
+        non_stop=True,
+    )
+    session.debugger = dbg
+    dbg.reset()
+    dbg.set_break(str(path), BREAKPOINT_LINE)
+    results: list[str] = []
+
+    def run(tag: str) -> None:
+        sys.settrace(dbg.trace_dispatch)
+        try:
+            results.append(namespace["worker"](tag))
+        finally:
+            sys.settrace(None)
+
+    threads = [threading.Thread(target=run, args=(tag,)) for tag in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    try:
+        assert _wait_for(lambda: len(stopped) == len(threads))
+        assert {event["threadId"] for event in stopped} == {t.ident for t in threads}
+        assert not any(event["allThreadsStopped"] for event in stopped)
+
+        first, second = threads
+        command_handlers.handle_debug_command(
+            {"command": "continue", "id": 1, "arguments": {"threadId": first.ident}}, session
+        )
+        first.join(timeout=10)
+        assert not first.is_alive()
+        second.join(timeout=0.2)
+        assert second.is_alive()
+        assert dbg.thread_tracker.stopped_thread_ids == {second.ident}
+        assert dbg.thread_tracker.frames_by_thread[second.ident]
+
+        command_handlers.handle_debug_command(
+            {"command": "continue", "id": 2, "arguments": {"threadId": second.ident}}, session
+        )
+        second.join(timeout=10)
+        assert not second.is_alive()
+        assert sorted(results) == ["a", "b"]
+    finally:
+        session.terminate_session()
+        for thread in threads:
+            thread.join(timeout=10)
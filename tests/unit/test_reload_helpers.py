@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import importlib.machinery
 from pathlib import Path
 import sys
@@ -19,13 +20,19 @@ from dapper.shared.reload_helpers import _maybe_update_frame_code
 from dapper.shared.reload_helpers import _replacement_for_value
 from dapper.shared.reload_helpers import _try_invalidate_frame_eval
 from dapper.shared.reload_helpers import build_rebind_map
+from dapper.shared.reload_helpers import build_referrer_index
 from dapper.shared.reload_helpers import check_reloadable_source
 from dapper.shared.reload_helpers import collect_module_functions
+from dapper.shared.reload_helpers import collect_qualified_functions
 from dapper.shared.reload_helpers import delete_stale_pyc
 from dapper.shared.reload_helpers import is_code_compatible
+from dapper.shared.reload_helpers import order_modules_for_reload
+from dapper.shared.reload_helpers import patch_referrers
+from dapper.shared.reload_helpers import perform_batch_reload
 from dapper.shared.reload_helpers import perform_reload
 from dapper.shared.reload_helpers import rebind_stack_frames
 from dapper.shared.reload_helpers import resolve_module_for_path
+from dapper.shared.source_watcher import SourceWatcher
 
 # ---------------------------------------------------------------------------
 # Helpers shared across tests
@@ -672,3 +679,204 @@ class TestPerformReload:
             "updatedFrameCodes",
             "warnings",
         }
+
+
+# ---------------------------------------------------------------------------
+# Batch reload
+# ---------------------------------------------------------------------------
+
+
+class TestCollectQualifiedFunctions:
+    def test_includes_methods_of_module_classes(self):
+        mod = types.ModuleType("qualmod")
+        exec(
+            "def top(): pass\n"
+            "class K:\n"
+            "    def m(self): pass\n"
+            "    @staticmethod\n"
+            "    def s(): pass\n"
+            "    @classmethod\n"
+            "    def c(cls): pass\n"
+            "    class Inner:\n"
+            "        def n(self): pass\n",
+            mod.__dict__,
+        )
+        mod.Foreign = Path  # classes from other modules are not walked
+
+        result = collect_qualified_functions(mod)
+
+        assert set(result) == {"top", "K.m", "K.s", "K.c", "K.Inner.n"}
+        assert result["K.s"] is mod.K.__dict__["s"].__func__
+
+
+class TestOrderModulesForReload:
+    def test_dependencies_first(self):
+        b = types.ModuleType("ord_b")
+        exec("def f(): pass", b.__dict__)
+        a = types.ModuleType("ord_a")
+        a.f = b.f
+        c = types.ModuleType("ord_c")
+        c.ord_a = a
+
+        assert order_modules_for_reload({"ord_c": c, "ord_a": a, "ord_b": b}) == [
+            "ord_b",
+            "ord_a",
+            "ord_c",
+        ]
+
+    def test_cycle_keeps_input_order_and_warns(self):
+        a = types.ModuleType("cyc_a")
+        b = types.ModuleType("cyc_b")
+        a.cyc_b = b
+        b.cyc_a = a
+        warnings: list[str] = []
+
+        assert order_modules_for_reload({"cyc_a": a, "cyc_b": b}, warnings) == [
+            "cyc_a",
+            "cyc_b",
+        ]
+        assert any("cycle" in w for w in warnings)
+
+
+class TestPatchReferrers:
+    def _pair(self):
+        old = _make_fn("def fn():\n    return 'old'\n")
+        new = _make_fn("def fn():\n    return 'new'\n")
+        return old, new, {id(old): new}
+
+    def test_patches_dict_list_and_cell(self):
+        old, new, rebind = self._pair()
+        registry = {"handler": old}
+        hooks = [old]
+
+        def make(f):
+            return lambda: f
+
+        getter = make(old)
+
+        index = build_referrer_index([old])
+        patched, warnings = patch_referrers(index, rebind)
+
+        assert registry["handler"] is new
+        assert hooks[0] is new
+        assert getter() is new
+        # The three above plus the namespace _make_fn compiled into.
+        assert patched == 4
+        assert warnings == []
+
+    def test_patches_class_namespace_and_bound_method(self):
+        ns: dict = {}
+        exec("class K:\n    def m(self):\n        return 'old'\n", ns)
+        new_ns: dict = {}
+        exec("class K:\n    def m(self):\n        return 'new'\n", new_ns)
+        cls = ns["K"]
+        old = cls.__dict__["m"]
+        new = new_ns["K"].__dict__["m"]
+        instance = cls()
+        holder = {"cb": instance.m}
+
+        index = build_referrer_index([old])
+        patch_referrers(index, {id(old): new})
+
+        assert instance.m() == "new"
+        assert holder["cb"]() == "new"
+        assert holder["cb"].__self__ is instance
+
+    def test_patches_staticmethod_wrapper(self):
+        ns: dict = {}
+        exec("class K:\n    @staticmethod\n    def s():\n        return 'old'\n", ns)
+        cls = ns["K"]
+        old = cls.__dict__["s"].__func__
+        new = _make_fn("def s():\n    return 'new'\n", "s")
+
+        patch_referrers(build_referrer_index([old]), {id(old): new})
+
+        assert cls.s() == "new"
+        assert isinstance(cls.__dict__["s"], staticmethod)
+
+    def test_excluded_containers_are_left_alone(self):
+        old, _new, rebind = self._pair()
+        keep = {"fn": old}
+
+        patch_referrers(build_referrer_index([old], exclude=(id(keep),)), rebind)
+
+        assert keep["fn"] is old
+
+
+class TestPerformBatchReload:
+    def _load(self, tmp_path: Path, name: str, content: str) -> types.ModuleType:
+        f = tmp_path / f"{name}.py"
+        f.write_text(content)
+        if str(tmp_path) not in sys.path:
+            sys.path.insert(0, str(tmp_path))
+        return importlib.import_module(name)
+
+    def test_reloads_in_dependency_order_and_patches_referrers(self, tmp_path):
+        base = self._load(tmp_path, "batch_base", "def f():\n    return 'old'\n")
+        user = self._load(tmp_path, "batch_user", "from batch_base import f\nREG = [f]\n")
+        outside = {"f": base.f}
+        try:
+            (tmp_path / "batch_base.py").write_text("def f():\n    return 'new'\n")
+
+            result = perform_batch_reload(
+                [str(tmp_path / "batch_user.py"), str(tmp_path / "batch_base.py")],
+                {"invalidatePycache": False},  # type: ignore[arg-type]
+                get_frames_fn=list,
+            )
+
+            assert result["reloadedModules"] == ["batch_base", "batch_user"]
+            assert user.f() == "new"
+            assert user.REG[0]() == "new"
+            assert outside["f"]() == "new"
+            assert result["patchedReferrers"] >= 1
+            assert result["durationMs"] >= 0.0
+        finally:
+            sys.modules.pop("batch_base", None)
+            sys.modules.pop("batch_user", None)
+            sys.path.remove(str(tmp_path))
+
+    def test_failures_become_warnings(self, tmp_path):
+        good = self._load(tmp_path, "batch_good", "def f():\n    return 1\n")
+        bad = self._load(tmp_path, "batch_bad", "X = 1\n")
+        try:
+            (tmp_path / "batch_bad.py").write_text("raise RuntimeError('boom')\n")
+
+            result = perform_batch_reload(
+                [
+                    str(tmp_path / "missing.py"),
+                    str(tmp_path / "batch_bad.py"),
+                    str(tmp_path / "batch_good.py"),
+                ],
+                None,
+                get_frames_fn=list,
+            )
+
+            assert result["reloadedModules"] == ["batch_good"]
+            assert any("missing.py" in w for w in result["warnings"])
+            assert any("batch_bad" in w and "boom" in w for w in result["warnings"])
+            assert good.f() == 1
+            assert bad.X == 1
+        finally:
+            sys.modules.pop("batch_good", None)
+            sys.modules.pop("batch_bad", None)
+            sys.path.remove(str(tmp_path))
+
+    def test_without_paths_reloads_sources_changed_since_last_reload(self, tmp_path):
+        mod = self._load(tmp_path, "batch_watched", "VALUE = 1\n")
+        path = str((tmp_path / "batch_watched.py").resolve())
+        watcher = SourceWatcher(lambda: [path])
+        try:
+            with patch("dapper.shared.source_watcher._session_watcher", watcher):
+                watcher.poll()
+                assert (
+                    perform_batch_reload(None, None, get_frames_fn=list)["reloadedModules"] == []
+                )
+
+                (tmp_path / "batch_watched.py").write_text("VALUE = 22\n")
+                result = perform_batch_reload(None, None, get_frames_fn=list)
+
+            assert result["reloadedModules"] == ["batch_watched"]
+            assert mod.VALUE == 22
+        finally:
+            sys.modules.pop("batch_watched", None)
+            sys.path.remove(str(tmp_path))
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from dapper.adapter.server import PyDebugger
 from dapper.adapter.server import RequestHandler
 from dapper.shared import debug_shared
 
@@ -81,6 +82,7 @@ def mock_server():
         # Use AsyncCallRecorder instances so tests can set .return_value and
         # assert calls without creating AsyncMock coroutines.
         setattr(server.debugger, method, AsyncCallRecorder())
+    server.debugger.get_external_backend = MagicMock(return_value=None)
 
     return server
 
@@ -631,6 +633,103 @@ async def test_handle_request_routes_slash_commands(handler, mock_server):
     assert body["stoppedThreads"] == [1]
 
 
+@pytest.mark.asyncio
+async def test_agent_snapshot_since_checkpoint_returns_delta(handler, mock_server):
+    """A second snapshot with sinceCheckpoint only carries what changed."""
+    stopped_thread = types.SimpleNamespace(is_stopped=True, stop_reason="step")
+    mock_server.debugger._session_facade = types.SimpleNamespace(
+        iter_threads=lambda: [(1, stopped_thread)],
+    )
+    frames = [
+        {"id": 5, "name": "loop", "line": 3, "source": {"path": "/home/user/app.py"}},
+        {"id": 6, "name": "main", "line": 9, "source": {"path": "/home/user/app.py"}},
+    ]
+    mock_server.debugger.get_stack_trace.return_value = {"stackFrames": frames}
+    mock_server.debugger.get_scopes.return_value = [
+        {"name": "Locals", "variablesReference": 1},
+    ]
+    mock_server.debugger.get_variables.return_value = [
+        {"name": "i", "value": "0"},
+        {"name": "total", "value": "0"},
+    ]
+    request = {"seq": 1, "type": "request", "command": "dapper/agentSnapshot"}
+
+    first = (await handler.handle_request(request))["body"]
+    frames[0]["line"] = 4
+    mock_server.debugger.get_variables.return_value = [
+        {"name": "i", "value": "1"},
+        {"name": "total", "value": "0"},
+    ]
+    delta = (
+        await handler.handle_request(
+            {**request, "arguments": {"sinceCheckpoint": first["checkpoint"]}}
+        )
+    )["body"]
+
+    assert first["delta"] is False
+    assert delta["delta"] is True
+    assert delta["checkpoint"] == first["checkpoint"] + 1
+    assert [f["name"] for f in delta["callStack"]] == ["loop"]
+    assert delta["frameOrder"] == [f["frameKey"] for f in first["callStack"]]
+    assert delta["locals"] == {"i": "1"}
+
+
+@pytest.mark.asyncio
+async def test_agent_snapshot_frame_keys_survive_calls_above_a_truncated_stack(
+    handler, mock_server
+):
+    """Keys count from the bottom of the full stack, not of the reported page."""
+    stopped_thread = types.SimpleNamespace(is_stopped=True, stop_reason="step")
+    mock_server.debugger._session_facade = types.SimpleNamespace(
+        iter_threads=lambda: [(1, stopped_thread)],
+    )
+    mock_server.debugger.get_scopes.return_value = []
+    caller = {"id": 5, "name": "caller", "line": 3, "source": {"path": "/home/user/app.py"}}
+    callee = {"id": 9, "name": "callee", "line": 7, "source": {"path": "/home/user/app.py"}}
+    request = {
+        "seq": 1,
+        "type": "request",
+        "command": "dapper/agentSnapshot",
+        "arguments": {"depth": 2},
+    }
+
+    mock_server.debugger.get_stack_trace.return_value = {
+        "stackFrames": [caller, {**caller, "id": 6, "name": "main"}],
+        "totalFrames": 6,
+    }
+    before = (await handler.handle_request(request))["body"]["callStack"]
+    mock_server.debugger.get_stack_trace.return_value = {
+        "stackFrames": [callee, caller],
+        "totalFrames": 7,
+    }
+    after = (await handler.handle_request(request))["body"]["callStack"]
+
+    assert after[1]["frameKey"] == before[0]["frameKey"]
+    assert after[0]["frameKey"] != before[0]["frameKey"]
+
+
+@pytest.mark.asyncio
+async def test_agent_snapshot_forwards_to_external_backend(handler, mock_server):
+    """External debuggees build (and checkpoint) the snapshot themselves."""
+    backend = MagicMock()
+    backend.agent_snapshot = AsyncCallRecorder(return_value={"checkpoint": 3, "delta": True})
+    mock_server.debugger = PyDebugger(mock_server)
+    mock_server.debugger._external_backend = backend
+
+    result = await handler.handle_request(
+        {
+            "seq": 2,
+            "type": "request",
+            "command": "dapper/agentSnapshot",
+            "arguments": {"sinceCheckpoint": 2},
+        }
+    )
+
+    assert result["success"] is True
+    assert result["body"] == {"checkpoint": 3, "delta": True}
+    backend.agent_snapshot.assert_called_once_with({"sinceCheckpoint": 2})
+
+
 @pytest.mark.asyncio
 async def test_handle_request_routes_agent_eval(handler, mock_server):
     """handle_request must route 'dapper/agentEval' to _handle_dapper_agent_eval."""
@@ -696,6 +795,101 @@ async def test_handle_dapper_agent_inspect_allows_readonly_dunder_name(handler,
     mock_server.debugger.evaluate.assert_called_once_with("__name__", 100, "repl")
 
 
+def _external_inspect_debugger(mock_server, variable_tree):
+    """Swap in a PyDebugger that evaluates to a container and expands it externally."""
+    mock_server.debugger = PyDebugger(mock_server)
+    mock_server.debugger._session_facade = types.SimpleNamespace(iter_threads=list)
+    mock_server.debugger.evaluate = AsyncCallRecorder(
+        return_value={"result": "[...]", "type": "list", "variablesReference": 7}
+    )
+    backend = MagicMock()
+    backend.variable_tree = variable_tree
+    mock_server.debugger._external_backend = backend
+
+
+@pytest.mark.asyncio
+async def test_agent_inspect_expands_external_tree_in_one_round_trip(handler, mock_server):
+    variable_tree = AsyncCallRecorder(
+        return_value={
+            "variables": [
+                {
+                    "name": "0",
+                    "value": "[1]",
+                    "type": "list",
+                    "variablesReference": 8,
+                    "children": [{"name": "0", "value": "1", "type": "int"}],
+                },
+                {"name": "1", "value": "[...]", "type": "list", "cycle": True},
+            ],
+            "nodes": 3,
+            "truncated": False,
+        }
+    )
+    _external_inspect_debugger(mock_server, variable_tree)
+
+    result = await handler._handle_dapper_agent_inspect(
+        {
+            "seq": 102,
+            "type": "request",
+            "command": "dapper/agentInspect",
+            "arguments": {"expression": "data", "depth": 3, "maxItems": 5},
+        }
+    )
+
+    root = result["body"]["root"]
+    assert root["children"][0]["children"] == [{"name": "0", "type": "int", "value": "1"}]
+    assert root["children"][1]["cycle"] is True
+    assert "truncated" not in result["body"]
+    variable_tree.assert_called_once_with(7, depth=3, max_items=5)
+
+
+@pytest.mark.asyncio
+async def test_agent_inspect_reports_truncated_external_tree(handler, mock_server):
+    _external_inspect_debugger(
+        mock_server,
+        AsyncCallRecorder(
+            return_value={
+                "variables": [{"name": "0", "value": "1", "type": "int"}],
+                "nodes": 1,
+                "truncated": True,
+            }
+        ),
+    )
+
+    result = await handler._handle_dapper_agent_inspect(
+        {
+            "seq": 103,
+            "type": "request",
+            "command": "dapper/agentInspect",
+            "arguments": {"expression": "xs"},
+        }
+    )
+
+    assert result["success"] is True
+    assert result["body"]["truncated"] is True
+    assert result["body"]["root"]["children"] == [{"name": "0", "type": "int", "value": "1"}]
+
+
+@pytest.mark.asyncio
+async def test_agent_inspect_fails_when_external_expansion_fails(handler, mock_server):
+    _external_inspect_debugger(
+        mock_server,
+        AsyncCallRecorder(side_effect=RuntimeError("Unknown variablesReference: 7")),
+    )
+
+    result = await handler._handle_dapper_agent_inspect(
+        {
+            "seq": 104,
+            "type": "request",
+            "command": "dapper/agentInspect",
+            "arguments": {"expression": "xs"},
+        }
+    )
+
+    assert result["success"] is False
+    assert "Unknown variablesReference: 7" in result["message"]
+
+
 @pytest.mark.asyncio
 async def test_handle_request_routes_hot_reload(handler, mock_server):
     """handle_request must route 'dapper/hotReload' through the normalized path."""
@@ -727,3 +921,68 @@ async def test_handle_request_routes_hot_reload(handler, mock_server):
     assert result is not None
     assert result["success"] is True
     assert result["command"] == "dapper/hotReload"
+
+
+@pytest.mark.asyncio
+async def test_handle_request_routes_hot_reload_batch(handler, mock_server):
+    """'dapper/hotReloadBatch' forwards every source path (or None) to the debugger."""
+    mock_server.debugger._session_facade = types.SimpleNamespace(iter_threads=list)
+    mock_server.debugger.stopped_event = types.SimpleNamespace(is_set=lambda: True)
+    mock_server.debugger.hot_reload_batch = AsyncCallRecorder(
+        return_value={"reloadedModules": ["a", "b"], "warnings": []},
+    )
+
+    result = await handler.handle_request(
+        {
+            "seq": 102,
+            "type": "request",
+            "command": "dapper/hotReloadBatch",
+            "arguments": {"sources": [{"path": "/tmp/a.py"}, {"path": "/tmp/b.py"}]},
+        }
+    )
+    await handler.handle_request(
+        {"seq": 103, "type": "request", "command": "dapper/hotReloadBatch"}
+    )
+
+    assert result is not None
+    assert result["success"] is True
+    assert result["body"]["reloadedModules"] == ["a", "b"]
+    assert [args for args, _ in mock_server.debugger.hot_reload_batch.calls] == [
+        (["/tmp/a.py", "/tmp/b.py"], {}),
+        (None, {}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_handle_request_source_registry_stats_in_process(handler, mock_server):
+    """'dapper/sourceRegistryStats' reads the active session's registry in-process."""
+    mock_server.debugger = PyDebugger(mock_server)
+    session = debug_shared.DebugSession()
+    session.register_dynamic_source("<stats-probe>", "x = 1\n")
+
+    with debug_shared.use_session(session):
+        result = await handler.handle_request(
+            {"seq": 104, "type": "request", "command": "dapper/sourceRegistryStats"}
+        )
+
+    assert result is not None
+    assert result["success"] is True
+    assert result["body"]["entries"] == 1
+    assert result["body"]["rawBytes"] == len(b"x = 1\n")
+
+
+@pytest.mark.asyncio
+async def test_handle_request_source_registry_stats_from_external_debuggee(handler, mock_server):
+    """External debuggees report their own registry through the backend."""
+    backend = MagicMock()
+    backend.source_registry_stats = AsyncCallRecorder(return_value={"entries": 4})
+    mock_server.debugger = PyDebugger(mock_server)
+    mock_server.debugger._external_backend = backend
+
+    result = await handler.handle_request(
+        {"seq": 105, "type": "request", "command": "dapper/sourceRegistryStats"}
+    )
+
+    assert result["success"] is True
+    assert result["body"] == {"entries": 4}
+    backend.source_registry_stats.assert_called_once_with()
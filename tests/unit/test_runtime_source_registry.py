@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import linecache
 import threading
+from typing import ClassVar
 
 import pytest
 
@@ -368,6 +369,134 @@ class TestSourceCatalogDynamicSourceIntegration:
         assert session.get_dynamic_sources() == []
 
 
+# ---------------------------------------------------------------------------
+# Memory bounds: LRU eviction, compression, pinning
+# ---------------------------------------------------------------------------
+
+
+def _source(tag: str, size: int = 2000) -> str:
+    line = f"value_{tag} = {tag!r}  # generated\n"
+    return line * (size // len(line) + 1)
+
+
+class TestRuntimeSourceRegistryBudget:
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=5000, compress=False)
+        first = reg.register("<gen-1>", _source("1"))
+        reg.register("<gen-2>", _source("2"))
+        assert reg.get_by_ref(first.ref) is first  # now most recently used
+
+        reg.register("<gen-3>", _source("3"))
+
+        assert reg.get_by_path("<gen-2>") is None
+        assert reg.get_by_path("<gen-1>") is first
+        assert reg.stats()["evictions"] == 1
+        assert reg.stats()["storedBytes"] <= 5000
+
+    def test_zero_budget_never_evicts(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=0, compress=False)
+        for i in range(20):
+            reg.register(f"<gen-{i}>", _source(str(i)))
+        assert len(reg) == 20
+
+    def test_cold_entries_are_compressed_and_inflated_on_read(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=1_000_000, hot_bytes=2500, compress=True)
+        text = _source("a")
+        cold = reg.register("<gen-a>", text)
+        reg.register("<gen-b>", _source("b"))
+
+        assert cold.compressed
+        stats = reg.stats()
+        assert stats["compressedEntries"] == 1
+        assert stats["storedBytes"] < stats["rawBytes"]
+
+        assert reg.get_source_text(cold.ref) == text
+        assert not cold.compressed
+        assert reg.stats()["inflations"] == 1
+
+    def test_compression_disabled(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=1_000_000, hot_bytes=100, compress=False)
+        reg.register("<gen-a>", _source("a"))
+        reg.register("<gen-b>", _source("b"))
+        assert reg.stats()["compressedEntries"] == 0
+
+    def test_update_keeps_accounting_consistent(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=1_000_000, hot_bytes=2500, compress=True)
+        reg.register("<gen-a>", _source("a"))
+        reg.register("<gen-b>", _source("b"))
+        reg.update("<gen-a>", "short = 1\n")
+
+        stats = reg.stats()
+        expected = sum(e.stored_bytes for e in reg.all_entries())
+        assert stats["storedBytes"] == expected
+        assert reg.get_source_text_by_path("<gen-a>") == "short = 1\n"
+
+    def test_pinned_entries_survive_eviction(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=5000, compress=False)
+        reg.register("<pinned>", _source("p"))
+        reg.pin("<pinned>")
+        reg.register("<gen-2>", _source("2"))
+        reg.register("<gen-3>", _source("3"))
+
+        assert reg.get_by_path("<pinned>") is not None
+        assert reg.get_by_path("<gen-2>") is None
+
+        reg.unpin("<pinned>")
+        reg.register("<gen-4>", _source("4"))
+        reg.register("<gen-5>", _source("5"))
+        assert reg.get_by_path("<pinned>") is None
+
+    def test_pin_provider_protects_entries(self) -> None:
+        reg = RuntimeSourceRegistry(
+            max_bytes=5000, compress=False, pin_provider=lambda: ["<bp-file>"]
+        )
+        reg.register("<bp-file>", _source("bp"))
+        reg.register("<gen-2>", _source("2"))
+        reg.register("<gen-3>", _source("3"))
+
+        assert reg.get_by_path("<bp-file>") is not None
+        assert reg.stats()["pinnedEntries"] == 1
+
+    def test_source_in_live_frame_is_pinned(self) -> None:
+        reg = RuntimeSourceRegistry(max_bytes=5000, compress=False)
+        src = _source("live")
+        reg.register("<live-code>", src)
+        ns: dict = {"reg": reg, "make": _source}
+        code = compile(
+            "reg.register('<gen-2>', make('2'))\nreg.register('<gen-3>', make('3'))\n",
+            "<live-code>",
+            "exec",
+        )
+
+        exec(code, ns)
+
+        assert reg.get_source_text_by_path("<live-code>") == src
+
+
+class TestSourceCatalogBoundedRegistry:
+    def test_evicted_source_is_restored_from_linecache(self, session) -> None:
+        path = "<restored-from-linecache>"
+        text = _source("r")
+        linecache.cache[path] = (len(text), None, text.splitlines(True), path)
+        try:
+            ref = session.register_dynamic_source(path, text)
+            session.sources._dynamic.clear()
+
+            assert session.get_source_content_by_ref(ref) == text
+            assert session.sources._dynamic.get_by_path(path).ref == ref
+        finally:
+            linecache.cache.pop(path, None)
+
+    def test_breakpoint_files_are_pinned(self, session) -> None:
+        class _Debugger:
+            breaks: ClassVar[dict[str, list[int]]] = {"<bp-source>": [1]}
+
+        session.debugger = _Debugger()
+        session.register_dynamic_source("<bp-source>", "x = 1\n")
+
+        assert session.sources.get_dynamic_source_stats()["pinnedEntries"] == 1
+
+
 # ---------------------------------------------------------------------------
 # annotate_stack_frames_with_source_refs
 # ---------------------------------------------------------------------------
@@ -295,6 +295,7 @@ def test_agent_command_logs_are_condensed(monkeypatch, debug_session):
                 f_globals={"visible": "yes", "__name__": "fixture"},
             )
         },
+        materialize_frames=lambda _thread_id, _count=None: None,
     )
     debug_session.debugger = SimpleNamespace(
         thread_tracker=tracker,
@@ -0,0 +1,35 @@
+"""Tests for concurrent handling of coalescible requests in the DAP server loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dapper.adapter.server import DebugAdapterServer
+from tests.mocks import MockConnection
+
+
+@pytest.mark.asyncio
+async def test_set_breakpoints_burst_overlaps_and_later_requests_wait() -> None:
+    connection = MockConnection()
+    server = DebugAdapterServer(connection, asyncio.get_running_loop())
+    server.running = True
+    connection.add_request("setBreakpoints", {"source": {"path": "/a.py"}}, seq=1)
+    connection.add_request("setBreakpoints", {"source": {"path": "/b.py"}}, seq=2)
+    connection.add_request("configurationDone", seq=3)
+
+    log: list[tuple[str, int]] = []
+
+    async def _fake_handle(request):
+        log.append(("start", request["seq"]))
+        if request["command"] == "setBreakpoints":
+            await asyncio.sleep(0.01)
+        log.append(("end", request["seq"]))
+
+    server.request_handler.handle_request = _fake_handle  # type: ignore[method-assign]
+
+    await server._message_loop()
+
+    assert log.index(("start", 2)) < log.index(("end", 1))
+    assert log.index(("start", 3)) > max(log.index(("end", 1)), log.index(("end", 2)))
@@ -37,7 +37,7 @@ def test_start_command_receiver_idempotent(monkeypatch):
         monkeypatch.setattr(sys.modules["dapper.ipc"], "ipc_receiver", mod, raising=False)
 
     # Monkeypatch Thread
-    monkeypatch.setattr(ds.threading, "Thread", _DummyThread)
+    monkeypatch.setattr(ds, "InternalThread", _DummyThread)
 
     state.start_command_receiver()
 
@@ -69,7 +69,7 @@ def test_start_command_receiver_failure_logged(monkeypatch, caplog):
     def bad_thread(*_args, **_kwargs):  # simple callable matching Thread signature
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(ds.threading, "Thread", bad_thread)
+    monkeypatch.setattr(ds, "InternalThread", bad_thread)
     state.start_command_receiver()
 
     # Should not set command_thread
@@ -0,0 +1,95 @@
+"""Unit tests for dapper.shared.source_watcher."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from dapper.shared.source_watcher import SourceWatcher
+from dapper.shared.source_watcher import loaded_user_sources
+from dapper.shared.source_watcher import start_session_source_watcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    st = path.stat()
+    # Force a distinct mtime even on coarse-grained file systems.
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_first_poll_only_records_baseline(tmp_path: Path) -> None:
+    f = tmp_path / "a.py"
+    f.write_text("x = 1\n")
+    watcher = SourceWatcher(lambda: [str(f)])
+
+    assert watcher.poll() == set()
+    assert watcher.watched == 1
+
+
+def test_poll_reports_edited_files_once(tmp_path: Path) -> None:
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("x = 1\n")
+    b.write_text("y = 1\n")
+    watcher = SourceWatcher(lambda: [str(a), str(b)])
+    watcher.poll()
+
+    _touch(a, "x = 2\n")
+
+    assert watcher.poll() == {str(a)}
+    assert watcher.poll() == set()
+
+
+def test_deleted_file_is_not_reported(tmp_path: Path) -> None:
+    f = tmp_path / "gone.py"
+    f.write_text("x = 1\n")
+    watcher = SourceWatcher(lambda: [str(f)])
+    watcher.poll()
+
+    f.unlink()
+
+    assert watcher.poll() == set()
+
+
+def test_mark_current_suppresses_change(tmp_path: Path) -> None:
+    f = tmp_path / "a.py"
+    f.write_text("x = 1\n")
+    watcher = SourceWatcher(lambda: [str(f)])
+    watcher.poll()
+
+    _touch(f, "x = 2\n")
+    watcher.mark_current([str(f)])
+
+    assert watcher.poll() == set()
+
+
+def test_files_first_seen_after_baseline_count_when_edited_since(tmp_path: Path) -> None:
+    early = tmp_path / "early.py"
+    late = tmp_path / "late.py"
+    early.write_text("x = 1\n")
+    late.write_text("y = 1\n")
+    paths = [str(early)]
+    watcher = SourceWatcher(lambda: paths, since_ns=late.stat().st_mtime_ns)
+    watcher.poll()
+
+    # Imported after the baseline and edited before the first reload.
+    _touch(late, "y = 2\n")
+    paths.append(str(late))
+
+    assert watcher.poll() == {str(late)}
+    assert watcher.poll() == set()
+
+
+def test_session_watcher_is_started_once() -> None:
+    with patch("dapper.shared.source_watcher._session_watcher", None):
+        watcher = start_session_source_watcher()
+        assert start_session_source_watcher() is watcher
+        assert watcher.watched > 0
+
+
+def test_loaded_user_sources_lists_this_test_module() -> None:
+    assert os.path.abspath(__file__) in loaded_user_sources()  # noqa: PTH100
@@ -86,9 +86,9 @@ class TestHandleStackTraceImpl:
             {"threadId": 1},
             get_thread_ident=lambda: 1,
         )
-        assert result == {"success": True, "body": {"stackFrames": []}}
+        assert result == {"success": True, "body": {"stackFrames": [], "totalFrames": 0}}
         session.transport.send.assert_called_once_with(
-            "stackTrace", threadId=1, stackFrames=[], totalFrames=0
+            "stackTrace", threadId=1, stackFrames=[], startFrame=0, totalFrames=0
         )
 
     def test_stack_with_dict_frames(self) -> None:
@@ -169,6 +169,7 @@ class TestHandleStackTraceImpl:
         )
 
         assert len(result["body"]["stackFrames"]) == 2
+        assert result["body"]["totalFrames"] == 5
 
     def test_arguments_none_treated_as_empty(self) -> None:
         session = _make_session()
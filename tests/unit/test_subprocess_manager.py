@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import concurrent.futures
 import multiprocessing
+import os
 import subprocess
+import sys
 import threading
 from typing import Any
 from typing import cast
 
+import pytest
+
+from dapper.adapter.subprocess_manager import ChildProcessInfo
+from dapper.adapter.subprocess_manager import ChildReaper
 from dapper.adapter.subprocess_manager import SubprocessConfig
 from dapper.adapter.subprocess_manager import SubprocessManager
 
@@ -304,3 +310,99 @@ def test_process_pool_scaffold_emits_candidate_event(monkeypatch) -> None:
     assert calls == ["submit"]
     event_names = [event for event, _ in recorder.calls]
     assert "dapper/childProcessCandidate" in event_names
+
+
+def test_scalable_mode_has_no_child_cap() -> None:
+    recorder = _Recorder()
+    manager = SubprocessManager(
+        send_event=recorder.send,
+        config=SubprocessConfig(enabled=True, max_children=1, scalable=True),
+    )
+
+    for pid in range(100, 125):
+        manager.on_child_detected(
+            ChildProcessInfo(pid=pid, name="worker", ipc_port=6123, command=["python"])
+        )
+
+    assert len(manager.children) == 25
+    assert all(payload["dormant"] for _event, payload in recorder.calls)
+
+
+def test_scalable_mode_starts_children_dormant() -> None:
+    manager = SubprocessManager(
+        send_event=lambda _event, _payload: None,
+        config=SubprocessConfig(enabled=True, scalable=True, shared_ipc_port=6123),
+    )
+
+    args = manager.build_launcher_args(["python", "worker.py"], port=6123)
+
+    assert "--subprocess-dormant" in args
+    assert "--subprocess-dormant" not in SubprocessManager(
+        send_event=lambda _event, _payload: None
+    ).build_launcher_args(["python", "worker.py"], port=6123)
+
+
+def test_scalable_mode_watches_children_from_one_thread(monkeypatch) -> None:
+    recorder = _Recorder()
+    manager = SubprocessManager(
+        send_event=recorder.send,
+        config=SubprocessConfig(enabled=True, scalable=True, shared_ipc_port=6123),
+    )
+    exited = threading.Event()
+
+    def fake_init(self, args, *rest, **kwargs):
+        self.pid = 3000 + len(recorder.calls)
+        self.poll = lambda: 0 if exited.is_set() else None
+
+    monkeypatch.setattr(subprocess.Popen, "__init__", fake_init)
+    # Fake pids cannot be watched through pidfds.
+    monkeypatch.delattr(os, "pidfd_open", raising=False)
+
+    manager.enable()
+    try:
+        for _ in range(30):
+            subprocess.Popen(["python", "worker.py"])
+        reapers = [t for t in threading.enumerate() if t.name == "dapper-child-reaper"]
+        assert len(reapers) == 1
+        exited.set()
+        for _ in range(200):
+            if len(manager.children) == 0:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        manager.cleanup()
+
+    exit_events = [event for event, _ in recorder.calls if event == "dapper/childProcessExited"]
+    assert len(exit_events) == 30
+
+
+@pytest.mark.parametrize(
+    "use_pidfd",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open"),
+        ),
+        False,
+    ],
+)
+def test_child_reaper_reports_real_child_exit(use_pidfd: bool) -> None:
+    exited: list[int] = []
+    done = threading.Event()
+
+    def on_exit(pid: int) -> None:
+        exited.append(pid)
+        done.set()
+
+    reaper = ChildReaper(on_exit, poll_interval=0.01, use_pidfd=use_pidfd)
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    try:
+        reaper.track(proc, proc.pid)
+        assert done.wait(timeout=10)
+    finally:
+        reaper.stop()
+        proc.wait()
+
+    assert exited == [proc.pid]
+    assert proc.returncode == 0
+    assert reaper.tracked == 0
@@ -8,7 +8,7 @@ Covers:
 - ``LINE`` callback: ``DISABLE`` for non-breakpoints, ``user_line`` for hits.
 - Conditional breakpoints evaluated through ``ConditionEvaluator``.
 - Stepping (``STEP_IN`` / ``STEP_OVER`` / ``STEP_OUT`` / ``CONTINUE``).
-- ``CALL`` callback for function breakpoints.
+- Function breakpoints armed as local ``PY_START`` events.
 - ``integrate_with_backend`` routing in ``debugger_integration``.
 - Statistics shape compatibility.
 - Thread-safety: breakpoints hit correctly across two threads.
@@ -20,11 +20,15 @@ available there; the companion ``SettraceBackend`` path is tested in
 
 from __future__ import annotations
 
+import gc
+import json
 import sys
 import threading
 import types
+from typing import Any
 from unittest.mock import MagicMock
 from unittest.mock import patch
+import weakref
 
 import pytest
 
@@ -236,12 +240,21 @@ class TestPyStartRegistry:
 
         b, _ = backend
         filename = "/src/app.py"
-        b._breakpoints[filename] = frozenset({42})
+        b._breakpoints[filename] = frozenset({1})
         code = _make_code(filename, "calc")
         with patch.object(sys.monitoring, "set_local_events") as mock_sle:
             b._on_py_start(code, 0)
         mock_sle.assert_called_once_with(DEBUGGER_ID, code, sys.monitoring.events.LINE)
 
+    def test_py_start_skips_code_without_breakpoint_lines(self, backend):
+        b, _ = backend
+        filename = "/src/app.py"
+        b._breakpoints[filename] = frozenset({42})
+        code = _make_code(filename, "calc")
+        with patch.object(sys.monitoring, "set_local_events") as mock_sle:
+            b._on_py_start(code, 0)
+        mock_sle.assert_not_called()
+
     def test_py_start_no_line_events_when_file_has_no_breakpoints(self, backend):
         b, _ = backend
         code = _make_code("/src/other.py", "noop")
@@ -296,10 +309,30 @@ class TestBreakpointManagement:
             patch.object(sys.monitoring, "restart_events"),
             patch.object(sys.monitoring, "set_local_events") as mock_sle,
         ):
-            b.update_breakpoints(filename, {55, 60})
+            b.update_breakpoints(filename, {1, 60})
 
         mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.LINE)
 
+    def test_update_breakpoints_arms_only_code_owning_a_breakpoint_line(self, backend):
+
+        b, _ = backend
+        filename = "/app/models.py"
+        compiled = compile("def save():\n    pass\n\ndef load():\n    pass\n", filename, "exec")
+        save, load = (c for c in compiled.co_consts if isinstance(c, types.CodeType))
+        b._code_registry[filename].update({save, load})  # type: ignore[index]
+
+        with (
+            patch.object(sys.monitoring, "restart_events"),
+            patch.object(sys.monitoring, "set_local_events") as mock_sle,
+        ):
+            b.update_breakpoints(filename, {5})
+
+        events = {call.args[1]: call.args[2] for call in mock_sle.call_args_list}
+        assert events == {
+            save: sys.monitoring.events.NO_EVENTS,
+            load: sys.monitoring.events.LINE,
+        }
+
     def test_update_breakpoints_disables_events_when_cleared(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
@@ -474,7 +507,7 @@ class TestStepping:
         )
         mock_se.assert_called_with(DEBUGGER_ID, expected)
 
-    def test_step_over_enables_py_return_globally(self, backend):
+    def test_step_over_without_context_enables_py_return_globally(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
         b, _ = backend
@@ -491,21 +524,25 @@ class TestStepping:
             sys.monitoring.events.PY_START | sys.monitoring.events.PY_RETURN,
         ) in args_list
 
-    def test_step_over_enables_line_on_current_code(self, backend):
+    def test_step_over_arms_only_the_current_code(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
         b, _ = backend
         code = _make_code("/src/main.py", "run")
         b._step_code = code  # type: ignore[attr-defined]
         with (
-            patch.object(sys.monitoring, "set_events"),
+            patch.object(sys.monitoring, "set_events") as mock_se,
             patch.object(sys.monitoring, "set_local_events") as mock_sle,
-            patch.object(sys.monitoring, "restart_events"),
+            patch.object(sys.monitoring, "restart_events") as mock_restart,
         ):
             b.set_stepping("STEP_OVER")
-        mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.LINE)
+        mock_se.assert_called_once_with(DEBUGGER_ID, sys.monitoring.events.PY_START)
+        mock_sle.assert_called_with(
+            DEBUGGER_ID, code, sys.monitoring.events.LINE | sys.monitoring.events.PY_RETURN
+        )
+        mock_restart.assert_not_called()
 
-    def test_step_out_enables_py_return_globally(self, backend):
+    def test_step_out_without_context_enables_py_return_globally(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
         b, _ = backend
@@ -521,19 +558,38 @@ class TestStepping:
             sys.monitoring.events.PY_START | sys.monitoring.events.PY_RETURN,
         ) in args_list
 
-    def test_step_out_disables_line_on_current_code(self, backend):
+    def test_step_out_arms_only_py_return_on_current_code(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
         b, _ = backend
         code = _make_code("/src/main.py", "run")
         b._step_code = code  # type: ignore[attr-defined]
         with (
-            patch.object(sys.monitoring, "set_events"),
+            patch.object(sys.monitoring, "set_events") as mock_se,
             patch.object(sys.monitoring, "set_local_events") as mock_sle,
             patch.object(sys.monitoring, "restart_events"),
         ):
             b.set_stepping("STEP_OUT")
-        mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.NO_EVENTS)
+        mock_se.assert_called_once_with(DEBUGGER_ID, sys.monitoring.events.PY_START)
+        mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.PY_RETURN)
+
+    def test_step_restarts_events_only_for_disabled_code(self, backend):
+        b, _ = backend
+        code = _make_code("/src/main.py", "run")
+        b._step_code = code  # type: ignore[attr-defined]
+        with (
+            patch.object(sys.monitoring, "set_events"),
+            patch.object(sys.monitoring, "set_local_events"),
+            patch.object(sys.monitoring, "restart_events") as mock_restart,
+        ):
+            b.set_stepping("STEP_OVER")
+            b.set_stepping("CONTINUE")
+            mock_restart.assert_not_called()
+
+            assert b._on_line(code, 1) is sys.monitoring.DISABLE
+            b._step_code = code  # type: ignore[attr-defined]
+            b.set_stepping("STEP_OVER")
+        mock_restart.assert_called_once_with()
 
     def test_continue_restores_breakpoint_only_events(self, backend):
         from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
@@ -543,13 +599,14 @@ class TestStepping:
         with (
             patch.object(sys.monitoring, "set_events") as mock_se,
             patch.object(sys.monitoring, "set_local_events"),
-            patch.object(sys.monitoring, "restart_events"),
+            patch.object(sys.monitoring, "restart_events") as mock_restart,
         ):
             b.set_stepping("CONTINUE")
         # Global set_events for CONTINUE: PY_START only
         assert any(
             c.args == (DEBUGGER_ID, sys.monitoring.events.PY_START) for c in mock_se.call_args_list
         )
+        mock_restart.assert_not_called()
 
     def test_py_return_during_step_over_switches_to_step_in(self, backend):
         b, _ = backend
@@ -564,11 +621,24 @@ class TestStepping:
         result = b._on_py_return(_make_code(), 0, None)
         assert result is sys.monitoring.DISABLE
 
+    def test_disabled_codes_do_not_keep_code_alive(self, backend):
+        b, _ = backend
+        code = _make_code()
+        ref = weakref.ref(code)
+        b._step_mode = "CONTINUE"  # type: ignore[attr-defined]
+        b._on_py_return(code, 0, None)
+        assert code in b._disabled_codes  # type: ignore[attr-defined]
+
+        del code
+        gc.collect()
+        assert ref() is None
+
     def test_capture_step_context_stores_code(self, backend):
         b, _ = backend
         code = _make_code()
-        b.capture_step_context(code)
+        b.capture_step_context(code, None)
         assert b._step_code is code  # type: ignore[attr-defined]
+        assert b._step_thread is None  # type: ignore[attr-defined]
 
     def test_stepping_fires_user_line(self, backend):
         """LINE callback in step-in mode calls user_line even for non-bp lines."""
@@ -580,64 +650,180 @@ class TestStepping:
         mock_debugger.user_line.assert_called_once()
 
 
-# ---------------------------------------------------------------------------
-# 8. CALL callback — function breakpoints (2.6)
-# ---------------------------------------------------------------------------
+class TestThreadScopedStepping:
+    def test_step_over_arms_only_the_current_code(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
+
+        b, _ = backend
+        code = _make_code("/src/main.py", "run")
+        b.capture_step_context(code, thread_id=threading.get_ident())
+        with (
+            patch.object(sys.monitoring, "set_events") as mock_se,
+            patch.object(sys.monitoring, "set_local_events") as mock_sle,
+            patch.object(sys.monitoring, "restart_events"),
+        ):
+            b.set_stepping("STEP_OVER")
+        mock_se.assert_called_once_with(DEBUGGER_ID, sys.monitoring.events.PY_START)
+        mock_sle.assert_called_with(
+            DEBUGGER_ID, code, sys.monitoring.events.LINE | sys.monitoring.events.PY_RETURN
+        )
 
+    def test_continue_disarms_step_codes(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
-class TestCallCallback:
-    def test_call_returns_disable_when_no_function_breakpoints(self, backend):
         b, _ = backend
-        code = _make_code()
-        result = b._on_call(code, 0, lambda: None, None)
-        assert result is sys.monitoring.DISABLE
+        code = _make_code("/src/main.py", "run")
+        b.capture_step_context(code, threading.get_ident())
+        with (
+            patch.object(sys.monitoring, "set_events"),
+            patch.object(sys.monitoring, "set_local_events") as mock_sle,
+            patch.object(sys.monitoring, "restart_events"),
+        ):
+            b.set_stepping("STEP_IN")
+            b.set_stepping("CONTINUE")
+        mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.NO_EVENTS)
+        assert b._step_codes == {}  # type: ignore[attr-defined]
+        assert b._step_thread is None  # type: ignore[attr-defined]
 
-    def test_call_matches_qualname_and_fires_user_call(self, backend):
+    def test_other_threads_do_not_stop_in_step_code(self, backend):
         b, mock_debugger = backend
-        b._function_breakpoints = frozenset({"MyClass.method"})
-        callable_ = MagicMock(__qualname__="MyClass.method", __name__="method")
-        b._on_call(_make_code(), 0, callable_, None)
-        mock_debugger.user_call.assert_called_once()
+        code = _make_code("/src/main.py", "run")
+        b.capture_step_context(code, thread_id=threading.get_ident() + 1)
+        with patch.object(sys.monitoring, "set_local_events"):
+            b.set_stepping("STEP_OVER")
+
+        # Not DISABLE: the stepping thread still needs this code's events.
+        assert b._on_line(code, 1) is None
+        assert b._on_line(_make_code("/src/other.py"), 1) is sys.monitoring.DISABLE
+        mock_debugger.user_line.assert_not_called()
+
+    def test_step_in_arms_callees_of_the_stepping_thread_only(self, backend):
+        b, _ = backend
+        b.capture_step_context(_make_code("/src/main.py", "run"), threading.get_ident())
+        with (
+            patch.object(sys.monitoring, "set_local_events"),
+            patch.object(sys.monitoring, "restart_events"),
+        ):
+            b.set_stepping("STEP_IN")
+            callee = _make_code("/src/callee.py", "callee")
+            assert b._on_py_start(callee, 0) is None
+
+            b._step_thread = threading.get_ident() + 1  # type: ignore[attr-defined]
+            foreign = _make_code("/src/foreign.py", "foreign")
+            assert b._on_py_start(foreign, 0) is None
+
+        assert callee in b._step_codes  # type: ignore[attr-defined]
+        assert foreign not in b._step_codes  # type: ignore[attr-defined]
+
+    def test_internal_threads_never_stop(self, backend):
+        from dapper.utils.internal_threads import InternalThread
 
-    def test_call_non_matching_returns_disable(self, backend):
         b, mock_debugger = backend
-        b._function_breakpoints = frozenset({"other_func"})
-        callable_ = MagicMock(__qualname__="unrelated_func", __name__="unrelated_func")
-        result = b._on_call(_make_code(), 0, callable_, None)
-        assert result is sys.monitoring.DISABLE
-        mock_debugger.user_call.assert_not_called()
+        code = _make_code("/src/main.py", "run")
+        b._breakpoints["/src/main.py"] = frozenset({1})
+        results: list[Any] = []
+        thread = InternalThread(
+            target=lambda: results.append(b._on_line(code, 1)), name="dapper-test-worker"
+        )
+        thread.start()
+        thread.join(timeout=5)
+
+        # Not DISABLE: user threads still need the breakpoint line.
+        assert results == [None]
+        mock_debugger.user_line.assert_not_called()
+        assert b.get_statistics()["thread_events"] == {"dapper-test-worker": 1}
+
+
+class TestTargetedPause:
+    def test_arm_pause_enables_line_on_stack_codes_only(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
-    def test_call_increments_hit_counter(self, backend):
         b, _ = backend
-        b._function_breakpoints = frozenset({"target"})
-        callable_ = MagicMock(__qualname__="target", __name__="target")
-        before = b._stats["call_hits"]
-        b._on_call(_make_code(), 0, callable_, None)
-        assert b._stats["call_hits"] == before + 1  # type: ignore[index]
+        code = _make_code("/src/main.py", "run")
+        with patch.object(sys.monitoring, "set_local_events") as mock_sle:
+            b.arm_pause(threading.get_ident() + 1, [code])
+            mock_sle.assert_called_once_with(DEBUGGER_ID, code, sys.monitoring.events.LINE)
+            b.disarm_pause(threading.get_ident() + 1)
+            mock_sle.assert_called_with(DEBUGGER_ID, code, sys.monitoring.events.NO_EVENTS)
+        assert b._pause_codes == frozenset()  # type: ignore[attr-defined]
+
+    def test_only_the_paused_thread_reaches_the_debugger(self, backend):
+        b, mock_debugger = backend
+        code = _make_code("/src/main.py", "run")
+        with patch.object(sys.monitoring, "set_local_events"):
+            b.arm_pause(threading.get_ident() + 1, [code])
+            # Another thread keeps the event for the paused thread.
+            assert b._on_line(code, 1) is None
+            mock_debugger.user_line.assert_not_called()
+
+            b.arm_pause(threading.get_ident(), [code])
+            assert b._on_line(code, 1) is None
+        mock_debugger.user_line.assert_called_once()
+        assert b.get_statistics()["counters"]["pause_hits"] == 1
+
+
+# ---------------------------------------------------------------------------
+# 8. Function breakpoints — local PY_START events (2.6)
+# ---------------------------------------------------------------------------
 
-    def test_update_function_breakpoints_enables_call_events(self, backend):
 
+class TestFunctionBreakpoints:
+    def test_update_restarts_events_so_seen_code_is_resolved(self, backend):
         b, _ = backend
-        with (
-            patch.object(sys.monitoring, "set_events") as mock_se,
-            patch.object(sys.monitoring, "get_events", return_value=0),
-        ):
+        with patch.object(sys.monitoring, "restart_events") as mock_restart:
             b.update_function_breakpoints({"some_func"})
-        # Should OR in the CALL event
-        assert any(c.args[1] & sys.monitoring.events.CALL for c in mock_se.call_args_list)
+        mock_restart.assert_called_once()
+        assert b._function_breakpoints == frozenset({"some_func"})
+
+    def test_py_start_arms_and_dispatches_matching_code(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
+
+        b, mock_debugger = backend
+        b.update_function_breakpoints({"target"})
+
+        def target():
+            return b._on_py_start(target.__code__, 0)
+
+        with patch.object(sys.monitoring, "set_local_events") as mock_sle:
+            result = target()
+
+        assert result is None
+        mock_sle.assert_called_once_with(
+            DEBUGGER_ID, target.__code__, sys.monitoring.events.PY_START
+        )
+        assert b._function_codes == frozenset({target.__code__})
+        frame = mock_debugger.user_call.call_args[0][0]
+        assert frame.f_code is target.__code__
+        assert b._stats["function_hits"] == 1
+
+    def test_py_start_disables_unrelated_code(self, backend):
+        b, mock_debugger = backend
+        b.update_function_breakpoints({"target"})
+
+        def other():
+            return b._on_py_start(other.__code__, 0)
+
+        assert other() is sys.monitoring.DISABLE
+        mock_debugger.user_call.assert_not_called()
+        assert not b._function_codes
 
-    def test_update_function_breakpoints_empty_removes_call_events(self, backend):
+    def test_clearing_names_disarms_resolved_code(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
 
         b, _ = backend
-        b._step_mode = "CONTINUE"  # type: ignore[attr-defined]
-        call_flag = sys.monitoring.events.CALL
-        with (
-            patch.object(sys.monitoring, "set_events") as mock_se,
-            patch.object(sys.monitoring, "get_events", return_value=call_flag),
-        ):
+        b.update_function_breakpoints({"target"})
+
+        def target():
+            return b._on_py_start(target.__code__, 0)
+
+        target()
+        with patch.object(sys.monitoring, "set_local_events") as mock_sle:
             b.update_function_breakpoints(set())
-        # Should clear the CALL event
-        assert any(not (c.args[1] & call_flag) for c in mock_se.call_args_list)
+
+        mock_sle.assert_called_once_with(
+            DEBUGGER_ID, target.__code__, sys.monitoring.events.NO_EVENTS
+        )
+        assert not b._function_codes
 
 
 # ---------------------------------------------------------------------------
@@ -725,6 +911,248 @@ class TestStatistics:
         b.set_exception_breakpoints(["raised", "uncaught"])
 
 
+# ---------------------------------------------------------------------------
+# 10b. Exception breakpoints — RAISE / RERAISE / PY_UNWIND
+# ---------------------------------------------------------------------------
+
+
+class _RecordingDebugger:
+    def __init__(self) -> None:
+        self.reports: list[tuple[str, type[BaseException], bool | None]] = []
+        self.calls: list[str] = []
+        self.lines: list[int] = []
+        self.stops: list[tuple[Any, int]] = []
+
+    def user_call(self, frame, _argument_list) -> None:
+        self.calls.append(frame.f_code.co_name)
+
+    def user_line(self, frame) -> None:
+        self.lines.append(threading.get_ident())
+        self.stops.append((frame, frame.f_lineno))
+
+    def user_exception(self, frame, exc_info, *, uncaught=None) -> None:
+        self.reports.append((frame.f_code.co_name, exc_info[0], uncaught))
+
+
+def _raise_value_error() -> None:
+    raise ValueError("boom")
+
+
+def _catch_through_finally() -> None:
+    try:
+        try:
+            _raise_value_error()
+        finally:
+            pass
+    except ValueError:
+        pass
+
+
+def _parse_bad_json() -> None:
+    try:
+        json.loads('{"bad')
+    except json.JSONDecodeError:
+        pass
+
+
+@pytest.fixture
+def live_backend():
+    """Install a backend on the real ``sys.monitoring`` API."""
+    if sys.monitoring.get_tool(sys.monitoring.DEBUGGER_ID) is not None:
+        pytest.skip("DEBUGGER_ID already in use")
+    b = _make_backend()
+    debugger = _RecordingDebugger()
+    b.install(debugger)
+    try:
+        yield b, debugger
+    finally:
+        b.shutdown()
+
+
+class TestExceptionBreakpoints:
+    def test_filters_enable_matching_events(self, backend):
+        from dapper._frame_eval.monitoring_backend import DEBUGGER_ID
+
+        b, _ = backend
+        events = sys.monitoring.events
+        with patch.object(sys.monitoring, "set_events") as mock_set:
+            b.set_exception_breakpoints(["uncaught"])
+        mock_set.assert_called_once_with(DEBUGGER_ID, events.PY_UNWIND)
+        assert b.handles_exception_breakpoints
+
+        with patch.object(sys.monitoring, "set_events") as mock_set:
+            b.set_exception_breakpoints([])
+        mock_set.assert_called_once_with(DEBUGGER_ID, 0)
+        assert not b.handles_exception_breakpoints
+
+    def test_stepping_keeps_exception_events(self, backend):
+        b, _ = backend
+        events = sys.monitoring.events
+        b.set_exception_breakpoints(["raised"])
+        with patch.object(sys.monitoring, "set_events") as mock_set:
+            b.set_stepping("STEP_IN")
+        mask = mock_set.call_args[0][1]
+        assert mask & events.RAISE
+        assert mask & events.LINE
+
+    def test_raised_reports_once_per_exception(self, live_backend):
+        b, debugger = live_backend
+        b.set_exception_breakpoints(["raised"])
+        _catch_through_finally()
+        b.set_exception_breakpoints([])
+        assert debugger.reports == [("_raise_value_error", ValueError, False)]
+
+    def test_library_raised_exception_reports_at_first_user_frame(self, live_backend):
+        b, debugger = live_backend
+        b.set_exception_breakpoints(["raised"])
+        _parse_bad_json()
+        b.set_exception_breakpoints([])
+        assert debugger.reports == [("_parse_bad_json", json.JSONDecodeError, False)]
+
+    def test_library_raised_exception_reports_at_raise_site_without_just_my_code(
+        self, live_backend
+    ):
+        b, debugger = live_backend
+        debugger.just_my_code = False
+        b.set_exception_breakpoints(["raised"])
+        _parse_bad_json()
+        b.set_exception_breakpoints([])
+        assert [name for name, _, _ in debugger.reports] == ["raw_decode"]
+
+    def test_caught_exception_is_not_uncaught(self, live_backend):
+        b, debugger = live_backend
+        b.set_exception_breakpoints(["uncaught"])
+        _catch_through_finally()
+        b.set_exception_breakpoints([])
+        assert debugger.reports == []
+        assert b._stats["unwind_callbacks"] >= 1
+
+    def test_exception_escaping_thread_is_uncaught(self, live_backend, monkeypatch):
+        b, debugger = live_backend
+        monkeypatch.setattr(threading, "excepthook", lambda _args: None)
+        b.set_exception_breakpoints(["uncaught"])
+        worker = threading.Thread(target=_raise_value_error)
+        worker.start()
+        worker.join()
+        b.set_exception_breakpoints([])
+        assert debugger.reports == [("_raise_value_error", ValueError, True)]
+
+
+def _function_bp_target(x: int) -> int:
+    return x + 1
+
+
+def _function_bp_other(x: int) -> int:
+    return x
+
+
+class _FunctionBpBase:
+    def method(self) -> int:
+        return 1
+
+
+class _FunctionBpSub(_FunctionBpBase):
+    pass
+
+
+class TestLiveFunctionBreakpoints:
+    def test_only_resolved_code_reports_calls(self, live_backend):
+        b, debugger = live_backend
+        _function_bp_target(0)  # already seen before the breakpoint is set
+        b.update_function_breakpoints({"_function_bp_target"})
+        for i in range(3):
+            _function_bp_other(i)
+            _function_bp_target(i)
+        b.update_function_breakpoints(set())
+        _function_bp_target(0)
+
+        assert debugger.calls == ["_function_bp_target"] * 3
+
+    def test_inherited_method_reports_subclass_calls_only(self, live_backend):
+        b, debugger = live_backend
+        b.update_function_breakpoints({"_FunctionBpSub.method"})
+        for _ in range(2):
+            _FunctionBpBase().method()  # first call comes from the base class
+            _FunctionBpSub().method()
+        b.update_function_breakpoints(set())
+
+        assert debugger.calls == ["method"] * 2
+
+
+def _step_target(x: int) -> int:
+    y = x + 1
+    return y * 2
+
+
+class TestLiveThreadScopedStepping:
+    def test_other_threads_run_the_step_code_without_stopping(self, live_backend):
+        b, debugger = live_backend
+        b.capture_step_context(_step_target.__code__, threading.get_ident())
+        b.set_stepping("STEP_OVER")
+        try:
+            worker = threading.Thread(target=_step_target, args=(1,))
+            worker.start()
+            worker.join()
+            _step_target(1)
+        finally:
+            b.set_stepping("CONTINUE")
+
+        assert debugger.lines
+        assert set(debugger.lines) == {threading.get_ident()}
+
+
+def _leaf() -> int:
+    return 1
+
+
+def _recurse(n: int, backend=None, events: list[int] | None = None) -> int:
+    if backend is not None:
+        backend.capture_step_context(None, threading.get_ident(), sys._getframe())
+        backend.set_stepping("STEP_OVER")
+    if events is not None:
+        events.append(sys.monitoring.get_events(sys.monitoring.DEBUGGER_ID))
+    total = _recurse(n - 1, events=events) + _leaf() if n else 0
+    return total
+
+
+class TestLiveFrameScopedStepOver:
+    def test_step_over_stops_only_in_the_stepped_frame(self, live_backend):
+        b, debugger = live_backend
+        events: list[int] = []
+        try:
+            _recurse(5, b, events)
+        finally:
+            b.set_stepping("CONTINUE")
+
+        recursed = [(f, line) for f, line in debugger.stops if f.f_code is _recurse.__code__]
+        assert recursed
+        assert len({id(f) for f, _ in recursed}) == 1
+        assert len(recursed) == len({line for _, line in recursed})
+        # The caller is stepped into once the stepped frame returns.
+        assert debugger.stops[-1][0].f_code is not _recurse.__code__
+        # Nothing but PY_START (and no PY_RETURN) is enabled globally.
+        assert all(mask & sys.monitoring.events.PY_RETURN == 0 for mask in events)
+
+    def test_step_out_returns_to_the_caller(self, live_backend):
+        b, debugger = live_backend
+
+        def stepped() -> int:
+            b.capture_step_context(None, threading.get_ident(), sys._getframe())
+            b.set_stepping("STEP_OUT")
+            return _recurse(3)
+
+        try:
+            stepped()
+            after_call = sys._getframe().f_lineno
+        finally:
+            b.set_stepping("CONTINUE")
+
+        assert debugger.stops
+        frame, line = debugger.stops[0]
+        assert frame is sys._getframe()
+        assert line == after_call
+
+
 # ---------------------------------------------------------------------------
 # 11. Thread safety — breakpoints hit correctly across threads
 # ---------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+"""Pause stops the target thread at a checkpoint armed on its own stack."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from typing import Any
+
+import pytest
+
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.core.pause_controller import PauseController
+from dapper.shared import stepping_handlers
+from dapper.shared.debug_shared import DebugSession
+
+logger = logging.getLogger(__name__)
+
+
+def _untraced(frame, event, arg) -> None:
+    """Thread trace function that traces no frame by itself."""
+
+
+class _Worker:
+    """A thread with a trace function, running *body* until released."""
+
+    def __init__(self, body) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(body,), daemon=True)
+        self.thread.start()
+        assert self.started.wait(5)
+
+    def _run(self, body) -> None:
+        sys.settrace(_untraced)
+        try:
+            self.started.set()
+            body(self)
+        finally:
+            sys.settrace(None)
+
+    def stop(self) -> None:
+        self.release.set()
+        self.thread.join(5)
+        assert not self.thread.is_alive()
+
+
+def _spin(worker: _Worker) -> None:
+    count = 0
+    while not worker.release.is_set():
+        count += 1
+
+
+def _block(worker: _Worker) -> None:
+    worker.release.wait()
+
+
+@pytest.fixture
+def paused_session():
+    """A session whose debugger parks stopped threads until ``resume`` is set."""
+    events: list[dict[str, Any]] = []
+    resume = threading.Event()
+
+    def record(kind: str, **body: Any) -> None:
+        if kind == "stopped":
+            events.append({"thread": threading.get_ident(), **body})
+
+    dbg = DebuggerBDB(
+        send_message=record,
+        process_commands=lambda: resume.wait(5),
+        just_my_code=False,
+    )
+    dbg.reset()
+    session = DebugSession()
+    session.debugger = dbg
+    session.transport.send = record  # type: ignore[assignment]
+    yield session, dbg, events, resume
+    resume.set()
+
+
+def _wait_for(events: list[dict[str, Any]], count: int) -> None:
+    done = threading.Event()
+    for _ in range(500):
+        if len(events) >= count:
+            return
+        done.wait(0.01)
+    msg = f"expected {count} stopped events, got {events}"
+    raise AssertionError(msg)
+
+
+def test_pause_stops_busy_thread_at_its_own_frame(paused_session) -> None:
+    session, dbg, events, resume = paused_session
+    worker = _Worker(_spin)
+    tid = worker.thread.ident
+    assert tid is not None
+
+    stepping_handlers.handle_pause_impl(session, {"threadId": tid}, threading.get_ident, logger)
+    _wait_for(events, 1)
+
+    assert events[0]["thread"] == tid
+    assert events[0]["reason"] == "pause"
+    # Stopped in _spin, or in the Event.is_set call it was making.
+    top = [f["name"] for f in dbg.thread_tracker.frames_by_thread[tid][:2]]
+    assert "_spin" in top
+    stats = dbg.pause_controller.statistics()
+    assert stats["landed"] == 1
+    assert stats["last_latency"] is not None
+    assert not dbg.pause_controller.requests
+
+    worker.release.set()
+    resume.set()
+    worker.stop()
+
+
+def test_pause_of_blocked_thread_is_reported_then_lands(paused_session, monkeypatch) -> None:
+    monkeypatch.setattr(stepping_handlers, "PAUSE_REPORT_TIMEOUT", 0.01)
+    session, dbg, events, resume = paused_session
+    worker = _Worker(_block)
+    tid = worker.thread.ident
+
+    stepping_handlers.handle_pause_impl(session, {"threadId": tid}, threading.get_ident, logger)
+    _wait_for(events, 1)
+
+    # Blocked in native code: reported from a snapshot by another thread.
+    assert events[0]["thread"] != tid
+    assert events[0]["description"]
+    assert tid in dbg.thread_tracker.stopped_thread_ids
+
+    # Back in Python, the thread stops at the armed checkpoint.
+    worker.release.set()
+    _wait_for(events, 2)
+    assert events[1]["thread"] == tid
+    assert dbg.pause_controller.statistics()["reported_from_snapshot"] == 1
+
+    resume.set()
+    worker.stop()
+
+
+def test_continue_cancels_pending_pause(paused_session, monkeypatch) -> None:
+    monkeypatch.setattr(stepping_handlers, "PAUSE_REPORT_TIMEOUT", 0.01)
+    session, dbg, events, _resume = paused_session
+    worker = _Worker(_block)
+    tid = worker.thread.ident
+
+    stepping_handlers.handle_pause_impl(session, {"threadId": tid}, threading.get_ident, logger)
+    _wait_for(events, 1)
+    stepping_handlers.handle_continue_impl(session, {"threadId": tid})
+    worker.stop()
+
+    assert len(events) == 1
+    assert not dbg.pause_controller.requests
+    assert dbg.pause_controller.statistics()["cancelled"] == 1
+
+
+def test_pause_of_unknown_or_own_thread_is_not_armed() -> None:
+    dbg = DebuggerBDB()
+
+    assert dbg.pause(threading.get_ident()) is False
+    assert dbg.pause(-1) is False
+    assert not dbg.pause_controller.requests
+
+
+def test_pause_controller_tracks_requests() -> None:
+    controller = PauseController()
+    controller.request(1)
+    controller.request(1)
+    controller.request(2)
+
+    assert controller.mark_reported(1) is True
+    assert controller.mark_reported(1) is False
+    request = controller.consume(1)
+    assert request is not None
+    assert request.reported
+    assert controller.consume(1) is None
+    assert controller.cancel() is True
+
+    stats = controller.statistics()
+    assert stats["requested"] == 2
+    assert stats["landed"] == 1
+    assert stats["reported_from_snapshot"] == 1
+    assert stats["cancelled"] == 1
+    assert stats["max_latency"] >= 0
@@ -34,6 +34,10 @@ class _DummyWriter:
     def write(self, payload: bytes) -> None:
         self.data.extend(payload)
 
+    def writelines(self, parts) -> None:
+        for part in parts:
+            self.data.extend(part)
+
     async def drain(self) -> None:
         self.drains += 1
 
@@ -0,0 +1,158 @@
+"""Stepping is confined to the thread the step was requested for."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from unittest.mock import MagicMock
+
+from dapper.core.debugger_bdb import DebuggerBDB
+from dapper.core.stepping_controller import SteppingController
+from dapper.shared.debug_shared import DebugSession
+from dapper.shared.stepping_handlers import handle_next_impl
+from dapper.shared.stepping_handlers import handle_step_in_impl
+from dapper.shared.stepping_handlers import handle_step_out_impl
+
+MAX_STOPS = 25
+
+
+def test_stop_here_rejects_other_threads() -> None:
+    dbg = DebuggerBDB()
+    frame = sys._getframe()
+    dbg.set_step()
+
+    dbg.stepping_controller.set_step_thread(threading.get_ident() + 1)
+    assert dbg.stop_here(frame) is False
+
+    dbg.stepping_controller.set_step_thread(threading.get_ident())
+    assert dbg.stop_here(frame) is True
+
+
+def test_set_continue_clears_step_thread() -> None:
+    dbg = DebuggerBDB()
+    dbg.reset()
+    dbg.stepping_controller.set_step_thread(123)
+
+    dbg.set_continue()
+
+    assert dbg.stepping_controller.step_thread_id is None
+
+
+def test_clear_resets_step_thread() -> None:
+    controller = SteppingController()
+    controller.set_step_thread(7)
+    controller.clear()
+    assert controller.step_thread_id is None
+
+
+def _make_session() -> tuple[DebugSession, MagicMock]:
+    dbg = MagicMock()
+    dbg.thread_tracker.stopped_thread_ids = {42}
+    dbg.stepping_controller = SteppingController()
+    session = DebugSession()
+    session.debugger = dbg
+    return session, dbg
+
+
+def test_step_handlers_record_the_stepping_thread() -> None:
+    for handler in (handle_next_impl, handle_step_in_impl, handle_step_out_impl):
+        session, dbg = _make_session()
+        handler(session, {"threadId": 42}, lambda: 1, lambda _dbg: None)
+        assert dbg.stepping_controller.step_thread_id == 42
+
+
+def test_step_handlers_scope_the_monitoring_backend_to_the_thread() -> None:
+    cases = (
+        (handle_next_impl, "STEP_OVER"),
+        (handle_step_in_impl, "STEP_IN"),
+        (handle_step_out_impl, "STEP_OUT"),
+    )
+    for handler, mode in cases:
+        session, dbg = _make_session()
+        frame = sys._getframe()
+        dbg.stepping_controller.current_frame = frame
+        backend = MagicMock(spec=["capture_step_context", "set_stepping"])
+        dbg._sys_monitoring_backend = backend
+
+        handler(session, {"threadId": 42}, lambda: 1, lambda _dbg: None)
+
+        backend.capture_step_context.assert_called_once_with(frame.f_code, 42, frame)
+        backend.set_stepping.assert_called_once_with(mode)
+
+
+def test_set_continue_ends_the_monitoring_step() -> None:
+    dbg = DebuggerBDB()
+    dbg.reset()
+    backend = MagicMock(spec=["set_stepping"])
+    dbg._sys_monitoring_backend = backend  # type: ignore[attr-defined]
+
+    dbg.set_continue()
+
+    backend.set_stepping.assert_called_once_with("CONTINUE")
+
+
+def _background(running: threading.Event, done: threading.Event, loops: list[int]) -> None:
+    running.set()
+    while not done.is_set():
+        total = 0
+        for i in range(10):
+            total += i
+        loops[0] += 1
+
+
+def _stepped(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+
+def test_step_storm_stops_only_the_stepping_thread() -> None:
+    stops: list[int] = []
+    dbg = DebuggerBDB(just_my_code=False)
+
+    def process_commands() -> None:
+        stops.append(threading.get_ident())
+        if len(stops) < MAX_STOPS:
+            dbg.stepping_controller.set_stepping()
+            dbg.set_step()
+        else:
+            dbg.set_continue()
+
+    dbg.process_commands = process_commands
+    stepping = threading.Event()
+    running = threading.Event()
+    done = threading.Event()
+    loops = [0]
+
+    def stepping_thread() -> None:
+        dbg.stepping_controller.set_step_thread(threading.get_ident())
+        dbg.stepping_controller.set_stepping()
+        dbg.set_step()
+        stepping.set()
+        running.wait(timeout=30)
+        sys.settrace(dbg.trace_dispatch)
+        try:
+            _stepped(50)
+        finally:
+            sys.settrace(None)
+
+    dbg.reset()
+    stepper = threading.Thread(target=stepping_thread)
+    stepper.start()
+    stepping.wait(timeout=30)
+    # Threads started now run under the same trace function and see the
+    # step state of the stepping thread.
+    threading.settrace(dbg.trace_dispatch)
+    try:
+        background = threading.Thread(target=_background, args=(running, done, loops))
+        background.start()
+    finally:
+        threading.settrace(None)  # type: ignore[arg-type]
+    stepper.join(timeout=30)
+    done.set()
+    background.join(timeout=30)
+
+    assert len(stops) == MAX_STOPS
+    assert set(stops) == {stepper.ident}
+    assert loops[0] > 0
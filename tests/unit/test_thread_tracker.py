@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import threading
 from types import SimpleNamespace
 from typing import Any
@@ -9,9 +10,12 @@ from typing import cast
 
 from dapper.core.debugger_bdb import DebuggerBDB
 from dapper.core.thread_tracker import MAX_STACK_DEPTH
+from dapper.core.thread_tracker import STOP_FRAME_BUDGET
 from dapper.core.thread_tracker import StackFrame
 from dapper.core.thread_tracker import ThreadTracker
 from dapper.protocol.structures import StackFrame as StackFrameDict
+from dapper.shared.debug_shared import DebugSession
+from dapper.shared.stack_handlers import handle_stack_trace_impl
 
 
 class TestStackFrame:
@@ -298,6 +302,97 @@ class TestBuildStackFrames:
         assert frames == []
 
 
+def _recurse(depth: int, frames: list[Any]) -> None:
+    if depth:
+        _recurse(depth - 1, frames)
+    else:
+        frames.append(sys._getframe())
+
+
+class TestStopFrameBudget:
+    """Tests for building deep stacks lazily beyond the stop-time budget."""
+
+    def _stop(self, tracker: ThreadTracker, depth: int) -> Any:
+        frames: list[Any] = []
+        _recurse(depth, frames)
+        (frame,) = frames
+        tracker.frames_by_thread[1] = tracker.build_stack_frames(
+            frame, max_depth=STOP_FRAME_BUDGET
+        )
+        return frame
+
+    def test_total_frames_counts_unbuilt_frames(self):
+        tracker = ThreadTracker()
+        frame = self._stop(tracker, 300)
+        depth = 0
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+
+        assert len(tracker.frames_by_thread[1]) == STOP_FRAME_BUDGET
+        assert len(tracker.frame_id_to_frame) == STOP_FRAME_BUDGET
+        assert tracker.total_frames(1) == depth
+
+    def test_materialize_frames_extends_in_place(self):
+        tracker = ThreadTracker()
+        annotated: list[int] = []
+        tracker.frame_annotator = lambda frames: annotated.extend(f["id"] for f in frames)
+        self._stop(tracker, 300)
+        stored = tracker.frames_by_thread[1]
+
+        frames = tracker.materialize_frames(1, 50)
+
+        assert frames is stored
+        assert len(frames) == 50
+        assert all(f["name"] == "_recurse" for f in frames)
+        assert annotated == [f["id"] for f in frames[STOP_FRAME_BUDGET:]]
+        assert len({f["id"] for f in frames}) == 50
+
+        assert len(tracker.materialize_frames(1)) == tracker.total_frames(1)
+
+    def test_materialize_frames_without_live_frames_is_noop(self):
+        tracker = ThreadTracker()
+        tracker.frames_by_thread[1] = [StackFrameDict(id=1, name="f", line=1, column=0)]
+
+        assert tracker.materialize_frames(1, 10) == tracker.frames_by_thread[1]
+        assert tracker.total_frames(1) == 1
+        assert tracker.materialize_frames(2) == []
+        assert tracker.total_frames(2) == 0
+
+    def test_release_thread_forgets_total(self):
+        tracker = ThreadTracker()
+        self._stop(tracker, 30)
+        tracker.total_frames(1)
+
+        tracker.release_thread(1)
+
+        assert tracker.frame_totals == {}
+
+    def test_stack_trace_pages_through_lazy_frames(self):
+        dbg = DebuggerBDB()
+        session = DebugSession()
+        session.debugger = dbg
+        sent: list[dict[str, Any]] = []
+        session.transport.send = lambda _kind, **kwargs: sent.append(kwargs)  # type: ignore[assignment]
+        frames: list[Any] = []
+        _recurse(300, frames)
+        dbg.thread_tracker.frames_by_thread[1] = dbg._get_stack_frames(frames[0])
+        total = dbg.thread_tracker.total_frames(1)
+
+        result = handle_stack_trace_impl(
+            session,
+            {"threadId": 1, "startFrame": 100, "levels": 20},
+            get_thread_ident=threading.get_ident,
+        )
+
+        body = sent[-1]
+        assert len(body["stackFrames"]) == 20
+        assert body["startFrame"] == 100
+        assert body["totalFrames"] == total
+        assert result["body"]["totalFrames"] == total
+        assert len(dbg.thread_tracker.frames_by_thread[1]) == 120
+
+
 class TestClear:
     """Tests for clear method."""
 
@@ -11,6 +11,8 @@ export interface LaunchRequestArguments extends DebugProtocol.LaunchRequestArgum
   __dapperExplicitEnvironmentSelection?: boolean;
   __dapperEnvironmentSearchRoot?: string;
   subprocessAutoAttach?: boolean;
+  subprocessScalable?: boolean;
+  nonStop?: boolean;
   args?: string[];
   stopOnEntry?: boolean;
   console?: 'internalConsole' | 'integratedTerminal' | 'externalTerminal';
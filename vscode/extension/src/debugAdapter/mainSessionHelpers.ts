@@ -150,11 +150,17 @@ export function buildLauncherArgs(
   if (config.noDebug) {
     args.push('--no-debug');
   }
+  if (config.nonStop) {
+    args.push('--non-stop');
+  }
   if (config.subprocessAutoAttach) {
     args.push('--subprocess-auto-attach');
     if (childIpcPort != null) {
       args.push('--subprocess-ipc-port', childIpcPort.toString());
     }
+    if (config.subprocessScalable) {
+      args.push('--subprocess-scalable');
+    }
   }
 
   args.push('--ipc', 'tcp', '--ipc-port', pythonIpcPort.toString());
@@ -123,6 +123,9 @@ function* registerCommands(
   logger.log('Registering Dapper Debugger commands');
   const stoppedSessions = new Set<string>();
   const pendingReloads = new Set<string>();
+  // Saves arriving within this window are reloaded as one dapper/hotReloadBatch.
+  const autoReloadBatchWindowMs = 300;
+  const queuedReloads = new Map<string, { session: vscode.DebugSession; paths: Set<string>; timer: NodeJS.Timeout }>();
   const autoReloadStatusThrottleMs = 1500;
   let lastAutoReloadStatusAt = 0;
   const environmentPickCancelledMessage = 'Launch cancelled because no Python environment was selected.';
@@ -179,17 +182,53 @@ function* registerCommands(
 
   void refreshStickyActionContexts();
 
-  const showAutoReloadStatus = (document: vscode.TextDocument): void => {
+  const showAutoReloadStatus = (paths: string[]): void => {
     const now = Date.now();
     if (now - lastAutoReloadStatusAt < autoReloadStatusThrottleMs) {
       return;
     }
     lastAutoReloadStatusAt = now;
 
-    const displayPath = vscode.workspace.asRelativePath(document.uri, false);
+    const displayPath = paths.length === 1
+      ? vscode.workspace.asRelativePath(vscode.Uri.file(paths[0]), false)
+      : `${paths.length} files`;
     vscode.window.setStatusBarMessage(`Dapper: Auto reloaded ${displayPath}`, 2500);
   };
 
+  const flushQueuedReloads = async (sessionId: string): Promise<void> => {
+    const queued = queuedReloads.get(sessionId);
+    queuedReloads.delete(sessionId);
+    if (!queued || !stoppedSessions.has(sessionId)) {
+      return;
+    }
+
+    const paths = [...queued.paths];
+    const pendingKeys = paths.map((path) => `${sessionId}:${path}`);
+    pendingKeys.forEach((key) => pendingReloads.add(key));
+    try {
+      await queued.session.customRequest('dapper/hotReloadBatch', {
+        sources: paths.map((path) => ({ path })),
+      });
+      logger.log(`Auto hot reload sent for ${paths.join(', ')}`);
+      showAutoReloadStatus(paths);
+    } catch (error) {
+      logger.debug('Auto hot reload skipped/failed', { error: String(error) });
+    } finally {
+      pendingKeys.forEach((key) => pendingReloads.delete(key));
+    }
+  };
+
+  const queueAutoReload = (session: vscode.DebugSession, sourcePath: string): void => {
+    const queued = queuedReloads.get(session.id);
+    if (queued) {
+      clearTimeout(queued.timer);
+    }
+    const paths = queued?.paths ?? new Set<string>();
+    paths.add(sourcePath);
+    const timer = setTimeout(() => void flushQueuedReloads(session.id), autoReloadBatchWindowMs);
+    queuedReloads.set(session.id, { session, paths, timer });
+  };
+
   const tryAutoHotReload = async (document: vscode.TextDocument): Promise<void> => {
     const enabled = vscode.workspace.getConfiguration('dapper').get<boolean>('hotReload.autoOnSave', true);
     if (!enabled || document.languageId !== 'python' || document.isUntitled) {
@@ -223,18 +262,9 @@ function* registerCommands(
         return;
       }
 
-      pendingReloads.add(pendingKey);
-      await session.customRequest('dapper/hotReload', {
-        source: {
-          path: sourcePath,
-        },
-      });
-      logger.log(`Auto hot reload sent for ${sourcePath}`);
-      showAutoReloadStatus(document);
+      queueAutoReload(session, sourcePath);
     } catch (error) {
       logger.debug('Auto hot reload skipped/failed', { error: String(error) });
-    } finally {
-      pendingReloads.delete(pendingKey);
     }
   };
 
@@ -255,6 +285,11 @@ function* registerCommands(
 
   yield vscode.debug.onDidTerminateDebugSession((session) => {
     stoppedSessions.delete(session.id);
+    const queued = queuedReloads.get(session.id);
+    if (queued) {
+      clearTimeout(queued.timer);
+      queuedReloads.delete(session.id);
+    }
   });
 
   yield vscode.workspace.onDidSaveTextDocument((document) => {